@@ -1,7 +1,14 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
 from abqpy.decorators import abaqus_class_doc
 
 from ..UtilityAndView.abaqusConstants import STEP, SymbolicConstant
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
 
 @abaqus_class_doc
 class Amplitude:
@@ -24,3 +31,36 @@ class Amplitude:
     #: A SymbolicConstant specifying the time span of the amplitude. Possible values are STEP
     #: and TOTAL. The default value is STEP.
     timeSpan: SymbolicConstant = STEP
+
+    def evaluate(self, times: Sequence[float], stepStart: float = 0.0) -> ndarray:
+        """This method evaluates the amplitude at an array of times.
+
+        Parameters
+        ----------
+        times
+            An array of Floats specifying total times.
+        stepStart
+            A Float specifying the total time at the beginning of the step. If **timeSpan** = STEP, the
+            amplitude is evaluated at the step times **times** - **stepStart**. The default value is 0.0, for
+            which step time and total time coincide.
+
+        Tabular and equally spaced amplitudes with **smooth** = SOLVER_DEFAULT are evaluated with a degree of
+        smoothing of 0.25.
+
+        Returns
+        -------
+        ndarray
+            A float array of the same shape as **times** with the amplitude values.
+
+        Raises
+        ------
+        TypeError
+            If the amplitude cannot be evaluated as a function of time.
+        """
+        import numpy as np
+
+        samples = np.asarray(times, dtype=np.float64)
+        return self._evaluate(samples - stepStart if self.timeSpan == STEP else samples)
+
+    def _evaluate(self, times: ndarray) -> ndarray:
+        raise TypeError(f"A {type(self).__name__} cannot be evaluated as a function of time")
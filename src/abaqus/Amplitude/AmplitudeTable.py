@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+
+class AmplitudeTable:
+    """The AmplitudeTable object is the precomputed lookup structure used to evaluate tabular amplitude
+    definitions. It stores the knots of the amplitude together with the slope of each interval and the
+    smoothing interval around each knot, so that evaluating the amplitude at an array of times is a binary search
+    followed by an interpolation.
+
+    Between two knots the amplitude is interpolated linearly, or with the fifth order polynomial
+    :math:`\\xi^3 (10 - 15 \\xi + 6 \\xi^2)` for smooth step amplitudes. Before the first and after the last knot
+    the amplitude is constant. With a degree of smoothing :math:`s`, the linear interpolation is replaced by a
+    quadratic within :math:`s \\Delta t` of each interior knot, where :math:`\\Delta t` is the shorter of the two
+    adjacent intervals, so that the slope is continuous.
+    """
+
+    #: An (n,) float array specifying the times of the knots in increasing order.
+    times: np.ndarray
+
+    #: An (n,) float array specifying the amplitude values at the knots.
+    values: np.ndarray
+
+    #: A Float specifying the degree of smoothing.
+    smoothing: float = 0.0
+
+    #: A Boolean specifying whether the knots are connected by smooth steps instead of straight lines.
+    smoothStep: bool = False
+
+    def __init__(
+        self,
+        times: Sequence[float] | np.ndarray,
+        values: Sequence[float] | np.ndarray,
+        smoothing: float = 0.0,
+        smoothStep=False,
+    ):
+        """This method creates an AmplitudeTable object.
+
+        Parameters
+        ----------
+        times
+            A sequence of Floats specifying the times of the knots in strictly increasing order.
+        values
+            A sequence of Floats specifying the amplitude values at the knots.
+        smoothing
+            A Float between 0 and 0.5 specifying the degree of smoothing. The default value is 0.0. Smoothing
+            only applies to linear interpolation.
+        smoothStep
+            A Boolean specifying whether the knots are connected by smooth steps. The default value is False.
+
+        Raises
+        ------
+        ValueError
+            If the table is empty, the times are not strictly increasing or the smoothing is out of range.
+        """
+        self.times = np.asarray(times, dtype=np.float64).reshape(-1)
+        self.values = np.asarray(values, dtype=np.float64).reshape(-1)
+        self.smoothing, self.smoothStep = float(smoothing), bool(smoothStep)
+        if len(self.times) == 0 or len(self.times) != len(self.values):
+            raise ValueError("An amplitude table requires the same positive number of times and values")
+        if not 0.0 <= self.smoothing <= 0.5:
+            raise ValueError(f"The degree of smoothing must be between 0 and 0.5, got {smoothing}")
+        self._intervals = np.diff(self.times)
+        if np.any(self._intervals <= 0):
+            raise ValueError("The times of an amplitude table must be strictly increasing")
+        self._changes = np.diff(self.values)
+        slopes = self._changes / self._intervals
+        # Half width and curvature of the smoothing parabola around each knot, zero at the end knots
+        self._widths = np.zeros(len(self.times))
+        self._curvatures = np.zeros(len(self.times))
+        if self.smoothing > 0 and not self.smoothStep and len(self.times) > 2:
+            self._widths[1:-1] = self.smoothing * np.minimum(self._intervals[:-1], self._intervals[1:])
+            self._curvatures[1:-1] = np.diff(slopes) / (4 * self._widths[1:-1])
+
+    @classmethod
+    def fromData(cls, data: Sequence[Sequence[float]], smoothing: float = 0.0, smoothStep=False) -> AmplitudeTable:
+        """Create an AmplitudeTable from a sequence of (time, amplitude) pairs."""
+        table = np.asarray(data, dtype=np.float64).reshape(-1, 2)
+        return cls(table[:, 0], table[:, 1], smoothing, smoothStep)
+
+    def __call__(self, times: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Evaluate the amplitude at an array of times."""
+        samples = np.asarray(times, dtype=np.float64)
+        if len(self.times) == 1:
+            return np.full(samples.shape, self.values[0])
+        index = np.clip(np.searchsorted(self.times, samples, side="right") - 1, 0, len(self.times) - 2)
+        offsets = samples - self.times[index]
+        xi = np.clip(offsets / self._intervals[index], 0.0, 1.0)
+        if self.smoothStep:
+            xi = xi**3 * (10.0 + xi * (6.0 * xi - 15.0))
+        result = self.values[index] + self._changes[index] * xi
+        if self.smoothing > 0 and not self.smoothStep:
+            # The parabola differs from the straight lines by c * (w - |u|)^2 at a distance |u| < w from a knot
+            for knot, distance in ((index, offsets), (index + 1, samples - self.times[index + 1])):
+                result += self._curvatures[knot] * np.maximum(self._widths[knot] - np.abs(distance), 0.0) ** 2
+        return result
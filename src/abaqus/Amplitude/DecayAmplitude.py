@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -6,6 +10,9 @@ from ..UtilityAndView.abaqusConstants import STEP, SymbolicConstant
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Amplitude import Amplitude
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
 
 @abaqus_class_doc
 class DecayAmplitude(Amplitude):
@@ -89,10 +96,17 @@ class DecayAmplitude(Amplitude):
         RangeError
         """
         super().__init__()
+        self.name = name
+        self.initial = initial
+        self.maximum = maximum
+        self.start = start
+        self.decayTime = decayTime
+        self.timeSpan = timeSpan
 
     @abaqus_method_doc
-    def setValues(self, timeSpan: Literal[C.STEP, C.TOTAL] = STEP):
-        """This method modifies the DecayAmplitude object.
+    def setValues(self, timeSpan: Literal[C.STEP, C.TOTAL] | None = None):
+        """This method modifies the DecayAmplitude object. Only the arguments that are specified are
+        modified.
 
         Parameters
         ----------
@@ -104,4 +118,12 @@ class DecayAmplitude(Amplitude):
         ------
         RangeError
         """
-        ...
+        if timeSpan is not None:
+            self.timeSpan = timeSpan
+
+    def _evaluate(self, times: ndarray) -> ndarray:
+        import numpy as np
+
+        elapsed = times - self.start
+        decay = np.exp(-np.maximum(elapsed, 0.0) / self.decayTime)
+        return self.initial + np.where(elapsed < 0, 0.0, self.maximum * decay)
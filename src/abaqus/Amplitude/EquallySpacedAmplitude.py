@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from typing_extensions import Literal
 
@@ -11,6 +11,11 @@ from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Amplitude import Amplitude
 from .BaselineCorrection import BaselineCorrection
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
+    from .AmplitudeTable import AmplitudeTable
+
 
 @abaqus_class_doc
 class EquallySpacedAmplitude(Amplitude):
@@ -57,6 +62,8 @@ class EquallySpacedAmplitude(Amplitude):
     #: and TOTAL. The default value is STEP.
     timeSpan: SymbolicConstant = STEP
 
+    _table: AmplitudeTable | None = None
+
     @abaqus_method_doc
     def __init__(
         self,
@@ -107,15 +114,22 @@ class EquallySpacedAmplitude(Amplitude):
         RangeError
         """
         super().__init__()
+        self.name = name
+        self.fixedInterval = fixedInterval
+        self.data = data
+        self.begin = begin
+        self.smooth = smooth
+        self.timeSpan = timeSpan
 
     @abaqus_method_doc
     def setValues(
         self,
-        begin: float = 0,
-        smooth: Union[Literal[C.SOLVER_DEFAULT], float] = SOLVER_DEFAULT,
-        timeSpan: Literal[C.STEP, C.TOTAL] = STEP,
+        begin: float | None = None,
+        smooth: Union[Literal[C.SOLVER_DEFAULT], float, None] = None,
+        timeSpan: Literal[C.STEP, C.TOTAL] | None = None,
     ):
-        """This method modifies the EquallySpacedAmplitude object.
+        """This method modifies the EquallySpacedAmplitude object. Only the arguments that are specified are
+        modified.
 
         Parameters
         ----------
@@ -135,4 +149,21 @@ class EquallySpacedAmplitude(Amplitude):
         ------
         RangeError
         """
-        ...
+        if begin is not None:
+            self.begin = begin
+        if smooth is not None:
+            self.smooth = smooth
+        if timeSpan is not None:
+            self.timeSpan = timeSpan
+        self._table = None
+
+    def _evaluate(self, times: ndarray) -> ndarray:
+        if self._table is None:
+            import numpy as np
+
+            from .AmplitudeTable import AmplitudeTable
+
+            smoothing = 0.25 if self.smooth == SOLVER_DEFAULT else float(self.smooth)
+            values = np.asarray(self.data, dtype=np.float64).reshape(-1)
+            self._table = AmplitudeTable(self.begin + self.fixedInterval * np.arange(len(values)), values, smoothing)
+        return self._table(times)
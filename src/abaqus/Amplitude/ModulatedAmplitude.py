@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -6,6 +10,9 @@ from ..UtilityAndView.abaqusConstants import STEP, SymbolicConstant
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Amplitude import Amplitude
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
 
 @abaqus_class_doc
 class ModulatedAmplitude(Amplitude):
@@ -99,10 +106,18 @@ class ModulatedAmplitude(Amplitude):
         RangeError
         """
         super().__init__()
+        self.name = name
+        self.initial = initial
+        self.magnitude = magnitude
+        self.start = start
+        self.frequency1 = frequency1
+        self.frequency2 = frequency2
+        self.timeSpan = timeSpan
 
     @abaqus_method_doc
-    def setValues(self, timeSpan: Literal[C.STEP, C.TOTAL] = STEP):
-        """This method modifies the ModulatedAmplitude object.
+    def setValues(self, timeSpan: Literal[C.STEP, C.TOTAL] | None = None):
+        """This method modifies the ModulatedAmplitude object. Only the arguments that are specified are
+        modified.
 
         Parameters
         ----------
@@ -114,4 +129,11 @@ class ModulatedAmplitude(Amplitude):
         ------
         RangeError
         """
-        ...
+        if timeSpan is not None:
+            self.timeSpan = timeSpan
+
+    def _evaluate(self, times: ndarray) -> ndarray:
+        import numpy as np
+
+        elapsed = np.maximum(times - self.start, 0.0)
+        return self.initial + self.magnitude * np.sin(self.frequency1 * elapsed) * np.sin(self.frequency2 * elapsed)
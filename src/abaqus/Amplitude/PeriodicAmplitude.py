@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -6,6 +10,9 @@ from ..UtilityAndView.abaqusConstants import STEP, SymbolicConstant
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Amplitude import Amplitude
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
 
 @abaqus_class_doc
 class PeriodicAmplitude(Amplitude):
@@ -89,10 +96,17 @@ class PeriodicAmplitude(Amplitude):
         RangeError
         """
         super().__init__()
+        self.name = name
+        self.frequency = frequency
+        self.start = start
+        self.a_0 = a_0
+        self.data = data
+        self.timeSpan = timeSpan
 
     @abaqus_method_doc
-    def setValues(self, timeSpan: Literal[C.STEP, C.TOTAL] = STEP):
-        """This method modifies the PeriodicAmplitude object.
+    def setValues(self, timeSpan: Literal[C.STEP, C.TOTAL] | None = None):
+        """This method modifies the PeriodicAmplitude object. Only the arguments that are specified are
+        modified.
 
         Parameters
         ----------
@@ -104,4 +118,18 @@ class PeriodicAmplitude(Amplitude):
         ------
         RangeError
         """
-        ...
+        if timeSpan is not None:
+            self.timeSpan = timeSpan
+
+    def _evaluate(self, times: ndarray) -> ndarray:
+        import numpy as np
+
+        phase = self.frequency * np.maximum(times - self.start, 0.0)
+        cos1, sin1 = np.cos(phase), np.sin(phase)
+        cosN, sinN = np.ones_like(phase), np.zeros_like(phase)
+        result = np.full(times.shape, float(self.a_0))
+        # cos(n phase) and sin(n phase) by the angle addition formulas, one harmonic at a time
+        for a, b in self.data:
+            cosN, sinN = cosN * cos1 - sinN * sin1, sinN * cos1 + cosN * sin1
+            result += a * cosN + b * sinN
+        return np.where(times < self.start, float(self.a_0), result)
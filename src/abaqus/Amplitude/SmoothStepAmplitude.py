@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -6,6 +10,11 @@ from ..UtilityAndView.abaqusConstants import STEP, SymbolicConstant
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Amplitude import Amplitude
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
+    from .AmplitudeTable import AmplitudeTable
+
 
 @abaqus_class_doc
 class SmoothStepAmplitude(Amplitude):
@@ -36,6 +45,8 @@ class SmoothStepAmplitude(Amplitude):
     #: and TOTAL. The default value is STEP.
     timeSpan: SymbolicConstant = STEP
 
+    _table: AmplitudeTable | None = None
+
     @abaqus_method_doc
     def __init__(self, name: str, data: tuple, timeSpan: Literal[C.STEP, C.TOTAL] = STEP):
         """This method creates a SmoothStepAmplitude object.
@@ -68,10 +79,14 @@ class SmoothStepAmplitude(Amplitude):
         RangeError
         """
         super().__init__()
+        self.name = name
+        self.data = data
+        self.timeSpan = timeSpan
 
     @abaqus_method_doc
-    def setValues(self, timeSpan: Literal[C.STEP, C.TOTAL] = STEP):
-        """This method modifies the SmoothStepAmplitude object.
+    def setValues(self, timeSpan: Literal[C.STEP, C.TOTAL] | None = None):
+        """This method modifies the SmoothStepAmplitude object. Only the arguments that are specified are
+        modified.
 
         Parameters
         ----------
@@ -83,4 +98,13 @@ class SmoothStepAmplitude(Amplitude):
         ------
         RangeError
         """
-        ...
+        if timeSpan is not None:
+            self.timeSpan = timeSpan
+        self._table = None
+
+    def _evaluate(self, times: ndarray) -> ndarray:
+        if self._table is None:
+            from .AmplitudeTable import AmplitudeTable
+
+            self._table = AmplitudeTable.fromData(self.data, smoothStep=True)
+        return self._table(times)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence, Union
+from typing import TYPE_CHECKING, Sequence, Union
 
 from typing_extensions import Literal
 
@@ -11,6 +11,11 @@ from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Amplitude import Amplitude
 from .BaselineCorrection import BaselineCorrection
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
+    from .AmplitudeTable import AmplitudeTable
+
 
 @abaqus_class_doc
 class TabularAmplitude(Amplitude):
@@ -50,6 +55,8 @@ class TabularAmplitude(Amplitude):
     #: and TOTAL. The default value is STEP.
     timeSpan: Literal[C.STEP, C.TOTAL] = STEP
 
+    _table: AmplitudeTable | None = None
+
     @abaqus_method_doc
     def __init__(
         self,
@@ -93,14 +100,19 @@ class TabularAmplitude(Amplitude):
         RangeError
         """
         super().__init__()
+        self.name = name
+        self.data = data
+        self.smooth = smooth
+        self.timeSpan = timeSpan
 
     @abaqus_method_doc
     def setValues(
         self,
-        smooth: Union[Literal[C.SOLVER_DEFAULT], float] = SOLVER_DEFAULT,
-        timeSpan: Literal[C.STEP, C.TOTAL] = STEP,
+        smooth: Union[Literal[C.SOLVER_DEFAULT], float, None] = None,
+        timeSpan: Literal[C.STEP, C.TOTAL] | None = None,
     ):
-        """This method modifies the TabularAmplitude object.
+        """This method modifies the TabularAmplitude object. Only the arguments that are specified are
+        modified.
 
         Parameters
         ----------
@@ -117,4 +129,16 @@ class TabularAmplitude(Amplitude):
         ------
         RangeError
         """
-        ...
+        if smooth is not None:
+            self.smooth = smooth
+        if timeSpan is not None:
+            self.timeSpan = timeSpan
+        self._table = None
+
+    def _evaluate(self, times: ndarray) -> ndarray:
+        if self._table is None:
+            from .AmplitudeTable import AmplitudeTable
+
+            smoothing = 0.25 if self.smooth == SOLVER_DEFAULT else float(self.smooth)
+            self._table = AmplitudeTable.fromData(self.data, smoothing)
+        return self._table(times)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
@@ -25,6 +25,9 @@ from ..Region.Stringer import Stringer
 from ..Region.Surface import Surface
 from ..UtilityAndView.abaqusConstants import OFF, Boolean, SymbolicConstant
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from ..Mesh.MeshAdjacency import MeshAdjacency
+
 
 @abaqus_class_doc
 class PartInstance:
@@ -180,6 +183,25 @@ class PartInstance:
         self.elemEdges = part.elemEdges
         self.elementEdges = part.elementEdges
 
+    def adjacency(self) -> MeshAdjacency:
+        """This method returns the node to element adjacency of the orphan mesh of the instanced part, shared with
+        the part.
+
+        Returns
+        -------
+        MeshAdjacency
+            A MeshAdjacency object.
+
+        Raises
+        ------
+        ValueError
+            If the instanced part does not contain an orphan mesh stored as arrays.
+        """
+        mesh = getattr(self.elements, "_mesh", None)
+        if mesh is None:
+            raise ValueError("The instanced part does not contain an orphan mesh stored as arrays")
+        return mesh.adjacency()
+
     @abaqus_method_doc
     def checkGeometry(self, detailed: Boolean = OFF, level: int | None = None):
         """This method checks the validity of the geometry of the part instance and prints a count of all
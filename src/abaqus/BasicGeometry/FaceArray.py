@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import List, Sequence, Union, overload
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -139,9 +140,17 @@ class FaceArray(List[Face]):
         Returns
         -------
         EdgeArray
-            An EdgeArray object specifying the exterior edges.
+            An EdgeArray object specifying the exterior edges, identified by their
+            :attr:`~abaqus.BasicGeometry.Edge.Edge.index`.
         """
-        return EdgeArray([Edge()])
+        counts = Counter(index for face in self for index in face.getEdges())
+        edges = EdgeArray([])
+        for index, count in counts.items():
+            if count == 1:
+                edge = Edge()
+                edge.index = index
+                edges.append(edge)
+        return edges
 
     @overload
     @abaqus_method_doc
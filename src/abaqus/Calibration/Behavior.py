@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import ast
+from typing import TYPE_CHECKING, Sequence
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import Boolean
 from .DataSet import DataSet
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
 
 @abaqus_class_doc
 class Behavior:
@@ -60,7 +66,8 @@ class Behavior:
         Behavior
             A Behavior object.
         """
-        ...
+        self.name = name
+        self.typeName = typeName
 
     @abaqus_method_doc
     def setValues(
@@ -204,7 +211,7 @@ class Behavior:
             A tuple consisting of a and b values of the regression line(y = ax + b), coefficient of
             determination(r-squared) value and the start and end-points of the line.
         """
-        ...
+        return self._regression(dataSet)
 
     @abaqus_method_doc
     def compute_nu(self, dataSet: DataSet):
@@ -222,7 +229,7 @@ class Behavior:
             A tuple consisting of a and b values of the regression line(y = ax + b), coefficient of
             determination(r-squared) value and the start and end-points of the line.
         """
-        ...
+        return self._regression(dataSet)
 
     @abaqus_method_doc
     def compute_ultimatePoint(self, dataSet: DataSet):
@@ -239,7 +246,13 @@ class Behavior:
         Sequence[float]
             Coordinates of the ultimate point.
         """
-        ...
+        from .curveCalibration import curveArrays, ultimateIndices
+
+        x, y, counts = curveArrays([dataSet])
+        index = ultimateIndices(y, counts)[0]
+        if index < 0:
+            raise ValueError(f"The data set {dataSet.name} is empty")
+        return float(x[0, index]), float(y[0, index])
 
     @abaqus_method_doc
     def compute_elasticModulus(self, yieldPoint: tuple):
@@ -256,7 +269,10 @@ class Behavior:
         float
             A float specifying the value of elastic modulus.
         """
-        ...
+        strain, stress = (float(value) for value in _point(yieldPoint))
+        if strain == 0.0:
+            raise ValueError("The strain of the yield point must not be zero")
+        return stress / strain
 
     @abaqus_method_doc
     def compute_plasticPoints(
@@ -288,7 +304,25 @@ class Behavior:
         Sequence[tuple[float]]
             A sequence of coordinates of the Plastic points..
         """
-        ...
+        import numpy as np
+
+        from .curveCalibration import curveArrays, elasticLines, plasticTables, yieldPoints
+
+        x, y, counts = curveArrays([dataSet])
+        moduli, intercepts, _, elasticEnds = elasticLines(x, y, counts)
+        point = _point(yp) if yp not in ("", None) else (0.0, 0.0)
+        if any(point):
+            yields = np.array([point], dtype=np.float64)
+            moduli = np.array([self.compute_elasticModulus(point)])
+        else:
+            yields = yieldPoints(x, y, moduli, intercepts, elasticEnds)
+        lower = float(start_index) if str(start_index).strip() else -np.inf
+        upper = float(end_index) if str(end_index).strip() else np.inf
+        table = plasticTables(x, y, counts, yields, moduli, int(float(slider_val)), lower, upper,
+                              nominal=str(dataSet.form).upper() != "TRUE")[0]  # fmt: skip
+        if np.isnan(table).any():
+            raise ValueError(f"The data set {dataSet.name} has no plastic points")
+        return tuple((float(stress), float(strain)) for stress, strain in table)
 
     @abaqus_method_doc
     def xyDataDissect(self, dsName: str, modelName: str, calibrationName: str, biaxial: Boolean = True):
@@ -313,4 +347,114 @@ class Behavior:
             A sequence of strings specifying names of the DataSet objects containing loading,
             unloading, reloading and primary datasets.
         """
-        ...
+        from abaqus import mdb
+
+        from .curveCalibration import dissectCycles
+
+        calibration = mdb.models[modelName].calibrations[calibrationName]
+        dataSet = calibration.dataSets[dsName]
+        primary, unloads, reloads, permanent = dissectCycles(dataSet.asArray())
+
+        def create(name: str, points: ndarray) -> str:
+            calibration.DataSet(name, tuple(map(tuple, points.tolist())), dataSet.type, dataSet.form)
+            return name
+
+        prefix = "b" if biaxial else "u"
+        setattr(self, f"{prefix}Primary", create(f"{dsName}-Primary", primary))
+        setattr(
+            self,
+            f"{prefix}MullinsUnload",
+            [create(f"{dsName}-Unload-{number}", points) for number, points in enumerate(unloads, 1)],
+        )
+        setattr(
+            self,
+            f"{prefix}MullinsReload",
+            [create(f"{dsName}-Reload-{number}", points) for number, points in enumerate(reloads, 1)],
+        )
+        setattr(self, f"{prefix}PermSet", [create(f"{dsName}-PermanentSet", permanent)])  # fmt: skip
+        if biaxial:
+            self.biAxialAllName = dsName
+        else:
+            self.uniAxialAllName = dsName
+        return (getattr(self, f"{prefix}Primary"), *getattr(self, f"{prefix}MullinsUnload"),
+                *getattr(self, f"{prefix}MullinsReload"), *getattr(self, f"{prefix}PermSet"))  # fmt: skip
+
+    def compute_yieldPoint(self, dataSet: DataSet, offset: float = 0.002) -> tuple[float, float]:
+        """This method computes the coordinates of the yield point from the existing DataSet object, where the
+        curve crosses its elastic line offset in strain. The elastic line is the least squares line through the
+        first points of the curve with stresses between 10% and 40% of the ultimate stress, at least two points.
+
+        Parameters
+        ----------
+        dataSet
+            A DataSet object.
+        offset
+            A Float specifying the strain offset of the elastic line. The default value is 0.002.
+
+        Returns
+        -------
+        tuple[float, float]
+            The strain and stress of the yield point.
+
+        Raises
+        ------
+        ValueError
+            If the curve does not cross the offset elastic line.
+        """
+        from .curveCalibration import curveArrays, elasticLines, yieldPoints
+
+        x, y, counts = curveArrays([dataSet])
+        moduli, intercepts, _, elasticEnds = elasticLines(x, y, counts)
+        strain, stress = yieldPoints(x, y, moduli, intercepts, elasticEnds, offset)[0]
+        if strain != strain:
+            raise ValueError(f"The data set {dataSet.name} does not yield")
+        return float(strain), float(stress)
+
+    def calibrate(
+        self,
+        dataSets: Sequence[DataSet],
+        offset: float = 0.002,
+        numPoints: int = 20,
+        numWorkers: int | None = 1,
+    ) -> dict[str, ndarray]:
+        """This method calibrates the elastic-plastic behavior of many DataSet objects at once: the elastic
+        modulus, the yield point, the ultimate point and the plastic points of each data set.
+
+        Parameters
+        ----------
+        dataSets
+            A sequence of DataSet objects of stress/strain data.
+        offset
+            A Float specifying the strain offset of the yield points. The default value is 0.002.
+        numPoints
+            An Int specifying the number of plastic points of each data set. The default value is 20.
+        numWorkers
+            An Int specifying the number of worker processes. None uses the number of CPUs. The default value is
+            1, the data sets are calibrated in the calling process.
+
+        Returns
+        -------
+        dict[str, ndarray]
+            The arrays ``elasticModulus``, ``rSquared``, ``yieldPoint``, ``ultimatePoint`` and ``plasticPoints``
+            of the data sets in order, see :func:`~abaqus.Calibration.curveCalibration.calibrateCurves`.
+        """
+        from .curveCalibration import calibrateCurves
+
+        nominal = [str(dataSet.form).upper() != "TRUE" for dataSet in dataSets]
+        return calibrateCurves(dataSets, offset, numPoints, nominal, numWorkers)
+
+    def _regression(self, dataSet: DataSet) -> tuple:
+        """Return the regression line of a DataSet object, its coefficient of determination and its end points."""
+        from .curveCalibration import curveArrays, linearRegression
+
+        x, y, _ = curveArrays([dataSet])
+        slope, intercept, rSquared = (float(value[0]) for value in linearRegression(x, y))
+        if slope != slope:
+            raise ValueError(f"The data set {dataSet.name} has fewer than two distinct points")
+        first, last = float(x[0].min()), float(x[0].max())
+        return slope, intercept, rSquared, (first, slope * first + intercept), (last, slope * last + intercept)
+
+
+def _point(point) -> tuple:
+    """Return the coordinates of a point given as a tuple or as the String of a tuple."""
+    return tuple(ast.literal_eval(point) if isinstance(point, str) else point)
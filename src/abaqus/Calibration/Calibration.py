@@ -18,11 +18,11 @@ class Calibration:
             mdb.models[name].calibrations[name]
     """
 
-    #: A DataSet object.
-    dataSets: DataSet | None = None
+    #: A repository of DataSet objects.
+    dataSets: dict[str, DataSet] = {}
 
-    #: A Behavior object.
-    behaviors: Behavior | None = None
+    #: A repository of Behavior objects.
+    behaviors: dict[str, Behavior] = {}
 
     #: A String specifying the name of the new calibration.
     name: str
@@ -46,7 +46,9 @@ class Calibration:
         Calibration
             A Calibration object.
         """
-        ...
+        self.name = name
+        self.dataSets = {}
+        self.behaviors = {}
 
     @abaqus_method_doc
     def Behavior(self, name: str, typeName: str) -> Behavior:
@@ -70,7 +72,7 @@ class Calibration:
         Behavior
             A Behavior object.
         """
-        self.behaviors = behavior = Behavior(name, typeName)
+        self.behaviors[name] = behavior = Behavior(name, typeName)
         return behavior
 
     @abaqus_method_doc
@@ -102,5 +104,5 @@ class Calibration:
         DataSet
             A DataSet object.
         """
-        self.dataSets = dataSet = DataSet(name, data, type, form)
+        self.dataSets[name] = dataSet = DataSet(name, data, type, form)
         return dataSet
@@ -1,5 +1,12 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
 
 @abaqus_class_doc
 class DataSet:
@@ -28,6 +35,8 @@ class DataSet:
     #: default value is "NOMINAl".
     form: str = ""
 
+    _array: ndarray | None = None
+
     @abaqus_method_doc
     def __init__(self, name: str, data: tuple = (), type: str = "", form: str = ""):
         """This method creates a DataSet object.
@@ -57,7 +66,10 @@ class DataSet:
         DataSet
             A DataSet object.
         """
-        ...
+        self.name = name
+        self.type = type
+        self.form = form
+        self.setValues(data)
 
     @abaqus_method_doc
     def setValues(self, data: tuple = ()):
@@ -68,4 +80,22 @@ class DataSet:
         data
             A sequence of pairs of Floats specifying data set type pairs.
         """
-        ...
+        self.data = data
+        self._array = None
+
+    def asArray(self) -> ndarray:
+        """Return the data as an (n, 2) float array, cached until the data are modified.
+
+        Raises
+        ------
+        ValueError
+            If the data are not pairs of Floats.
+        """
+        import numpy as np
+
+        if self._array is None:
+            array = np.asarray(self.data if len(self.data) else np.zeros((0, 2)), dtype=np.float64)
+            if array.ndim != 2 or array.shape[1] != 2:
+                raise ValueError(f"The data of the data set {self.name} are not pairs of Floats")
+            self._array = array
+        return self._array
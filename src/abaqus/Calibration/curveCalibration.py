@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+
+import numpy as np
+
+#: The strain offset of the yield point from the elastic line.
+YIELD_OFFSET = 0.002
+
+#: The range of the stresses of the elastic part of a curve, as fractions of its ultimate stress.
+ELASTIC_RANGE = (0.1, 0.4)
+
+#: The least number of points of the elastic part of a curve.
+MIN_ELASTIC_POINTS = 2
+
+#: The number of plastic points of the tables extracted by default.
+NUM_PLASTIC_POINTS = 20
+
+
+def curveArrays(curves: Sequence) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return curves of different lengths as rectangular arrays padded with NaN.
+
+    Parameters
+    ----------
+    curves
+        A sequence of (n, 2) arrays of Floats, or of DataSet objects, specifying the x - y pairs of each curve.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        The (N, L) float arrays of the x and y values of the N curves and the (N,) int array of their numbers of
+        points.
+    """
+    arrays = [curve.asArray() if hasattr(curve, "asArray") else np.asarray(curve, dtype=np.float64).reshape(-1, 2)
+              for curve in curves]  # fmt: skip
+    counts = np.array([len(array) for array in arrays], dtype=np.int64)
+    x = np.full((len(arrays), counts.max(initial=0)), np.nan)
+    y = np.full_like(x, np.nan)
+    for row, array in enumerate(arrays):
+        x[row, : len(array)], y[row, : len(array)] = array[:, 0], array[:, 1]
+    return x, y, counts
+
+
+def linearRegression(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the least squares lines y = a x + b of curves padded with NaN.
+
+    Parameters
+    ----------
+    x, y
+        (N, L) arrays of Floats specifying the points of the curves, padded with NaN.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        The (N,) arrays of the slopes a, the intercepts b and the coefficients of determination, NaN for curves
+        with fewer than two distinct x values.
+    """
+    sums, scaleX, scaleY = _sums(x, y)
+    return _line([total[:, -1] for total in sums], scaleX, scaleY)
+
+
+def elasticLines(
+    x: np.ndarray, y: np.ndarray, counts: np.ndarray, stressRange: Sequence[float] = ELASTIC_RANGE
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return the elastic lines of stress-strain curves padded with NaN.
+
+    The elastic part of a curve is made of its first points with stresses in **stressRange**, as fractions of the
+    ultimate stress, at least :data:`MIN_ELASTIC_POINTS` points. It is fitted by a least squares line, the chord
+    modulus of the curve; the regressions of all the curves are computed at once from cumulative sums.
+
+    Parameters
+    ----------
+    x, y
+        (N, L) arrays of Floats specifying the strains and stresses of the curves, padded with NaN.
+    counts
+        An (N,) array of Ints specifying the number of points of each curve.
+    stressRange
+        A pair of Floats specifying the lowest and highest stresses of the elastic part as fractions of the ultimate
+        stress.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        The (N,) arrays of the elastic moduli, the intercepts of the elastic lines, the coefficients of
+        determination of the regressions and the indices of the last point of the elastic parts.
+    """
+    numCurves, length = x.shape
+    rows = np.arange(numCurves)
+    ultimate = ultimateIndices(y, counts)
+    peaks = np.where(ultimate >= 0, y[rows, np.maximum(ultimate, 0)] if length else 0.0, np.nan)
+    loading = (np.arange(length)[None, :] <= ultimate[:, None]) & np.isfinite(y)
+    low, high = (loading & (y >= fraction * peaks[:, None]) for fraction in stressRange)
+    starts = np.argmax(low, axis=1) if length else np.zeros(numCurves, dtype=np.int64)
+    stops = np.where(high.any(axis=1), np.argmax(high, axis=1), counts) if length else starts
+    stops = np.minimum(np.maximum(stops, starts + MIN_ELASTIC_POINTS), counts)
+    starts = np.maximum(np.minimum(starts, stops - MIN_ELASTIC_POINTS), 0)
+    sums, scaleX, scaleY = _sums(x, y)
+    sums = [np.concatenate([np.zeros((numCurves, 1)), total], axis=1) for total in sums]
+    windows = [total[rows, stops] - total[rows, starts] for total in sums]
+    slopes, intercepts, rSquared = _line(windows, scaleX, scaleY)
+    return slopes, intercepts, rSquared, np.where(np.isfinite(slopes), stops - 1, -1)
+
+
+def ultimateIndices(y: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Return the (N,) indices of the points of largest stress of curves padded with NaN, -1 for empty curves."""
+    if not y.shape[1]:
+        return np.full(len(y), -1)
+    return np.where(counts > 0, np.argmax(np.where(np.isnan(y), -np.inf, y), axis=1), -1)
+
+
+def yieldPoints(
+    x: np.ndarray,
+    y: np.ndarray,
+    moduli: np.ndarray,
+    intercepts: np.ndarray,
+    elasticEnds: np.ndarray,
+    offset: float = YIELD_OFFSET,
+) -> np.ndarray:
+    """Return the (N, 2) strains and stresses where curves padded with NaN cross their elastic lines offset by
+    **offset** in strain, interpolated between the points of the curves. Curves that do not cross have NaN yield
+    points."""
+    numCurves, length = x.shape
+    above = y - (moduli[:, None] * (x - offset) + intercepts[:, None])
+    after = np.arange(length)[None, :] > elasticEnds[:, None]
+    crossed = after & (above <= 0.0) & np.isfinite(above)
+    crossed[:, 0] = False
+    index = np.argmax(crossed, axis=1)
+    found = crossed[np.arange(numCurves), index]
+    rows, index = np.arange(numCurves)[found], index[found]
+    previous, current = above[rows, index - 1], above[rows, index]
+    weight = np.divide(previous, previous - current, out=np.zeros(len(rows)), where=previous != current)
+    points = np.full((numCurves, 2), np.nan)
+    for column, values in enumerate((x, y)):
+        points[rows, column] = values[rows, index - 1] + weight * (values[rows, index] - values[rows, index - 1])
+    return points
+
+
+def plasticTables(
+    x: np.ndarray,
+    y: np.ndarray,
+    counts: np.ndarray,
+    yieldPoints: np.ndarray,
+    moduli: np.ndarray,
+    numPoints: int = NUM_PLASTIC_POINTS,
+    lower: float = -np.inf,
+    upper: float = np.inf,
+    nominal: bool | np.ndarray = True,
+) -> np.ndarray:
+    """Return the plastic tables of stress-strain curves padded with NaN.
+
+    The points are evenly spaced in strain from the yield point, or from **lower** if larger, to the ultimate
+    point, or to **upper** if smaller. Nominal curves are converted to true stresses and strains first. The plastic
+    strain is the strain less the elastic strain, starting at zero at the first point and never decreasing.
+
+    Parameters
+    ----------
+    x, y
+        (N, L) arrays of Floats specifying the strains and stresses of the curves, padded with NaN.
+    counts
+        An (N,) array of Ints specifying the number of points of each curve.
+    yieldPoints
+        An (N, 2) array of Floats specifying the strain and stress of the yield point of each curve.
+    moduli
+        An (N,) array of Floats specifying the elastic modulus of each curve.
+    numPoints
+        An Int specifying the number of points of the tables.
+    lower, upper
+        Floats specifying the range of the strains of the points.
+    nominal
+        A Boolean or an (N,) array of Booleans specifying whether the curves are nominal curves to convert.
+
+    Returns
+    -------
+    np.ndarray
+        An (N, numPoints, 2) float array of the yield stresses and plastic strains of each curve, NaN for curves
+        without a yield point.
+    """
+    numCurves = len(x)
+    ultimate = ultimateIndices(y, counts)
+    ends = np.full(numCurves, np.nan)
+    ends[ultimate >= 0] = x[ultimate >= 0, ultimate[ultimate >= 0]]
+    first = np.maximum(yieldPoints[:, 0], lower)
+    last = np.minimum(ends, upper)
+    fractions = np.linspace(0.0, 1.0, max(int(numPoints), 1))
+    strains = first[:, None] + fractions * (last - first)[:, None]
+    stresses = np.full_like(strains, np.nan)
+    for row in np.flatnonzero(np.isfinite(strains).all(axis=1) & (counts > 1)):
+        # Loading branch up to the ultimate point, the strains increasing
+        curveX, curveY = x[row, : ultimate[row] + 1], y[row, : ultimate[row] + 1]
+        order = np.argsort(curveX, kind="stable")
+        stresses[row] = np.interp(strains[row], curveX[order], curveY[order])
+    nominal = np.broadcast_to(np.asarray(nominal, dtype=bool), (numCurves,))[:, None]
+    trueStresses = np.where(nominal, stresses * (1.0 + strains), stresses)
+    trueStrains = np.where(nominal, np.log1p(strains), strains)
+    plastic = np.maximum(trueStrains - trueStresses / moduli[:, None], 0.0)
+    plastic = np.maximum.accumulate(plastic - plastic[:, :1], axis=1)
+    return np.stack([trueStresses, plastic], axis=-1)
+
+
+def calibrateCurves(
+    curves: Sequence,
+    offset: float = YIELD_OFFSET,
+    numPoints: int = NUM_PLASTIC_POINTS,
+    nominal: bool | Sequence[bool] = True,
+    numWorkers: int | None = 1,
+) -> dict[str, np.ndarray]:
+    """Calibrate the elastic-plastic behavior of many stress-strain curves at once.
+
+    The curves are padded into rectangular arrays and every step is vectorised over the curves. With several
+    workers the curves are split into groups calibrated in a process pool.
+
+    Parameters
+    ----------
+    curves
+        A sequence of (n, 2) arrays of Floats, or of DataSet objects, specifying the strain - stress pairs of each
+        curve.
+    offset
+        A Float specifying the strain offset of the yield points.
+    numPoints
+        An Int specifying the number of points of the plastic tables.
+    nominal
+        A Boolean or a sequence of Booleans specifying whether each curve is a nominal curve, whose plastic table
+        is converted to true stresses and strains.
+    numWorkers
+        An Int specifying the number of worker processes. None uses the number of CPUs, 1 calibrates the curves in
+        the calling process.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The (N,) arrays ``elasticModulus`` and ``rSquared`` of the elastic regressions, the (N, 2) arrays
+        ``yieldPoint`` and ``ultimatePoint`` and the (N, numPoints, 2) array ``plasticPoints``, NaN where a curve
+        has no such point.
+    """
+    arrays = [curve.asArray() if hasattr(curve, "asArray") else np.asarray(curve, dtype=np.float64).reshape(-1, 2)
+              for curve in curves]  # fmt: skip
+    flags = np.broadcast_to(np.asarray(nominal, dtype=bool), (len(arrays),))
+    numWorkers = os.cpu_count() or 1 if numWorkers is None else max(int(numWorkers), 1)
+    groups = np.array_split(np.arange(len(arrays)), min(numWorkers, max(len(arrays), 1)))
+    tasks = [([arrays[index] for index in group], offset, numPoints, flags[group]) for group in groups]
+    if len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            results = list(executor.map(_calibrate, *zip(*tasks)))
+    else:
+        results = [_calibrate(*task) for task in tasks]
+    return {key: np.concatenate([result[key] for result in results]) for key in results[0]}
+
+
+def dissectCycles(points) -> tuple[np.ndarray, list[np.ndarray], list[np.ndarray], np.ndarray]:
+    """Split the curve of a cyclic test into its primary, unloading and reloading branches.
+
+    The curve is cut where the strain changes direction. The primary curve is made of the loading points beyond
+    the largest strain reached before; the other loading points are reloading branches and the points of strain
+    decreasing are unloading branches. The permanent set of a cycle is the strain at the end of its unloading
+    branch.
+
+    Parameters
+    ----------
+    points
+        An (n, 2) array of Floats specifying the strain - stress pairs of the test.
+
+    Returns
+    -------
+    tuple[np.ndarray, list[np.ndarray], list[np.ndarray], np.ndarray]
+        The (k, 2) primary curve, the lists of the (k, 2) unloading and reloading branches in order, and the (c, 2)
+        largest strains and permanent sets of the cycles.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) < 2:
+        return points, [], [], np.zeros((0, 2))
+    strains = points[:, 0]
+    # Direction of each step, steps without strain change continue the previous direction
+    direction = np.sign(np.diff(strains))
+    known = np.maximum.accumulate(np.where(direction != 0, np.arange(len(direction)), -1))
+    direction = np.where(known >= 0, direction[np.maximum(known, 0)], 1.0)
+    turns = np.flatnonzero(direction[1:] != direction[:-1]) + 1
+    bounds = np.concatenate([[0], turns, [len(strains) - 1]])
+    previous = np.maximum.accumulate(np.concatenate([[-np.inf], strains[:-1]]))
+    primary = np.zeros(len(strains), dtype=bool)
+    primary[0] = True
+    unloads, reloads, permanent = [], [], []
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        segment = slice(first, last + 1)
+        if direction[first] < 0:
+            unloads.append(points[segment])
+            permanent.append((previous[first + 1], strains[last]))
+            continue
+        beyond = strains[segment] >= previous[segment]
+        primary[first : last + 1] |= beyond
+        if not beyond.all():
+            reloads.append(points[segment][~beyond])
+    return points[primary], unloads, reloads, np.array(permanent, dtype=np.float64).reshape(-1, 2)
+
+
+def _calibrate(arrays: list, offset: float, numPoints: int, nominal: np.ndarray) -> dict[str, np.ndarray]:
+    """Calibrate a group of curves, in a worker process or in the calling process."""
+    x, y, counts = curveArrays(arrays)
+    moduli, intercepts, rSquared, elasticEnds = elasticLines(x, y, counts)
+    yields = yieldPoints(x, y, moduli, intercepts, elasticEnds, offset)
+    ultimate = ultimateIndices(y, counts)
+    found = np.flatnonzero(ultimate >= 0)
+    ultimatePoints = np.full((len(x), 2), np.nan)
+    ultimatePoints[found] = np.column_stack([x[found, ultimate[found]], y[found, ultimate[found]]])
+    return {
+        "elasticModulus": moduli,
+        "rSquared": rSquared,
+        "yieldPoint": yields,
+        "ultimatePoint": ultimatePoints,
+        "plasticPoints": plasticTables(x, y, counts, yields, moduli, numPoints, nominal=nominal),
+    }
+
+
+def _sums(x: np.ndarray, y: np.ndarray) -> tuple[list[np.ndarray], np.ndarray, np.ndarray]:
+    """Return the cumulative counts and sums of x, y, x x, x y and y y of each curve, ignoring the padding, and the
+    (N,) scales of x and y.
+
+    The curves are divided by their largest absolute values first, so that the sums do not lose precision.
+    """
+    valid = np.isfinite(x) & np.isfinite(y)
+    scaleX = np.max(np.where(valid, np.abs(x), 0.0), axis=1, initial=0.0)
+    scaleY = np.max(np.where(valid, np.abs(y), 0.0), axis=1, initial=0.0)
+    scaleX, scaleY = np.where(scaleX > 0, scaleX, 1.0), np.where(scaleY > 0, scaleY, 1.0)
+    u, v = np.where(valid, x, 0.0) / scaleX[:, None], np.where(valid, y, 0.0) / scaleY[:, None]
+    sums = [np.cumsum(values, axis=1) for values in (valid.astype(np.float64), u, v, u * u, u * v, v * v)]
+    return sums, scaleX, scaleY
+
+
+def _line(
+    sums: Sequence[np.ndarray], scaleX: np.ndarray, scaleY: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the slopes, intercepts and coefficients of determination of the least squares lines of the counts and
+    sums of x, y, x x, x y and y y of scaled points, in the units of the points."""
+    n, sx, sy, sxx, sxy, syy = sums
+    with np.errstate(divide="ignore", invalid="ignore"):
+        varianceX, varianceY, covariance = n * sxx - sx * sx, n * syy - sy * sy, n * sxy - sx * sy
+        slopes = np.where((n >= 2) & (varianceX > 1e-12 * n * n), covariance / varianceX, np.nan)
+        intercepts = (sy - slopes * sx) / n
+        rSquared = np.where(varianceY > 0, covariance * covariance / (varianceX * varianceY), 1.0)
+    return slopes * scaleY / scaleX, intercepts * scaleY, np.where(np.isnan(slopes), np.nan, rSquared)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Sequence
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -20,6 +22,9 @@ from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Field import Field
 from .OdbMeshRegionData import OdbMeshRegionData
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
 
 @abaqus_class_doc
 class AnalyticalField(Field):
@@ -49,6 +54,33 @@ class AnalyticalField(Field):
     #: An OdbMeshRegionData object.
     odbMeshRegionData: OdbMeshRegionData = OdbMeshRegionData("", "")
 
+    def evaluate(self, coordinates: Sequence[Sequence[float]]) -> ndarray:
+        """This method evaluates the field at an array of points.
+
+        Parameters
+        ----------
+        coordinates
+            An (n, 3) array of Floats specifying the global coordinates of the points. Two-dimensional
+            coordinates are completed with a zero Z-coordinate.
+
+        Returns
+        -------
+        ndarray
+            An (n,) float array with the value of the field at each point.
+
+        Raises
+        ------
+        TypeError
+            If the field cannot be evaluated at points.
+        """
+        import numpy as np
+
+        points = np.asarray(coordinates, dtype=np.float64)
+        return self._evaluate(points.reshape(-1, points.shape[-1] if points.ndim else 3))
+
+    def _evaluate(self, coordinates: ndarray) -> ndarray:
+        raise TypeError(f"A {type(self).__name__} cannot be evaluated at points")
+
     @abaqus_method_doc
     def OdbMeshRegionData(
         self,
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import ast
+from functools import lru_cache, reduce
+from typing import Sequence
+
+import numpy as np
+
+from ..UtilityAndView.abaqusConstants import CARTESIAN, CYLINDRICAL, SPHERICAL
+
+#: The functions allowed in expressions, mapped to their vectorised implementations.
+FUNCTIONS: dict[str, object] = {
+    "abs": np.abs,
+    "fabs": np.abs,
+    "acos": np.arccos,
+    "asin": np.arcsin,
+    "atan": np.arctan,
+    "atan2": np.arctan2,
+    "cos": np.cos,
+    "cosh": np.cosh,
+    "sin": np.sin,
+    "sinh": np.sinh,
+    "tan": np.tan,
+    "tanh": np.tanh,
+    "exp": np.exp,
+    "log": np.log,
+    "log10": np.log10,
+    "sqrt": np.sqrt,
+    "pow": np.power,
+    "hypot": np.hypot,
+    "floor": np.floor,
+    "ceil": np.ceil,
+    "degrees": np.degrees,
+    "radians": np.radians,
+    "min": lambda *args: reduce(np.minimum, args),
+    "max": lambda *args: reduce(np.maximum, args),
+}
+
+#: The constants allowed in expressions.
+CONSTANTS: dict[str, float] = {"pi": np.pi, "e": np.e}
+
+#: The variables of the expressions of each type of coordinate system.
+VARIABLES: dict[str, tuple] = {
+    "CARTESIAN": ("X", "Y", "Z"),
+    "CYLINDRICAL": ("R", "Th", "Z"),
+    "SPHERICAL": ("R", "Th", "P"),
+}
+
+_operators = {
+    ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/", ast.FloorDiv: "//", ast.Mod: "%", ast.Pow: "**",
+    ast.UAdd: "+", ast.USub: "-",
+    ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">=",
+}  # fmt: skip
+_namespace = {
+    "__builtins__": {},
+    "_and": lambda *args: reduce(np.logical_and, args),
+    "_or": lambda *args: reduce(np.logical_or, args),
+    "_not": np.logical_not,
+    "_where": np.where,
+    **{f"_{name}": function for name, function in FUNCTIONS.items()},
+}
+
+
+class CompiledExpression:
+    """The CompiledExpression object is a field expression compiled into a vectorised function of arrays of
+    coordinates.
+
+    The expression is parsed with :mod:`ast` and every node is checked against the grammar of the Abaqus
+    expressions: numbers, the variables of the coordinate systems, the constants of :data:`CONSTANTS`, arithmetic
+    and comparison operators, ``and``, ``or``, ``not``, conditional expressions and calls of the functions of
+    :data:`FUNCTIONS`. Attributes, subscripts, keywords and any other name are rejected, so evaluating an expression
+    cannot run arbitrary code. The validated expression is translated into Python source calling NumPy functions,
+    boolean operators and conditional expressions becoming element-wise operations, and compiled once. Evaluating it
+    on arrays of coordinates is then a single vectorised pass. Both branches of a conditional expression are
+    evaluated at every point, so the invalid values of the branch that is not taken do not emit warnings; the
+    operations on numbers only that overflow, such as ``10**400``, are rejected when the expression is compiled.
+    """
+
+    #: A String specifying the expression.
+    expression: str
+
+    #: A tuple of Strings specifying the variables used by the expression, in order of appearance.
+    variables: tuple = ()
+
+    #: A String specifying the vectorised Python source of the expression.
+    source: str
+
+    def __init__(self, expression: str):
+        """This method compiles an expression.
+
+        Parameters
+        ----------
+        expression
+            A String specifying the expression, a Python expression of the variables X, Y and Z; R, Th and Z; or
+            R, Th and P.
+
+        Raises
+        ------
+        ValueError
+            If the expression is not valid.
+        """
+        self.expression = str(expression)
+        try:
+            tree = ast.parse(self.expression.strip(), mode="eval")
+        except SyntaxError as error:
+            raise ValueError(f"Invalid expression {self.expression!r}: {error.msg}") from None
+        self.variables = ()
+        self.source = self._translate(tree.body)
+        self._code = compile(self.source, "<expression>", "eval")
+
+    def evaluate(self, variables: dict, shape: Sequence[int] | None = None) -> np.ndarray:
+        """Evaluate the expression.
+
+        Parameters
+        ----------
+        variables
+            A dictionary mapping the names of the variables of the expression to arrays of Floats.
+        shape
+            A sequence of Ints specifying the shape of the result. The default is the shape of the variables,
+            which must be given for an expression without variables.
+
+        Returns
+        -------
+        np.ndarray
+            A float array with the value of the expression at each point.
+
+        Raises
+        ------
+        ValueError
+            If a variable of the expression is not given.
+        """
+        missing = [name for name in self.variables if name not in variables]
+        if missing:
+            raise ValueError(f"Variable {missing[0]} of the expression {self.expression!r} is not defined")
+        values = {name: variables[name] for name in self.variables}
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            result = np.asarray(eval(self._code, _namespace, values), dtype=np.float64)
+        if shape is None:
+            shape = np.broadcast(*values.values()).shape if values else result.shape
+        return np.array(np.broadcast_to(result, tuple(shape)), dtype=np.float64)
+
+    def _translate(self, node: ast.AST) -> str:
+        """Return the vectorised source of a node of the expression, collecting the names of the variables."""
+        translate = self._translate
+        kind = type(node).__name__
+        if kind in ("Constant", "Num"):
+            value = getattr(node, "value", getattr(node, "n", None))
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"Unsupported constant {value!r} in expression {self.expression!r}")
+            # Floats only, integer arithmetic such as 9**9**9 would not be bounded
+            try:
+                number = float(value)
+            except OverflowError:
+                number = np.inf
+            if not np.isfinite(number):
+                raise ValueError(f"Constant {value} is too large in expression {self.expression!r}")
+            return repr(number)
+        if isinstance(node, ast.Name):
+            if node.id in CONSTANTS:
+                return repr(CONSTANTS[node.id])
+            if not any(node.id in names for names in VARIABLES.values()):
+                raise ValueError(f"Unknown name {node.id} in expression {self.expression!r}")
+            if node.id not in self.variables:
+                self.variables += (node.id,)
+            return node.id
+        if isinstance(node, ast.BinOp) and type(node.op) in _operators:
+            source = f"({translate(node.left)} {_operators[type(node.op)]} {translate(node.right)})"
+            if all(not isinstance(child, ast.Name) or child.id in CONSTANTS for child in ast.walk(node)):
+                # Python floats raise instead of returning inf or nan, check the operations on numbers only
+                try:
+                    eval(source, _namespace, {})
+                except ArithmeticError as error:
+                    raise ValueError(f"Invalid operation {source} in expression {self.expression!r}: {error}") from None
+            return source
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return f"_not({translate(node.operand)})"
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _operators:
+            return f"({_operators[type(node.op)]}{translate(node.operand)})"
+        if isinstance(node, ast.BoolOp):
+            function = "_and" if isinstance(node.op, ast.And) else "_or"
+            return f"{function}({', '.join(translate(value) for value in node.values)})"
+        if isinstance(node, ast.Compare) and all(type(operator) in _operators for operator in node.ops):
+            operands = [translate(operand) for operand in [node.left] + node.comparators]
+            comparisons = [f"({left} {_operators[type(operator)]} {right})"
+                           for left, operator, right in zip(operands, node.ops, operands[1:])]  # fmt: skip
+            return comparisons[0] if len(comparisons) == 1 else f"_and({', '.join(comparisons)})"
+        if isinstance(node, ast.IfExp):
+            return f"_where({translate(node.test)}, {translate(node.body)}, {translate(node.orelse)})"
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS:
+            if node.keywords or any(isinstance(argument, ast.Starred) for argument in node.args):
+                raise ValueError(f"Only positional arguments are allowed in expression {self.expression!r}")
+            return f"_{node.func.id}({', '.join(translate(argument) for argument in node.args)})"
+        if isinstance(node, ast.Call):
+            name = node.func.id if isinstance(node.func, ast.Name) else ast.dump(node.func)
+            raise ValueError(f"Unknown function {name} in expression {self.expression!r}")
+        raise ValueError(f"Unsupported syntax {kind} in expression {self.expression!r}")
+
+
+@lru_cache(maxsize=256)
+def compileExpression(expression: str) -> CompiledExpression:
+    """Return the compiled expression, the 256 most recently used ones being cached by the text of the expression.
+
+    Raises
+    ------
+    ValueError
+        If the expression is not valid.
+    """
+    return CompiledExpression(expression)
+
+
+def localVariables(coordinates, localCsys=None, names: Sequence[str] | None = None) -> dict[str, np.ndarray]:
+    """Return the coordinates of points as the variables of the expressions in a coordinate system.
+
+    The coordinates are transformed into the local coordinate system **localCsys**, if any, by its origin and the
+    directions of its axes. The variables of a cylindrical system are the radius R, the angle Th about the 3-axis
+    from the 1-axis in radians and the axial coordinate Z; those of a spherical system are the radius R, the angle
+    Th about the 3-axis and the angle P from the 3-axis.
+
+    Parameters
+    ----------
+    coordinates
+        An (n, 3) or (n, 2) array of Floats specifying the global coordinates of the points.
+    localCsys
+        None or a DatumCsys object specifying the coordinate system. The default is the global Cartesian system.
+    names
+        A sequence of Strings specifying the variables to compute. The default is all the variables of the system.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The (n,) arrays of the variables.
+
+    Raises
+    ------
+    ValueError
+        If a requested variable is not a variable of the coordinate system.
+    """
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    coordinates = coordinates.reshape(-1, coordinates.shape[-1] if coordinates.ndim else 3)
+    if coordinates.shape[1] < 3:
+        coordinates = np.column_stack([coordinates, np.zeros((len(coordinates), 3 - coordinates.shape[1]))])
+    system = "CARTESIAN"
+    if localCsys is not None:
+        system = str(getattr(localCsys, "coordSysType", CARTESIAN))
+        origin = getattr(getattr(localCsys, "origin", None), "pointOn", None)
+        axes = [getattr(getattr(localCsys, f"axis{number}", None), "direction", None) for number in (1, 2, 3)]
+        if origin is not None and len(origin):
+            coordinates = coordinates - np.asarray(origin, dtype=np.float64)
+        if all(axis is not None and len(axis) for axis in axes):
+            rotation = np.asarray(axes, dtype=np.float64)
+            coordinates = coordinates @ (rotation / np.linalg.norm(rotation, axis=1, keepdims=True)).T
+    if system not in VARIABLES:
+        raise ValueError(f"Unsupported coordinate system type {system}, expected {CARTESIAN}, {CYLINDRICAL} or "
+                         f"{SPHERICAL}")  # fmt: skip
+    names = VARIABLES[system] if names is None else tuple(names)
+    unknown = [name for name in names if name not in VARIABLES[system]]
+    if unknown:
+        raise ValueError(f"Variable {unknown[0]} is not defined in a {system} coordinate system")
+    x, y, z = coordinates[:, 0], coordinates[:, 1], coordinates[:, 2]
+    result: dict[str, np.ndarray] = {}
+    for name in names:
+        if name in ("X", "Y", "Z"):
+            result[name] = {"X": x, "Y": y, "Z": z}[name]
+        elif name == "R":
+            result[name] = np.hypot(x, y) if system == "CYLINDRICAL" else np.sqrt(x * x + y * y + z * z)
+        elif name == "Th":
+            result[name] = np.arctan2(y, x)
+        else:
+            result[name] = np.arctan2(np.hypot(x, y), z)
+    return result
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from abaqus.Datum.DatumCsys import DatumCsys
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .AnalyticalField import AnalyticalField
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
 
 @abaqus_class_doc
 class ExpressionField(AnalyticalField):
@@ -34,7 +39,7 @@ class ExpressionField(AnalyticalField):
     description: str = ""
 
     @abaqus_method_doc
-    def __init__(self, name: str, expression: str, localCsys: str | None = None, description: str = ""):
+    def __init__(self, name: str, expression: str, localCsys: DatumCsys | None = None, description: str = ""):
         """This method creates an ExpressionField object.
 
         .. note::
@@ -66,9 +71,13 @@ class ExpressionField(AnalyticalField):
         TextException
         """
         super().__init__()
+        self.name = name
+        self.expression = expression
+        self.localCsys = localCsys
+        self.description = description
 
     @abaqus_method_doc
-    def setValues(self, localCsys: str | None = None, description: str = ""):
+    def setValues(self, localCsys: DatumCsys | None = None, description: str = ""):
         """This method modifies the ExpressionField object.
 
         Parameters
@@ -80,4 +89,13 @@ class ExpressionField(AnalyticalField):
         description
             A String specifying the description of the field. The default value is an empty string.
         """
-        ...
+        self.localCsys = localCsys
+        self.description = description
+
+    def _evaluate(self, coordinates: ndarray) -> ndarray:
+        """Evaluate the expression, compiled once per expression text, in a single vectorised pass."""
+        from .CompiledExpression import compileExpression, localVariables
+
+        compiled = compileExpression(self.expression)
+        variables = localVariables(coordinates, self.localCsys, compiled.variables)
+        return compiled.evaluate(variables, (len(coordinates),))
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abaqus.Datum.DatumCsys import DatumCsys
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import (
+    GRID,
     OFF,
     POINT,
     RELATIVE,
     SURFACE,
     XYPLANE,
     XYZ,
+    XZPLANE,
     Boolean,
     SymbolicConstant,
 )
@@ -19,6 +23,11 @@ from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .AnalyticalField import AnalyticalField
 from .OdbMeshRegionData import OdbMeshRegionData
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
+    from .PointCloudMapper import PointCloudMapper
+
 
 @abaqus_class_doc
 class MappedField(AnalyticalField):
@@ -138,7 +147,7 @@ class MappedField(AnalyticalField):
         gridPointData: tuple = (),
         xyzPointData: tuple = (),
         coordinateScalingFactors: tuple = (),
-        localCsys: str | None = None,
+        localCsys: DatumCsys | None = None,
         description: str = "",
     ):
         """This method creates an MappedField object.
@@ -227,6 +236,11 @@ class MappedField(AnalyticalField):
         AbaqusException
         """
         super().__init__()
+        self.name = name
+        self.setValues(regionType, partLevelData, pointDataFormat, gridPointPlane, defaultUnMappedValue,
+                       mappingAlgorithm, searchTolType, boundarySearchTol, neighborhoodSearchTol,
+                       negativeNormalSearchTol, positiveNormalSearchTol, scaleCoordinates, gridPointData,
+                       xyzPointData, coordinateScalingFactors, localCsys, description)  # fmt: skip
 
     @abaqus_method_doc
     def setValues(
@@ -246,7 +260,7 @@ class MappedField(AnalyticalField):
         gridPointData: tuple = (),
         xyzPointData: tuple = (),
         coordinateScalingFactors: tuple = (),
-        localCsys: str | None = None,
+        localCsys: DatumCsys | None = None,
         description: str = "",
     ):
         """This method modifies the MappedField object.
@@ -318,4 +332,62 @@ class MappedField(AnalyticalField):
         description
             A String specifying the description of the field. The default value is an empty string.
         """
-        ...
+        self.regionType = regionType
+        self.partLevelData = partLevelData
+        self.pointDataFormat = pointDataFormat
+        self.gridPointPlane = gridPointPlane
+        self.defaultUnMappedValue = defaultUnMappedValue
+        self.mappingAlgorithm = mappingAlgorithm
+        self.searchTolType = searchTolType
+        self.boundarySearchTol = boundarySearchTol
+        self.neighborhoodSearchTol = neighborhoodSearchTol
+        self.negativeNormalSearchTol = negativeNormalSearchTol
+        self.positiveNormalSearchTol = positiveNormalSearchTol
+        self.scaleCoordinates = scaleCoordinates
+        self.gridPointData = gridPointData
+        self.xyzPointData = xyzPointData
+        self.coordinateScalingFactors = tuple(coordinateScalingFactors) or (1.0, 1.0, 1.0)
+        self.localCsys = localCsys
+        self.description = description
+        self._mapper: PointCloudMapper | None = None
+
+    def _evaluate(self, coordinates: ndarray) -> ndarray:
+        """Map the point cloud onto the points.
+
+        The coordinates are transformed into **localCsys**, unless **partLevelData** is ON, and divided by the
+        **coordinateScalingFactors** if **scaleCoordinates** is ON. XYZ data are interpolated by inverse distance
+        weighting of the nearest source points within **neighborhoodSearchTol**, GRID data bilinearly in the grid
+        cell containing the projection of the point onto **gridPointPlane**; the first row of the grid holds the
+        coordinates along the first axis of the plane after a placeholder, every other row a coordinate along the
+        second axis followed by the values. Points without source data within the tolerance take the
+        **defaultUnMappedValue**. RELATIVE tolerances are fractions of the mean spacing of the source points.
+        The normal search tolerances of the SURFACE algorithm are not applied.
+        """
+        import numpy as np
+
+        from .CompiledExpression import VARIABLES, localVariables
+        from .PointCloudMapper import PointCloudMapper, interpolateGrid
+
+        if self.regionType != POINT:
+            raise TypeError(f"A MappedField with regionType={self.regionType} cannot be evaluated at points")
+        localCsys = None if self.partLevelData else self.localCsys
+        system = str(getattr(localCsys, "coordSysType", "CARTESIAN")) if localCsys is not None else "CARTESIAN"
+        variables = localVariables(coordinates, localCsys)
+        points = np.column_stack([variables[name] for name in VARIABLES[system]])
+        if self.scaleCoordinates:
+            points /= np.asarray(self.coordinateScalingFactors, dtype=np.float64)
+        default = float(self.defaultUnMappedValue)
+        if self.pointDataFormat == GRID:
+            rows = [tuple(row) for row in self.gridPointData]
+            first, second = np.asarray(rows[0][1:], dtype=np.float64), np.array([row[0] for row in rows[1:]])
+            table = np.array([row[1:] for row in rows[1:]], dtype=np.float64)
+            spacing = float(np.mean([np.ptp(first) / max(len(first) - 1, 1), np.ptp(second) / max(len(second) - 1, 1)]))
+            tolerance = self.boundarySearchTol * (spacing if self.searchTolType == RELATIVE else 1.0)
+            axes = {XYPLANE: [0, 1], XZPLANE: [0, 2]}.get(self.gridPointPlane, [1, 2])
+            return interpolateGrid(first, second, table, points[:, axes], tolerance, default)
+        mapper = self._mapper
+        if mapper is None:
+            data = np.asarray(self.xyzPointData, dtype=np.float64).reshape(len(self.xyzPointData), -1)
+            mapper = self._mapper = PointCloudMapper(data[:, :3], data[:, 3])
+        radius = self.neighborhoodSearchTol * (mapper.spacing if self.searchTolType == RELATIVE else 1.0)
+        return mapper.interpolate(points, radius=radius, default=default)
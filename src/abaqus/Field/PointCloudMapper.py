@@ -0,0 +1,433 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ..Mesh.ElementLocator import ElementLocator
+from ..Mesh.MeshArrays import MeshArrays
+
+#: The number of source points weighted at each target point by default.
+NUM_NEIGHBORS = 8
+
+#: The number of target points mapped at once by a worker.
+CHUNK_SIZE = 1 << 16
+
+#: The largest number of source points in a leaf of the search tree.
+LEAF_SIZE = 16
+
+#: The largest number of candidate source points compared with target points at once.
+MAX_CANDIDATES = 1 << 22
+
+# Bits of each coordinate in the Morton codes, three of them fit in an unsigned 64-bit Int
+_BITS = 21
+
+
+class PointCloudMapper:
+    """The PointCloudMapper object maps values given at a cloud of source points onto arbitrary target points.
+
+    The source points are sorted into a balanced k-d tree, built once per cloud: each node splits its points in two
+    halves along the axis of their largest extent, down to leaves of at most :data:`LEAF_SIZE` points, and the
+    bounding boxes of the nodes are kept level by level. The boxes adapt to the density of the cloud, they are small
+    where the points are dense, so the memory and time of a search do not depend on how clustered the cloud is. The
+    nearest neighbours of a batch of target points are found together: the tree is descended to the leaf of each
+    target, whose neighbourhood bounds the distance of the last neighbour, then descended again level by level
+    keeping the boxes within a ball around each target, enlarged until it holds enough points. The points of the
+    remaining leaves are the candidates, compared in batches of at most :data:`MAX_CANDIDATES` points and selected
+    with a single sort. The targets are processed in chunks distributed over a thread pool, the array operations
+    release the global interpreter lock.
+    """
+
+    #: An (S, 3) float array specifying the coordinates of the source points, in tree order.
+    points: np.ndarray
+
+    #: An (S, c) float array specifying the values at the source points, in tree order.
+    values: np.ndarray
+
+    #: A Float specifying the mean spacing of the source points, the edge of the cube or square holding one
+    #: point on average.
+    spacing: float = 1.0
+
+    #: An Int specifying the number of worker threads.
+    numWorkers: int = 1
+
+    def __init__(self, points, values, numWorkers: int | None = None):
+        """This method creates a PointCloudMapper object.
+
+        Parameters
+        ----------
+        points
+            An (S, 3) or (S, 2) array of Floats specifying the coordinates of the source points.
+        values
+            An (S,) or (S, c) array of Floats specifying the values at the source points.
+        numWorkers
+            An Int specifying the number of worker threads. The default is the number of CPUs.
+
+        Raises
+        ------
+        ValueError
+            If the numbers of points and values differ.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        points = points.reshape(len(points), -1)
+        if points.shape[1] < 3:
+            points = np.column_stack([points, np.zeros((len(points), 3 - points.shape[1]))])
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) != len(points):
+            raise ValueError(f"Expected {len(points)} source values, got {len(values)}")
+        self._shapeOfValues = values.shape[1:]
+        self.numWorkers = max(1, os.cpu_count() or 1) if numWorkers is None else max(1, numWorkers)
+
+        # Mean spacing over the dimensions spanned by the cloud
+        self._low = points.min(axis=0) if len(points) else np.zeros(3)
+        self._high = points.max(axis=0) if len(points) else np.zeros(3)
+        extent = self._high - self._low
+        spanned = extent[extent > 1e-12 * max(extent.max(initial=0.0), 1.0)]
+        if len(spanned) and len(points) > 1:
+            self.spacing = float((np.prod(spanned) / len(points)) ** (1.0 / len(spanned)))
+        else:
+            self.spacing = float(max(extent.max(initial=0.0), 1.0))
+        self._dimension = max(len(spanned), 1)
+        self._scale = (2**_BITS - 1) / max(float(extent.max(initial=0.0)), 1e-300)
+        # A balanced tree of 2**levels leaves of LEAF_SIZE / 2 to LEAF_SIZE points
+        levels = max(0, int(np.ceil(np.log2(max(len(points), 1) / LEAF_SIZE))))
+        order = _kdOrder(points, levels)
+        self.points, self.values = points[order], values.reshape(len(points), -1)[order]
+        self._columns = [np.ascontiguousarray(self.points[:, axis]) for axis in range(3)]
+        # Bounding boxes and numbers of points of the leaves, then of each level of the tree up to the root, node i
+        # having the children 2i and 2i + 1 on the level below
+        self._starts = (np.arange(2**levels) * len(points)) >> levels
+        self._lows: list[np.ndarray] = []
+        self._highs: list[np.ndarray] = []
+        self._counts: list[np.ndarray] = []
+        if len(points):
+            self._lows.append(np.minimum.reduceat(self.points, self._starts, axis=0))
+            self._highs.append(np.maximum.reduceat(self.points, self._starts, axis=0))
+            self._counts.append(np.diff(np.append(self._starts, len(points))))
+        while len(self._lows) and len(self._lows[-1]) > 1:
+            pairs = np.arange(0, len(self._lows[-1]), 2)
+            self._lows.append(np.minimum.reduceat(self._lows[-1], pairs, axis=0))
+            self._highs.append(np.maximum.reduceat(self._highs[-1], pairs, axis=0))
+            self._counts.append(np.add.reduceat(self._counts[-1], pairs))
+
+    def query(
+        self, targets, numNeighbors: int = NUM_NEIGHBORS, radius: float = np.inf
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the nearest source points of target points.
+
+        Parameters
+        ----------
+        targets
+            An (n, 3) or (n, 2) array of Floats specifying the coordinates of the target points.
+        numNeighbors
+            An Int specifying the number of neighbours to find.
+        radius
+            A Float specifying the largest distance of a neighbour. The default is no limit.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            An (n, k) float array of the distances of the neighbours of each target, in increasing order, and an
+            (n, k) int array of their indices in :attr:`points`. Missing neighbours have an infinite distance and
+            the index -1.
+        """
+        targets, order = self._targets(targets)
+        count = max(1, min(int(numNeighbors), len(self.points)))
+        distances = np.full((len(targets), count), np.inf)
+        indices = np.full((len(targets), count), -1, dtype=np.int64)
+
+        def work(start: int):
+            chunk = order[start : start + CHUNK_SIZE]
+            distances[chunk], indices[chunk] = self._query(targets[chunk], count, radius)
+
+        self._run(work, len(targets))
+        return distances, indices
+
+    def interpolate(
+        self,
+        targets,
+        numNeighbors: int = NUM_NEIGHBORS,
+        radius: float = np.inf,
+        power: float = 2.0,
+        default: float = 0.0,
+    ) -> np.ndarray:
+        """Interpolate the source values at target points by inverse distance weighting.
+
+        The value at a target point is the mean of the values of its nearest source points weighted by the inverse
+        of their distance to the power **power**, or the value of a source point at the same location.
+
+        Parameters
+        ----------
+        targets
+            An (n, 3) or (n, 2) array of Floats specifying the coordinates of the target points.
+        numNeighbors
+            An Int specifying the number of source points weighted at each target point.
+        radius
+            A Float specifying the largest distance of a weighted source point. The default is no limit.
+        power
+            A Float specifying the power of the inverse distance. The default value is 2.0.
+        default
+            A Float specifying the value of target points without any source point within **radius**.
+
+        Returns
+        -------
+        np.ndarray
+            An (n,) or (n, c) float array of the values at the target points.
+        """
+        targets, order = self._targets(targets)
+        count = max(1, min(int(numNeighbors), len(self.points)))
+        result = np.full((len(targets), self.values.shape[1]), float(default))
+
+        def work(start: int):
+            chunk = order[start : start + CHUNK_SIZE]
+            distances, indices = self._query(targets[chunk], count, radius)
+            with np.errstate(divide="ignore"):
+                weights = np.where(indices >= 0, distances ** -float(power), 0.0)
+            exact = distances[:, 0] == 0.0
+            weights[exact] = 0.0
+            weights[exact, 0] = 1.0
+            totals = weights.sum(axis=1)
+            found = totals > 0
+            neighbours = self.values[np.maximum(indices[found], 0)]
+            result[chunk[found]] = np.einsum("pk,pkc->pc", weights[found] / totals[found, None], neighbours)
+
+        self._run(work, len(targets))
+        return result.reshape((len(targets),) + self._shapeOfValues)
+
+    def _query(self, targets: np.ndarray, count: int, radius: float) -> tuple[np.ndarray, np.ndarray]:
+        """Find the neighbours of a chunk of targets, enlarging the search ball of the unresolved targets."""
+        distances = np.full((len(targets), count), np.inf)
+        indices = np.full((len(targets), count), -1, dtype=np.int64)
+        # Descend to the leaf closest to each target, the boxes containing the target by their centre. The smallest
+        # box on the way holding enough points gives the spacing of the source points near the target
+        nodes = np.zeros(len(targets), dtype=np.int64)
+        spacing = np.full(len(targets), self.spacing)
+        for level in range(len(self._lows) - 1, -1, -1):
+            if level < len(self._lows) - 1:
+                children = np.minimum(nodes[:, None] * 2 + np.arange(2), len(self._lows[level]) - 1)
+                low, high = self._lows[level][children], self._highs[level][children]
+                gaps = np.maximum(low - targets[:, None], 0.0) + np.maximum(targets[:, None] - high, 0.0)
+                gaps = (gaps * gaps).sum(axis=2)
+                centres = ((0.5 * (low + high) - targets[:, None]) ** 2).sum(axis=2)
+                closer = np.where(gaps[:, 0] == gaps[:, 1], centres[:, 1] < centres[:, 0], gaps[:, 1] < gaps[:, 0])
+                nodes = children[np.arange(len(targets)), closer.astype(np.int64)]
+            counts = self._counts[level][nodes]
+            extents = -np.sort(-(self._highs[level][nodes] - self._lows[level][nodes]), axis=1)[:, : self._dimension]
+            volumes = np.prod(extents, axis=1)
+            dense = (counts >= 2 * count) & (volumes > 0.0)
+            spacing[dense] = (volumes[dense] / counts[dense]) ** (1.0 / self._dimension)
+        # The count-th nearest of the source points in and next to that leaf bounds the distance of the last neighbour
+        window = min(2 * count, len(self.points))
+        first = np.clip(self._starts[nodes] + (self._counts[0][nodes] - window) // 2, 0, len(self.points) - window)
+        nearby = first[:, None] + np.arange(window)
+        squared = sum((column[nearby] - targets[:, axis, None]) ** 2 for axis, column in enumerate(self._columns))
+        limits = np.minimum(np.partition(squared, count - 1, axis=1)[:, count - 1] * (1.0 + 1e-9), radius * radius)
+        # Start with a ball reaching the leaf and the expected distance of the last neighbour at the local spacing,
+        # enlarged for the unresolved targets, which keeps the search local in clusters and next to them
+        low, high = self._lows[0][nodes], self._highs[0][nodes]
+        outside = np.linalg.norm(np.maximum(low - targets, 0.0) + np.maximum(targets - high, 0.0), axis=1)
+        ball = {1: 2.0, 2: np.pi, 3: 4.0 * np.pi / 3.0}[self._dimension]
+        reach = np.minimum((outside + 1.5 * spacing * (count / ball) ** (1.0 / self._dimension)) ** 2, limits)
+        pending = np.arange(len(targets))
+        while len(pending):
+            found, distances[pending], indices[pending] = self._search(targets[pending], reach[pending], count)
+            # All the points within the ball are found, the neighbours are exact once there are enough of them
+            done = (found >= count) | (reach[pending] >= limits[pending])
+            pending = pending[~done]
+            reach[pending] = np.minimum(4.0 * reach[pending], limits[pending])
+        return distances, indices
+
+    def _search(self, targets: np.ndarray, limits: np.ndarray, count: int) -> tuple:
+        """Return the number of source points within the squared distances **limits** of each target and the
+        distances and indices of the nearest of them."""
+        distances = np.full((len(targets), count), np.inf)
+        indices = np.full((len(targets), count), -1, dtype=np.int64)
+        found = np.zeros(len(targets), dtype=np.int64)
+        # Descend the tree keeping the boxes within the limit of each target, the pairs stay sorted by target
+        limits = limits.copy()
+        rows, nodes = np.arange(len(targets)), np.zeros(len(targets), dtype=np.int64)
+        for level in range(len(self._lows) - 1, -1, -1):
+            if level < len(self._lows) - 1:
+                rows, nodes = np.repeat(rows, 2), (nodes[:, None] * 2 + np.arange(2)).ravel()
+                exists = nodes < len(self._lows[level])
+                rows, nodes = rows[exists], nodes[exists]
+            point, low, high = targets[rows], self._lows[level][nodes], self._highs[level][nodes]
+            gap = np.maximum(low - point, 0.0) + np.maximum(point - high, 0.0)
+            inside = np.einsum("ij,ij->i", gap, gap) <= limits[rows]
+            rows, nodes, point, low, high = rows[inside], nodes[inside], point[inside], low[inside], high[inside]
+            # The farthest corner of a box holding at least count points bounds the distance of the last neighbour
+            full = self._counts[level][nodes] >= count
+            if full.any():
+                reach = np.maximum(np.abs(point[full] - low[full]), np.abs(point[full] - high[full]))
+                bounds = np.full(len(targets), np.inf)
+                np.minimum.at(bounds, rows[full], np.einsum("ij,ij->i", reach, reach) * (1.0 + 1e-9))
+                np.minimum(limits, bounds, out=limits)
+        # Compare the candidates in batches of whole targets
+        pointCounts = self._counts[0][nodes]
+        batches = np.cumsum(np.bincount(rows, weights=pointCounts, minlength=len(targets))) // MAX_CANDIDATES
+        bounds = np.searchsorted(rows, np.flatnonzero(np.diff(batches)) + 1)
+        for start, stop in zip(np.append(0, bounds), np.append(bounds, len(rows))):
+            # The points of every leaf, concatenated without a Python loop
+            counts = pointCounts[start:stop]
+            owners = np.repeat(rows[start:stop], counts)
+            offsets = self._starts[nodes[start:stop]] - np.cumsum(counts) + counts
+            candidates = np.arange(len(owners)) + np.repeat(offsets, counts)
+            squared = np.zeros(len(owners))
+            for axis, column in enumerate(self._columns):
+                difference = column[candidates] - targets[:, axis][owners]
+                squared += difference * difference
+            within = squared <= limits[owners]
+            owners, candidates, squared = owners[within], candidates[within], squared[within]
+            found += np.bincount(owners, minlength=len(targets))
+            # Rank the candidates of each target by distance with a single sort
+            order = np.lexsort((squared, owners))
+            owners, candidates, squared = owners[order], candidates[order], squared[order]
+            first = np.ones(len(owners), dtype=bool)
+            first[1:] = owners[1:] != owners[:-1]
+            starts = np.flatnonzero(first)
+            ranks = np.arange(len(owners)) - np.repeat(starts, np.diff(np.append(starts, len(owners))))
+            kept = ranks < count
+            distances[owners[kept], ranks[kept]] = np.sqrt(squared[kept])
+            indices[owners[kept], ranks[kept]] = candidates[kept]
+        return found, distances, indices
+
+    def _targets(self, targets) -> tuple[np.ndarray, np.ndarray]:
+        """Return the target coordinates as an (n, 3) float array and the order of the targets along a Morton curve,
+        which keeps the source points gathered for a chunk close in memory."""
+        targets = np.asarray(targets, dtype=np.float64)
+        targets = targets.reshape(-1, targets.shape[-1] if targets.ndim else 3)
+        if targets.shape[1] < 3:
+            targets = np.column_stack([targets, np.zeros((len(targets), 3 - targets.shape[1]))])
+        return targets, np.argsort(_morton(targets, self._low, self._scale), kind="stable")
+
+    def _run(self, work, count: int):
+        """Run **work** for the start of every chunk of **count** targets, over the thread pool."""
+        starts = range(0, count, CHUNK_SIZE) if len(self.points) else range(0)
+        if self.numWorkers == 1 or len(starts) < 2:
+            for start in starts:
+                work(start)
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.numWorkers, len(starts))) as executor:
+                list(executor.map(work, starts))
+
+
+def _morton(points: np.ndarray, low: np.ndarray, scale) -> np.ndarray:
+    """Return the Morton codes of points, interleaving the bits of their coordinates scaled from **low**."""
+    quantized = np.clip((points - low) * scale, 0, 2**_BITS - 1).astype(np.uint64)
+    codes = np.zeros(len(points), dtype=np.uint64)
+    for axis in range(3):
+        bits = quantized[:, axis]
+        for shift, mask in ((32, 0x1F00000000FFFF), (16, 0x1F0000FF0000FF), (8, 0x100F00F00F00F00F),
+                            (4, 0x10C30C30C30C30C3), (2, 0x1249249249249249)):  # fmt: skip
+            bits = (bits | (bits << np.uint64(shift))) & np.uint64(mask)
+        codes |= bits << np.uint64(axis)
+    return codes
+
+
+def _kdOrder(points: np.ndarray, levels: int) -> np.ndarray:
+    """Return the order of points in a balanced k-d tree of 2**levels leaves. The nodes of each level are the
+    ranges of positions starting at (i * S) >> level, each split at its middle after sorting its points along the
+    axis of their largest extent."""
+    order = np.arange(len(points))
+    for level in range(levels):
+        starts = (np.arange(2**level) * len(points)) >> level
+        lengths = np.diff(np.append(starts, len(points)))
+        ordered = points[order]
+        low = np.minimum.reduceat(ordered, starts, axis=0)
+        extent = np.maximum.reduceat(ordered, starts, axis=0) - low
+        axes = np.argmax(extent, axis=1)
+        # Sort by node, then by the coordinate scaled to [0, 0.5] within the node, with a single float key
+        nodes = np.repeat(np.arange(2**level), lengths)
+        columns = axes[nodes]
+        scales = np.divide(
+            0.5, extent[np.arange(len(starts)), axes], out=np.zeros(len(starts)), where=extent.max(1) > 0
+        )
+        keys = nodes + (ordered[np.arange(len(points)), columns] - low[nodes, columns]) * scales[nodes]
+        order = order[np.argsort(keys)]
+    return order
+
+
+def interpolateGrid(first, second, table, points, tolerance: float = 0.0, default: float = 0.0) -> np.ndarray:
+    """Interpolate values given on a rectangular grid at points in the plane of the grid.
+
+    The value at a point is interpolated bilinearly in the cell of the grid containing the point. Points outside
+    the grid by at most **tolerance** take the value at the closest point of the grid.
+
+    Parameters
+    ----------
+    first
+        An (a,) array of Floats specifying the increasing coordinates of the grid along the first axis.
+    second
+        A (b,) array of Floats specifying the increasing coordinates of the grid along the second axis.
+    table
+        A (b, a) array of Floats specifying the value at each grid point, row after row along the second axis.
+    points
+        An (n, 2) array of Floats specifying the coordinates of the points in the plane of the grid.
+    tolerance
+        A Float specifying the distance outside the grid within which points are mapped.
+    default
+        A Float specifying the value of points farther than **tolerance** outside the grid.
+
+    Returns
+    -------
+    np.ndarray
+        An (n,) float array of the values at the points.
+    """
+    first, second = np.asarray(first, dtype=np.float64), np.asarray(second, dtype=np.float64)
+    table = np.asarray(table, dtype=np.float64).reshape(len(second), len(first))
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    clamped = np.column_stack(
+        [np.clip(points[:, 0], first[0], first[-1]), np.clip(points[:, 1], second[0], second[-1])]
+    )
+    inside = np.linalg.norm(points - clamped, axis=1) <= tolerance
+    weights, cells = [], []
+    for axis, coordinates in enumerate((first, second)):
+        cell = np.clip(
+            np.searchsorted(coordinates, clamped[:, axis], side="right") - 1, 0, max(len(coordinates) - 2, 0)
+        )
+        following = np.minimum(cell + 1, len(coordinates) - 1)
+        length = coordinates[following] - coordinates[cell]
+        weights.append(
+            np.divide(clamped[:, axis] - coordinates[cell], length, out=np.zeros(len(points)), where=length > 0)
+        )
+        cells.append((cell, following))
+    (i, i1), (j, j1), (u, v) = cells[0], cells[1], weights
+    values = (
+        (1 - u) * (1 - v) * table[j, i]
+        + u * (1 - v) * table[j, i1]
+        + (1 - u) * v * table[j1, i]
+        + u * v * table[j1, i1]
+    )
+    return np.where(inside, values, float(default))
+
+
+def interpolateMesh(mesh: MeshArrays, values, targets, tolerance: float = 0.0, default: float = 0.0) -> np.ndarray:
+    """Interpolate values given at the nodes of a source mesh at target points, with the shape functions of the
+    source element containing each point.
+
+    Parameters
+    ----------
+    mesh
+        A MeshArrays object specifying the source mesh.
+    values
+        An (N,) or (N, c) array of Floats specifying the values at the nodes of the source mesh.
+    targets
+        An (n, 3) array of Floats specifying the coordinates of the target points.
+    tolerance
+        A Float specifying the distance outside the source mesh within which points are projected onto the closest
+        element.
+    default
+        A Float specifying the value of target points outside the source mesh.
+
+    Returns
+    -------
+    np.ndarray
+        An (n,) or (n, c) float array of the values at the target points.
+    """
+    locator = ElementLocator(mesh)
+    result = np.empty((len(targets),) + np.shape(values)[1:])
+    for start in range(0, len(targets), CHUNK_SIZE):
+        elements, natural = locator.locate(np.asarray(targets[start : start + CHUNK_SIZE]), tolerance)
+        result[start : start + CHUNK_SIZE] = locator.interpolate(elements, natural, values)
+    return np.where(np.isnan(result), float(default), result)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+from ..UtilityAndView.abaqusConstants import NODAL, SymbolicConstant
+
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
+    from ..Odb.FieldBulkData import FieldBulkData
+
+
+class FieldReportBlock:
+    """The FieldReportBlock object stores the values of one field output variable of one part instance in one
+    frame column by column. FieldReportBlock objects are the unit of work of the
+    :class:`~abaqus.FieldReport.FieldReportWriter.FieldReportWriter`, blocks are formatted independently and the
+    formatted chunks are concatenated in the order of the blocks.
+    """
+
+    #: A String specifying the name of the output variable.
+    variable: str = ""
+
+    #: A String specifying the name of the part instance to which the labels belong.
+    instanceName: str = ""
+
+    #: A String specifying the name of the step.
+    stepName: str = ""
+
+    #: A String specifying the description of the frame.
+    frameDescription: str = ""
+
+    #: A SymbolicConstant specifying the position of the output, NODAL for node labels, any other position
+    #: for element labels.
+    position: SymbolicConstant = NODAL
+
+    #: An (n,) int array specifying the node or element labels of the rows.
+    labels: ndarray
+
+    #: A sequence of Strings specifying the component labels of the columns of **data**.
+    componentLabels: tuple = ()
+
+    #: An (n, c) float array specifying the values of each component at each row.
+    data: ndarray
+
+    def __init__(
+        self,
+        variable: str,
+        labels: Sequence[int] | ndarray,
+        data: Sequence[Sequence[float]] | ndarray,
+        componentLabels: Sequence[str] = (),
+        instanceName: str = "",
+        stepName: str = "",
+        frameDescription: str = "",
+        position: SymbolicConstant = NODAL,
+    ):
+        """This method creates a FieldReportBlock object.
+
+        Parameters
+        ----------
+        variable
+            A String specifying the name of the output variable.
+        labels
+            A sequence of Ints specifying the node or element label of each row.
+        data
+            A sequence of sequences of Floats specifying the values of each component at each row. Scalar
+            data can be given as a flat sequence.
+        componentLabels
+            A sequence of Strings specifying the component labels. The default is an empty sequence, which
+            reports the columns under the name of the variable.
+        instanceName
+            A String specifying the name of the part instance.
+        stepName
+            A String specifying the name of the step.
+        frameDescription
+            A String specifying the description of the frame.
+        position
+            A SymbolicConstant specifying the position of the output. The default value is NODAL.
+
+        Raises
+        ------
+        ValueError
+            If the number of labels and rows of data differ.
+        """
+        import numpy as np
+
+        self.variable, self.instanceName, self.position = str(variable), str(instanceName), position
+        self.stepName, self.frameDescription = str(stepName), str(frameDescription)
+        self.labels = np.asarray(labels, dtype=np.int64).reshape(-1)
+        self.data = np.asarray(data, dtype=np.float64).reshape(len(self.labels), -1)
+        self.componentLabels = tuple(componentLabels)
+        if self.componentLabels and len(self.componentLabels) != self.data.shape[1]:
+            raise ValueError(f"Expected {self.data.shape[1]} component labels, got {len(self.componentLabels)}")
+
+    @classmethod
+    def fromBulkData(
+        cls, bulkData: FieldBulkData, variable: str, stepName: str = "", frameDescription: str = ""
+    ) -> FieldReportBlock:
+        """Create a FieldReportBlock from a FieldBulkData object of a FieldOutput."""
+        position = bulkData.position
+        labels = bulkData.nodeLabels if position == NODAL else bulkData.elementLabels
+        return cls(variable, labels, bulkData.data, bulkData.componentLabels,
+                   getattr(bulkData.instance, "name", ""), stepName, frameDescription, position)  # fmt: skip
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """The headers of the value columns, such as ``U.U1``."""
+        if not self.componentLabels:
+            return (
+                (self.variable,)
+                if self.data.shape[1] == 1
+                else tuple(f"{self.variable}.{i + 1}" for i in range(self.data.shape[1]))
+            )
+        return tuple(f"{self.variable}.{label}" for label in self.componentLabels)
+
+    @property
+    def labelName(self) -> str:
+        """The header of the label column."""
+        return "Node Label" if self.position == NODAL else "Element Label"
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -7,10 +9,12 @@ from ..UtilityAndView.abaqusConstants import (
     ASCENDING,
     ENGINEERING,
     NO_LIMIT,
+    NORMAL_ANNOTATED,
     OFF,
     ON,
     SINGLE_TABLE,
     Boolean,
+    SymbolicConstant,
 )
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 
@@ -32,20 +36,59 @@ class FieldReportOptions:
     #: Format of the number
     numberFormat: NumberFormat = NumberFormat()
 
+    #: An Int specifying the number of columns to display for the tabular report. The default
+    #: value is 80.
+    numColumns: int = 80
+
+    #: A Boolean specifying whether to include **X - Y** data values in the tabular report. The
+    #: default value is ON.
+    printXYData: Boolean = ON
+
+    #: A Boolean specifying whether to include column totals in the tabular report. The default
+    #: value is ON.
+    printTotal: Boolean = ON
+
+    #: A Boolean specifying whether to include column summary minimum and maximum values in the
+    #: tabular report. The default value is ON.
+    printMinMax: Boolean = ON
+
+    #: A SymbolicConstant specifying how the width of the tabular report is to be determined.
+    #: Possible values are NO_LIMIT and SPECIFY. The default value is NO_LIMIT.
+    pageWidth: SymbolicConstant = NO_LIMIT
+
+    #: A SymbolicConstant specifying how values are to be presented in the tabular report.
+    #: Possible values are SINGLE_TABLE and SEPARATE_TABLES. The default value is SINGLE_TABLE.
+    columnLayout: SymbolicConstant = SINGLE_TABLE
+
+    #: A SymbolicConstant specifying the order in which values are to be sorted within a
+    #: tabular report. Possible values are ASCENDING and DESCENDING. The default value is
+    #: ASCENDING.
+    sort: SymbolicConstant = ASCENDING
+
+    #: A Boolean specifying whether to include the local coordinate system values in the
+    #: tabular report. The default value is OFF.
+    printLocalCSYS: Boolean = OFF
+
+    #: A SymbolicConstant specifying the format of the report. Possible values are
+    #: NORMAL_ANNOTATED and COMMA_SEPARATED_VALUES. The default value is NORMAL_ANNOTATED.
+    reportFormat: SymbolicConstant = NORMAL_ANNOTATED
+
     @abaqus_method_doc
     def setValues(
         self,
-        numColumns: int,
-        numberFormat: NumberFormat,
-        printXYData: Boolean = ON,
-        printTotal: Boolean = ON,
-        printMinMax: Boolean = ON,
-        pageWidth: Literal[C.SPECIFY, C.NO_LIMIT] = NO_LIMIT,
-        columnLayout: Literal[C.SINGLE_TABLE, C.SEPARATE_TABLES] = SINGLE_TABLE,
-        sort: Literal[C.ASCENDING, C.DESCENDING] = ASCENDING,
-        printLocalCSYS: Boolean = OFF,
+        numColumns: int | None = None,
+        numberFormat: NumberFormat | None = None,
+        printXYData: Boolean | None = None,
+        printTotal: Boolean | None = None,
+        printMinMax: Boolean | None = None,
+        pageWidth: Literal[C.SPECIFY, C.NO_LIMIT] | None = None,
+        columnLayout: Literal[C.SINGLE_TABLE, C.SEPARATE_TABLES] | None = None,
+        sort: Literal[C.ASCENDING, C.DESCENDING] | None = None,
+        printLocalCSYS: Boolean | None = None,
+        reportFormat: Literal[C.NORMAL_ANNOTATED, C.COMMA_SEPARATED_VALUES] | None = None,
     ):
-        """This method modifies the FieldReportOptions object.
+        """This method modifies the FieldReportOptions object. Only the arguments that are specified are
+        modified.
 
         Parameters
         ----------
@@ -80,13 +123,22 @@ class FieldReportOptions:
 
             .. versionadded:: 2022
                 The ``printLocalCSYS`` argument was added.
+        reportFormat
+            A SymbolicConstant specifying the format of the report. Possible values are
+            NORMAL_ANNOTATED and COMMA_SEPARATED_VALUES. The default value is NORMAL_ANNOTATED.
 
         Returns
         -------
         FieldReportOptions
             A FieldReportOptions object.
         """
-        ...
+        values = dict(numColumns=numColumns, numberFormat=numberFormat, printXYData=printXYData,
+                      printTotal=printTotal, printMinMax=printMinMax, pageWidth=pageWidth,
+                      columnLayout=columnLayout, sort=sort, printLocalCSYS=printLocalCSYS,
+                      reportFormat=reportFormat)  # fmt: skip
+        for key, value in values.items():
+            if value is not None:
+                setattr(self, key, value)
 
     @abaqus_method_doc
     def NumberFormat(
@@ -56,6 +56,10 @@ class FieldReportSession(SessionBase):
     ):
         """This method writes a FieldOutput object to a user-defined ASCII file.
 
+        The values are read from the **bulkDataBlocks** of the field outputs. The blocks of each part instance
+        and frame are formatted in a thread pool according to **fieldReportOptions**, the output is identical to
+        formatting them one after another.
+
         .. note::
             This function can be accessed by::
 
@@ -121,7 +125,10 @@ class FieldReportSession(SessionBase):
             from all active frames. Possible values are SPECIFY and ALL. The default value is
             SPECIFY.
         """
-        ...
+        from .FieldReportWriter import FieldReportWriter, fieldReportBlocks
+
+        blocks = fieldReportBlocks(odb, step, frame, variable, stepFrame)
+        FieldReportWriter(self.fieldReportOptions).write(filename, blocks, bool(append), sortItem)
 
     @abaqus_method_doc
     def writeFreeBodyReport(
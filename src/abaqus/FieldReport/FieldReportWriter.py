@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Sequence
+
+import numpy as np
+
+from ..UtilityAndView.abaqusConstants import (
+    ALL,
+    AUTOMATIC,
+    COMMA_SEPARATED_VALUES,
+    COMPONENT,
+    DESCENDING,
+    ENGINEERING,
+    NODAL,
+    ON,
+    SPECIFY,
+)
+from .FieldReportBlock import FieldReportBlock
+from .FieldReportOptions import FieldReportOptions
+
+_SPACE, _MINUS, _PLUS, _POINT, _E, _ZERO = (ord(char) for char in " -+.E0")
+
+
+class FieldReportWriter:
+    """The FieldReportWriter object writes FieldReportBlock objects to an ASCII report file.
+
+    Each block is formatted on its own: numeric columns are converted to fixed-width byte matrices with array
+    operations and the rows of a block are emitted with a single ``tobytes`` call. Blocks are distributed over a
+    thread or process pool and the formatted chunks are written in the order of the blocks, so the output of the
+    parallel mode is byte-identical to the serial mode.
+    """
+
+    #: A FieldReportOptions object specifying the number format, summaries, sort order and report format.
+    options: FieldReportOptions
+
+    #: An Int specifying the number of workers, 1 formats the blocks serially.
+    numWorkers: int = 1
+
+    #: A Boolean specifying whether to use a process pool instead of a thread pool.
+    useProcesses: bool = False
+
+    def __init__(
+        self, options: FieldReportOptions | None = None, numWorkers: int | None = None, useProcesses: bool = False
+    ):
+        """This method creates a FieldReportWriter object.
+
+        Parameters
+        ----------
+        options
+            A FieldReportOptions object. The default is a FieldReportOptions object with default values.
+        numWorkers
+            An Int specifying the number of workers. The default is the number of CPUs.
+        useProcesses
+            A Boolean specifying whether to format the blocks in a process pool instead of a thread pool. The
+            default value is False.
+        """
+        self.options = FieldReportOptions() if options is None else options
+        self.numWorkers = max(1, os.cpu_count() or 1) if numWorkers is None else max(1, numWorkers)
+        self.useProcesses = useProcesses
+
+    def format(self, blocks: Sequence[FieldReportBlock], sortItem: str = "") -> list[bytes]:
+        """Format the blocks into report chunks.
+
+        Parameters
+        ----------
+        blocks
+            A sequence of FieldReportBlock objects.
+        sortItem
+            A String specifying the column header by which to sort the rows of each block. The default is to
+            sort by label.
+
+        Returns
+        -------
+        list[bytes]
+            The formatted chunk of each block, in the order of the blocks.
+        """
+        settings = _settings(self.options, sortItem)
+        if self.numWorkers == 1 or len(blocks) < 2:
+            return [_formatBlock(block, settings) for block in blocks]
+        numWorkers = min(self.numWorkers, len(blocks))
+        executor: Executor
+        if self.useProcesses:
+            executor = ProcessPoolExecutor(max_workers=numWorkers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=numWorkers)
+        with executor:
+            return list(executor.map(_formatBlock, blocks, [settings] * len(blocks)))
+
+    def write(self, filename: str, blocks: Sequence[FieldReportBlock], append: bool = True, sortItem: str = ""):
+        """Write the blocks to a report file.
+
+        Parameters
+        ----------
+        filename
+            A String specifying the name of the file to which field output will be written.
+        blocks
+            A sequence of FieldReportBlock objects.
+        append
+            A Boolean specifying whether to append the field output to an existing file. The default value is
+            True.
+        sortItem
+            A String specifying the column header by which to sort the rows of each block.
+        """
+        chunks = self.format(blocks, sortItem)
+        with open(filename, "ab" if append else "wb") as file:
+            file.writelines(chunks)
+
+
+def _settings(options: FieldReportOptions, sortItem: str) -> dict:
+    """Collect the options used to format a block into a picklable dictionary."""
+    numberFormat = options.numberFormat
+    return dict(
+        csv=getattr(options, "reportFormat", None) == COMMA_SEPARATED_VALUES,
+        format=str(numberFormat.format),
+        numDigits=max(1, int(numberFormat.numDigits)),
+        precision=int(numberFormat.precision),
+        blankPad=bool(numberFormat.blankPad),
+        printTotal=bool(getattr(options, "printTotal", ON)),
+        printMinMax=bool(getattr(options, "printMinMax", ON)),
+        descending=getattr(options, "sort", None) == DESCENDING,
+        sortItem=sortItem,
+    )
+
+
+def _formatBlock(block: FieldReportBlock, settings: dict) -> bytes:
+    """Format one block into a chunk of the report."""
+    labels, data, columns = block.labels, block.data, block.columns
+    if settings["precision"] > 0:
+        data = np.round(data, settings["precision"])
+    headers = (block.labelName,) + columns
+    sortItem = settings["sortItem"]
+    key = data[:, columns.index(sortItem)] if sortItem in columns else labels
+    order = np.argsort(-key if settings["descending"] else key, kind="stable")
+    labels, data = labels[order], data[order]
+
+    numbers = dict(numDigits=settings["numDigits"], format=settings["format"])
+    fields = [formatIntegers(labels)] + [formatFloats(data[:, i], **numbers) for i in range(data.shape[1])]
+    if settings["csv"]:
+        header = ",".join(headers) + "\n"
+        rows = _joinRows(fields, b",", strip=True)
+        return header.encode() + rows
+
+    widths = [max(field.shape[1], len(name)) + 3 for field, name in zip(fields, headers)]
+    fields = [_pad(field, width) for field, width in zip(fields, widths)]
+    lines = [
+        "",
+        f"Field Output reported at {'nodes' if block.position == NODAL else 'elements'} "
+        f"for part: {block.instanceName}",
+    ]
+    lines += [f"Step: {block.stepName}"] if block.stepName else []
+    lines += [f"Frame: {block.frameDescription}"] if block.frameDescription else []
+    lines += ["", "".join(name.rjust(width) for name, width in zip(headers, widths)), "-" * sum(widths)]
+    text = "\n".join(lines).encode() + b"\n" + _joinRows(fields, b"")
+    if len(labels) and (settings["printMinMax"] or settings["printTotal"]):
+        text += b"\n" + _summary(labels, data, widths, numbers, settings, block.labelName.split()[0])
+    return text
+
+
+def _summary(labels, data, widths, numbers, settings, item: str) -> bytes:
+    """Format the minimum, maximum and total rows of a block."""
+    rows = []
+    if settings["printMinMax"]:
+        for name, index in (("Minimum", data.argmin(axis=0)), ("Maximum", data.argmax(axis=0))):
+            values = formatFloats(data[index, np.arange(data.shape[1])], **numbers)
+            at = formatIntegers(labels[index])
+            rows.append(name.ljust(widths[0]).encode() + _joinCells(values, widths[1:]))
+            rows.append(f"At {item}".rjust(widths[0]).encode() + _joinCells(at, widths[1:]))
+            rows.append(b"")
+    if settings["printTotal"]:
+        rows.append("Total".ljust(widths[0]).encode() + _joinCells(formatFloats(data.sum(axis=0), **numbers),
+                                                                   widths[1:]))  # fmt: skip
+    return b"\n".join(rows) + b"\n"
+
+
+def _joinCells(field: np.ndarray, widths: Sequence[int]) -> bytes:
+    """Join the cells of one formatted column as a single line, one cell per width."""
+    return b"".join(bytes(cell).strip().rjust(width) for cell, width in zip(field, widths))
+
+
+def _pad(field: np.ndarray, width: int) -> np.ndarray:
+    """Right-justify a formatted column to **width** characters."""
+    padding = np.full((len(field), width - field.shape[1]), _SPACE, dtype=np.uint8)
+    return np.hstack([padding, field])
+
+
+def _joinRows(fields: list[np.ndarray], separator: bytes, strip: bool = False) -> bytes:
+    """Join formatted columns into lines, optionally dropping the blank padding of each field."""
+    if not len(fields[0]):
+        return b""
+    parts = []
+    for i, field in enumerate(fields):
+        if i and separator:
+            parts.append(np.full((len(field), len(separator)), separator[0], dtype=np.uint8))
+        parts.append(field)
+    parts.append(np.full((len(fields[0]), 1), ord("\n"), dtype=np.uint8))
+    rows = np.hstack(parts)
+    return (rows[rows != _SPACE] if strip else rows).tobytes()
+
+
+def _digits(values: np.ndarray, count: int) -> np.ndarray:
+    """Return the last **count** decimal digits of non-negative integers as an (n, count) ASCII matrix."""
+    remainder = values.astype(np.uint32 if count <= 9 else np.uint64)
+    digits = np.empty((len(values), count), dtype=np.uint8)
+    for column in range(count - 1, -1, -1):
+        remainder, digit = np.divmod(remainder, 10)
+        digits[:, column] = digit
+    return digits + np.uint8(_ZERO)
+
+
+def _shift(values: np.ndarray, powers: np.ndarray) -> np.ndarray:
+    """Return **values** / 10 ** **powers** in two steps, so that the powers of ten of denormal and huge values
+    neither underflow nor overflow."""
+    half = np.floor_divide(powers, 2)
+    return values / 10.0 ** half.astype(np.float64) / 10.0 ** (powers - half).astype(np.float64)
+
+
+def formatIntegers(values: np.ndarray) -> np.ndarray:
+    """Format an array of integers as a right-justified byte matrix.
+
+    Parameters
+    ----------
+    values
+        An (n,) array of Ints.
+
+    Returns
+    -------
+    np.ndarray
+        An (n, w) uint8 array, each row is the ASCII representation of a value.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    magnitude = np.abs(values)
+    numDigits = len(str(int(magnitude.max()))) if len(values) else 1
+    powers = 10 ** np.arange(numDigits - 1, -1, -1, dtype=np.int64)
+    digits = _digits(magnitude, numDigits)
+    # Blank the leading zeros, keeping at least one digit
+    leading = (magnitude[:, None] < powers) & (powers > 1)
+    digits = np.where(leading, _SPACE, digits).astype(np.uint8)
+    sign = np.where(values < 0, _MINUS, _SPACE).astype(np.uint8)
+    # Move the minus sign next to the first digit
+    position = leading.sum(axis=1) - 1
+    rows = np.flatnonzero((values < 0) & (position >= 0))
+    digits[rows, position[rows]] = _MINUS
+    sign[rows] = _SPACE
+    return np.column_stack([sign, digits])
+
+
+def formatFloats(values: np.ndarray, numDigits: int = 6, format: str = "ENGINEERING") -> np.ndarray:
+    """Format an array of floats as a right-justified byte matrix according to a NumberFormat.
+
+    Parameters
+    ----------
+    values
+        An (n,) array of Floats.
+    numDigits
+        An Int specifying the number of significant digits.
+    format
+        A String specifying the formatting type, SCIENTIFIC, ENGINEERING or AUTOMATIC. ENGINEERING uses
+        exponents that are multiples of three, AUTOMATIC uses positional notation for exponents from -4 to
+        **numDigits** - 1.
+
+    Returns
+    -------
+    np.ndarray
+        An (n, w) uint8 array, each row is the ASCII representation of a value.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = np.where(np.isfinite(values), values, 0.0)
+    magnitude = np.abs(values)
+    nonzero = magnitude > 0
+    exponent = np.where(nonzero, np.floor(np.log10(np.where(nonzero, magnitude, 1.0))), 0).astype(np.int64)
+    mantissa = np.rint(_shift(magnitude, exponent - numDigits + 1)).astype(np.int64)
+    # Correct the exponent when rounding or log10 crossed a power of ten
+    upper, lower = 10**numDigits, 10 ** (numDigits - 1)
+    carry = mantissa >= upper
+    mantissa, exponent = np.where(carry, mantissa // 10, mantissa), exponent + carry
+    borrow = nonzero & (mantissa < lower)
+    mantissa = np.where(borrow, np.rint(_shift(magnitude, exponent - numDigits)), mantissa)
+    mantissa, exponent = mantissa.astype(np.int64), exponent - borrow
+    # The scaled value is inexact, round the values close to halfway between two mantissas as printf does
+    scaled = _shift(magnitude, exponent - numDigits + 1)
+    fraction = np.abs(scaled - np.floor(scaled) - 0.5)
+    for row in np.flatnonzero(nonzero & (fraction < 1e-6 + 1e-15 * scaled)):
+        text, power = ("%.*E" % (numDigits - 1, magnitude[row])).split("E")
+        mantissa[row], exponent[row] = int(text.replace(".", "")), int(power)
+
+    # Number of digits before the decimal point and exponent printed for each value
+    if format == str(ENGINEERING):
+        shown = np.floor_divide(exponent, 3) * 3
+        point, printExponent = exponent - shown + 1, np.ones(len(values), dtype=bool)
+    elif format == str(AUTOMATIC):
+        positional = (exponent >= -4) & (exponent < numDigits)
+        shown = np.where(positional, 0, exponent)
+        point, printExponent = np.where(positional, exponent + 1, 1), ~positional
+    else:
+        shown, point, printExponent = exponent, np.ones(len(values), dtype=np.int64), np.ones(len(values), dtype=bool)
+
+    digits = _digits(mantissa, numDigits)
+    exponentChars = _digits(np.abs(shown), 3)
+    exponentSign = np.where(shown < 0, _MINUS, _PLUS).astype(np.uint8)[:, None]
+
+    # Rows sharing the sign, decimal point position and exponent width share the same layout, each layout is
+    # assembled with a few slice operations over all of its rows
+    exponentDigits = np.where(printExponent, np.where(np.abs(shown) >= 100, 3, 2), 0)
+    negative = (values < 0).astype(np.int64)
+    offset = int(point.min(initial=0))
+    key = (negative * 4 + exponentDigits) * (numDigits + 2 - offset) + (point - offset)
+    layouts, inverse = np.unique(key, return_inverse=True)
+    groups = np.split(np.argsort(inverse, kind="stable"), np.cumsum(np.bincount(inverse.reshape(-1)))[:-1])
+    chunks = []
+    for rows in groups if len(values) else ():
+        row = rows[0]
+        sign, pointAt, numExponent = negative[row], int(point[row]), int(exponentDigits[row])
+        size = len(rows)
+        parts = [np.full((size, 1), _MINUS, dtype=np.uint8)] if sign else []
+        zeros = np.full((size, max(abs(pointAt), pointAt - numDigits, 1)), _ZERO, dtype=np.uint8)
+        if pointAt <= 0:
+            parts += [zeros[:, :1], np.full((size, 1), _POINT, dtype=np.uint8), zeros[:, :-pointAt], digits[rows]]
+        elif pointAt < numDigits:
+            parts += [digits[rows, :pointAt], np.full((size, 1), _POINT, dtype=np.uint8), digits[rows, pointAt:]]
+        else:
+            parts += [digits[rows], zeros[:, : pointAt - numDigits]]
+        if numExponent:
+            parts += [
+                np.full((size, 1), _E, dtype=np.uint8),
+                exponentSign[rows],
+                exponentChars[rows, 3 - numExponent :],
+            ]
+        chunks.append((rows, np.hstack(parts)))
+
+    width = max((chunk.shape[1] for _, chunk in chunks), default=1)
+    out = np.full((len(values), width), _SPACE, dtype=np.uint8)
+    for rows, chunk in chunks:
+        out[rows, width - chunk.shape[1] :] = chunk
+    return out
+
+
+def fieldReportBlocks(odb, step: int, frame: int, variable: Sequence, stepFrame=SPECIFY) -> list[FieldReportBlock]:
+    """Collect the FieldReportBlock objects requested by ``writeFieldReport`` from the bulk data of an Odb.
+
+    One block is created per frame, variable and FieldBulkData object, that is per part instance and element
+    class, in the order of the frames, the variables and the bulk data blocks.
+
+    Parameters
+    ----------
+    odb
+        An Odb object from which to obtain field output values.
+    step
+        An Int specifying the index of the step.
+    frame
+        An Int specifying the index of the frame, ignored if **stepFrame** = ALL.
+    variable
+        A sequence of variable description sequences as accepted by ``writeFieldReport``. COMPONENT refinements
+        select columns, the INVARIANT refinements Magnitude and Mises are computed from the components.
+    stepFrame
+        A SymbolicConstant indicating whether to obtain the values from the specified frame or from all frames.
+
+    Returns
+    -------
+    list[FieldReportBlock]
+        A list of FieldReportBlock objects.
+    """
+    stepName, odbStep = list(odb.steps.items())[step]
+    frames = list(odbStep.frames) if stepFrame == ALL else [odbStep.frames[frame]]
+    blocks = []
+    for odbFrame in frames:
+        for description in variable:
+            name, refinements = description[0], description[2] if len(description) > 2 else ()
+            fieldOutput = odbFrame.fieldOutputs[name]
+            for bulkData in getattr(fieldOutput, "bulkDataBlocks", ()):
+                block = FieldReportBlock.fromBulkData(bulkData, name, stepName, odbFrame.description)
+                blocks.append(refineBlock(block, refinements) if refinements else block)
+    return blocks
+
+
+def refineBlock(block: FieldReportBlock, refinements: Sequence) -> FieldReportBlock:
+    """Select the components and compute the invariants requested by the refinements of a variable."""
+    labels, columns = list(block.componentLabels), []
+    for refinement, item in refinements:
+        if refinement == COMPONENT:
+            columns.append((item, block.data[:, labels.index(item)]))
+        elif str(item).upper() == "MAGNITUDE":
+            columns.append((item, np.sqrt(np.square(block.data).sum(axis=1))))
+        elif str(item).upper() == "MISES":
+            s = np.zeros((len(block.data), 6))
+            s[:, : min(6, block.data.shape[1])] = block.data[:, :6]
+            normal = np.square(s[:, 0] - s[:, 1]) + np.square(s[:, 1] - s[:, 2]) + np.square(s[:, 2] - s[:, 0])
+            columns.append((item, np.sqrt(0.5 * normal + 3.0 * np.square(s[:, 3:]).sum(axis=1))))
+        else:
+            raise ValueError(f"Invariant {item} is not supported")
+    data = np.column_stack([values for _, values in columns])
+    return FieldReportBlock(block.variable, block.labels, data, [item for item, _ in columns], block.instanceName,
+                            block.stepName, block.frameDescription, block.position)  # fmt: skip
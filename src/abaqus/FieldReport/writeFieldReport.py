@@ -93,4 +93,7 @@ def writeFieldReport(
         from all active frames. Possible values are SPECIFY and ALL. The default value is
         SPECIFY.
     """
-    ...
+    from abaqus import session
+
+    session.writeFieldReport(filename, append, sortItem, odb, step, frame, outputPosition, displayGroup, variable,
+                             numericForm, complexAngle, stepFrame)  # fmt: skip
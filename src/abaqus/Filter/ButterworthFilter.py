@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -8,6 +10,9 @@ from ..UtilityAndView.abaqusConstants import NONE, OFF, Boolean, SymbolicConstan
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Filter import Filter
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
 
 @abaqus_class_doc
 class ButterworthFilter(Filter):
@@ -113,17 +118,24 @@ class ButterworthFilter(Filter):
         RangeError
         """
         super().__init__()
+        self.name = name
+        self.cutoffFrequency = cutoffFrequency
+        self.order = order
+        self.operation = operation
+        self.halt = halt
+        self.limit = limit
+        self.invariant = invariant
 
     @abaqus_method_doc
     def setValues(
         self,
-        order: int = 2,
-        operation: Literal[C.MIN, C.MAX, C.NONE, C.ABS] = NONE,
-        halt: Boolean = OFF,
+        order: int | None = None,
+        operation: Literal[C.MIN, C.MAX, C.NONE, C.ABS] | None = None,
+        halt: Boolean | None = None,
         limit: float | None = None,
-        invariant: Literal[C.FIRST, C.SECOND, C.NONE] = NONE,
+        invariant: Literal[C.FIRST, C.SECOND, C.NONE] | None = None,
     ):
-        """This method modifies the ButterworthFilter object.
+        """This method modifies the ButterworthFilter object. Only the arguments that are specified are modified.
 
         Parameters
         ----------
@@ -149,4 +161,12 @@ class ButterworthFilter(Filter):
         ------
         RangeError
         """
-        ...
+        values = dict(order=order, operation=operation, halt=halt, limit=limit, invariant=invariant)
+        for key, value in values.items():
+            if value is not None:
+                setattr(self, key, value)
+
+    def sections(self, samplingFrequency: float) -> ndarray:
+        from .digitalFilters import butterworthSections
+
+        return butterworthSections(self.order, self.cutoffFrequency, samplingFrequency)
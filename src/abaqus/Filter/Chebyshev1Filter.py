@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
@@ -8,6 +10,9 @@ from ..UtilityAndView.abaqusConstants import NONE, OFF, Boolean, SymbolicConstan
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Filter import Filter
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
 
 @abaqus_class_doc
 class Chebyshev1Filter(Filter):
@@ -121,18 +126,26 @@ class Chebyshev1Filter(Filter):
         RangeError
         """
         super().__init__()
+        self.name = name
+        self.cutoffFrequency = cutoffFrequency
+        self.rippleFactor = rippleFactor
+        self.order = order
+        self.operation = operation
+        self.halt = halt
+        self.limit = limit
+        self.invariant = invariant
 
     @abaqus_method_doc
     def setValues(
         self,
-        rippleFactor: float = 0,
-        order: int = 2,
-        operation: Literal[C.MIN, C.MAX, C.NONE, C.ABS] = NONE,
-        halt: Boolean = OFF,
+        rippleFactor: float | None = None,
+        order: int | None = None,
+        operation: Literal[C.MIN, C.MAX, C.NONE, C.ABS] | None = None,
+        halt: Boolean | None = None,
         limit: float | None = None,
-        invariant: Literal[C.FIRST, C.SECOND, C.NONE] = NONE,
+        invariant: Literal[C.FIRST, C.SECOND, C.NONE] | None = None,
     ):
-        """This method modifies the Chebyshev1Filter object.
+        """This method modifies the Chebyshev1Filter object. Only the arguments that are specified are modified.
 
         Parameters
         ----------
@@ -161,4 +174,14 @@ class Chebyshev1Filter(Filter):
         ------
         RangeError
         """
-        ...
+        values = dict(
+            rippleFactor=rippleFactor, order=order, operation=operation, halt=halt, limit=limit, invariant=invariant
+        )
+        for key, value in values.items():
+            if value is not None:
+                setattr(self, key, value)
+
+    def sections(self, samplingFrequency: float) -> ndarray:
+        from .digitalFilters import chebyshev1Sections
+
+        return chebyshev1Sections(self.order, self.cutoffFrequency, samplingFrequency, self.rippleFactor or 0.225)
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Sequence
+
 from abqpy.decorators import abaqus_class_doc
 
 from ..UtilityAndView.abaqusConstants import NONE, OFF, Boolean, SymbolicConstant
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
 
 @abaqus_class_doc
 class Filter:
@@ -48,3 +53,115 @@ class Filter:
     #: A SymbolicConstant specifying the invariant to which filtering is applied. Possible
     #: values are NONE, FIRST, and SECOND. The default value is NONE.
     invariant: SymbolicConstant = NONE
+
+    def sections(self, samplingFrequency: float) -> ndarray:
+        """This method returns the second-order sections of the digital filter at the given sampling frequency.
+
+        Parameters
+        ----------
+        samplingFrequency
+            A Float specifying the sampling frequency of the signals.
+
+        Returns
+        -------
+        ndarray
+            An (n, 6) array with one row (b0, b1, b2, 1, a1, a2) per section. The array is empty if the filter
+            only applies an operation.
+        """
+        import numpy as np
+
+        return np.zeros((0, 6))
+
+    def filterValues(self, values: Sequence, samplingFrequency: float, steadyState: bool = True) -> ndarray:
+        """This method filters uniformly sampled signals and applies the operation, limit and halt settings of
+        the filter. Any number of signals can be filtered at once, which is much faster than filtering them one
+        by one.
+
+        Parameters
+        ----------
+        values
+            An array of signals with the samples of each signal along the last axis.
+        samplingFrequency
+            A Float specifying the sampling frequency of the signals.
+        steadyState
+            A Boolean specifying whether the filter starts in the steady state of the first sample of each
+            signal instead of at rest. The default value is True.
+
+        Returns
+        -------
+        ndarray
+            An array of the same shape as **values**. If **halt** is ON, the samples of a signal after the limit
+            is reached are NaN.
+
+        Raises
+        ------
+        ValueError
+            If the filter definition is invalid for the sampling frequency.
+        """
+        from .digitalFilters import applyOperation, filterSections
+
+        filtered = filterSections(self.sections(samplingFrequency), values, steadyState)
+        return applyOperation(filtered, self.operation, self.limit, bool(self.halt))[0]
+
+    def filterXYData(self, data: Sequence[Sequence[float]]) -> tuple:
+        """This method filters an X - Y curve, such as the data of an XYData or a HistoryOutput object.
+
+        Parameters
+        ----------
+        data
+            A sequence of pairs of Floats specifying the uniformly sampled **X - Y** data pairs.
+
+        Returns
+        -------
+        tuple
+            A tuple of pairs of Floats with the filtered curve. If **halt** is ON, the curve ends at the first
+            point reaching the limit.
+
+        Raises
+        ------
+        ValueError
+            If the X-values are not uniformly increasing.
+        """
+        return self.filterXYDataList([data])[0]
+
+    def filterXYDataList(self, dataList: Sequence[Sequence[Sequence[float]]]) -> list[tuple]:
+        """This method filters many X - Y curves at once, such as the histories of the same output variable at
+        many points. Curves sharing the same X-values are filtered together.
+
+        Parameters
+        ----------
+        dataList
+            A sequence of sequences of pairs of Floats specifying the uniformly sampled **X - Y** data pairs of
+            each curve.
+
+        Returns
+        -------
+        list[tuple]
+            A list of tuples of pairs of Floats with the filtered curves in the order of **dataList**.
+
+        Raises
+        ------
+        ValueError
+            If the X-values of a curve are not uniformly increasing.
+        """
+        import numpy as np
+
+        from .digitalFilters import applyOperation, filterSections, samplingFrequency
+
+        curves = [np.asarray(data, dtype=np.float64).reshape(-1, 2) for data in dataList]
+        groups: dict = {}
+        for i, curve in enumerate(curves):
+            groups.setdefault(curve[:, 0].tobytes(), []).append(i)
+        result: list = [()] * len(curves)
+        for indices in groups.values():
+            times = curves[indices[0]][:, 0]
+            if len(times) < 2:
+                for i in indices:
+                    result[i] = tuple(map(tuple, curves[i].tolist()))
+                continue
+            values = np.stack([curves[i][:, 1] for i in indices])
+            values = filterSections(self.sections(samplingFrequency(times)), values)
+            values, counts = applyOperation(values, self.operation, self.limit, bool(self.halt))
+            for i, row, count in zip(indices, values, counts):
+                result[i] = tuple(zip(times[:count].tolist(), row[:count].tolist()))
+        return result
@@ -113,17 +113,24 @@ class OperatorFilter(Filter):
         RangeError
         """
         super().__init__()
+        self.name = name
+        self.cutoffFrequency = cutoffFrequency
+        self.order = order
+        self.operation = operation
+        self.halt = halt
+        self.limit = limit
+        self.invariant = invariant
 
     @abaqus_method_doc
     def setValues(
         self,
-        order: int = 2,
-        operation: Literal[C.MIN, C.MAX, C.NONE, C.ABS] = NONE,
-        halt: Boolean = OFF,
+        order: int | None = None,
+        operation: Literal[C.MIN, C.MAX, C.NONE, C.ABS] | None = None,
+        halt: Boolean | None = None,
         limit: float | None = None,
-        invariant: Literal[C.FIRST, C.SECOND, C.NONE] = NONE,
+        invariant: Literal[C.FIRST, C.SECOND, C.NONE] | None = None,
     ):
-        """This method modifies the OperatorFilter object.
+        """This method modifies the OperatorFilter object. Only the arguments that are specified are modified.
 
         Parameters
         ----------
@@ -149,4 +156,7 @@ class OperatorFilter(Filter):
         ------
         RangeError
         """
-        ...
+        values = dict(order=order, operation=operation, halt=halt, limit=limit, invariant=invariant)
+        for key, value in values.items():
+            if value is not None:
+                setattr(self, key, value)
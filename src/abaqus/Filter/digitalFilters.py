@@ -0,0 +1,306 @@
+"""Design and application of the digital filters defined by the Filter objects.
+
+The low-pass filters are designed from their analog prototypes and discretised with the bilinear transform, the
+cutoff frequency being pre-warped so that the digital filter has its attenuation point at the requested frequency.
+Filters are stored as second-order sections, one row ``(b0, b1, b2, 1, a1, a2)`` per section.
+
+Signals are filtered along their last axis and any number of signals is filtered at once. Instead of stepping
+through the samples one by one, the cascade of sections is converted to a state-space model and the signal is
+processed in blocks: the response of a block to its own samples is a product with a Toeplitz matrix of the impulse
+response and the response to the state at the start of the block is a product with the observability matrix. Only
+the state has to be carried sequentially from one block to the next.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from ..UtilityAndView.abaqusConstants import ABS, MAX, MIN, NONE, SymbolicConstant
+
+
+def butterworthSections(order: int, cutoffFrequency: float, samplingFrequency: float) -> np.ndarray:
+    """Return the second-order sections of a low-pass Butterworth filter.
+
+    Parameters
+    ----------
+    order
+        An Int specifying the order of the filter, between 1 and 20.
+    cutoffFrequency
+        A Float specifying the frequency at which the gain is :math:`1/\\sqrt{2}`.
+    samplingFrequency
+        A Float specifying the sampling frequency of the signals.
+
+    Returns
+    -------
+    ndarray
+        An (ceil(order / 2), 6) array of second-order sections.
+    """
+    _checkOrder(order)
+    poles = np.exp(1j * np.pi * np.arange(order + 1, 3 * order, 2) / (2 * order))
+    return _sections(np.empty(0), poles, 1.0, cutoffFrequency, samplingFrequency)
+
+
+def chebyshev1Sections(
+    order: int, cutoffFrequency: float, samplingFrequency: float, rippleFactor: float = 0.225
+) -> np.ndarray:
+    """Return the second-order sections of a low-pass Chebyshev type I filter.
+
+    The gain ripples between 1 and :math:`1/\\sqrt{1 + \\epsilon^2}` in the pass band, where :math:`\\epsilon` is the
+    ripple factor, and equals the lower value at the cutoff frequency.
+
+    Parameters
+    ----------
+    order
+        An Int specifying the order of the filter, between 1 and 20.
+    cutoffFrequency
+        A Float specifying the edge of the pass band.
+    samplingFrequency
+        A Float specifying the sampling frequency of the signals.
+    rippleFactor
+        A positive Float specifying the ripple factor. The default value is 0.225.
+
+    Returns
+    -------
+    ndarray
+        An (ceil(order / 2), 6) array of second-order sections.
+    """
+    _checkOrder(order)
+    if not rippleFactor > 0:
+        raise ValueError(f"The ripple factor of a Chebyshev filter must be positive, got {rippleFactor}")
+    mu = np.arcsinh(1.0 / rippleFactor) / order
+    theta = np.pi * np.arange(1, 2 * order, 2) / (2 * order)
+    poles = -np.sinh(mu) * np.sin(theta) + 1j * np.cosh(mu) * np.cos(theta)
+    gain = np.prod(-poles).real
+    if order % 2 == 0:
+        gain /= np.sqrt(1.0 + rippleFactor**2)
+    return _sections(np.empty(0), poles, gain, cutoffFrequency, samplingFrequency)
+
+
+def chebyshev2Sections(
+    order: int, cutoffFrequency: float, samplingFrequency: float, rippleFactor: float = 0.025
+) -> np.ndarray:
+    """Return the second-order sections of a low-pass Chebyshev type II filter.
+
+    The gain is monotonic in the pass band and ripples below :math:`\\epsilon/\\sqrt{1 + \\epsilon^2}` in the stop
+    band, where :math:`\\epsilon` is the ripple factor. The cutoff frequency is the edge of the stop band.
+
+    Parameters
+    ----------
+    order
+        An Int specifying the order of the filter, between 1 and 20.
+    cutoffFrequency
+        A Float specifying the edge of the stop band.
+    samplingFrequency
+        A Float specifying the sampling frequency of the signals.
+    rippleFactor
+        A Float between 0 and 1 specifying the ripple factor. The default value is 0.025.
+
+    Returns
+    -------
+    ndarray
+        An (ceil(order / 2), 6) array of second-order sections.
+    """
+    _checkOrder(order)
+    if not 0 < rippleFactor < 1:
+        raise ValueError(f"The ripple factor of a Chebyshev type II filter must be in (0, 1), got {rippleFactor}")
+    mu = np.arcsinh(1.0 / rippleFactor) / order
+    theta = np.pi * np.arange(1, 2 * order, 2) / (2 * order)
+    poles = 1.0 / (-np.sinh(mu) * np.sin(theta) + 1j * np.cosh(mu) * np.cos(theta))
+    # The zeros are on the imaginary axis, the middle one of an odd order filter is at infinity
+    theta = theta[np.abs(np.cos(theta)) > 1e-12]
+    zeros = 1j / np.cos(theta)
+    gain = (np.prod(-poles) / np.prod(-zeros)).real
+    return _sections(zeros, poles, gain, cutoffFrequency, samplingFrequency)
+
+
+def filterSections(
+    sections: np.ndarray, values: Sequence | np.ndarray, steadyState: bool = True, blockSize: int = 0
+) -> np.ndarray:
+    """Filter signals with a cascade of second-order sections.
+
+    Parameters
+    ----------
+    sections
+        An (n, 6) array of second-order sections.
+    values
+        An array of signals, the samples of each signal along the last axis.
+    steadyState
+        A Boolean specifying whether the filter starts in the steady state of the first sample of each signal.
+        Otherwise the filter starts at rest. The default value is True.
+    blockSize
+        An Int specifying the number of samples processed at once. The default value 0 chooses a block size
+        based on the number of signals.
+
+    Returns
+    -------
+    ndarray
+        An array of the same shape as **values** with the filtered signals.
+    """
+    signals = np.asarray(values, dtype=np.float64)
+    shape, signals = signals.shape, signals.reshape(-1, signals.shape[-1] if signals.ndim else 1)
+    numSignals, numSamples = signals.shape
+    if numSamples == 0 or len(sections) == 0:
+        return signals.reshape(shape).copy()
+    A, B, C, D = _stateSpace(np.asarray(sections, dtype=np.float64))
+    size = blockSize or (256 if numSignals < 16 else 64)
+    size = min(size, numSamples)
+    numBlocks = -(-numSamples // size)
+
+    # Powers of A give the impulse response, the observability matrix and the input to state map of a block
+    powers = np.empty((size + 1, len(A), len(A)))
+    powers[0] = np.eye(len(A))
+    for i in range(size):
+        powers[i + 1] = A @ powers[i]
+    observe = C @ powers[:size]  # (size, n)
+    impulse = np.concatenate(([D], observe[:-1] @ B))
+    index = np.arange(size)
+    lag = index[:, None] - index[None, :]
+    toeplitz = np.where(lag >= 0, impulse[np.maximum(lag, 0)], 0.0)
+    control = (powers[size - 1 :: -1] @ B).T  # (n, size), column j is A^(size - 1 - j) B
+    transition = powers[size]
+
+    padded = np.zeros((numSignals, numBlocks * size))
+    padded[:, :numSamples] = signals
+    blocks = padded.reshape(numSignals, numBlocks, size)
+    inputs = blocks @ control.T
+    states = np.empty((numSignals, numBlocks, len(A)))
+    if steadyState:
+        state = np.outer(signals[:, 0], np.linalg.solve(np.eye(len(A)) - A, B))
+    else:
+        state = np.zeros((numSignals, len(A)))
+    for k in range(numBlocks):
+        states[:, k] = state
+        state = state @ transition.T + inputs[:, k]
+    result = blocks @ toeplitz.T + states @ observe.T
+    return result.reshape(numSignals, -1)[:, :numSamples].reshape(shape)
+
+
+def applyOperation(
+    values: np.ndarray, operation: SymbolicConstant = NONE, limit: float | None = None, halt: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """Apply the operation, limit and halt settings of a filter to filtered signals.
+
+    MIN and MAX replace each sample by the running minimum or maximum of the signal, ABS by the running maximum of
+    its absolute value. Without **halt** the **limit** is a lower bound of the output of MIN and an upper bound of
+    the output of MAX and ABS, it bounds the absolute value of the output if there is no operation. With **halt**
+    the signal stops at the first sample reaching the limit.
+
+    Parameters
+    ----------
+    values
+        An array of filtered signals, the samples of each signal along the last axis.
+    operation
+        A SymbolicConstant specifying the operation. Possible values are NONE, MIN, MAX and ABS.
+    limit
+        None or a Float specifying the threshold limit.
+    halt
+        A Boolean specifying whether the signals stop when the limit is reached.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray]
+        The signals after the operation, and an Int array with the number of valid samples of each signal. The
+        samples after a halt are NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if operation == MIN:
+        values = np.minimum.accumulate(values, axis=-1)
+    elif operation == MAX:
+        values = np.maximum.accumulate(values, axis=-1)
+    elif operation == ABS:
+        values = np.maximum.accumulate(np.abs(values), axis=-1)
+    elif operation != NONE:
+        raise ValueError(f"Unsupported filter operation {operation}")
+    counts = np.full(values.shape[:-1], values.shape[-1], dtype=np.int64)
+    if limit is None:
+        return values, counts
+    if not halt:
+        if operation == MIN:
+            return np.maximum(values, limit), counts
+        if operation == NONE:
+            return np.clip(values, -abs(limit), abs(limit)), counts
+        return np.minimum(values, limit), counts
+    reached = values <= limit if operation == MIN else (np.abs(values) if operation == NONE else values) >= limit
+    stopped = reached.any(axis=-1)
+    counts[stopped] = reached[stopped].argmax(axis=-1) + 1
+    values = np.where(np.arange(values.shape[-1]) < counts[..., None], values, np.nan)
+    return values, counts
+
+
+def samplingFrequency(times: Sequence[float], rtol: float = 1e-3) -> float:
+    """Return the sampling frequency of uniformly sampled times.
+
+    Raises
+    ------
+    ValueError
+        If there are less than two times or the times are not uniformly increasing.
+    """
+    samples = np.asarray(times, dtype=np.float64)
+    if len(samples) < 2:
+        raise ValueError("At least two samples are required to determine the sampling frequency")
+    steps = np.diff(samples)
+    step = (samples[-1] - samples[0]) / (len(samples) - 1)
+    if not step > 0 or np.abs(steps - step).max() > rtol * step:
+        raise ValueError("The signal must be sampled at uniformly increasing times")
+    return 1.0 / step
+
+
+def _checkOrder(order: int):
+    if not 1 <= int(order) <= 20 or int(order) != order:
+        raise ValueError(f"The filter order must be an integer between 1 and 20, got {order}")
+
+
+def _sections(zeros, poles, gain: float, cutoffFrequency: float, samplingFrequency: float) -> np.ndarray:
+    """Discretise an analog prototype with unit cutoff and return its second-order sections."""
+    if not 0 < cutoffFrequency < samplingFrequency / 2:
+        raise ValueError(
+            f"The cutoff frequency must be positive and below the Nyquist frequency {samplingFrequency / 2}, "
+            f"got {cutoffFrequency}"
+        )
+    # Pre-warped bilinear transform
+    fs2 = 2.0 * samplingFrequency
+    warped = fs2 * np.tan(np.pi * cutoffFrequency / samplingFrequency)
+    zeros, poles = zeros * warped, poles * warped
+    gain *= warped ** (len(poles) - len(zeros))
+    gain = (gain * np.prod(fs2 - zeros) / np.prod(fs2 - poles)).real
+    zeros = np.concatenate(((fs2 + zeros) / (fs2 - zeros), -np.ones(len(poles) - len(zeros))))
+    poles = (fs2 + poles) / (fs2 - poles)
+
+    zeroGroups, poleGroups = _pairs(zeros), _pairs(poles)
+    # Pair the poles closest to the unit circle first with their nearest zeros
+    poleGroups.sort(key=lambda group: -np.abs(group).max())
+    sections = np.zeros((len(poleGroups), 6))
+    for i, group in enumerate(poleGroups):
+        nearest = min(range(len(zeroGroups)), key=lambda j: np.abs(zeroGroups[j][0] - group[0]))
+        sections[i, :3] = _polynomial(zeroGroups.pop(nearest))
+        sections[i, 3:] = _polynomial(group)
+    sections[0, :3] *= gain
+    return sections
+
+
+def _pairs(roots: np.ndarray) -> list:
+    """Group roots in conjugate pairs and pairs of real roots, a single real root may remain."""
+    complexRoots = [np.array([r, np.conj(r)]) for r in roots[roots.imag > 1e-10]]
+    realRoots = np.sort(roots[np.abs(roots.imag) <= 1e-10].real)
+    return complexRoots + [realRoots[i : i + 2] for i in range(0, len(realRoots), 2)]
+
+
+def _polynomial(roots: np.ndarray) -> np.ndarray:
+    coefficients = np.poly(roots).real
+    return np.pad(coefficients, (0, 3 - len(coefficients)))
+
+
+def _stateSpace(sections: np.ndarray):
+    """Return the state-space model (A, B, C, D) of a cascade of sections in transposed direct form II."""
+    A, B, C, D = np.zeros((0, 0)), np.zeros(0), np.zeros(0), 1.0
+    for b0, b1, b2, a0, a1, a2 in sections:
+        b0, b1, b2, a1, a2 = b0 / a0, b1 / a0, b2 / a0, a1 / a0, a2 / a0
+        a = np.array([[-a1, 1.0], [-a2, 0.0]])
+        b = np.array([b1 - a1 * b0, b2 - a2 * b0])
+        n = len(A)
+        # The output of the cascade so far is the input of the section
+        A = np.block([[A, np.zeros((n, 2))], [np.outer(b, C), a]])
+        B, C, D = np.concatenate((B, b * D)), np.concatenate((b0 * C, [1.0, 0.0])), b0 * D
+    return A, B, C, D
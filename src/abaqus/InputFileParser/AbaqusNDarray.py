@@ -1,8 +1,12 @@
+from __future__ import annotations
+
+import numpy as np
+
 from abqpy.decorators import abaqus_class_doc
 
 
 @abaqus_class_doc
-class AbaqusNDarray:
+class AbaqusNDarray(np.ndarray):
     """The AbaqusNDarray object is a sequence object derived from numpy.ndarray and is used to store numeric
     keyword data from an Abaqus input file. This object is similar to the numpy.ndarray object, but the numeric
     elements are returned as standard Python objects, not numpy numeric types. The numeric elements can be:
@@ -15,4 +19,47 @@ class AbaqusNDarray:
     cases, it will be False.
     """
 
-    ...
+    #: A Boolean specifying whether the first column holds ints while the other columns hold floats.
+    colZeroIsInt: bool = False
+
+    def __new__(cls, array, colZeroIsInt: bool = False):
+        obj = np.asarray(array).view(cls)
+        obj.colZeroIsInt = colZeroIsInt
+        return obj
+
+    def __array_finalize__(self, obj):
+        self.colZeroIsInt = getattr(obj, "colZeroIsInt", False)
+
+    def __getitem__(self, index):
+        item = super().__getitem__(index)
+        if isinstance(item, np.generic):
+            column = index[-1] if isinstance(index, tuple) else index
+            return int(item) if self.colZeroIsInt and int(column) % self.shape[-1] == 0 else item.item()
+        if isinstance(item, AbaqusNDarray) and item.colZeroIsInt:
+            # Only rows, and slices of a row from its first column, keep an int first column
+            rows = self.ndim == 2 and not isinstance(index, tuple)
+            head = self.ndim == 1 and isinstance(index, slice) and index.start in (None, 0) and index.step in (None, 1)
+            item.colZeroIsInt = rows or head
+        return item
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def tolist(self) -> list:
+        values = super().tolist()
+        if self.colZeroIsInt and self.ndim == 2:
+            for row in values:
+                row[0] = int(row[0])
+        elif self.colZeroIsInt and self.ndim == 1 and values:
+            values[0] = int(values[0])
+        return values
+
+    def __reduce_ex__(self, protocol):
+        # Pickle the plain array so that protocol 5 can transfer its data out-of-band
+        return _rebuild, (self.view(np.ndarray), self.colZeroIsInt)
+
+
+def _rebuild(array: np.ndarray, colZeroIsInt: bool) -> AbaqusNDarray:
+    """Rebuild an unpickled AbaqusNDarray."""
+    return AbaqusNDarray(array, colZeroIsInt)
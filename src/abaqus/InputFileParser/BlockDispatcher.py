@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from .inpTokenizer import (
+    BULK_KEYWORDS,
+    CONTINUED_KEYWORDS,
+    Text,
+    bulkArray,
+    decode,
+    normalizeName,
+    parseData,
+    parseKeywordLine,
+    readFile,
+    splitComments,
+)
+from .Keyword import Keyword
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # Python 3.7
+    shared_memory = None  # type: ignore
+
+#: The size in bytes of the data of the keyword blocks that are parsed by the workers, smaller blocks are parsed by
+#: the calling process.
+MIN_BLOCK_SIZE = 1 << 20
+
+#: The size in bytes of the chunks the data of a keyword block is split into.
+CHUNK_SIZE = 1 << 23
+
+# Modes of the chunk parser
+_ARRAY, _FLOAT, _TUPLES, _EMPTY = "array", "float", "tuples", "empty"
+
+
+class BlockDispatcher:
+    """The BlockDispatcher object parses the data of large keyword blocks in a process pool.
+
+    The data of a block is split into chunks at line boundaries, which are parsed independently by the workers,
+    and the chunks are joined in order when :meth:`finish` is called. Arrays are returned by the workers in shared
+    memory, where it is available. The keywords are identical to the keywords parsed serially by
+    :func:`~abaqus.InputFileParser.inpTokenizer.parseBlock`: if the chunks of a block disagree, for example if one
+    of them holds floats and another only ints, or if one of them is not rectangular, the chunks are parsed again
+    so that the block is converted as a whole would have been.
+
+    The BlockDispatcher object is a context manager, which shuts down the process pool on exit.
+    """
+
+    def __init__(self, numWorkers: int, bulk: bool = True, usePyArray: bool = False):
+        self.bulk = bulk
+        self.usePyArray = usePyArray
+        if shared_memory is not None and os.name != "nt":
+            # Workers and the calling process must share the tracker, which unregisters the memory on unlink
+            resource_tracker.ensure_running()
+        self._executor = ProcessPoolExecutor(max_workers=numWorkers)
+        # The keyword, the (path, start, end, first, last, continued) arguments of its chunks and their futures
+        self._pending: list[tuple[Keyword, list[tuple[str, int, int, bool, bool, bool]], list[Future]]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        for _, _, futures in self._pending:
+            for future in futures:
+                future.cancel()
+        self._executor.shutdown(wait=True)
+        for _, _, futures in self._pending:
+            for future in futures:
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    _release(future.result())
+        self._pending = []
+
+    def __call__(self, path: str, text: Text, start: int, dataStart: int, end: int) -> Keyword | None:
+        """Submit the data of a keyword block to the workers.
+
+        Returns
+        -------
+        Keyword | None
+            The Keyword object, whose data and comments are set by :meth:`finish`, or None if the block is small or
+            its data is not parsed, in which case it must be parsed by the caller.
+        """
+        if end - dataStart < MIN_BLOCK_SIZE:
+            return None
+        name, parameter = parseKeywordLine(decode(text[start:dataStart]))
+        normalized = normalizeName(name)
+        if not self.bulk and normalized in BULK_KEYWORDS:
+            return None
+        continued = normalized in CONTINUED_KEYWORDS
+        bounds = _chunkBounds(text, dataStart, end, continued)
+        mode = _ARRAY if self.usePyArray and _sameWidth(text, dataStart, end) else _TUPLES
+        chunks = [(path, first, last, index == 0, index == len(bounds) - 2, continued)
+                  for index, (first, last) in enumerate(zip(bounds[:-1], bounds[1:]))]  # fmt: skip
+        keyword = Keyword(name, parameter)
+        keyword._markSource(path, start, dataStart, end)
+        self._pending.append((keyword, chunks, [self._executor.submit(_parseChunk, *chunk, mode) for chunk in chunks]))
+        return keyword
+
+    def finish(self):
+        """Wait for the workers and set the data and the comments of the submitted keywords."""
+        while self._pending:
+            keyword, chunks, futures = self._pending[0]
+            results = [future.result() for future in futures]
+            parsed = [result for result in results if result[0] != _EMPTY]
+            arrays = [result for result in parsed if result[0] == _ARRAY]
+            if parsed and len(arrays) == len(parsed) and len({_width(result) for result in arrays}) == 1:
+                if any(result[3] for result in arrays) and not all(result[3] for result in arrays):
+                    # Some chunks hold only ints while others hold floats, the int chunks are converted to floats
+                    self._resubmit(results, lambda result: result[0] == _ARRAY and result[3], _FLOAT)
+                    continue
+                keyword.data = _joinArrays(arrays)
+            elif arrays:
+                # The data of the block is not rectangular as a whole, the chunks are parsed as tuples
+                self._resubmit(results, lambda result: result[0] == _ARRAY, _TUPLES)
+                continue
+            else:
+                keyword.data = tuple(itertools.chain.from_iterable(result[1] for result in parsed))
+            keyword.comments = tuple(itertools.chain.from_iterable(result[2] for result in results))
+            keyword._markSource(*keyword._source)
+            self._pending.pop(0)
+
+    def _resubmit(self, results: list, select, mode: str):
+        """Parse the selected chunks of the first pending keyword again in another mode."""
+        _, chunks, futures = self._pending[0]
+        for index, (chunk, result) in enumerate(zip(chunks, results)):
+            if select(result):
+                futures[index] = self._executor.submit(_parseChunk, *chunk, mode)
+                _release(result)
+
+
+def _width(result: tuple) -> tuple:
+    """Return the shape of the rows of the array of a chunk."""
+    _, (_, shape), _ = result[1]
+    return tuple(shape[1:])
+
+
+def _chunkBounds(text: Text, dataStart: int, end: int, continued: bool) -> list[int]:
+    """Return the offsets splitting the data of a keyword block into chunks of whole lines.
+
+    If **continued** is True, the data is only split after lines that do not continue on the next line. The last
+    chunk is never blank.
+    """
+    bounds = [dataStart]
+    position = dataStart
+    while end - position > CHUNK_SIZE:
+        cut = text.find(b"\n", position + CHUNK_SIZE, end)
+        while continued and cut >= 0 and not _closedLine(text, cut):
+            cut = text.find(b"\n", cut + 1, end)
+        if cut < 0 or cut + 1 >= end or (end - cut <= CHUNK_SIZE and not text[cut + 1 : end].strip()):
+            break
+        position = cut + 1
+        bounds.append(position)
+    bounds.append(end)
+    return bounds
+
+
+def _closedLine(text: Text, newline: int) -> bool:
+    """Check that the line ending at a newline is a data line that is not continued on the next line."""
+    line = text[text.rfind(b"\n", 0, newline) + 1 : newline]
+    if line.startswith(b"**"):
+        return False
+    fragments = decode(line).splitlines()
+    return bool(fragments) and bool(fragments[-1].strip()) and not fragments[-1].rstrip().endswith(",")
+
+
+def _sameWidth(text: Text, dataStart: int, end: int) -> bool:
+    """Check whether the first and the last data lines of a keyword block have the same number of commas, a cheap
+    test ruling out most blocks that are not rectangular, such as sets with a short last line."""
+    first, last = _dataLine(text, dataStart, end, True), _dataLine(text, dataStart, end, False)
+    return first is None or last is None or first.count(b",") == last.count(b",")
+
+
+def _dataLine(text: Text, dataStart: int, end: int, forward: bool, attempts: int = 16) -> bytes | None:
+    """Return the first or the last line of a keyword block that is not blank or a comment, or None if it is not
+    found within a few lines."""
+    position = dataStart if forward else end
+    for _ in range(attempts):
+        if forward:
+            newline = text.find(b"\n", position, end)
+            lineEnd = end if newline < 0 else newline
+            line, position = text[position:lineEnd], lineEnd + 1
+        else:
+            lineStart = text.rfind(b"\n", dataStart, max(position - 1, dataStart)) + 1 or dataStart
+            line, position = text[lineStart:position], lineStart
+        if line.strip() and not line.startswith(b"**"):
+            return line
+        if position <= dataStart or position >= end:
+            return None
+    return None
+
+
+def _parseChunk(path: str, start: int, end: int, first: bool, last: bool, continued: bool, mode: str) -> tuple:
+    """Parse a chunk of the data of a keyword block in a worker.
+
+    Returns
+    -------
+    tuple
+        ``("empty", None, comments)`` if the chunk holds no data, ``("tuples", data, comments)``, or
+        ``("array", reference, comments, isInt, colZeroIsInt)`` where **reference** is returned by :func:`_share`.
+    """
+    text = readFile(path)
+    try:
+        data, comments = splitComments(text[start:end])
+    finally:
+        getattr(text, "close", lambda: None)()
+    stripped = data.strip()
+    if mode != _TUPLES:
+        if not stripped:
+            return _EMPTY, None, comments
+        # Blank lines are only stripped at the ends of the block, elsewhere they make the data irregular
+        blank = (not first and b"\n" in data[: len(data) - len(data.lstrip())]) or (
+            not last and data[len(data.rstrip()) :].count(b"\n") > 1
+        )
+        values = None if blank else bulkArray(data, floating=mode == _FLOAT)
+        if values is not None:
+            isInt = values.dtype.kind == "i"
+            return _ARRAY, _share(values), comments, isInt, values.colZeroIsInt
+    return _TUPLES, parseData(decode(data).splitlines(), continued), comments
+
+
+def _share(values) -> tuple:
+    """Return a reference to an array that can be returned to the calling process, the data is copied to shared
+    memory if it is available."""
+    import numpy as np
+
+    array = values.view(type(values).__base__)
+    if shared_memory is None or os.name == "nt" or array.nbytes == 0:
+        return None, (array.dtype.str, array.shape), array
+    memory = shared_memory.SharedMemory(create=True, size=array.nbytes)
+    try:
+        shared = np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)
+        shared[...] = array
+        del shared
+    finally:
+        memory.close()
+    return memory.name, (array.dtype.str, array.shape), None
+
+
+def _joinArrays(results: list):
+    """Join the arrays of the chunks of a keyword block, given by their results, and release their shared memory."""
+    import numpy as np
+
+    from .AbaqusNDarray import AbaqusNDarray
+
+    arrays, memories = [], []
+    try:
+        for result in results:
+            name, (dtype, shape), array = result[1]
+            if name is not None:
+                memory = shared_memory.SharedMemory(name=name)
+                memories.append(memory)
+                array = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+            arrays.append(array)
+        values = np.concatenate(arrays) if len(arrays) > 1 else arrays[0].copy()
+    finally:
+        # The views of the shared memory must be released before it is closed
+        arrays.clear()
+        array = None
+        for memory in memories:
+            memory.close()
+            memory.unlink()
+    values.flags.writeable = False
+    colZeroIsInt = not results[0][3] and all(result[4] for result in results)
+    return AbaqusNDarray(values, colZeroIsInt)
+
+
+def _release(result: tuple):
+    """Release the shared memory of the array of a chunk that is not used."""
+    if result[0] != _ARRAY or result[1][0] is None:
+        return
+    try:
+        memory = shared_memory.SharedMemory(name=result[1][0])
+    except FileNotFoundError:
+        return
+    memory.close()
+    memory.unlink()
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import itertools
+from typing import Iterable
+
+import numpy as np
+
+from ..Mesh.MeshArrays import LabelIndex
+from .inpTokenizer import normalizeName
+from .LabelSet import LabelSet, expandRanges, rangeCounts, uniqueLabels
+
+_NODE, _ELEMENT = "node", "element"
+_SETS = {"NSET": (_NODE, "NSET"), "ELSET": (_ELEMENT, "ELSET")}
+
+
+class DeckSets:
+    """The DeckSets object resolves the node and element sets of the keywords parsed from an input file.
+
+    Sets are defined by NSET and ELSET keywords, with lists of labels or, with the GENERATE parameter, ranges of
+    labels, and by the NSET and ELSET parameters of NODE and ELEMENT keywords. Repeated definitions of a set are
+    merged, set names in the data refer to other sets of the same kind, and the ELSET parameter of an NSET keyword
+    adds the nodes of the elements of an element set. The labels of all the definitions are expanded and sorted
+    in a single vectorised pass, only nested references are resolved set by set.
+
+    Sets are stored as :class:`~abaqus.InputFileParser.LabelSet.LabelSet` objects by scope and by name. The scope
+    of a set is the name of its part, the name given by the INSTANCE parameter of an assembly set, or ``""`` for
+    sets of the assembly or of a model without parts. Names are not case sensitive.
+    """
+
+    def __init__(self):
+        self._ids: dict[tuple[str, str, str], int] = {}
+        self._references: dict[tuple[str, str, str], list[tuple[str, str]]] = {}
+        self._sets: dict[tuple[str, str, str], LabelSet] = {}
+        self._nodeLabels: dict[str, list[np.ndarray]] = {}
+        self._elements: dict[str, list[tuple[np.ndarray, np.ndarray, np.ndarray]]] = {}
+        self._instances: dict[str, str] = {}
+        self._indices: dict[tuple[str, str], LabelIndex] = {}
+        # The labels and the ranges of the definitions, with the (set id, count) of each array, until expanded
+        self._pending: tuple[list, list, list, list] = ([], [], [], [])
+
+    @classmethod
+    def fromKeywords(cls, keywords: Iterable) -> DeckSets:
+        """Resolve the sets of a flat or organized KeywordSequence returned by :meth:`InputFile.parse`.
+
+        Raises
+        ------
+        ValueError
+            If a set refers to a set that is not defined, or if sets refer to each other.
+        """
+        deck = cls()
+        part = instance = None
+        for keyword in _flatten(keywords):
+            name = normalizeName(keyword.name)
+            parameter = {normalizeName(key): value for key, value in keyword.parameter.items()}
+            if name == "PART":
+                part = parameter.get("NAME", "").upper()
+            elif name == "END PART":
+                part = None
+            elif name == "INSTANCE" and part is None:
+                instance = parameter.get("NAME", "").upper()
+                deck._instances[instance] = parameter.get("PART", "").upper()
+            elif name == "END INSTANCE":
+                instance = None
+            scope = part if part is not None else instance if instance is not None else parameter.get("INSTANCE", "")
+            scope = scope.upper()
+            if name == "NODE":
+                nodes = _column(keyword.data)
+                deck._nodeLabels.setdefault(scope, []).append(nodes)
+                if "NSET" in parameter:
+                    deck._define((_NODE, scope, parameter["NSET"].upper()), nodes)
+            elif name == "ELEMENT":
+                elements = _connectivity(keyword.data)
+                deck._elements.setdefault(scope, []).append(elements)
+                if "ELSET" in parameter:
+                    deck._define((_ELEMENT, scope, parameter["ELSET"].upper()), elements[0])
+            elif name in _SETS:
+                kind, key = _SETS[name]
+                setKey = (kind, scope, parameter.get(key, "").upper())
+                if kind == _NODE and "ELSET" in parameter:
+                    # The nodes of the elements of an element set
+                    deck._define(setKey)
+                    deck._references[setKey].append((_ELEMENT, parameter["ELSET"].upper()))
+                elif "GENERATE" in parameter:
+                    deck._define(setKey, ranges=_ranges(keyword.data))
+                else:
+                    values, references = _items(keyword.data)
+                    deck._define(setKey, values)
+                    deck._references[setKey].extend((kind, reference.upper()) for reference in references)
+        deck._expand()
+        for setKey in list(deck._ids):
+            deck._resolve(setKey, ())
+        return deck
+
+    def nodeSets(self, scope: str = "") -> tuple[str, ...]:
+        """Return the names of the node sets of a scope."""
+        return tuple(name for kind, setScope, name in self._sets if kind == _NODE and setScope == scope.upper())
+
+    def elementSets(self, scope: str = "") -> tuple[str, ...]:
+        """Return the names of the element sets of a scope."""
+        return tuple(name for kind, setScope, name in self._sets if kind == _ELEMENT and setScope == scope.upper())
+
+    def nodeSet(self, name: str, scope: str = "") -> LabelSet:
+        """Return a node set.
+
+        Raises
+        ------
+        KeyError
+            If the set is not defined.
+        """
+        return self._sets[(_NODE, scope.upper(), name.upper())]
+
+    def elementSet(self, name: str, scope: str = "") -> LabelSet:
+        """Return an element set.
+
+        Raises
+        ------
+        KeyError
+            If the set is not defined.
+        """
+        return self._sets[(_ELEMENT, scope.upper(), name.upper())]
+
+    def nodeLabels(self, scope: str = "") -> np.ndarray:
+        """Return the labels of the nodes of a scope, in the order of the NODE keywords. The nodes of an instance
+        are the nodes of its part."""
+        blocks = self._nodeLabels.get(self._meshScope(scope), [])
+        return np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.int64)
+
+    def elementLabels(self, scope: str = "") -> np.ndarray:
+        """Return the labels of the elements of a scope, in the order of the ELEMENT keywords. The elements of an
+        instance are the elements of its part."""
+        blocks = self._elements.get(self._meshScope(scope), [])
+        return np.concatenate([block[0] for block in blocks]) if blocks else np.zeros(0, dtype=np.int64)
+
+    def nodeIndices(self, name: str, scope: str = "") -> np.ndarray:
+        """Return the indices of the nodes of a node set in :meth:`nodeLabels`, -1 for labels without a node."""
+        return self._index(_NODE, scope)(self.nodeSet(name, scope).labels)
+
+    def elementIndices(self, name: str, scope: str = "") -> np.ndarray:
+        """Return the indices of the elements of an element set in :meth:`elementLabels`, -1 for labels without an
+        element."""
+        return self._index(_ELEMENT, scope)(self.elementSet(name, scope).labels)
+
+    def _define(self, key: tuple, labels: np.ndarray | None = None, ranges: np.ndarray | None = None):
+        """Add labels, or (first, last, increment) ranges of labels, to the definition of a set. They are expanded
+        for all the sets at once by :meth:`_expand`."""
+        owner = self._ids.setdefault(key, len(self._ids))
+        self._references.setdefault(key, [])
+        if labels is not None and len(labels):
+            self._pending[0].append(labels)
+            self._pending[1].append((owner, len(labels)))
+        if ranges is not None and len(ranges):
+            self._pending[2].append(ranges)
+            self._pending[3].append((owner, len(ranges)))
+
+    def _expand(self):
+        """Expand the ranges and sort and deduplicate the labels of all the sets at once."""
+        keys = list(self._ids)
+        labels, labelOwners, ranges, rangeOwners = self._pending
+        self._pending = ([], [], [], [])
+        values = [np.concatenate(labels)] if labels else []
+        owners = [_repeat(labelOwners)] if labels else []
+        if ranges:
+            first, last, step = np.concatenate(ranges).T
+            values.append(expandRanges(first, last, step))
+            owners.append(np.repeat(_repeat(rangeOwners), rangeCounts(first, last, step)))
+        values = np.concatenate(values) if values else np.zeros(0, dtype=np.int64)
+        owners = np.concatenate(owners) if owners else np.zeros(0, dtype=np.int64)
+        if len(values) and (values.min() < 0 or values.max() >= 1 << 32):
+            raise ValueError("Set labels must be non-negative and less than 2**32")
+        # Sorting the set ids and the labels as one key groups the labels by set, sorted and unique
+        combined = uniqueLabels((owners << 32) | values)
+        bounds = np.searchsorted(combined >> 32, np.arange(len(keys) + 1))
+        values = combined & 0xFFFFFFFF
+        for position, key in enumerate(keys):
+            self._sets[key] = LabelSet(values[bounds[position] : bounds[position + 1]], isSorted=True)
+
+    def _resolve(self, key: tuple, stack: tuple) -> LabelSet:
+        """Add the sets referred to by a set to its labels."""
+        kind, scope, name = key
+        if key not in self._ids:
+            raise ValueError(f"The {kind} set {name} of the scope {scope!r} is not defined")
+        references = self._references[key]
+        if not references:
+            return self._sets[key]
+        if key in stack:
+            raise ValueError(f"The {kind} sets {' -> '.join(item[2] for item in stack + (key,))} refer to each other")
+        others = []
+        for referenceKind, reference in references:
+            other = self._resolve((referenceKind, scope, reference), stack + (key,))
+            others.append(other if referenceKind == kind else self._elementNodes(other, scope))
+        self._sets[key] = self._sets[key].union(*others)
+        self._references[key] = []
+        return self._sets[key]
+
+    def _elementNodes(self, elements: LabelSet, scope: str) -> LabelSet:
+        """Return the nodes of the elements of an element set."""
+        blocks = self._elements.get(self._meshScope(scope), [])
+        if not blocks:
+            return LabelSet()
+        nodes = np.concatenate([block[1] for block in blocks])
+        parts, total = [np.zeros(1, dtype=np.int64)], 0
+        for _, blockNodes, blockOffsets in blocks:
+            parts.append(blockOffsets[1:] + total)
+            total += len(blockNodes)
+        offsets = np.concatenate(parts)
+        rows = self._index(_ELEMENT, scope)(elements.labels)
+        rows = rows[rows >= 0]
+        counts = offsets[rows + 1] - offsets[rows]
+        # The positions of the nodes of each row, the row offset plus 0 to its count minus 1
+        positions = np.repeat(offsets[rows] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        return LabelSet(nodes[positions])
+
+    def _meshScope(self, scope: str) -> str:
+        """Return the scope holding the mesh of a scope, the part of an instance."""
+        scope = scope.upper()
+        return self._instances.get(scope, scope)
+
+    def _index(self, kind: str, scope: str) -> LabelIndex:
+        """Return the label index of the nodes or the elements of a scope."""
+        key = (kind, self._meshScope(scope))
+        if key not in self._indices:
+            self._indices[key] = LabelIndex(self.nodeLabels(scope) if kind == _NODE else self.elementLabels(scope))
+        return self._indices[key]
+
+
+def _flatten(keywords: Iterable) -> Iterable:
+    """Iterate over the keywords and their suboptions, in the order of the input file."""
+    for keyword in keywords:
+        yield keyword
+        if keyword.suboptions:
+            yield from _flatten(keyword.suboptions)
+
+
+def _column(data) -> np.ndarray:
+    """Return the first column of the data of a keyword as an int64 array."""
+    if isinstance(data, np.ndarray):
+        return np.asarray(data[:, 0] if data.ndim == 2 else data, dtype=np.int64)
+    return np.array([row[0] for row in data], dtype=np.int64)
+
+
+def _connectivity(data) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the labels, the flat node labels and the offsets of the nodes of the data of an ELEMENT keyword."""
+    if isinstance(data, np.ndarray) and data.ndim == 2:
+        array = np.asarray(data, dtype=np.int64)
+        width = array.shape[1] - 1
+        return array[:, 0].copy(), array[:, 1:].reshape(-1), np.arange(len(array) + 1, dtype=np.int64) * width
+    counts = np.array([len(row) - 1 for row in data], dtype=np.int64)
+    nodes = np.fromiter(itertools.chain.from_iterable(row[1:] for row in data), dtype=np.int64, count=counts.sum())
+    return _column(data), nodes, np.concatenate(([0], np.cumsum(counts)))
+
+
+def _items(data) -> tuple[np.ndarray, list[str]]:
+    """Split the data of an NSET or ELSET keyword into an array of labels and a list of set names."""
+    if isinstance(data, np.ndarray):
+        return np.asarray(data, dtype=np.int64).reshape(-1), []
+    values = list(itertools.chain.from_iterable(data))
+    try:
+        return np.array(values, dtype=np.int64), []
+    except (TypeError, ValueError):
+        pass
+    labels = [value for value in values if isinstance(value, int)]
+    names = [value for value in values if isinstance(value, str) and value]
+    return np.array(labels, dtype=np.int64), names
+
+
+def _ranges(data) -> np.ndarray:
+    """Return the (first, last, increment) ranges of the data of an NSET or ELSET keyword with GENERATE as a (K, 3)
+    int64 array."""
+    if isinstance(data, np.ndarray) and data.ndim == 2 and data.shape[1] in (2, 3):
+        array = np.asarray(data, dtype=np.int64)
+        return array if array.shape[1] == 3 else np.column_stack((array, np.ones(len(array), dtype=np.int64)))
+    rows = [tuple(row) + (1,) if len(row) == 2 else tuple(row)[:3] for row in data]
+    return np.array(rows, dtype=np.int64).reshape(-1, 3)
+
+
+def _repeat(owners: list[tuple[int, int]]) -> np.ndarray:
+    """Expand (set id, count) pairs into an array of set ids."""
+    ids, counts = np.array(owners, dtype=np.int64).reshape(-1, 2).T
+    return np.repeat(ids, counts)
@@ -1,6 +1,30 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Iterator
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import Boolean
+from .inpTokenizer import (
+    includeLines,
+    includePath,
+    keywordBlocks,
+    normalizeName,
+    parseBlock,
+    parseKeywordLine,
+    readFile,
+)
+from .KeywordSequence import KeywordSequence
+
+if TYPE_CHECKING:
+    from .BlockDispatcher import BlockDispatcher
+    from .Keyword import Keyword
+    from .KeywordIndex import KeywordIndex
+
+#: The normalized names of the keywords whose following keywords are organized into their suboptions, up to the
+#: matching END keyword.
+BLOCK_KEYWORDS = frozenset(("PART", "INSTANCE", "ASSEMBLY", "STEP"))
 
 
 @abaqus_class_doc
@@ -49,7 +73,21 @@ class InputFile:
         InputFile
             An InputFile object.
         """
-        ...
+        self.file = file
+        self._path = os.path.abspath(os.path.join(directory, file))
+        self.directory = os.path.dirname(self._path)
+        self._parsed = False
+        self._index: KeywordIndex | None = None
+        from .parseCache import cachedIncludes, cachePath
+
+        # An up-to-date cache or index file records the included files, which saves reading the input files
+        cached = cachedIncludes(cachePath(self._path)) or cachedIncludes(cachePath(self._path, ".inpi"))
+        if cached is None:
+            includes: list[str] = []
+            missing: list[str] = []
+            self._scanIncludes(self._path, includes, missing)
+            cached = tuple(includes), tuple(missing)
+        self.includes, self.missingIncludes = cached
 
     @abaqus_method_doc
     def parse(
@@ -58,6 +96,8 @@ class InputFile:
         verbose: Boolean = False,
         bulk: Boolean = True,
         usePyArray: Boolean = False,
+        cache: Boolean = False,
+        numWorkers: int = 1,
     ):
         """This method parses the input file associated with the InputFile object.
 
@@ -76,8 +116,17 @@ class InputFile:
         usePyArray
             A Boolean specifying that parse method can return an AbaqusNDarray object for a keyword
             data value. In cases where large amounts of numerical data (i.e., large node arrays) are
-            expected, it is recommended that you use the option usePyArray=True. The default is
-            False.
+            expected, it is recommended that you use the option usePyArray=True. The arrays are
+            read-only, keyword data is modified by assigning new data. The default is False.
+        cache
+            A Boolean specifying whether to use a binary cache file of the parsed keywords next to the input
+            file, with the extension ``.inpc``. The cache is used if the input file and its included files have
+            not changed since it was written, otherwise it is written after parsing. The arrays of keywords read
+            from the cache are read-only. The default is False.
+        numWorkers
+            An Int specifying the number of processes parsing the data of large keyword blocks, such as NODE and
+            ELEMENT, in parallel. The keywords are identical to the keywords parsed by a single process. The default
+            is 1.
 
         Returns
         -------
@@ -90,4 +139,194 @@ class InputFile:
             If you parse an input file more than once, a ValueError is raised for each subsequent
             parsing.
         """
-        ...
+        if self._parsed:
+            raise ValueError(f"The input file {self.file} has already been parsed")
+        self._parsed = True
+        keywords = None
+        if cache:
+            from .parseCache import cachePath, readCache
+
+            options = {"bulk": bool(bulk), "usePyArray": bool(usePyArray)}
+            files = (self._path,) + self.includes
+            keywords = readCache(cachePath(self._path), files, self.missingIncludes, options)
+        cached = keywords is not None
+        if keywords is None and numWorkers > 1:
+            from .BlockDispatcher import BlockDispatcher
+
+            with BlockDispatcher(numWorkers, bool(bulk), bool(usePyArray)) as dispatch:
+                keywords = self._parseFile(self._path, bool(verbose), bool(bulk), bool(usePyArray), dispatch)
+                dispatch.finish()
+        elif keywords is None:
+            keywords = self._parseFile(self._path, bool(verbose), bool(bulk), bool(usePyArray))
+        if cache and not cached:
+            from .parseCache import writeCache
+
+            try:
+                writeCache(cachePath(self._path), files, self.missingIncludes, options, keywords)
+            except OSError as error:
+                if verbose:
+                    print(f"The cache of {self.file} could not be written: {error}")
+        return _organize(keywords) if organize else keywords
+
+    def index(self, cache: Boolean = False) -> KeywordIndex:
+        """This method returns the index of the keywords of the input file and of its included files, which records
+        the location and the name, elset and nset parameters of each keyword. The index is built on the first call
+        by reading only the keyword lines.
+
+        Parameters
+        ----------
+        cache
+            A Boolean specifying whether to use an index file next to the input file, with the extension
+            ``.inpi``. The index file is used if the input file and its included files have not changed since it was
+            written, otherwise it is written after building the index. The default is False.
+
+        Returns
+        -------
+        KeywordIndex
+            A KeywordIndex object.
+        """
+        if self._index is not None:
+            return self._index
+        from .KeywordIndex import KeywordIndex
+
+        index = None
+        if cache:
+            from .parseCache import cachePath, readCache
+
+            files = (self._path,) + self.includes
+            index = readCache(cachePath(self._path, ".inpi"), files, self.missingIncludes, {"index": True})
+        if not isinstance(index, KeywordIndex):
+            index = KeywordIndex.build(self._path)
+            if cache:
+                from .parseCache import writeCache
+
+                try:
+                    writeCache(cachePath(self._path, ".inpi"), files, self.missingIncludes, {"index": True}, index)
+                except OSError:
+                    pass
+        self._index = index
+        return index
+
+    def findKeywords(
+        self, keyword: str | None = None, bulk: Boolean = True, usePyArray: Boolean = False, **parameter: str
+    ) -> Iterator[Keyword]:
+        """This method parses the keywords with a given name and given parameter values, without parsing the rest of
+        the input file. The keywords are selected with the index returned by :meth:`index`.
+
+        Parameters
+        ----------
+        keyword
+            A String specifying the name of the keywords, such as ``"Material"``. Case and spacing are ignored. If
+            None, keywords of any name are selected.
+        bulk
+            A Boolean specifying whether the data of bulk keywords, such as NODE, should be parsed. The default is
+            True.
+        usePyArray
+            A Boolean specifying whether rectangular numeric data is returned as an AbaqusNDarray object. The
+            default is False.
+        parameter
+            Strings specifying the values of the name, elset or nset parameters of the keywords, for example
+            ``name="Steel"``. Case is ignored.
+
+        Returns
+        -------
+        Iterator[Keyword]
+            An iterator over the Keyword objects, in the order of the input file.
+
+        Raises
+        ------
+        ValueError
+            If a parameter other than name, elset or nset is given.
+        """
+        index = self.index()
+        return index.read(index.select(keyword, **parameter), bool(bulk), bool(usePyArray))
+
+    def getKeyword(
+        self, keyword: str, bulk: Boolean = True, usePyArray: Boolean = False, **parameter: str
+    ) -> Keyword | None:
+        """This method parses the first keyword with a given name and given parameter values, see
+        :meth:`findKeywords`.
+
+        Returns
+        -------
+        Keyword | None
+            A Keyword object, or None if there is no such keyword.
+        """
+        return next(iter(self.findKeywords(keyword, bulk, usePyArray, **parameter)), None)
+
+    def write(self, keywords: KeywordSequence, file: str | None = None):
+        """This method writes keywords parsed from the input file back to the input file and to its included files.
+        The unmodified parts of the keywords are copied verbatim from the files, including their comments, and the
+        INCLUDE keywords are kept; modified and new keywords are formatted. Keyword data is modified by assigning
+        new data, the arrays of parsed keywords are read-only.
+
+        Parameters
+        ----------
+        keywords
+            A KeywordSequence object returned by :meth:`parse` or built from keywords returned by
+            :meth:`findKeywords`, with or without suboptions.
+        file
+            A String specifying the path of the input file to write. The included files are written relative to it,
+            as they are placed relative to the input file. If None, the input file and the included files holding
+            modified keywords are replaced. The default is None.
+        """
+        from .inpWriter import writeInputFile
+
+        writeInputFile(keywords, self._path if file is None else os.path.join(self.directory, file), self._path)
+
+    def _parseFile(
+        self, path: str, verbose: bool, bulk: bool, usePyArray: bool, dispatch: BlockDispatcher | None = None
+    ) -> KeywordSequence:
+        """Parse a file and the files it includes into a flat KeywordSequence, the data of large keyword blocks is
+        submitted to **dispatch** if it is given."""
+        keywords = KeywordSequence()
+        text = readFile(path)
+        try:
+            for start, dataStart, end in keywordBlocks(text):
+                keyword = dispatch(path, text, start, dataStart, end) if dispatch is not None else None
+                if keyword is not None:
+                    keywords.append(keyword)
+                    continue
+                keyword = parseBlock(text, start, dataStart, end, bulk, usePyArray)
+                keyword._markSource(path, start, dataStart, end)
+                if normalizeName(keyword.name) == "INCLUDE":
+                    include = includePath(path, keyword.parameter)
+                    if include is not None and os.path.isfile(include):
+                        keywords.extend(self._parseFile(include, verbose, bulk, usePyArray, dispatch))
+                        continue
+                    if verbose:
+                        print(f"Included file {include} of {path} could not be located")
+                keywords.append(keyword)
+        finally:
+            getattr(text, "close", lambda: None)()
+        return keywords
+
+    def _scanIncludes(self, path: str, includes: list, missing: list):
+        """Collect the files included by a file and by its included files, in order of appearance."""
+        text = readFile(path)
+        try:
+            lines = [line for _, line in includeLines(text)]
+        finally:
+            getattr(text, "close", lambda: None)()
+        for line in lines:
+            include = includePath(path, parseKeywordLine(line)[1])
+            if include is None or not os.path.isfile(include):
+                missing.append(include or line.strip())
+            elif include not in includes:
+                includes.append(include)
+                self._scanIncludes(include, includes, missing)
+
+
+def _organize(keywords: KeywordSequence) -> KeywordSequence:
+    """Organize the keywords between a block keyword, such as PART, and its END keyword into its suboptions."""
+    root = KeywordSequence()
+    stack = [("", root)]
+    for keyword in keywords:
+        name = normalizeName(keyword.name)
+        stack[-1][1].append(keyword)
+        if name in BLOCK_KEYWORDS:
+            stack.append((name, keyword.suboptions))
+        elif name.startswith("END ") and any(block == name[4:] for block, _ in stack[1:]):
+            while stack.pop()[0] != name[4:]:
+                pass
+    return root
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abqpy.decorators import abaqus_class_doc
 
+from .KeywordSequence import KeywordSequence
+
 
 @abaqus_class_doc
 class Keyword:
@@ -28,7 +30,31 @@ class Keyword:
     data: tuple = ()
 
     #: A KeywordSequence specifying the suboptions of the keyword.
-    suboptions: str = ""
+    suboptions: KeywordSequence | None = None
 
     #: A sequence of Strings specifying the comments.
     comments: tuple = ()
+
+    def __init__(
+        self,
+        name: str = "",
+        parameter: dict | None = None,
+        data: tuple = (),
+        suboptions: KeywordSequence | None = None,
+        comments: tuple = (),
+    ):
+        self.name = name
+        self.parameter = {} if parameter is None else parameter
+        self.data = data
+        self.suboptions = KeywordSequence() if suboptions is None else suboptions
+        self.comments = comments
+
+    def __repr__(self):
+        return f"Keyword({self.name!r}, {self.parameter!r})"
+
+    def _markSource(self, path: str, start: int, dataStart: int, end: int):
+        """Record the byte offsets of the keyword block in its input file, see
+        :func:`~abaqus.InputFileParser.inpTokenizer.keywordBlocks`, and the parsed state of the keyword, which the
+        input file writer compares to copy the unmodified parts of the block verbatim."""
+        self._source = (path, start, dataStart, end)
+        self._state = (self.name, dict(self.parameter or {}), self.data, self.comments)
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import os
+from typing import Iterator
+
+from .inpTokenizer import (
+    Text,
+    decode,
+    includePath,
+    keywordBlocks,
+    normalizeName,
+    parseBlock,
+    parseKeywordLine,
+    readFile,
+)
+from .Keyword import Keyword
+
+#: The parameters of the keywords that are recorded in the index and that keywords can be selected by.
+INDEX_PARAMETERS = ("name", "elset", "nset")
+
+_CHUNK = 1 << 24
+
+
+class KeywordIndexEntry:
+    """The KeywordIndexEntry object records the location of a keyword in an input file."""
+
+    __slots__ = ("path", "line", "offset", "dataOffset", "end", "name", "parameter")
+
+    #: A String specifying the path of the file holding the keyword.
+    path: str
+
+    #: An Int specifying the line number of the keyword line, starting at 1.
+    line: int
+
+    #: An Int specifying the byte offset of the keyword line.
+    offset: int
+
+    #: An Int specifying the byte offset of the data lines, after the keyword line and its continuation lines.
+    dataOffset: int
+
+    #: An Int specifying the byte offset of the end of the data lines, the offset of the next keyword line or the
+    #: size of the file.
+    end: int
+
+    #: A String specifying the name of the keyword as written in the file.
+    name: str
+
+    #: A Dictionary of Strings specifying the values of the :data:`INDEX_PARAMETERS` given on the keyword line.
+    parameter: dict
+
+    def __init__(self, path: str, line: int, offset: int, dataOffset: int, end: int, name: str, parameter: dict):
+        self.path = path
+        self.line = line
+        self.offset = offset
+        self.dataOffset = dataOffset
+        self.end = end
+        self.name = name
+        self.parameter = parameter
+
+    def __repr__(self):
+        return f"KeywordIndexEntry({self.name!r}, {self.parameter!r}, {self.path!r}, line={self.line})"
+
+    def __getstate__(self):
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __setstate__(self, state):
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+
+
+class KeywordIndex:
+    """The KeywordIndex object records the location of every keyword of an input file and of its included files,
+    in the order of :meth:`InputFile.parse`, so that selected keywords can be parsed without parsing the rest of
+    the file.
+
+    Building the index only reads the keyword lines; the data lines are skipped, apart from counting their lines.
+    INCLUDE keywords of files that exist are replaced by the keywords of the included files.
+    """
+
+    #: A list of KeywordIndexEntry objects specifying the keywords.
+    entries: list
+
+    def __init__(self, entries: list):
+        self.entries = entries
+        self._byName: dict[str, list[int]] = {}
+        for position, entry in enumerate(entries):
+            self._byName.setdefault(normalizeName(entry.name), []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[KeywordIndexEntry]:
+        return iter(self.entries)
+
+    def __getstate__(self):
+        return self.entries
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    @classmethod
+    def build(cls, path: str) -> KeywordIndex:
+        """Build the index of an input file and of its included files."""
+        entries: list = []
+        _indexFile(os.path.abspath(path), entries, ())
+        return cls(entries)
+
+    @property
+    def names(self) -> tuple:
+        """The normalized names of the keywords in the index."""
+        return tuple(self._byName)
+
+    def select(self, keyword: str | None = None, **parameter: str) -> list[KeywordIndexEntry]:
+        """Return the entries of the keywords with the given name and parameter values.
+
+        Parameters
+        ----------
+        keyword
+            A String specifying the name of the keywords, case and spacing are ignored. If None, keywords of any
+            name are selected.
+        parameter
+            Strings specifying the values of the parameters in :data:`INDEX_PARAMETERS`, case is ignored.
+
+        Returns
+        -------
+        list[KeywordIndexEntry]
+            The entries, in the order of the file.
+
+        Raises
+        ------
+        ValueError
+            If a parameter is not in :data:`INDEX_PARAMETERS`.
+        """
+        unknown = [key for key in parameter if key.lower() not in INDEX_PARAMETERS]
+        if unknown:
+            raise ValueError(f"Keywords can only be selected by the parameters {INDEX_PARAMETERS}, got {unknown}")
+        if keyword is None:
+            entries = self.entries
+        else:
+            entries = [self.entries[position] for position in self._byName.get(normalizeName(keyword), ())]
+        wanted = {key.lower(): str(value).upper() for key, value in parameter.items()}
+        return [
+            entry
+            for entry in entries
+            if all(entry.parameter.get(key, "").upper() == value for key, value in wanted.items())
+        ]
+
+    def read(self, entries, bulk: bool = True, usePyArray: bool = False) -> Iterator[Keyword]:
+        """Parse the keywords of index entries, each file is opened once for consecutive entries of the file."""
+        text: Text = b""
+        path = None
+        try:
+            for entry in entries:
+                if entry.path != path:
+                    getattr(text, "close", lambda: None)()
+                    text, path = readFile(entry.path), entry.path
+                if entry.end > len(text):
+                    raise ValueError(f"The file {entry.path} has changed since the index was built")
+                keyword = parseBlock(text, entry.offset, entry.dataOffset, entry.end, bulk, usePyArray)
+                keyword._markSource(entry.path, entry.offset, entry.dataOffset, entry.end)
+                yield keyword
+        finally:
+            getattr(text, "close", lambda: None)()
+
+
+def _indexFile(path: str, entries: list, parents: tuple):
+    """Append the entries of the keywords of a file, expanding its INCLUDE keywords."""
+    text = readFile(path)
+    try:
+        line, counted = 1, 0
+        for start, dataStart, end in keywordBlocks(text):
+            line += _countLines(text, counted, start)
+            counted = start
+            name, parameter = parseKeywordLine(decode(text[start:dataStart]))
+            normalized = normalizeName(name)
+            if normalized == "INCLUDE":
+                include = includePath(path, parameter)
+                if include is not None and os.path.isfile(include) and include not in parents + (path,):
+                    _indexFile(include, entries, parents + (path,))
+                    continue
+            recorded = {key.lower(): value for key, value in parameter.items() if key.lower() in INDEX_PARAMETERS}
+            entries.append(KeywordIndexEntry(path, line, start, dataStart, end, name, recorded))
+    finally:
+        getattr(text, "close", lambda: None)()
+
+
+def _countLines(text, start: int, end: int) -> int:
+    """Count the newlines between two offsets of a text, in chunks so that large blocks are not copied at once."""
+    count = 0
+    for offset in range(start, end, _CHUNK):
+        count += text[offset : min(offset + _CHUNK, end)].count(b"\n")
+    return count
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from abqpy.decorators import abaqus_class_doc
+
+
+@abaqus_class_doc
+class KeywordSequence(list):
+    """The KeywordSequence object is a sequence of Keyword objects returned by the InputFile.parse() method and
+    stored in the suboptions of Keyword objects.
+
+    .. note::
+        This object can be accessed by::
+
+            import inpParser
+    """
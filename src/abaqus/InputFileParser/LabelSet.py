@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+class LabelSet:
+    """The LabelSet object stores a set of node or element labels as a sorted array of unique labels.
+
+    Set operations are performed on the sorted arrays: membership is found by binary search and the union merges
+    the two sorted arrays, so no hashing of individual labels is involved.
+    """
+
+    #: A sorted (N,) int64 array specifying the unique labels of the set.
+    labels: np.ndarray
+
+    def __init__(self, labels=(), isSorted: bool = False):
+        labels = np.asarray(labels, dtype=np.int64).reshape(-1)
+        self.labels = labels if isSorted else uniqueLabels(labels)
+
+    @classmethod
+    def fromRanges(cls, first, last, step=1) -> LabelSet:
+        """Create a LabelSet object from ranges of labels, such as the data of an NSET or ELSET keyword with the
+        GENERATE parameter.
+
+        Parameters
+        ----------
+        first
+            An int or an array of ints specifying the first labels of the ranges.
+        last
+            An int or an array of ints specifying the last labels of the ranges, which are included.
+        step
+            An int or an array of ints specifying the increments of the ranges. The default is 1.
+
+        Returns
+        -------
+        LabelSet
+            A LabelSet object.
+        """
+        return cls(expandRanges(first, last, step))
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __iter__(self):
+        return iter(self.labels.tolist())
+
+    def __contains__(self, label) -> bool:
+        return bool(_isin(self.labels, label))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LabelSet):
+            return NotImplemented
+        return np.array_equal(self.labels, other.labels)
+
+    def __repr__(self):
+        return f"LabelSet({len(self)} labels)"
+
+    def __or__(self, other: LabelSet) -> LabelSet:
+        return self.union(other)
+
+    def __and__(self, other: LabelSet) -> LabelSet:
+        return self.intersection(other)
+
+    def __sub__(self, other: LabelSet) -> LabelSet:
+        return self.difference(other)
+
+    def isin(self, labels) -> np.ndarray:
+        """Return a Boolean array specifying which of **labels** are in the set."""
+        return _isin(self.labels, labels)
+
+    def union(self, *others: LabelSet) -> LabelSet:
+        """Return the labels that are in the set or in any of the other sets."""
+        labels = self.labels
+        for other in others:
+            # The labels are disjoint and sorted, a stable sort merges the two runs in linear time
+            labels = np.sort(np.concatenate((labels, other.labels[~_isin(labels, other.labels)])), kind="stable")
+        return LabelSet(labels, isSorted=True)
+
+    def intersection(self, *others: LabelSet) -> LabelSet:
+        """Return the labels that are in the set and in all the other sets."""
+        labels = self.labels
+        for other in others:
+            labels = labels[_isin(other.labels, labels)]
+        return LabelSet(labels, isSorted=True)
+
+    def difference(self, *others: LabelSet) -> LabelSet:
+        """Return the labels that are in the set but in none of the other sets."""
+        labels = self.labels
+        for other in others:
+            labels = labels[~_isin(other.labels, labels)]
+        return LabelSet(labels, isSorted=True)
+
+    def ranges(self) -> np.ndarray:
+        """Return the run-length encoding of the set, a (K, 2) int64 array of the first and the last labels of the
+        runs of consecutive labels."""
+        if not len(self.labels):
+            return np.zeros((0, 2), dtype=np.int64)
+        breaks = np.flatnonzero(np.diff(self.labels) != 1)
+        return np.stack(
+            (self.labels[np.append(0, breaks + 1)], self.labels[np.append(breaks, len(self.labels) - 1)]), 1
+        )
+
+
+def expandRanges(first, last, step=1) -> np.ndarray:
+    """Expand ranges of labels, including their last labels, into a single array at once, see
+    :func:`rangeCounts`."""
+    first, last, step = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.int64).reshape(-1) for value in (first, last, step))
+    )
+    counts = rangeCounts(first, last, step)
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(first, counts) + (np.arange(offsets.size, dtype=np.int64) - offsets) * np.repeat(step, counts)
+
+
+def uniqueLabels(labels: np.ndarray) -> np.ndarray:
+    """Return the sorted unique labels of an int64 array. Sorting and masking repeated neighbours is much faster than
+    the hash-based numpy.unique of recent numpy versions on large arrays."""
+    labels = np.sort(labels)
+    return labels[np.concatenate(([True], labels[1:] != labels[:-1]))] if len(labels) else labels
+
+
+def rangeCounts(first, last, step=1) -> np.ndarray:
+    """Return the numbers of labels of ranges of labels.
+
+    Raises
+    ------
+    ValueError
+        If an increment is zero.
+    """
+    step = np.asarray(step, dtype=np.int64)
+    if np.any(step == 0):
+        raise ValueError("The increment of a range of labels must not be zero")
+    return np.maximum((np.asarray(last, dtype=np.int64) - first) // step + 1, 0)
+
+
+def _isin(sortedLabels: np.ndarray, labels) -> np.ndarray:
+    """Return a Boolean array specifying which of **labels** are in an array of sorted labels."""
+    labels = np.asarray(labels, dtype=np.int64)
+    if not len(sortedLabels):
+        return np.zeros(labels.shape, dtype=bool)
+    position = np.searchsorted(sortedLabels, labels).clip(max=len(sortedLabels) - 1)
+    return sortedLabels[position] == labels
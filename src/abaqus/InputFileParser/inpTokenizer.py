@@ -0,0 +1,286 @@
+"""Tokenizer of Abaqus input files.
+
+An input file is split into keyword blocks by byte offsets. A block starts at a keyword line, a line starting with a
+single ``*``, and extends to the next keyword line; it holds the data lines of the keyword and the comment lines,
+starting with ``**``, that follow them. Keyword lines ending with a comma are continued on the next line. Because the
+blocks are independent, they can be parsed separately, in any order.
+
+Data values are converted to Python ints and floats where possible and kept as stripped strings otherwise. Rectangular
+numeric data can be converted at once to an :class:`~abaqus.InputFileParser.AbaqusNDarray.AbaqusNDarray` by
+:func:`bulkArray`, which requires numpy.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import warnings
+from typing import Iterator, Union
+
+from .Keyword import Keyword
+
+# Searching for a newline followed by a star is much faster than for a star at the start of a line
+_KEYWORD = re.compile(rb"\n\*(?!\*)")
+_INCLUDE = re.compile(rb"\n\*[ \t]*[Ii][Nn][Cc][Ll][Uu][Dd][Ee][ \t]*,[^\n]*")
+_NUMERIC = b"0123456789eE+-., \t\r\n"
+_COMMENT = re.compile(rb"^\*\*[^\n]*(?:\n|$)", re.MULTILINE)
+_FIELDS = re.compile(r'((?:"[^"]*"|[^,"])*)(?:,|$)')
+# Data smaller than this is converted to arrays in Python, which is faster than numpy for a few values
+_SMALL_DATA = 2048
+
+#: The normalized names of the keywords holding bulk data, which are skipped when parsing without bulk data.
+BULK_KEYWORDS = frozenset(("NODE", "ELEMENT", "NSET", "ELSET", "INITIAL CONDITIONS"))
+
+#: The normalized names of the keywords whose data lines ending with a comma are continued on the next line.
+CONTINUED_KEYWORDS = frozenset(("ELEMENT", "USER ELEMENT"))
+
+Text = Union[bytes, mmap.mmap]
+
+
+def normalizeName(name: str) -> str:
+    """Return the normalized name of a keyword or a parameter: upper case with single spaces."""
+    return " ".join(name.upper().split())
+
+
+def readFile(path: str) -> Text:
+    """Return the content of a file, memory-mapped unless it is empty."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def keywordBlocks(text: Text) -> list[tuple[int, int, int]]:
+    """Return the (start, dataStart, end) byte offsets of the keyword blocks of a text.
+
+    **start** is the offset of the keyword line, **dataStart** the offset after the keyword line and its continuation
+    lines and **end** the offset of the next keyword line or the end of the text. The text before the first keyword
+    line is not part of any block.
+    """
+    starts = [match.start() + 1 for match in _KEYWORD.finditer(text)]
+    if text[:1] == b"*" and text[:2] != b"**":
+        starts.insert(0, 0)
+    size, blocks = len(text), []
+    for index, start in enumerate(starts):
+        end = starts[index + 1] if index + 1 < len(starts) else size
+        dataStart = start
+        while True:
+            newline = text.find(b"\n", dataStart, end)
+            dataStart = end if newline < 0 else newline + 1
+            if dataStart >= end or not text[start:dataStart].rstrip().endswith(b","):
+                break
+        blocks.append((start, dataStart, end))
+    return blocks
+
+
+def nextKeyword(text: Text, position: int) -> int:
+    """Return the offset of the first keyword line starting after an offset, or the size of the text."""
+    match = _KEYWORD.search(text, position)
+    return len(text) if match is None else match.start() + 1
+
+
+def includeLines(text: Text, position: int = 0) -> Iterator[tuple[int, str]]:
+    """Yield the offsets and the first lines of the INCLUDE keyword lines of a text, from an offset of a line."""
+    if position == 0:
+        # The pattern starts with a newline, so a newline is prepended to the first line to match it
+        end = text.find(b"\n")
+        first = _INCLUDE.match(b"\n" + text[: end if end >= 0 else len(text)])
+        if first:
+            yield 0, decode(first.group()[1:])
+    for match in _INCLUDE.finditer(text, max(position - 1, 0)):
+        yield match.start() + 1, decode(match.group()[1:])
+
+
+def decode(text: bytes) -> str:
+    """Decode a part of an input file, undecodable bytes are preserved as surrogates."""
+    return text.decode("utf-8", "surrogateescape")
+
+
+def splitFields(line: str) -> list[str]:
+    """Split a line at the commas that are not quoted, the fields are stripped and fields in quotes are unquoted."""
+    if '"' not in line:
+        return [field.strip() for field in line.split(",")]
+    fields = [field.strip() for field in _FIELDS.findall(line)][: line.count(",") - _quotedCommas(line) + 1]
+    return [field[1:-1] if len(field) > 1 and field[0] == field[-1] == '"' else field for field in fields]
+
+
+def _quotedCommas(line: str) -> int:
+    """Return the number of commas between quotes in a line."""
+    return sum(part.count(",") for part in line.split('"')[1::2])
+
+
+def parseKeywordLine(line: str) -> tuple[str, dict[str, str]]:
+    """Return the name and the parameters of a keyword line, parameters without a value are mapped to ``''``."""
+    fields = splitFields(" ".join(part.strip() for part in line.splitlines()).lstrip("*"))
+    parameter = {}
+    for field in fields[1:]:
+        key, _, value = field.partition("=")
+        if key.strip():
+            parameter[key.strip()] = value.strip().strip('"')
+    return fields[0].strip(), parameter
+
+
+def includePath(path: str, parameter: dict) -> str | None:
+    """Return the path of the file included by an INCLUDE keyword of a file, relative paths are relative to the
+    directory of the file."""
+    name = next((value for key, value in parameter.items() if normalizeName(key) == "INPUT"), None)
+    return None if not name else os.path.normpath(os.path.join(os.path.dirname(path), name))
+
+
+def splitComments(text: bytes) -> tuple[bytes, tuple]:
+    """Remove the comment lines from the data of a keyword block and return the data and the comments."""
+    if b"**" not in text:
+        return text, ()
+    comments = tuple(decode(line).rstrip("\r\n") for line in _COMMENT.findall(text))
+    return (_COMMENT.sub(b"", text) if comments else text), comments
+
+
+def parseBlock(text: Text, start: int, dataStart: int, end: int, bulk: bool = True, usePyArray: bool = False):
+    """Parse a keyword block given by its byte offsets, see :func:`keywordBlocks`, into a Keyword object.
+
+    If **bulk** is False the data of the bulk keywords is not parsed. If **usePyArray** is True, rectangular numeric
+    data is returned as an AbaqusNDarray object.
+    """
+    name, parameter = parseKeywordLine(decode(text[start:dataStart]))
+    normalized = normalizeName(name)
+    data, comments = splitComments(text[dataStart:end])
+    if not bulk and normalized in BULK_KEYWORDS:
+        return Keyword(name, parameter, (), None, comments)
+    values = bulkArray(data) if usePyArray else None
+    if values is not None:
+        # Keywords are modified by assigning new data, which the input file writer detects
+        values.flags.writeable = False
+    else:
+        values = parseData(decode(data).splitlines(), normalized in CONTINUED_KEYWORDS)
+    return Keyword(name, parameter, values, None, comments)
+
+
+def parseValue(token: str) -> int | float | str:
+    """Convert a data field to an int or a float if possible."""
+    try:
+        return int(token)
+    except ValueError:
+        pass
+    try:
+        return float(token)
+    except ValueError:
+        return token
+
+
+def parseData(lines: list[str], continued: bool = False) -> tuple:
+    """Convert data lines to a tuple of tuples of values.
+
+    A single empty field after a trailing comma is dropped. If **continued** is True, lines ending with a comma are
+    joined with the next line.
+    """
+    if continued:
+        joined: list[str] = []
+        for line in lines:
+            if joined and joined[-1].rstrip().endswith(","):
+                joined[-1] = joined[-1].rstrip() + line
+            else:
+                joined.append(line)
+        lines = joined
+    data = []
+    for line in lines:
+        if not line.strip():
+            continue
+        fields = splitFields(line)
+        if len(fields) > 1 and fields[-1] == "":
+            fields.pop()
+        data.append(tuple(parseValue(field) for field in fields))
+    return tuple(data)
+
+
+def bulkArray(data: bytes, floating: bool = False):
+    """Convert the data lines of a keyword block to an AbaqusNDarray at once.
+
+    Parameters
+    ----------
+    data
+        The data lines of a keyword block, without comment lines.
+    floating
+        If True, data holding only ints is converted to floats.
+
+    Returns
+    -------
+    AbaqusNDarray | None
+        The data, or None if the data is not rectangular or not numeric.
+    """
+    import numpy as np
+
+    from .AbaqusNDarray import AbaqusNDarray
+
+    data = data.strip()
+    if len(data) < _SMALL_DATA:
+        return _smallArray(data, floating)
+    if not data or data.translate(None, _NUMERIC):
+        return None
+    buffer = np.frombuffer(data, dtype=np.uint8)
+
+    # The data is rectangular if all the lines have the same number of commas
+    fields = np.flatnonzero((buffer == ord(",")) | (buffer == ord("\n")))
+    isComma = buffer[fields] == ord(",")
+    lineEnds = np.append(fields[~isComma], len(buffer))
+    commas = fields[isComma]
+    counts = np.diff(np.searchsorted(commas, lineEnds), prepend=0)
+    if np.any(counts != counts[0]):
+        return None
+
+    # Each field between commas and newlines holds exactly one value, the values start after a separator. Of the
+    # allowed characters, the separators are the comma and the whitespace characters, which precede the space.
+    isSeparator = (buffer <= ord(" ")) | (buffer == ord(","))
+    tokens = np.flatnonzero(isSeparator[:-1] & ~isSeparator[1:]) + 1
+    tokens = np.concatenate(([0], tokens)) if not isSeparator[0] else tokens
+    if len(tokens) != len(fields) + 1 or np.any(tokens[:-1] > fields) or np.any(tokens[1:] < fields):
+        return None
+    isInt = not floating and not any(character in data for character in (b".", b"e", b"E"))
+    with warnings.catch_warnings():
+        # Unparsable text stops the conversion with a warning, which is detected by the number of values
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            values = np.fromstring(data.replace(b",", b" "), dtype=np.int64 if isInt else np.float64, sep=" ")
+        except ValueError:
+            return None
+    width = int(counts[0]) + 1
+    if values.size != len(lineEnds) * width:
+        return None
+    if isInt and np.any((values == np.iinfo(np.int64).max) | (values == np.iinfo(np.int64).min)):
+        return None  # ints out of range are clipped by numpy
+
+    # The first column holds ints if there is no decimal point or exponent before the first comma of each line
+    colZeroIsInt = False
+    if not isInt and width > 1:
+        lineStarts = np.concatenate(([0], lineEnds[:-1] + 1))
+        marks = np.flatnonzero((buffer == ord(".")) | (buffer == ord("e")) | (buffer == ord("E")))
+        firstCommas = commas.reshape(len(lineEnds), width - 1)[:, 0]
+        colZeroIsInt = bool(np.all(np.searchsorted(marks, lineStarts) == np.searchsorted(marks, firstCommas)))
+    return AbaqusNDarray(values.reshape(len(lineEnds), width), colZeroIsInt)
+
+
+def _smallArray(data: bytes, floating: bool = False):
+    """Convert small stripped data to an AbaqusNDarray like :func:`bulkArray`, converting the values in Python to
+    avoid the overhead of the numpy calls."""
+    import numpy as np
+
+    from .AbaqusNDarray import AbaqusNDarray
+
+    if not data or data.translate(None, _NUMERIC):
+        return None
+    rows = [line.split(b",") for line in data.split(b"\n")]
+    width = len(rows[0])
+    if any(len(row) != width for row in rows):
+        return None
+    isInt = not floating and not any(character in data for character in (b".", b"e", b"E"))
+    try:
+        values = [[(int if isInt else float)(field) for field in row] for row in rows]
+    except ValueError:
+        return None
+    colZeroIsInt = (
+        not isInt and width > 1 and not any(b"." in row[0] or b"e" in row[0] or b"E" in row[0] for row in rows)
+    )
+    limits = (-(1 << 63), (1 << 63) - 1)
+    if isInt and any(value <= limits[0] or value >= limits[1] for row in values for value in row):
+        return None
+    return AbaqusNDarray(np.array(values, dtype=np.int64 if isInt else np.float64), colZeroIsInt)
@@ -0,0 +1,413 @@
+"""Writer of Abaqus input files.
+
+:func:`writeKeywords` formats keywords into a new input file. Keyword lines longer than :data:`MAX_LINE_LENGTH`
+characters are continued on the next line and the data lines of the keywords whose data lines can be continued, such
+as ELEMENT, hold at most :data:`MAX_ITEMS` values. Arrays are formatted in chunks of rows with a single string
+formatting operation per chunk, floats are written with the shortest representation that reads back to the same
+value.
+
+:func:`writeInputFile` writes keywords parsed from an input file back to the file and to its included files, copying
+the unmodified parts of the keyword blocks verbatim; only modified and new keywords are formatted. INCLUDE keywords
+and the comments of the copied blocks are preserved, and consecutive copied blocks are copied as a single byte range,
+so that writing an input file with a few modified keywords costs about as much as copying it. A keyword is
+unmodified if its name, parameters and comments equal the parsed ones and its data is the parsed object: the arrays
+of parsed keywords are read-only, keyword data is modified by assigning new data.
+"""
+
+from __future__ import annotations
+
+import numbers
+import os
+import tempfile
+from typing import IO, Iterable, Iterator
+
+from .inpTokenizer import (
+    CONTINUED_KEYWORDS,
+    includeLines,
+    includePath,
+    nextKeyword,
+    normalizeName,
+    parseKeywordLine,
+    readFile,
+    splitComments,
+)
+from .Keyword import Keyword
+
+#: The maximum number of characters of a keyword line before it is continued on the next line.
+MAX_LINE_LENGTH = 256
+
+#: The maximum number of values of a data line of the keywords whose data lines can be continued.
+MAX_ITEMS = 16
+
+#: The number of rows of an array that are formatted at once.
+CHUNK_ROWS = 1 << 16
+
+_COPY_SIZE = 1 << 26
+
+
+def formatKeywordLine(name: str, parameter: dict | None) -> str:
+    """Return the keyword line of a keyword, with its continuation lines."""
+    fields = [key if value == "" else f"{key}={_quote(str(value))}" for key, value in (parameter or {}).items()]
+    lines, line = [], f"*{name}"
+    for field in fields:
+        if len(line) + len(field) + 3 > MAX_LINE_LENGTH:
+            lines.append(line + ",")
+            line = field
+        else:
+            line += ", " + field
+    return "\n".join(lines + [line]) + "\n"
+
+
+def formatData(data, continued: bool = False) -> Iterator[str]:
+    """Yield the data lines of a keyword in chunks of text.
+
+    Parameters
+    ----------
+    data
+        A sequence of sequences of values or a two-dimensional array specifying the data.
+    continued
+        A Boolean specifying whether data lines with more than :data:`MAX_ITEMS` values are continued on the next
+        line.
+    """
+    if getattr(data, "ndim", None) == 2:
+        yield from _formatArray(data, continued)
+        return
+    lines = []
+    for row in data:
+        fields = [_formatValue(value) for value in row]
+        if fields and fields[-1] == "":
+            # The parser drops a single empty field after a trailing comma
+            fields.append("")
+        lines.append(_joinFields(fields, continued))
+        if len(lines) == CHUNK_ROWS:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+def formatKeyword(keyword: Keyword) -> str:
+    """Return the keyword line, the data lines and the comment lines of a keyword, without its suboptions."""
+    continued = normalizeName(keyword.name) in CONTINUED_KEYWORDS
+    return "".join(_keywordParts(keyword, continued))
+
+
+def writeKeywords(keywords: Iterable[Keyword], file: str | IO[bytes]):
+    """Format keywords and their suboptions into an input file.
+
+    Parameters
+    ----------
+    keywords
+        The Keyword objects.
+    file
+        A String specifying the path of the input file, or a binary file object.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "wb") as stream:
+            writeKeywords(keywords, stream)
+        return
+    for keyword in _flatten(keywords):
+        continued = normalizeName(keyword.name) in CONTINUED_KEYWORDS
+        for part in _keywordParts(keyword, continued):
+            file.write(_encode(part))
+
+
+def writeInputFile(keywords: Iterable[Keyword], path: str, source: str):
+    """Write keywords parsed from an input file back to the file structure they were parsed from.
+
+    The keywords parsed from an included file are written to the included file, placed relative to **path** as the
+    included file is placed relative to **source**. Files that are written in place and are unchanged are not
+    written. Every file is written to a temporary file first, which replaces the file once all files are written.
+    The source files must not have changed since the keywords were parsed.
+
+    Parameters
+    ----------
+    keywords
+        The Keyword objects, including their suboptions.
+    path
+        A String specifying the path of the input file to write, which may be **source**.
+    source
+        A String specifying the path of the input file the keywords were parsed from.
+    """
+    source, path = os.path.abspath(source), os.path.abspath(path)
+    plan = _Plan(source)
+    try:
+        for keyword in _flatten(keywords):
+            plan.add(keyword)
+        plan.write(path)
+    finally:
+        plan.close()
+
+
+class _Segments:
+    """The parts of an output file: byte ranges of its source file, strings and iterators of strings."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.text = readFile(path)
+        self.parts: list = []
+        #: The offset in the source file after the last keyword block that was written.
+        self.position = 0
+        start = 0 if self.text[:1] == b"*" and self.text[:2] != b"**" else nextKeyword(self.text, 0)
+        self.copy(0, start)
+
+    def copy(self, start: int, end: int):
+        """Append a byte range of the source file, merged with the previous range if they are contiguous."""
+        if start < end:
+            if self.parts and isinstance(self.parts[-1], tuple) and self.parts[-1][1] == start:
+                self.parts[-1] = (self.parts[-1][0], end)
+            else:
+                self.parts.append((start, end))
+        self.position = max(self.position, end)
+
+    def append(self, part):
+        """Append formatted text, which starts on a new line."""
+        last = self.parts[-1] if self.parts else None
+        if isinstance(last, tuple):
+            lastLine = self.text[last[1] - 1 : last[1]] == b"\n"
+        else:
+            lastLine = not isinstance(last, str) or not last or last.endswith("\n")
+        if not lastLine:
+            self.parts.append("\n")
+        self.parts.append(part)
+
+    def unchanged(self) -> bool:
+        """Check whether the output file is identical to the source file."""
+        return self.parts == [(0, len(self.text))] or (not self.parts and not len(self.text))
+
+    def write(self, output: str) -> str:
+        """Write the output file to a temporary file next to it and return the path of the temporary file."""
+        directory = os.path.dirname(output)
+        os.makedirs(directory, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(prefix=".inp-", dir=directory)
+        try:
+            with os.fdopen(handle, "wb") as file, open(self.path, "rb") as source:
+                for part in self.parts:
+                    if isinstance(part, tuple):
+                        file.flush()
+                        _copyRange(source, file, *part)
+                    elif isinstance(part, str):
+                        file.write(_encode(part))
+                    else:
+                        for chunk in part:
+                            file.write(_encode(chunk))
+        except BaseException:
+            os.remove(temporary)
+            raise
+        return temporary
+
+    def close(self):
+        getattr(self.text, "close", lambda: None)()
+
+
+class _Plan:
+    """The output files of :func:`writeInputFile`, built keyword by keyword."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.files = {source: _Segments(source)}
+        #: The included files from the input file to the file of the current keyword.
+        self.stack = [source]
+        #: The files that were left, whose keywords are not written again if the file is included again.
+        self.done: set = set()
+        self._descendants: dict = {}
+
+    def add(self, keyword: Keyword):
+        origin, state = keyword.__dict__.get("_source"), keyword.__dict__.get("_state")
+        if origin is not None and origin[0] != self.stack[-1] and not self._enter(origin[0]):
+            origin = None
+        if origin is not None and origin[0] in self.done:
+            # The keyword belongs to a file that is included again, whose keywords are already written
+            return
+        segments = self.files[next(file for file in reversed(self.stack) if file not in self.done)]
+        continued = normalizeName(keyword.name) in CONTINUED_KEYWORDS
+        if origin is None or state is None:
+            segments.append(formatKeywordLine(keyword.name, keyword.parameter))
+            segments.append(_dataParts(keyword, continued))
+            return
+        _, start, dataStart, end = origin
+        name, parameter, data, comments = state
+        if keyword.data is not data:
+            segments.position = max(segments.position, end)
+            segments.append(formatKeywordLine(keyword.name, keyword.parameter))
+            segments.append(_dataParts(keyword, continued))
+        elif keyword.name == name and keyword.parameter == parameter:
+            segments.copy(start, dataStart)
+        else:
+            segments.position = max(segments.position, dataStart)
+            segments.append(formatKeywordLine(keyword.name, keyword.parameter))
+        if keyword.data is data and keyword.comments == comments:
+            segments.copy(dataStart, end)
+        elif keyword.data is data:
+            segments.position = max(segments.position, end)
+            segments.append(_decode(splitComments(segments.text[dataStart:end])[0]))
+            segments.append("".join(f"{comment}\n" for comment in keyword.comments))
+
+    def write(self, path: str):
+        """Write the output files, the input file to **path** and the included files relative to it."""
+        directory = os.path.dirname(self.source)
+        replacements = []
+        try:
+            for file, segments in self.files.items():
+                output = os.path.join(os.path.dirname(path), os.path.relpath(file, directory))
+                output = path if file == self.source else os.path.normpath(output)
+                if output != file or not segments.unchanged():
+                    replacements.append((segments.write(output), output))
+        except BaseException:
+            for temporary, _ in replacements:
+                os.remove(temporary)
+            raise
+        for temporary, output in replacements:
+            os.replace(temporary, output)
+
+    def close(self):
+        for segments in self.files.values():
+            segments.close()
+
+    def _enter(self, path: str) -> bool:
+        """Make a file the current file, following the INCLUDE keywords from the current file or its parents to
+        the file. Returns False if the file is not included."""
+        if path in self.stack:
+            while self.stack[-1] != path:
+                self.done.add(self.stack.pop())
+            return True
+        while self.stack:
+            chain = self._findChain(self.stack[-1], path)
+            if chain is not None:
+                for parent, (start, end, child) in zip([self.stack[-1]] + [link[2] for link in chain], chain):
+                    self.files[parent].copy(start, end)
+                    if child not in self.files:
+                        self.files[child] = _Segments(child)
+                    self.stack.append(child)
+                return True
+            if len(self.stack) == 1:
+                return False
+            self.done.add(self.stack.pop())
+        return False
+
+    def _findChain(self, parent: str, path: str) -> list | None:
+        """Return the INCLUDE keyword blocks, as (start, end, included file) tuples, leading from a file to an
+        included file, searching the INCLUDE keywords of the file after the last written keyword block first."""
+        segments = self.files[parent]
+        for first, last in ((segments.position, None), (0, segments.position)) if segments.position else ((0, None),):
+            for start, line in includeLines(segments.text, first):
+                if last is not None and start >= last:
+                    break
+                child = includePath(parent, parseKeywordLine(line)[1])
+                if child is None or child in self.stack or not os.path.isfile(child):
+                    continue
+                link = (start, nextKeyword(segments.text, start), child)
+                if child == path:
+                    return [link]
+                if path in self._included(child):
+                    if child not in self.files:
+                        self.files[child] = _Segments(child)
+                    chain = self._findChain(child, path)
+                    if chain is not None:
+                        return [link] + chain
+        return None
+
+    def _included(self, path: str) -> set:
+        """Return the files included by a file and by its included files."""
+        if path not in self._descendants:
+            self._descendants[path] = set()
+            text = readFile(path)
+            try:
+                lines = [line for _, line in includeLines(text)]
+            finally:
+                getattr(text, "close", lambda: None)()
+            for line in lines:
+                child = includePath(path, parseKeywordLine(line)[1])
+                if child is not None and os.path.isfile(child):
+                    self._descendants[path] |= {child} | self._included(child)
+        return self._descendants[path]
+
+
+def _flatten(keywords: Iterable[Keyword]) -> Iterator[Keyword]:
+    """Yield keywords followed by their suboptions, in the order of the input file."""
+    for keyword in keywords:
+        yield keyword
+        if keyword.suboptions:
+            yield from _flatten(keyword.suboptions)
+
+
+def _keywordParts(keyword: Keyword, continued: bool) -> Iterator[str]:
+    """Yield the keyword line, the data lines and the comment lines of a keyword."""
+    yield formatKeywordLine(keyword.name, keyword.parameter)
+    yield from _dataParts(keyword, continued)
+
+
+def _dataParts(keyword: Keyword, continued: bool) -> Iterator[str]:
+    """Yield the data lines and the comment lines of a keyword, formatted when the iterator is consumed."""
+    yield from formatData(keyword.data, continued)
+    if keyword.comments:
+        yield "".join(f"{comment}\n" for comment in keyword.comments)
+
+
+def _formatArray(array, continued: bool) -> Iterator[str]:
+    """Yield the rows of a two-dimensional array in chunks of text."""
+    import numpy as np
+
+    colZeroIsInt = getattr(array, "colZeroIsInt", False)
+    array = np.asarray(array)
+    if not array.size:
+        return
+    integer = array.dtype.kind in "iub"
+    formats = ["%d" if integer or (column == 0 and colZeroIsInt) else "%r" for column in range(array.shape[1])]
+    row = _joinFields(formats, continued)
+    for first in range(0, len(array), CHUNK_ROWS):
+        chunk = array[first : first + CHUNK_ROWS]
+        yield (row * len(chunk)) % tuple(chunk.ravel().tolist())
+
+
+def _joinFields(fields: list, continued: bool) -> str:
+    """Join the fields of a data line, with continuation lines if **continued** is True."""
+    if not continued or len(fields) <= MAX_ITEMS:
+        return ", ".join(fields) + "\n"
+    lines = [", ".join(fields[index : index + MAX_ITEMS]) for index in range(0, len(fields), MAX_ITEMS)]
+    return ",\n".join(lines) + "\n"
+
+
+def _formatValue(value) -> str:
+    """Format a data value, floats are written with the shortest representation that reads back to the value."""
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+    if isinstance(value, numbers.Real):
+        return repr(float(value))
+    return _quote(str(value))
+
+
+def _quote(value: str) -> str:
+    """Quote a value holding commas."""
+    return f'"{value}"' if "," in value else value
+
+
+def _encode(text: str) -> bytes:
+    return text.encode("utf-8", "surrogateescape")
+
+
+def _decode(text: bytes) -> str:
+    return text.decode("utf-8", "surrogateescape")
+
+
+def _copyRange(source: IO[bytes], target: IO[bytes], start: int, end: int):
+    """Copy a byte range of a file to the current position of another file, in the kernel where it is supported."""
+    copyFileRange = getattr(os, "copy_file_range", None)
+    if copyFileRange is not None:
+        try:
+            while start < end:
+                copied = copyFileRange(source.fileno(), target.fileno(), end - start, start)
+                if copied == 0:
+                    break
+                start += copied
+        except OSError:
+            pass
+        # The kernel moved the offset of the file descriptor, the file object follows it
+        target.seek(0, os.SEEK_END)
+    source.seek(start)
+    while start < end:
+        chunk = source.read(min(_COPY_SIZE, end - start))
+        if not chunk:
+            raise ValueError(f"The file {source.name} has changed since it was parsed")
+        target.write(chunk)
+        start += len(chunk)
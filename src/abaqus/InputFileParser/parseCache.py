@@ -0,0 +1,207 @@
+"""Binary sidecar cache of parsed Abaqus input files.
+
+The Keyword objects parsed from an input file and its included files are stored next to the input file, in a file
+with the extension ``.inpc``, and its KeywordIndex in a file with the extension ``.inpi``. The keywords are pickled
+with protocol 5 and the data buffers of the AbaqusNDarray objects are stored out-of-band after the pickle, aligned
+to 64 bytes, so that loading the cache memory-maps the file and creates the arrays without copying their data.
+
+The file starts with a fixed prelude, the magic bytes, the format version and the offset and length of a JSON header
+written at the end of the file. The header holds the size, the modification time and the SHA-256 hash of the input
+file and of each included file, the parse options, and the offsets of the pickle and of the buffers. A cache is valid
+if every file has the recorded size and modification time, or else the recorded hash, and none of the missing
+included files has appeared.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from typing import Sequence
+
+MAGIC = b"ABQPYINP"
+
+#: The version of the cache format, caches of other versions are ignored.
+VERSION = 2
+
+_PRELUDE = struct.Struct("<8sIIQQ")
+_ALIGNMENT = 64
+_PROTOCOL = min(pickle.HIGHEST_PROTOCOL, 5)
+
+
+def cachePath(path: str, extension: str = ".inpc") -> str:
+    """Return the path of a cache file of an input file."""
+    return os.path.splitext(path)[0] + extension
+
+
+def fileStamp(path: str, digest: bool = True) -> dict:
+    """Return the size, the modification time and, if **digest** is True, the SHA-256 hash of a file."""
+    status = os.stat(path)
+    stamp = {"path": path, "size": status.st_size, "mtime": status.st_mtime_ns}
+    if digest:
+        stamp["sha256"] = _digest(path)
+    return stamp
+
+
+def writeCache(path: str, files: Sequence[str], missing: Sequence[str], options: dict, content):
+    """Write a cache file of an input file.
+
+    Parameters
+    ----------
+    path
+        The path of the cache file.
+    files
+        The paths of the input file and of its included files.
+    missing
+        The paths of the included files that could not be located.
+    options
+        The parse options that the keywords depend on.
+    content
+        The flat KeywordSequence parsed from the input file, or its KeywordIndex.
+    """
+    buffers: list = []
+    if _PROTOCOL >= 5:
+        data = pickle.dumps(content, protocol=_PROTOCOL, buffer_callback=buffers.append)
+    else:
+        data = pickle.dumps(content, protocol=_PROTOCOL)
+    views = [buffer.raw() for buffer in buffers]
+    offset = _align(_PRELUDE.size) + len(data)
+    layout = []
+    for view in views:
+        offset = _align(offset)
+        layout.append([offset, view.nbytes])
+        offset += view.nbytes
+    header = {"version": VERSION, "files": [fileStamp(file) for file in files], "missing": list(missing),
+              "options": options, "pickle": [_align(_PRELUDE.size), len(data)], "buffers": layout}  # fmt: skip
+    encoded = json.dumps(header).encode()
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temporary = tempfile.mkstemp(prefix=".inpc-", dir=directory)
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(_PRELUDE.pack(MAGIC, VERSION, 0, offset, len(encoded)))
+            _pad(file, _align(_PRELUDE.size))
+            file.write(data)
+            for (start, _), view in zip(layout, views):
+                _pad(file, start)
+                file.write(view)
+            file.write(encoded)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def readCache(path: str, files: Sequence[str], missing: Sequence[str], options: dict):
+    """Read a cache file of an input file.
+
+    The arrays of returned keywords are read-only views of the memory-mapped cache file.
+
+    Parameters
+    ----------
+    path
+        The path of the cache file.
+    files
+        The paths of the input file and of its included files.
+    missing
+        The paths of the included files that could not be located.
+    options
+        The parse options that the keywords depend on.
+
+    Returns
+    -------
+    KeywordSequence | KeywordIndex | None
+        The flat KeywordSequence or the KeywordIndex, or None if there is no valid cache.
+    """
+    try:
+        with open(path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    content, buffers = None, []
+    try:
+        header = _header(buffer)
+        if header is not None and header["options"] == options and _valid(header, files, missing):
+            view = memoryview(buffer)
+            start, size = header["pickle"]
+            buffers = [view[offset : offset + length] for offset, length in header["buffers"]]
+            data = view[start : start + size]
+            content = pickle.loads(data, buffers=buffers) if buffers else pickle.loads(data)
+    except Exception:  # a damaged or outdated cache is ignored
+        content = None
+    if content is None or not buffers:
+        try:
+            buffer.close()
+        except BufferError:  # views of the buffer are still referenced, it is closed when they are released
+            pass
+    return content
+
+
+def cachedIncludes(path: str) -> tuple[tuple, tuple] | None:
+    """Return the included and the missing included files recorded in a cache file, or None if one of the recorded
+    files has changed size or modification time since the cache was written."""
+    try:
+        with open(path, "rb") as file:
+            prelude = file.read(_PRELUDE.size)
+            magic, version, _, headerOffset, headerLength = _PRELUDE.unpack(prelude)
+            if magic != MAGIC or version != VERSION:
+                return None
+            file.seek(headerOffset)
+            header = json.loads(file.read(headerLength))
+        for stamp in header["files"]:
+            current = fileStamp(stamp["path"], digest=False)
+            if (current["size"], current["mtime"]) != (stamp["size"], stamp["mtime"]):
+                return None
+        if any(os.path.exists(missing) for missing in header["missing"]):
+            return None
+        return tuple(stamp["path"] for stamp in header["files"][1:]), tuple(header["missing"])
+    except Exception:  # a damaged or outdated cache is ignored
+        return None
+
+
+def _header(buffer) -> dict | None:
+    """Return the header of a memory-mapped cache file, or None if it is not a cache file of this version."""
+    magic, version, _, headerOffset, headerLength = _PRELUDE.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION:
+        return None
+    return json.loads(buffer[headerOffset : headerOffset + headerLength])
+
+
+def _valid(header: dict, files: Sequence[str], missing: Sequence[str]) -> bool:
+    """Check the files recorded in a cache header against the current files."""
+    if [stamp["path"] for stamp in header["files"]] != list(files) or header["missing"] != list(missing):
+        return False
+    for stamp in header["files"]:
+        try:
+            current = fileStamp(stamp["path"], digest=False)
+        except OSError:
+            return False
+        if current["size"] != stamp["size"]:
+            return False
+        if current["mtime"] != stamp["mtime"] and _digest(stamp["path"]) != stamp["sha256"]:
+            return False
+    return not any(os.path.exists(path) for path in missing)
+
+
+def _digest(path: str) -> str:
+    """Return the SHA-256 hash of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                digest.update(buffer)
+    return digest.hexdigest()
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to the alignment of the buffers."""
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _pad(file, offset: int):
+    """Pad a file with zeros up to an offset."""
+    file.write(b"\0" * (offset - file.tell()))
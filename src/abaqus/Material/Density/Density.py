@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import OFF, UNIFORM, Boolean
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -74,7 +75,11 @@ class Density:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.distributionType = distributionType
+        self.fieldName = fieldName
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -84,4 +89,4 @@ class Density:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -6,6 +6,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import LONG_TERM, OFF, Boolean
 from .....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ....behaviorValues import freezeTable, setBehaviorValues
 from ....TestData.BiaxialTestData import BiaxialTestData
 from ....TestData.PlanarTestData import PlanarTestData
 from ....TestData.SimpleShearTestData import SimpleShearTestData
@@ -99,7 +100,12 @@ class Hyperfoam:
         ------
         RangeError
         """
-        ...
+        self.testData = testData
+        self.poisson = poisson
+        self.n = n
+        self.temperatureDependency = temperatureDependency
+        self.moduli = moduli
+        self.table = freezeTable(table)
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -109,4 +115,4 @@ class Hyperfoam:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -21,6 +21,7 @@ from ....UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 from ...TestData.BiaxialTestData import BiaxialTestData
 from ...TestData.PlanarTestData import PlanarTestData
 from ...TestData.UniaxialTestData import UniaxialTestData
@@ -261,7 +262,24 @@ class Hyperelastic:
         InvalidNameError
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.type = type
+        self.moduliTimeScale = moduliTimeScale
+        self.temperatureDependency = temperatureDependency
+        self.n = n
+        self.beta = beta
+        self.testData = testData
+        self.compressible = compressible
+        self.properties = properties
+        self.deviatoricResponse = deviatoricResponse
+        self.volumetricResponse = volumetricResponse
+        self.poissonRatio = poissonRatio
+        self.materialType = materialType
+        self.anisotropicType = anisotropicType
+        self.formulation = formulation
+        self.behaviorType = behaviorType
+        self.dependencies = dependencies
+        self.localDirections = localDirections
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -271,4 +289,4 @@ class Hyperelastic:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -0,0 +1,470 @@
+from __future__ import annotations
+
+import re
+from typing import Sequence
+
+import numpy as np
+
+#: The deformation modes of the unit element tests: uniaxial, equibiaxial, planar and simple shear on the nominal
+#: strain, and volumetric on the volume ratio.
+MODES = ("UNIAXIAL", "BIAXIAL", "PLANAR", "SIMPLE_SHEAR", "VOLUMETRIC")
+
+#: The potentials with another name, mapped to the family and order they are a special case of.
+ALIASES = {"MOONEY_RIVLIN": "POLY_N1", "NEO_HOOKE": "REDUCED_POLY_N1", "YEOH": "REDUCED_POLY_N3"}
+
+#: The number of points of each mode evaluated.
+NUM_POINTS = 51
+
+#: The number of random parameter sets tried per nonlinear parameter before the refinement of a nonlinear fit.
+NUM_SAMPLES = 256
+
+#: The number of best parameter sets refined together by a nonlinear fit.
+NUM_STARTS = 8
+
+#: The number of Levenberg-Marquardt iterations of a nonlinear fit.
+ITERATIONS = 40
+
+# Coefficients of the series of the inverse Langevin function of the Arruda-Boyce potential
+_arrudaBoyce = np.array([1 / 2, 1 / 20, 11 / 1050, 19 / 7000, 519 / 673750])
+
+
+def modeKinematics(modes, strains) -> dict[str, np.ndarray]:
+    """Return the principal stretches and the invariants of incompressible deformation modes.
+
+    The rates are the derivatives with respect to the nominal strain, or to the shear strain in simple shear,
+    halved in the equibiaxial mode whose nominal stress acts on two faces. The nominal stress of a mode is then the
+    derivative of the strain energy along the rates.
+
+    Parameters
+    ----------
+    modes
+        A String or an (m,) array of Strings specifying the mode of each point: UNIAXIAL, BIAXIAL, PLANAR or
+        SIMPLE_SHEAR.
+    strains
+        An (m,) array of Floats specifying the nominal strain of each point.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The (m, 3) arrays ``stretches`` and ``rates`` and the (m,) arrays of the invariants ``I1`` and ``I2`` and of
+        their rates ``dI1`` and ``dI2``.
+
+    Raises
+    ------
+    ValueError
+        If a mode is not a deviatoric mode.
+    """
+    strains = np.atleast_1d(np.asarray(strains, dtype=np.float64))
+    modes = np.broadcast_to(np.asarray(modes, dtype=str), strains.shape)
+    stretches, rates = np.ones((len(strains), 3)), np.zeros((len(strains), 3))
+    for mode in np.unique(modes):
+        rows = modes == mode
+        stretch = 1.0 + strains[rows]
+        if mode == "UNIAXIAL":
+            lateral = stretch**-0.5
+            stretches[rows] = np.column_stack([stretch, lateral, lateral])
+            rates[rows] = np.column_stack([np.ones_like(stretch), -0.5 * lateral**3, -0.5 * lateral**3])
+        elif mode == "BIAXIAL":
+            stretches[rows] = np.column_stack([stretch, stretch, stretch**-2])
+            rates[rows] = np.column_stack([np.full_like(stretch, 0.5), np.full_like(stretch, 0.5), -(stretch**-3)])
+        elif mode == "PLANAR":
+            stretches[rows] = np.column_stack([stretch, np.ones_like(stretch), 1.0 / stretch])
+            rates[rows] = np.column_stack([np.ones_like(stretch), np.zeros_like(stretch), -(stretch**-2)])
+        elif mode == "SIMPLE_SHEAR":
+            shear = strains[rows]
+            major = 0.5 * shear + np.sqrt(1.0 + 0.25 * shear * shear)
+            rate = major / (major + 1.0 / major)
+            stretches[rows] = np.column_stack([major, 1.0 / major, np.ones_like(major)])
+            rates[rows] = np.column_stack([rate, -rate / (major * major), np.zeros_like(major)])
+        else:
+            raise ValueError(f"Unsupported deformation mode {mode}, expected UNIAXIAL, BIAXIAL, PLANAR or SIMPLE_SHEAR")
+    return {
+        "stretches": stretches,
+        "rates": rates,
+        "I1": (stretches**2).sum(axis=1),
+        "I2": (stretches**-2).sum(axis=1),
+        "dI1": 2.0 * (stretches * rates).sum(axis=1),
+        "dI2": -2.0 * (stretches**-3 * rates).sum(axis=1),
+    }
+
+
+class HyperelasticPotential:
+    """The HyperelasticPotential object is an isotropic hyperelastic strain energy potential evaluated on arrays of
+    strains.
+
+    The deviatoric nominal stress of every potential but Marlow is linear in some coefficients: the Cij of the
+    polynomial forms, the moduli of the Ogden terms and the shear modulus of the Arruda-Boyce and Van der Waals
+    forms. A potential builds the (B, m, p) matrix of the stresses of each of these coefficients at m strain points
+    for B sets of the other, nonlinear, parameters at once, so evaluating a potential is a matrix product and
+    fitting the linear coefficients to test data is a batch of least squares problems. The nonlinear parameters are
+    fitted by sampling random parameter sets and refining the best ones together with Levenberg-Marquardt
+    iterations. As in Abaqus, the fits minimize the relative error of the stresses. The Marlow potential depends on
+    the first invariant only and is tabulated from the test data of a single mode.
+    """
+
+    #: A String specifying the name of the potential, such as POLY_N2, REDUCED_POLY_N3, OGDEN_N3, ARRUDA_BOYCE,
+    #: VAN_DER_WAALS or MARLOW.
+    name: str
+
+    #: A String specifying the family of the potential: POLYNOMIAL, REDUCED_POLYNOMIAL, OGDEN, ARRUDA_BOYCE,
+    #: VAN_DER_WAALS or MARLOW.
+    family: str
+
+    #: An Int specifying the order of the potential.
+    order: int = 1
+
+    #: None or a Float specifying the fixed invariant mixture parameter of the Van der Waals potential. None fits it.
+    beta: float | None = None
+
+    #: A tuple of Floats specifying the coefficients of the potential in the order of the table of the Hyperelastic
+    #: object, the compressibility coefficients last.
+    coefficients: tuple = ()
+
+    #: None or a Float specifying the root mean square relative error of the stresses of the last fit.
+    error: float | None = None
+
+    #: A dict mapping the modes of the last evaluation to (k, 2) float arrays of the nominal strains, or volume
+    #: ratios, and the nominal stresses, or pressures.
+    responses: dict
+
+    def __init__(self, name: str, beta: float | None = None):
+        """This method creates a HyperelasticPotential object.
+
+        Parameters
+        ----------
+        name
+            A String specifying the potential: POLY_N1 to POLY_N6, REDUCED_POLY_N1 to REDUCED_POLY_N6, OGDEN_N1 to
+            OGDEN_N6, ARRUDA_BOYCE, VAN_DER_WAALS, MARLOW, MOONEY_RIVLIN, NEO_HOOKE or YEOH.
+        beta
+            None or a Float specifying the fixed invariant mixture parameter of the Van der Waals potential.
+
+        Raises
+        ------
+        ValueError
+            If the potential is not supported.
+        """
+        self.name = ALIASES.get(str(name), str(name)).replace("REDUCED_POLYNOMIAL_", "REDUCED_POLY_")
+        match = re.fullmatch(r"(POLY|REDUCED_POLY|OGDEN)_N([1-6])", self.name)
+        if match:
+            self.family = {"POLY": "POLYNOMIAL", "REDUCED_POLY": "REDUCED_POLYNOMIAL"}.get(match.group(1), "OGDEN")
+            self.order = int(match.group(2))
+        elif self.name in ("ARRUDA_BOYCE", "VAN_DER_WAALS", "MARLOW"):
+            self.family, self.order = self.name, 1
+        else:
+            raise ValueError(f"Unsupported strain energy potential {name}")
+        self.beta = None if beta is None else float(beta)
+        if self.family == "POLYNOMIAL":
+            self._terms = [(total - j, j) for total in range(1, self.order + 1) for j in range(total + 1)]
+        else:
+            self._terms = [(i, 0) for i in range(1, self.order + 1)]
+        self.responses = {}
+        self._curve: tuple[np.ndarray, np.ndarray] | None = None
+        self._volumetricCurve: tuple[np.ndarray, np.ndarray] | None = None
+
+    @classmethod
+    def fromHyperelastic(cls, hyperelastic) -> HyperelasticPotential:
+        """Return the potential defined by the coefficients of a Hyperelastic object, at the first row of its
+        table.
+
+        Raises
+        ------
+        ValueError
+            If the type of the Hyperelastic object is not supported or its table is empty.
+        """
+        kind, order = str(getattr(hyperelastic, "type", "UNKNOWN")), int(getattr(hyperelastic, "n", 1))
+        name = {"POLYNOMIAL": f"POLY_N{order}", "REDUCED_POLYNOMIAL": f"REDUCED_POLY_N{order}",
+                "OGDEN": f"OGDEN_N{order}"}.get(kind, kind)  # fmt: skip
+        potential = cls(name)
+        table = [row for row in getattr(hyperelastic, "table", ()) if len(row)]
+        if not table:
+            raise ValueError("The hyperelastic material does not define coefficients")
+        potential.coefficients = tuple(float(value) for value in table[0][: potential.numCoefficients])
+        return potential
+
+    @property
+    def numLinear(self) -> int:
+        """The number of deviatoric coefficients the stresses are linear in."""
+        return {"ARRUDA_BOYCE": 1, "VAN_DER_WAALS": 2, "MARLOW": 0}.get(self.family, len(self._terms))
+
+    @property
+    def numCoefficients(self) -> int:
+        """The number of coefficients in the table of the potential."""
+        deviatoric = {"OGDEN": 2 * self.order, "ARRUDA_BOYCE": 2, "VAN_DER_WAALS": 4}.get(self.family, self.numLinear)
+        return 0 if self.family == "MARLOW" else deviatoric + self.order
+
+    @property
+    def numParameters(self) -> int:
+        """The number of nonlinear parameters of the potential."""
+        return {"OGDEN": self.order, "ARRUDA_BOYCE": 1, "VAN_DER_WAALS": 1 if self.beta is not None else 2}.get(
+            self.family, 0
+        )
+
+    def design(self, kinematics: dict, parameters: np.ndarray | None = None) -> np.ndarray:
+        """Return the (B, m, p) nominal stresses of each linear coefficient at the points of **kinematics**, for each
+        of the (B, q) sets of nonlinear **parameters**.
+
+        The nonlinear parameters are the exponents of the Ogden terms, the locking stretch of the Arruda-Boyce
+        potential and the locking stretch and, unless fixed, the mixture parameter of the Van der Waals potential.
+        Parameter sets beyond locking give infinite stresses.
+        """
+        parameters = np.zeros((1, 0)) if parameters is None else np.atleast_2d(np.asarray(parameters, dtype=float))
+        I1, I2, dI1, dI2 = (kinematics[key] for key in ("I1", "I2", "dI1", "dI2"))
+        if self.family in ("POLYNOMIAL", "REDUCED_POLYNOMIAL"):
+            first, second = I1 - 3.0, I2 - 3.0
+            columns = [(i * first ** max(i - 1, 0) * second**j * dI1 if i else 0.0)
+                       + (j * first**i * second ** max(j - 1, 0) * dI2 if j else 0.0)
+                       for i, j in self._terms]  # fmt: skip
+            return np.broadcast_to(np.stack(columns, axis=-1), (len(parameters), len(I1), self.numLinear))
+        if self.family == "OGDEN":
+            alphas = parameters[:, None, None, :]
+            stretches, rates = kinematics["stretches"][None, :, :, None], kinematics["rates"][None, :, :, None]
+            return 2.0 / alphas[:, :, 0] * (stretches ** (alphas - 1.0) * rates).sum(axis=2)
+        if self.family == "ARRUDA_BOYCE":
+            locking = parameters[:, :1, None]
+            orders = np.arange(1, 6)
+            derivative = (orders * _arrudaBoyce * locking ** (2.0 - 2.0 * orders) * I1[:, None] ** (orders - 1)).sum(-1)
+            return (derivative * dI1)[:, :, None]
+        if self.family == "VAN_DER_WAALS":
+            locking = parameters[:, :1]
+            beta = parameters[:, 1:2] if self.beta is None else np.full_like(locking, self.beta)
+            mixed = (1.0 - beta) * I1 + beta * I2
+            rate = (1.0 - beta) * dI1 + beta * dI2
+            with np.errstate(invalid="ignore", divide="ignore"):
+                eta = np.sqrt(np.maximum(mixed - 3.0, 0.0) / (locking**2 - 3.0))
+                first = np.where(eta < 1.0, 0.5 / (1.0 - eta), np.inf) * rate
+            second = -0.5 * np.sqrt(np.maximum(mixed - 3.0, 0.0) / 2.0) * rate
+            return np.stack([first, second], axis=-1)
+        raise ValueError(f"The {self.family} potential has no linear coefficients")
+
+    def split(self, coefficients: Sequence[float] | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the linear coefficients, the nonlinear parameters and the compressibility coefficients Di of the
+        table coefficients, by default :attr:`coefficients`.
+
+        Raises
+        ------
+        ValueError
+            If the number of coefficients is not that of the potential.
+        """
+        values = np.asarray(self.coefficients if coefficients is None else coefficients, dtype=float)
+        if len(values) != self.numCoefficients:
+            raise ValueError(f"The {self.name} potential has {self.numCoefficients} coefficients, got {len(values)}")
+        deviatoric, compliances = values[: len(values) - self.order], values[len(values) - self.order :]
+        if self.family == "OGDEN":
+            return deviatoric[0::2], deviatoric[1::2], compliances
+        if self.family == "ARRUDA_BOYCE":
+            return deviatoric[:1], deviatoric[1:], compliances
+        if self.family == "VAN_DER_WAALS":
+            # Table of mu, lambda_m, a and beta, the stresses are linear in mu and mu * a
+            modulus, locking, interaction, beta = deviatoric
+            return np.array([modulus, modulus * interaction]), np.array([locking, beta]), compliances
+        return deviatoric, np.zeros(0), compliances
+
+    def join(self, linear, nonlinear, compliances) -> tuple:
+        """Return the table coefficients of the linear coefficients, the nonlinear parameters and the compressibility
+        coefficients Di."""
+        linear, nonlinear = np.asarray(linear, dtype=float), np.asarray(nonlinear, dtype=float)
+        if self.family == "OGDEN":
+            deviatoric = np.column_stack([linear, nonlinear]).ravel()
+        elif self.family == "ARRUDA_BOYCE":
+            deviatoric = np.array([linear[0], nonlinear[0]])
+        elif self.family == "VAN_DER_WAALS":
+            beta = nonlinear[1] if self.beta is None or len(nonlinear) > 1 else self.beta
+            interaction = linear[1] / linear[0] if linear[0] else 0.0
+            deviatoric = np.array([linear[0], nonlinear[0], interaction, beta])
+        else:
+            deviatoric = linear
+        return tuple(float(value) for value in np.concatenate([deviatoric, compliances]))
+
+    def stress(self, kinematics: dict, coefficients: Sequence[float] | None = None) -> np.ndarray:
+        """Return the (m,) nominal stresses at the points of **kinematics**, for the table coefficients, by default
+        :attr:`coefficients`. In simple shear the stress is the nominal shear stress.
+
+        Raises
+        ------
+        ValueError
+            If the coefficients do not match the potential or a Marlow potential was not fitted.
+        """
+        if self.family == "MARLOW":
+            if self._curve is None:
+                raise ValueError("The Marlow potential is defined by test data, fit it first")
+            return np.interp(kinematics["I1"], *self._curve) * kinematics["dI1"]
+        linear, nonlinear, _ = self.split(coefficients)
+        if self.family == "VAN_DER_WAALS" and self.beta is not None:
+            nonlinear = nonlinear[:1]
+        return self.design(kinematics, nonlinear[None])[0] @ linear
+
+    def pressure(self, volumeRatios, coefficients: Sequence[float] | None = None) -> np.ndarray:
+        """Return the (m,) pressures at the volume ratios **volumeRatios**, for the table coefficients, by default
+        :attr:`coefficients`. An incompressible material, with D1 = 0, has undefined pressures returned as NaN.
+        """
+        volumeRatios = np.atleast_1d(np.asarray(volumeRatios, dtype=np.float64))
+        if self.family == "MARLOW":
+            if self._volumetricCurve is None:
+                return np.full(len(volumeRatios), np.nan)
+            return np.interp(volumeRatios, *self._volumetricCurve)
+        compliances = self.split(coefficients)[2]
+        if compliances[0] <= 0.0:
+            return np.full(len(volumeRatios), np.nan)
+        bulk = np.divide(1.0, compliances, out=np.zeros(len(compliances)), where=compliances > 0.0)
+        return self._volumetricDesign(volumeRatios) @ bulk
+
+    def fit(self, modes, strains, stresses, volumeRatios=None, pressures=None, dataType: str = "BOTH") -> tuple:
+        """Fit the coefficients of the potential to test data, updating :attr:`coefficients` and :attr:`error`.
+
+        The deviatoric coefficients are fitted to the nominal stresses of the uniaxial, biaxial, planar and simple
+        shear data together, the compressibility coefficients to the volumetric data, if any, otherwise the
+        material is incompressible. The Marlow potential is tabulated from the data of the first mode given, the
+        tension, compression or both data according to **dataType**, and from the volumetric data.
+
+        Parameters
+        ----------
+        modes
+            A String or an (m,) array of Strings specifying the mode of each test point: UNIAXIAL, BIAXIAL, PLANAR or
+            SIMPLE_SHEAR.
+        strains
+            An (m,) array of Floats specifying the nominal strains.
+        stresses
+            An (m,) array of Floats specifying the nominal stresses.
+        volumeRatios
+            None or a (v,) array of Floats specifying the volume ratios of the volumetric test data.
+        pressures
+            None or a (v,) array of Floats specifying the pressures of the volumetric test data.
+        dataType
+            A String specifying the data of the Marlow potential: TENSION, COMPRESSION or BOTH.
+
+        Returns
+        -------
+        tuple
+            The fitted table coefficients.
+
+        Raises
+        ------
+        ValueError
+            If there are no test data to fit the deviatoric coefficients.
+        """
+        strains = np.atleast_1d(np.asarray(strains, dtype=np.float64))
+        stresses = np.atleast_1d(np.asarray(stresses, dtype=np.float64))
+        modes = np.broadcast_to(np.asarray(modes, dtype=str), strains.shape)
+        volumetric = volumeRatios is not None and pressures is not None and len(np.atleast_1d(volumeRatios))
+        if volumetric:
+            volumeRatios = np.atleast_1d(np.asarray(volumeRatios, dtype=np.float64))
+            pressures = np.atleast_1d(np.asarray(pressures, dtype=np.float64))
+        # Relative errors, points without stress carry no information
+        used = np.abs(stresses) > 1e-12 * np.abs(stresses).max(initial=0.0)
+        if not used.any():
+            raise ValueError(f"No test data with nonzero stresses to fit the {self.name} potential")
+        kinematics = modeKinematics(modes[used], strains[used])
+        weights, target = 1.0 / np.abs(stresses[used]), np.sign(stresses[used])
+        if self.family == "MARLOW":
+            self._fitMarlow(modes[used], strains[used], stresses[used], str(dataType))
+            self._volumetricCurve = None
+            if volumetric:
+                order = np.argsort(np.append(volumeRatios, 1.0))
+                self._volumetricCurve = (np.append(volumeRatios, 1.0)[order], np.append(pressures, 0.0)[order])
+            self.coefficients = ()
+            self.error = float(np.sqrt(np.mean((self.stress(kinematics) * weights - target) ** 2)))
+            return self.coefficients
+        if self.numParameters:
+            nonlinear = self._fitNonlinear(kinematics, weights, target)
+        else:
+            nonlinear = np.zeros(0)
+        linear, costs, _ = _leastSquares(self.design(kinematics, nonlinear[None]) * weights[:, None], target)
+        compliances = np.zeros(self.order)
+        if volumetric:
+            used = np.abs(pressures) > 1e-12 * np.abs(pressures).max(initial=0.0)
+            if used.any():
+                design = self._volumetricDesign(volumeRatios[used]) / np.abs(pressures[used])[:, None]
+                bulk = _leastSquares(design[None], np.sign(pressures[used]))[0][0]
+                # Terms without stiffness are left out, with Di = 0
+                np.divide(1.0, bulk, out=compliances, where=bulk > 1e-8 * np.abs(bulk).max(initial=0.0))
+        self.coefficients = self.join(linear[0], nonlinear, compliances)
+        self.error = float(np.sqrt(costs[0] / len(target)))
+        return self.coefficients
+
+    def _bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the lower and upper bounds of the nonlinear parameters."""
+        if self.family == "OGDEN":
+            return np.full(self.order, -20.0), np.full(self.order, 20.0)
+        if self.family == "ARRUDA_BOYCE":
+            return np.array([1.01]), np.array([100.0])
+        # Locking stretch beyond the undeformed state of the mixed invariant, sqrt(3)
+        return np.array([1.75, 0.0])[: self.numParameters], np.array([100.0, 1.0])[: self.numParameters]
+
+    def _fitNonlinear(self, kinematics: dict, weights: np.ndarray, target: np.ndarray) -> np.ndarray:
+        """Return the nonlinear parameters minimizing the relative error, the linear coefficients being solved for
+        every parameter set."""
+        lows, highs = self._bounds()
+        count = len(lows)
+
+        def residuals(parameters: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            if self.family == "OGDEN":
+                # Exponents away from zero, where the terms vanish
+                parameters = np.where(np.abs(parameters) < 0.05, np.where(parameters < 0, -0.05, 0.05), parameters)
+            with np.errstate(over="ignore", invalid="ignore"):
+                design = self.design(kinematics, parameters) * weights[:, None]
+            _, costs, errors = _leastSquares(design, target)
+            return costs, errors
+
+        random = np.random.default_rng(0)
+        samples = lows + (highs - lows) * random.random((NUM_SAMPLES * count, count))
+        costs = residuals(samples)[0]
+        current = samples[np.argsort(costs)[:NUM_STARTS]]
+        costs, errors = residuals(current)
+        damping = np.full(len(current), 1e-3)
+        identity = np.eye(count)
+        for _ in range(ITERATIONS):
+            # Forward difference Jacobian of all the starts in one batch
+            steps = 1e-6 * np.maximum(np.abs(current), 1.0)
+            shifted = (current[:, None, :] + identity * steps[:, None, :]).reshape(-1, count)
+            jacobian = (residuals(shifted)[1].reshape(len(current), count, -1) - errors[:, None, :]) / steps[..., None]
+            jacobian = np.nan_to_num(jacobian, nan=0.0, posinf=0.0, neginf=0.0)
+            hessian = jacobian @ jacobian.transpose(0, 2, 1)
+            gradient = jacobian @ np.nan_to_num(errors)[:, :, None]
+            scale = hessian.diagonal(axis1=1, axis2=2) + 1e-12 * hessian.diagonal(axis1=1, axis2=2).max(initial=0.0)
+            system = hessian + damping[:, None, None] * identity * (scale + 1e-300)[:, None, :]
+            trial = np.clip(current - np.linalg.solve(system, gradient)[..., 0], lows, highs)
+            trialCosts, trialErrors = residuals(trial)
+            better = trialCosts < costs
+            current[better], costs[better], errors[better] = trial[better], trialCosts[better], trialErrors[better]
+            damping = np.where(better, damping / 3.0, damping * 4.0)
+        best = current[np.argmin(costs)]
+        if not np.isfinite(costs.min()):
+            raise ValueError(f"The {self.name} potential cannot be fitted to the test data")
+        if self.family == "OGDEN":
+            best = np.where(np.abs(best) < 0.05, np.where(best < 0, -0.05, 0.05), best)
+        return best
+
+    def _fitMarlow(self, modes: np.ndarray, strains: np.ndarray, stresses: np.ndarray, dataType: str):
+        """Tabulate the derivative of the strain energy with respect to the first invariant from the test data of
+        the first mode."""
+        rows = modes == modes[0]
+        if dataType == "TENSION":
+            rows &= strains > 0.0
+        elif dataType == "COMPRESSION":
+            rows &= strains < 0.0
+        kinematics = modeKinematics(modes[rows], strains[rows])
+        # The stress of a mode is the derivative with respect to I1 times the rate of I1, zero at no strain
+        moving = np.abs(kinematics["dI1"]) > 1e-12
+        if not moving.any():
+            raise ValueError("No strained test data to define the Marlow potential")
+        invariants = kinematics["I1"][moving]
+        slopes = stresses[rows][moving] / kinematics["dI1"][moving]
+        order = np.argsort(invariants, kind="stable")
+        self._curve = (invariants[order], slopes[order])
+
+    def _volumetricDesign(self, volumeRatios: np.ndarray) -> np.ndarray:
+        """Return the (v, n) pressures of each inverse compressibility coefficient 1 / Di at the volume ratios."""
+        if self.family in ("ARRUDA_BOYCE", "VAN_DER_WAALS"):
+            return -(volumeRatios - 1.0 / volumeRatios)[:, None]
+        orders = np.arange(1, self.order + 1)
+        return -2.0 * orders * (volumeRatios[:, None] - 1.0) ** (2 * orders - 1)
+
+
+def _leastSquares(design: np.ndarray, target: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Solve the (B, m, p) least squares problems of a common (m,) target, returning the (B, p) solutions, the (B,)
+    squared residual norms, infinite for systems with non-finite entries, and the (B, m) residuals."""
+    valid = np.isfinite(design).all(axis=(1, 2))
+    design = np.where(valid[:, None, None], design, 0.0)
+    solutions = np.linalg.pinv(design) @ target
+    errors = np.einsum("bmp,bp->bm", design, solutions) - target
+    return solutions, np.where(valid, np.einsum("bm,bm->b", errors, errors), np.inf), errors
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ....behaviorValues import freezeTable, setBehaviorValues
+
 
 @abaqus_class_doc
 class CombinedTestData:
@@ -70,9 +72,11 @@ class CombinedTestData:
         CombinedTestData
             A CombinedTestData object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.volinf = volinf
+        self.shrinf = shrinf
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the CombinedTestData object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
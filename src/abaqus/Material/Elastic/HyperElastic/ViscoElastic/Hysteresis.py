@@ -1,5 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ....behaviorValues import freezeTable, setBehaviorValues
+
 
 @abaqus_class_doc
 class Hysteresis:
@@ -50,7 +52,7 @@ class Hysteresis:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -60,4 +62,4 @@ class Hysteresis:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import FORMULA, ISOTROPIC, NONE, PRONY
 from .....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ....behaviorValues import freezeTable, setBehaviorValues
 from ....Mechanical.Viscosity.Trs import Trs
 from ....TestData.ShearTestData import ShearTestData
 from ....TestData.VolumetricTestData import VolumetricTestData
@@ -171,7 +172,15 @@ class Viscoelastic:
         ------
         RangeError
         """
-        ...
+        self.domain = domain
+        self.table = freezeTable(table)
+        self.frequency = frequency
+        self.type = type
+        self.preload = preload
+        self.time = time
+        self.errtol = errtol
+        self.nmax = nmax
+        self.volumetricTable = volumetricTable
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -181,4 +190,4 @@ class Viscoelastic:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
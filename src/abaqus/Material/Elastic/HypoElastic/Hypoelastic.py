@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, Boolean
+from ...behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -51,9 +52,10 @@ class Hypoelastic:
         Hypoelastic
             A Hypoelastic object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.user = user
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the Hypoelastic object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import ISOTROPIC, LONG_TERM, OFF, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 from .FailStrain import FailStrain
 from .FailStress import FailStress
 
@@ -221,7 +222,13 @@ class Elastic:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.type = type
+        self.noCompression = noCompression
+        self.noTension = noTension
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.moduli = moduli
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -231,4 +238,4 @@ class Elastic:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
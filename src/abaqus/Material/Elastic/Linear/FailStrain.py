@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, Boolean
+from ...behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -60,7 +61,9 @@ class FailStrain:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -70,4 +73,4 @@ class FailStrain:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, Boolean
+from ...behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -63,7 +64,9 @@ class FailStress:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -73,4 +76,4 @@ class FailStress:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
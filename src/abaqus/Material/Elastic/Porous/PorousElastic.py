@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, POISSON, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -83,7 +84,10 @@ class PorousElastic:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.shear = shear
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -93,4 +97,4 @@ class PorousElastic:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
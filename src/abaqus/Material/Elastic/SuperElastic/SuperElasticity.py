@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ...behaviorValues import freezeTable, setBehaviorValues
 from ...Plastic.SuperElastic.SuperElasticHardening import SuperElasticHardening
 from ...Plastic.SuperElastic.SuperElasticHardeningModifications import (
     SuperElasticHardeningModifications,
@@ -75,7 +76,8 @@ class SuperElasticity:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.nonassociated = nonassociated
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -85,4 +87,4 @@ class SuperElasticity:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import ISOTROPIC, OFF, Boolean
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -93,9 +94,13 @@ class Dielectric:
         Dielectric
             A Dielectric object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.type = type
+        self.frequencyDependency = frequencyDependency
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the Dielectric object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import ISOTROPIC, OFF, Boolean
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -97,7 +98,11 @@ class ElectricalConductivity:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.type = type
+        self.frequencyDependency = frequencyDependency
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -107,4 +112,4 @@ class ElectricalConductivity:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
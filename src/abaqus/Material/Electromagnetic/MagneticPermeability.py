@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import ISOTROPIC, OFF, Boolean
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -129,7 +130,14 @@ class MagneticPermeability:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.table2 = table2
+        self.table3 = table3
+        self.type = type
+        self.frequencyDependency = frequencyDependency
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.nonlinearBH = nonlinearBH
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -139,4 +147,4 @@ class MagneticPermeability:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import OFF, STRESS, Boolean
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -106,9 +107,12 @@ class Piezoelectric:
         Piezoelectric
             A Piezoelectric object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.type = type
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the Piezoelectric object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
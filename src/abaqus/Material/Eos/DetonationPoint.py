@@ -1,5 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ..behaviorValues import freezeTable, setBehaviorValues
+
 
 @abaqus_class_doc
 class DetonationPoint:
@@ -46,9 +48,9 @@ class DetonationPoint:
         DetonationPoint
             A DetonationPoint object.
         """
-        ...
+        self.table = freezeTable(table)
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the DetonationPoint object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
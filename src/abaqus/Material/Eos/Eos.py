@@ -142,4 +142,12 @@ class Eos:
         Raises
         ------
         """
-        ...
+        self.type = type
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.detonationEnergy = detonationEnergy
+        self.solidTable = solidTable
+        self.gasTable = gasTable
+        self.reactionTable = reactionTable
+        self.gasSpecificTable = gasSpecificTable
+        self.table = table
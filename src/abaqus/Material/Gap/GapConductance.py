@@ -66,7 +66,9 @@ class GapConductance:
         Raises
         ------
         """
-        ...
+        self.pressureDependency = pressureDependency
+        self.dependencies = dependencies
+        self.table = table
 
     @abaqus_method_doc
     def setValues(self):
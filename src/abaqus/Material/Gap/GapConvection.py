@@ -66,7 +66,10 @@ class GapConvection:
         -------
             A GapConvection object.
         """
-        ...
+        self.type = type
+        self.table = table
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self):
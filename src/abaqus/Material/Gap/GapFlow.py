@@ -6,6 +6,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import NEWTONIAN, OFF, Boolean
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -98,9 +99,13 @@ class GapFlow:
         GapFlow
             A GapFlow object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.kmax = kmax
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.type = type
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the GapFlow object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -55,7 +55,9 @@ class GapRadiation:
         -------
             A GapRadiation object.
         """
-        ...
+        self.masterSurfaceEmissivity = masterSurfaceEmissivity
+        self.slaveSurfaceEmissivity = slaveSurfaceEmissivity
+        self.table = table
 
     @abaqus_method_doc
     def setValues(self):
@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import OFF, Boolean
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -58,9 +59,11 @@ class ContactArea:
         ContactArea
             A ContactArea object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the ContactArea object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
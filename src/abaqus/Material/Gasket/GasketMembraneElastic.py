@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import OFF, Boolean
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -58,7 +59,9 @@ class GasketMembraneElastic:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -68,4 +71,4 @@ class GasketMembraneElastic:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -12,6 +12,7 @@ from ...UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 from .ContactArea import ContactArea
 
 
@@ -163,7 +164,17 @@ class GasketThicknessBehavior:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.tensileStiffnessFactor = tensileStiffnessFactor
+        self.type = type
+        self.unloadingDependencies = unloadingDependencies
+        self.unloadingTemperatureDependency = unloadingTemperatureDependency
+        self.variableUnits = variableUnits
+        self.yieldOnset = yieldOnset
+        self.yieldOnsetMethod = yieldOnsetMethod
+        self.unloadingTable = unloadingTable
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -173,4 +184,4 @@ class GasketThicknessBehavior:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import OFF, STRESS, Boolean
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -69,7 +70,10 @@ class GasketTransverseShearElastic:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.variableUnits = variableUnits
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -79,4 +83,4 @@ class GasketTransverseShearElastic:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
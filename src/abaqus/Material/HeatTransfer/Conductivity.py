@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import ISOTROPIC, OFF, Boolean
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -91,7 +92,10 @@ class Conductivity:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.type = type
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -101,4 +105,4 @@ class Conductivity:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import CONSTANTVOLUME, OFF, Boolean
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -68,7 +69,10 @@ class SpecificHeat:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.law = law
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -78,4 +82,4 @@ class SpecificHeat:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
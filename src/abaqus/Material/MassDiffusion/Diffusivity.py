@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import GENERAL, ISOTROPIC, OFF, Boolean
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 from .PressureEffect import PressureEffect
 from .SoretEffect import SoretEffect
 
@@ -106,7 +107,11 @@ class Diffusivity:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.type = type
+        self.law = law
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -116,4 +121,4 @@ class Diffusivity:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import weakref
+from typing import Sequence
+
+import numpy as np
+
+from .behaviorValues import freezeTable
+
+#: The number of values of each row of the tables of the material behaviors by type, the empty type for behaviors
+#: without types.
+NUM_VALUES: dict[str, dict[str, int]] = {
+    "Density": {"": 1},
+    "SpecificHeat": {"": 1},
+    "Conductivity": {"ISOTROPIC": 1, "ORTHOTROPIC": 3, "ANISOTROPIC": 6},
+    "Expansion": {"ISOTROPIC": 1, "ORTHOTROPIC": 3, "ANISOTROPIC": 6},
+    "Elastic": {"ISOTROPIC": 2, "ORTHOTROPIC": 9, "ANISOTROPIC": 21, "ENGINEERING_CONSTANTS": 9, "LAMINA": 6,
+                "TRACTION": 3, "COUPLED_TRACTION": 6, "SHEAR": 1},
+    "Viscosity": {"NEWTONIAN": 1},
+}  # fmt: skip
+
+#: The number of queries interpolated at once in a regular grid.
+CHUNK_SIZE = 65536
+
+_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+class MaterialTable:
+    """The MaterialTable object interpolates the table of a material behavior at arrays of values of its
+    independent variables.
+
+    A row of the table holds the values of the behavior followed by its independent variables: the variables of
+    the behavior itself, such as the plastic strain of a hardening curve, then the temperature and the field
+    variables, if the data depend on them. As in Abaqus, the values are interpolated linearly in each variable,
+    the first variable varying fastest, and are constant outside the range of the data, unless the extrapolation
+    is linear for that variable. The table is compiled once: a table holding every combination of the values of
+    the variables is stored as a regular grid, interpolated for all the queries at once by combining the corners
+    of their cells; any other table is stored as nested groups of rows sharing the value of the outer variables,
+    interpolated group by group.
+    """
+
+    #: An Int specifying the number of values of each row.
+    numValues: int
+
+    #: A tuple of Strings specifying the names of the independent variables, in the order of the columns.
+    variables: tuple
+
+    #: An (m, numValues) float array specifying the values of the rows.
+    values: np.ndarray
+
+    #: An (m, k) float array specifying the independent variables of the rows.
+    points: np.ndarray
+
+    #: A Boolean specifying whether the rows form a regular grid of the independent variables.
+    isGrid: bool = False
+
+    def __init__(
+        self,
+        table: Sequence[Sequence[float]],
+        numValues: int,
+        variables: Sequence[str] = (),
+        temperatureDependency: bool = False,
+        dependencies: int = 0,
+        linear: Sequence[str] = (),
+        tolerance: float = 0.0,
+    ):
+        """This method compiles a MaterialTable object.
+
+        Parameters
+        ----------
+        table
+            A sequence of sequences of Floats specifying the rows of the table. Missing trailing entries are zero.
+        numValues
+            An Int specifying the number of values of each row.
+        variables
+            A sequence of Strings specifying the names of the independent variables of the behavior itself, which
+            precede the temperature and the field variables.
+        temperatureDependency
+            A Boolean specifying whether the data depend on temperature.
+        dependencies
+            An Int specifying the number of field variables the data depend on.
+        linear
+            A sequence of Strings specifying the variables along which the values are extrapolated linearly.
+        tolerance
+            A Float specifying the tolerance, relative to the range of each variable, within which the values of the
+            variable are merged into their mean to regularize the table. The default value is 0.0.
+
+        Raises
+        ------
+        ValueError
+            If the table is empty.
+        """
+        self.numValues = int(numValues)
+        self.variables = (
+            tuple(variables)
+            + (("temperature",) if temperatureDependency else ())
+            + tuple(f"field{number}" for number in range(1, int(dependencies) + 1))
+        )
+        rows = [tuple(row) for row in table if len(row)]
+        if not rows:
+            raise ValueError("The table is empty")
+        width = self.numValues + len(self.variables)
+        data = np.zeros((len(rows), width))
+        for index, row in enumerate(rows):
+            data[index, : min(len(row), width)] = row[:width]
+        self.values, self.points = data[:, : self.numValues], data[:, self.numValues :]
+        self._linear = np.array([name in linear for name in self.variables], dtype=bool)
+        if tolerance > 0.0:
+            self._regularize(tolerance)
+        self._compile()
+
+    @classmethod
+    def fromBehavior(cls, behavior, numValues: int | None = None) -> MaterialTable:
+        """Return the MaterialTable object of a material behavior, compiled once and cached until the table or the
+        options of the behavior change. The behaviors store their tables as nested tuples, which the cache
+        recognizes by identity; other tables are compared by their contents.
+
+        Parameters
+        ----------
+        behavior
+            A material behavior with a table, such as an Elastic, Plastic, Density or Conductivity object.
+        numValues
+            An Int specifying the number of values of each row, required for behaviors other than those of
+            :data:`NUM_VALUES` and Plastic.
+
+        Raises
+        ------
+        ValueError
+            If the number of values of the behavior is not known.
+        """
+        name = type(behavior).__name__
+        options = {key: getattr(behavior, key, None) for key in ("type", "hardening", "rate", "dataType",
+                                                                 "strainRangeDependency", "numBackstresses",
+                                                                 "extrapolation", "temperatureDependency",
+                                                                 "dependencies")}  # fmt: skip
+        rows = getattr(behavior, "table", None) or ()
+        rows = rows if isinstance(rows, tuple) else freezeTable(rows)
+        key = (numValues, tuple(map(str, options.values())))
+        cached = _cache.get(behavior)
+        if cached is not None and cached[1] == key and (cached[0] is rows or cached[0] == rows):
+            return cached[2]
+        variables: tuple[str, ...] = ()
+        linear: tuple[str, ...] = ()
+        if name == "Plastic":
+            hardening, dataType = str(options["hardening"]), str(options["dataType"])
+            if hardening == "JOHNSON_COOK":
+                count = 6
+            elif hardening == "COMBINED" and dataType == "PARAMETERS":
+                count = 1 + 2 * int(options["numBackstresses"] or 1)
+            elif hardening in ("ISOTROPIC", "KINEMATIC", "COMBINED"):
+                count, variables = 1, ("plasticStrain",)
+                if hardening == "COMBINED" and dataType == "STABILIZED":
+                    variables += ("strainRange",) if options["strainRangeDependency"] else ()
+                else:
+                    variables += ("strainRate",) if options["rate"] else ()
+                linear = ("plasticStrain",) if str(options["extrapolation"]) == "LINEAR" else ()
+            else:
+                count = None
+        else:
+            types = NUM_VALUES.get(name, {})
+            count = types.get(str(options["type"]), types.get(""))
+        count = numValues if numValues is not None else count
+        if count is None:
+            raise ValueError(f"The number of values of the table of the {name} behavior is not known")
+        table = cls(rows, count, variables, bool(options["temperatureDependency"]),
+                    int(options["dependencies"] or 0), linear)  # fmt: skip
+        _cache[behavior] = (rows, key, table)
+        return table
+
+    def evaluate(self, points=None, **variables) -> np.ndarray:
+        """Interpolate the values of the table.
+
+        Parameters
+        ----------
+        points
+            An (n, k) array of Floats specifying the independent variables of the queries in the order of
+            :attr:`variables`. Alternatively the variables are given by name as (n,) arrays, such as
+            ``plasticStrain`` and ``temperature``, the field variables as ``field1``, ``field2`` and so on, or
+            together as an (n, d) array ``fieldVariables``.
+
+        Returns
+        -------
+        np.ndarray
+            An (n, numValues) float array of the values.
+
+        Raises
+        ------
+        ValueError
+            If a variable of the table is not given.
+        """
+        if points is None:
+            fields = variables.pop("fieldVariables", None)
+            if fields is not None:
+                fields = np.asarray(fields, dtype=np.float64)
+                fields = fields.reshape(len(fields), -1) if fields.ndim else fields.reshape(1, 1)
+                variables.update({f"field{number}": fields[:, number - 1] for number in range(1, fields.shape[1] + 1)})
+            missing = [name for name in self.variables if name not in variables]
+            if missing:
+                raise ValueError(f"The variable {missing[0]} of the table is not given")
+            columns = np.broadcast_arrays(*(np.asarray(variables[name], dtype=np.float64) for name in self.variables))
+            points = np.stack([column.ravel() for column in columns], axis=1) if columns else np.zeros((1, 0))
+        points = np.asarray(points, dtype=np.float64)
+        if not len(self.variables):
+            return np.repeat(self.values[:1], len(points) if points.ndim else 1, axis=0)
+        points = points.reshape(-1, len(self.variables))
+        if self.isGrid:
+            return self._evaluateGrid(points)
+        return self._evaluateNested(self._tree, points, len(self.variables) - 1)
+
+    def _regularize(self, tolerance: float):
+        """Merge the values of each variable closer than **tolerance** times its range to their mean."""
+        for column in self.points.T:
+            order = np.argsort(column, kind="stable")
+            ordered = column[order]
+            clusters = np.cumsum(np.diff(ordered, prepend=ordered[0]) > tolerance * np.ptp(ordered))
+            sums, counts = np.bincount(clusters, ordered), np.bincount(clusters)
+            column[order] = (sums / counts)[clusters]
+
+    def _compile(self):
+        """Store the table as a regular grid if it holds every combination of the values of the variables, as
+        nested groups otherwise."""
+        if not len(self.variables):
+            return
+        axes = [np.unique(column) for column in self.points.T]
+        if len(self.points) == int(np.prod([len(axis) for axis in axes])):
+            indices = tuple(np.searchsorted(axis, column) for axis, column in zip(axes, self.points.T))
+            grid = np.full(tuple(len(axis) for axis in axes) + (self.numValues,), np.nan)
+            grid[indices] = self.values
+            if not np.isnan(grid).any():
+                self.isGrid, self._axes, self._grid = True, axes, grid
+                return
+        self._tree = self._group(np.arange(len(self.points)), len(self.variables) - 1)
+
+    def _group(self, rows: np.ndarray, level: int):
+        """Return the nested groups of the rows by the variable at **level**, the outermost first, sorted."""
+        keys = self.points[rows, level]
+        order = np.argsort(keys, kind="stable")
+        rows, keys = rows[order], keys[order]
+        if level == 0:
+            return keys, self.values[rows]
+        unique, starts = np.unique(keys, return_index=True)
+        bounds = np.append(starts, len(rows))
+        return unique, [self._group(rows[first:last], level - 1) for first, last in zip(bounds[:-1], bounds[1:])]
+
+    def _bracket(self, keys: np.ndarray, values: np.ndarray, level: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the index of the lower key of the interval of each value and the weight of the upper key."""
+        if len(keys) < 2:
+            return np.zeros(len(values), dtype=np.int64), np.zeros(len(values))
+        lower = np.clip(np.searchsorted(keys, values, side="right") - 1, 0, len(keys) - 2)
+        span = keys[lower + 1] - keys[lower]
+        weights = np.divide(values - keys[lower], span, out=np.zeros(len(values)), where=span > 0)
+        return lower, weights if self._linear[level] else np.clip(weights, 0.0, 1.0)
+
+    def _evaluateGrid(self, points: np.ndarray) -> np.ndarray:
+        """Interpolate the regular grid, combining the corners of the cell of each query."""
+        flat = self._grid.reshape(-1, self.numValues)
+        strides = np.cumprod([1] + [len(axis) for axis in self._axes[:0:-1]])[::-1]
+        result = np.empty((len(points), self.numValues))
+        for start in range(0, len(points), CHUNK_SIZE):
+            chunk = points[start : start + CHUNK_SIZE]
+            offsets, weights = np.zeros((1, len(chunk)), dtype=np.int64), np.ones((1, len(chunk)))
+            for level, (axis, stride) in enumerate(zip(self._axes, strides)):
+                lower, upper = self._bracket(axis, chunk[:, level], level)
+                # Double the corners of the cells along each axis, the lower then the upper neighbours
+                offsets = np.concatenate(
+                    [offsets + lower * stride, offsets + np.minimum(lower + 1, len(axis) - 1) * stride]
+                )
+                weights = np.concatenate([weights * (1.0 - upper), weights * upper])
+            result[start : start + CHUNK_SIZE] = np.einsum("cn,cnv->nv", weights, flat[offsets])
+        return result
+
+    def _evaluateNested(self, node, points: np.ndarray, level: int) -> np.ndarray:
+        """Interpolate the nested groups of **node** by the variable at **level**, then in each group."""
+        keys, children = node
+        lower, weights = self._bracket(keys, points[:, level], level)
+        if level == 0:
+            upper = np.minimum(lower + 1, len(keys) - 1)
+            return (1.0 - weights)[:, None] * children[lower] + weights[:, None] * children[upper]
+        upper = np.minimum(lower + 1, len(keys) - 1)
+        result = np.zeros((len(points), self.numValues))
+        for index in np.unique(np.concatenate([lower, upper])):
+            for rows, weight in ((lower == index, 1.0 - weights), (upper == index, weights)):
+                rows = np.flatnonzero(rows & (weight != 0.0))
+                if len(rows):
+                    result[rows] += weight[rows, None] * self._evaluateNested(children[index], points[rows], level - 1)
+        return result
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import ISOTROPIC, OFF, Boolean
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -101,7 +102,12 @@ class Expansion:
         ------
         RangeError
         """
-        ...
+        self.type = type
+        self.userSubroutine = userSubroutine
+        self.zero = zero
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.table = freezeTable(table)
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -111,4 +117,4 @@ class Expansion:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
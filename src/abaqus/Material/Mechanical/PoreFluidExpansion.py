@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import OFF, Boolean
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -64,7 +65,10 @@ class PoreFluidExpansion:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.zero = zero
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -74,4 +78,4 @@ class PoreFluidExpansion:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import WLF
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -57,9 +58,10 @@ class Trs:
         Trs
             A Trs object.
         """
-        ...
+        self.definition = definition
+        self.table = freezeTable(table)
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the Trs object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import NEWTONIAN, OFF, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 from .Trs import Trs
 
 
@@ -73,7 +74,10 @@ class Viscosity:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.type = type
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -83,4 +87,4 @@ class Viscosity:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
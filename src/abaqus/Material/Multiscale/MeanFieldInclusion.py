@@ -108,7 +108,20 @@ class MeanFieldInclusion:
         ------
         RangeError
         """
-        ...
+        self.name = name
+        self.table = table
+        self.material = material
+        self.isotropizationCoefficient = isotropizationCoefficient
+        self.volumeFractionType = volumeFractionType
+        self.volumeFractionFieldName = volumeFractionFieldName
+        self.aspectRatioType = aspectRatioType
+        self.aspectRatioFieldName = aspectRatioFieldName
+        self.orientationTensorType = orientationTensorType
+        self.orientationTensorFieldName = orientationTensorFieldName
+        self.shape = shape
+        self.direction = direction
+        self.strainConcentrationTensor = strainConcentrationTensor
+        self.temperatureGradientConcentrationTensor = temperatureGradientConcentrationTensor
 
     @abaqus_method_doc
     def setValues(self):
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, STRAIN, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 from .BrittleFailure import BrittleFailure
 from .BrittleShear import BrittleShear
 
@@ -92,9 +93,12 @@ class BrittleCracking:
         BrittleCracking
             A BrittleCracking object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.type = type
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the BrittleCracking object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, UNIDIRECTIONAL, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -77,7 +78,10 @@ class BrittleFailure:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.failureCriteria = failureCriteria
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -87,4 +91,4 @@ class BrittleFailure:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, RETENTION_FACTOR, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -80,7 +81,10 @@ class BrittleShear:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.type = type
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -90,4 +94,4 @@ class BrittleShear:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, Boolean
+from ...behaviorValues import freezeTable, setBehaviorValues
 from .FailureRatios import FailureRatios
 from .ShearRetention import ShearRetention
 from .TensionStiffening import TensionStiffening
@@ -69,7 +70,9 @@ class Concrete:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -79,4 +82,4 @@ class Concrete:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, Boolean
+from ...behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -67,7 +68,10 @@ class ConcreteCompressionDamage:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.tensionRecovery = tensionRecovery
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -77,4 +81,4 @@ class ConcreteCompressionDamage:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
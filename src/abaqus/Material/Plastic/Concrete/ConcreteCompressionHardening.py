@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, Boolean
+from ...behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -66,7 +67,10 @@ class ConcreteCompressionHardening:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.rate = rate
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -76,4 +80,4 @@ class ConcreteCompressionHardening:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, Boolean
+from ...behaviorValues import freezeTable, setBehaviorValues
 from .ConcreteCompressionDamage import ConcreteCompressionDamage
 from .ConcreteCompressionHardening import ConcreteCompressionHardening
 from .ConcreteTensionDamage import ConcreteTensionDamage
@@ -82,7 +83,9 @@ class ConcreteDamagedPlasticity:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -92,4 +95,4 @@ class ConcreteDamagedPlasticity:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
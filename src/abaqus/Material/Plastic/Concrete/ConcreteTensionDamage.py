@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, STRAIN, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -85,7 +86,11 @@ class ConcreteTensionDamage:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.compressionRecovery = compressionRecovery
+        self.type = type
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -95,4 +100,4 @@ class ConcreteTensionDamage:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, STRAIN, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -98,7 +99,11 @@ class ConcreteTensionStiffening:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.rate = rate
+        self.type = type
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -108,4 +113,4 @@ class ConcreteTensionStiffening:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
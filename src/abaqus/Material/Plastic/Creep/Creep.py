@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, STRAIN, TOTAL, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 from ..Metal.ORNL.Ornl import Ornl
 from ..Potential import Potential
 
@@ -149,7 +150,11 @@ class Creep:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.law = law
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.time = time
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -159,4 +164,4 @@ class Creep:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
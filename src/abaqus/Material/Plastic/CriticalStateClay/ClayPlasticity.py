@@ -6,6 +6,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import EXPONENTIAL, OFF, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 from .ClayHardening import ClayHardening
 
 
@@ -99,7 +100,11 @@ class ClayPlasticity:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.intercept = intercept
+        self.hardening = hardening
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -109,4 +114,4 @@ class ClayPlasticity:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, VOLUMETRIC, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 from ..Metal.RateDependent.RateDependent import RateDependent
 from .CrushableFoamHardening import CrushableFoamHardening
 
@@ -90,7 +91,10 @@ class CrushableFoam:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.hardening = hardening
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -100,4 +104,4 @@ class CrushableFoam:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import LINEAR, OFF, Boolean
 from .....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ....behaviorValues import freezeTable, setBehaviorValues
 from ...Metal.RateDependent.RateDependent import RateDependent
 from .DruckerPragerCreep import DruckerPragerCreep
 from .DruckerPragerHardening import DruckerPragerHardening
@@ -122,7 +123,12 @@ class DruckerPrager:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.shearCriterion = shearCriterion
+        self.eccentricity = eccentricity
+        self.testData = testData
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -132,4 +138,4 @@ class DruckerPrager:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
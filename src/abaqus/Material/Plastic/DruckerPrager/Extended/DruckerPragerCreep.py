@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import OFF, STRAIN, Boolean
 from .....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ....behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -84,7 +85,10 @@ class DruckerPragerCreep:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.law = law
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -94,4 +98,4 @@ class DruckerPragerCreep:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import COMPRESSION, OFF, Boolean
 from .....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ....behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -75,7 +76,11 @@ class DruckerPragerHardening:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.type = type
+        self.rate = rate
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -85,4 +90,4 @@ class DruckerPragerHardening:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ....behaviorValues import freezeTable, setBehaviorValues
+
 
 @abaqus_class_doc
 class TriaxialTestData:
@@ -58,7 +60,10 @@ class TriaxialTestData:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.a = a
+        self.b = b
+        self.pt = pt
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -68,4 +73,4 @@ class TriaxialTestData:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import OFF, Boolean
+from ....behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -57,7 +58,9 @@ class CapHardening:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -67,4 +70,4 @@ class CapHardening:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
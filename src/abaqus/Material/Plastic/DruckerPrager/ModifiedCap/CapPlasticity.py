@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import OFF, Boolean
+from ....behaviorValues import freezeTable, setBehaviorValues
 from .CapCreepCohesion import CapCreepCohesion
 from .CapCreepConsolidation import CapCreepConsolidation
 from .CapHardening import CapHardening
@@ -76,7 +77,9 @@ class CapPlasticity:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -86,4 +89,4 @@ class CapPlasticity:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -1,5 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ....behaviorValues import freezeTable, setBehaviorValues
+
 
 @abaqus_class_doc
 class AnnealTemperature:
@@ -52,7 +54,8 @@ class AnnealTemperature:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -62,4 +65,4 @@ class AnnealTemperature:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
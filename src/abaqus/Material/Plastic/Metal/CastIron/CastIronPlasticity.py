@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import OFF, Boolean
+from ....behaviorValues import freezeTable, setBehaviorValues
 from .CastIronCompressionHardening import CastIronCompressionHardening
 from .CastIronTensionHardening import CastIronTensionHardening
 
@@ -64,7 +65,9 @@ class CastIronPlasticity:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -74,4 +77,4 @@ class CastIronPlasticity:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
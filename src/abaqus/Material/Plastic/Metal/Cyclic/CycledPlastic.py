@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import OFF, Boolean
+from ....behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -48,9 +49,10 @@ class CycledPlastic:
         CycledPlastic
             A CycledPlastic object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the CycledPlastic object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import OFF, Boolean
+from ....behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -64,9 +65,12 @@ class CyclicHardening:
         CyclicHardening
             A CyclicHardening object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.parameters = parameters
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the CyclicHardening object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
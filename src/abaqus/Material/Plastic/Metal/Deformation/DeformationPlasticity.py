@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import OFF, Boolean
+from ....behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -55,7 +56,8 @@ class DeformationPlasticity:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -65,4 +67,4 @@ class DeformationPlasticity:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import OFF, Boolean
+from ....behaviorValues import freezeTable, setBehaviorValues
 from .PorousFailureCriteria import PorousFailureCriteria
 from .VoidNucleation import VoidNucleation
 
@@ -77,7 +78,10 @@ class PorousMetalPlasticity:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.relativeDensity = relativeDensity
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -87,4 +91,4 @@ class PorousMetalPlasticity:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
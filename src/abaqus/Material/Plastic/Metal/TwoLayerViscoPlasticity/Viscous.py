@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .....UtilityAndView.abaqusConstants import OFF, STRAIN, TOTAL, Boolean
 from .....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ....behaviorValues import freezeTable, setBehaviorValues
 from ...Potential import Potential
 
 
@@ -135,9 +136,13 @@ class Viscous:
         Viscous
             A Viscous object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.law = law
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.time = time
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the Viscous object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
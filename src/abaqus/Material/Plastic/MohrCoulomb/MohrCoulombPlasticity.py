@@ -3,6 +3,7 @@ from __future__ import annotations
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import OFF, Boolean
+from ...behaviorValues import freezeTable, setBehaviorValues
 from .MohrCoulombHardening import MohrCoulombHardening
 from .TensionCutOff import TensionCutOff
 
@@ -86,7 +87,12 @@ class MohrCoulombPlasticity:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.deviatoricEccentricity = deviatoricEccentricity
+        self.meridionalEccentricity = meridionalEccentricity
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.useTensionCutoff = useTensionCutoff
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -96,4 +102,4 @@ class MohrCoulombPlasticity:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
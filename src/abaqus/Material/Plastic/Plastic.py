@@ -10,6 +10,7 @@ from ...UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 from .Metal.Annealing.AnnealTemperature import AnnealTemperature
 from .Metal.Cyclic.CycledPlastic import CycledPlastic
 from .Metal.Cyclic.CyclicHardening import CyclicHardening
@@ -167,7 +168,15 @@ class Plastic:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.hardening = hardening
+        self.rate = rate
+        self.dataType = dataType
+        self.strainRangeDependency = strainRangeDependency
+        self.numBackstresses = numBackstresses
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.extrapolation = extrapolation
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -177,4 +186,4 @@ class Plastic:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
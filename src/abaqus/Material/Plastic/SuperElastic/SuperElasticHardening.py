@@ -1,5 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ...behaviorValues import freezeTable, setBehaviorValues
+
 
 @abaqus_class_doc
 class SuperElasticHardening:
@@ -48,7 +50,7 @@ class SuperElasticHardening:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -58,4 +60,4 @@ class SuperElasticHardening:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
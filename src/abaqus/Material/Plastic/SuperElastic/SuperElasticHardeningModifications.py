@@ -1,5 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ...behaviorValues import freezeTable, setBehaviorValues
+
 
 @abaqus_class_doc
 class SuperElasticHardeningModifications:
@@ -53,7 +55,7 @@ class SuperElasticHardeningModifications:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -63,4 +65,4 @@ class SuperElasticHardeningModifications:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
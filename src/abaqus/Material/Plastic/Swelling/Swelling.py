@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import INPUT, OFF, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 from ...Ratios import Ratios
 
 
@@ -73,7 +74,10 @@ class Swelling:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.law = law
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -83,4 +87,4 @@ class Swelling:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import COEFFICIENTS, OFF, Boolean
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -68,9 +69,12 @@ class FluidLeakoff:
         FluidLeakoff
             A FluidLeakoff object.
         """
-        ...
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.type = type
+        self.table = freezeTable(table)
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the FluidLeakoff object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -1,5 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ..behaviorValues import freezeTable, setBehaviorValues
+
 
 @abaqus_class_doc
 class Gel:
@@ -45,9 +47,9 @@ class Gel:
         Gel
             A Gel object.
         """
-        ...
+        self.table = freezeTable(table)
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the Gel object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....Material.Ratios import Ratios
+from ...behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -48,9 +49,9 @@ class MoistureSwelling:
         MoistureSwelling
             A MoistureSwelling object.
         """
-        ...
+        self.table = freezeTable(table)
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the MoistureSwelling object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
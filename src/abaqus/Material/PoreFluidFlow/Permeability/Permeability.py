@@ -4,6 +4,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ....UtilityAndView.abaqusConstants import ISOTROPIC, OFF, Boolean
 from ....UtilityAndView.abaqusConstants import abaqusConstants as C
+from ...behaviorValues import freezeTable, setBehaviorValues
 from .SaturationDependence import SaturationDependence
 from .VelocityDependence import VelocityDependence
 
@@ -101,7 +102,12 @@ class Permeability:
         ------
         RangeError
         """
-        ...
+        self.specificWeight = specificWeight
+        self.inertialDragCoefficient = inertialDragCoefficient
+        self.table = freezeTable(table)
+        self.type = type
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -111,4 +117,4 @@ class Permeability:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
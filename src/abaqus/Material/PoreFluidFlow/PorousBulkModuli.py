@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import OFF, Boolean
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -48,9 +49,10 @@ class PorousBulkModuli:
         PorousBulkModuli
             A PorousBulkModuli object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the PorousBulkModuli object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -13,6 +13,7 @@ from ...UtilityAndView.abaqusConstants import (
     Boolean,
 )
 from ...UtilityAndView.abaqusConstants import abaqusConstants as C
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -242,7 +243,15 @@ class DamageEvolution:
         ------
         RangeError
         """
-        ...
+        self.type = type
+        self.table = freezeTable(table)
+        self.degradation = degradation
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.mixedModeBehavior = mixedModeBehavior
+        self.modeMixRatio = modeMixRatio
+        self.power = power
+        self.softening = softening
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -252,4 +261,4 @@ class DamageEvolution:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
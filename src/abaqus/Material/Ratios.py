@@ -1,6 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import OFF, Boolean
+from .behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -71,7 +72,9 @@ class Ratios:
         ------
         RangeError
         """
-        ...
+        self.table = freezeTable(table)
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -81,4 +84,4 @@ class Ratios:
         ------
         RangeError
         """
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import OFF, Boolean
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -70,9 +71,13 @@ class BiaxialTestData:
         BiaxialTestData
             A BiaxialTestData object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.smoothing = smoothing
+        self.lateralNominalStrain = lateralNominalStrain
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the BiaxialTestData object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ..behaviorValues import freezeTable, setBehaviorValues
+
 
 @abaqus_class_doc
 class ShearTestData:
@@ -60,9 +62,10 @@ class ShearTestData:
         ShearTestData
             A ShearTestData object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.shrinf = shrinf
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the ShearTestData object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
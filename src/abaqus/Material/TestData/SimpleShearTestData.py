@@ -1,5 +1,7 @@
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ..behaviorValues import freezeTable, setBehaviorValues
+
 
 @abaqus_class_doc
 class SimpleShearTestData:
@@ -44,9 +46,9 @@ class SimpleShearTestData:
         SimpleShearTestData
             A SimpleShearTestData object.
         """
-        ...
+        self.table = freezeTable(table)
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the SimpleShearTestData object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
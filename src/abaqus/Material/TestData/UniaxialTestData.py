@@ -3,6 +3,7 @@ from __future__ import annotations
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import OFF, Boolean
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -90,9 +91,13 @@ class UniaxialTestData:
         UniaxialTestData
             A UniaxialTestData object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.smoothing = smoothing
+        self.lateralNominalStrain = lateralNominalStrain
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the UniaxialTestData object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ...UtilityAndView.abaqusConstants import OFF, Boolean
+from ..behaviorValues import freezeTable, setBehaviorValues
 
 
 @abaqus_class_doc
@@ -91,9 +92,13 @@ class VolumetricTestData:
         VolumetricTestData
             A VolumetricTestData object.
         """
-        ...
+        self.table = freezeTable(table)
+        self.volinf = volinf
+        self.smoothing = smoothing
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
         """This method modifies the VolumetricTestData object."""
-        ...
+        setBehaviorValues(self, args, kwargs)
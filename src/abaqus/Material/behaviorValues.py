@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import inspect
+
+_PARAMETERS: dict[type, tuple[str, ...]] = {}
+
+
+def freezeTable(table):
+    """Return a table as nested tuples, which cannot be edited in place, so that the tables compiled from it can
+    be cached by its identity.
+
+    Parameters
+    ----------
+    table
+        A sequence of sequences of Floats, or None.
+
+    Returns
+    -------
+    tuple
+        The rows of the table as tuples, or None.
+    """
+    if table is None:
+        return None
+    return tuple(tuple(row) if hasattr(row, "__len__") and not isinstance(row, str) else row for row in table)
+
+
+def setBehaviorValues(behavior, args: tuple, kwargs: dict):
+    """Assign the arguments of the setValues method of a material behavior, which are those of its constructor
+    other than the ones that are not given. The table of the behavior is stored as nested tuples.
+
+    Parameters
+    ----------
+    behavior
+        A material behavior, such as an Elastic or Plastic object.
+    args
+        A tuple of the positional arguments, in the order of the parameters of the constructor.
+    kwargs
+        A dict of the keyword arguments.
+
+    Raises
+    ------
+    TypeError
+        If an argument is not a parameter of the constructor or is given twice.
+    """
+    name, parameters = type(behavior).__name__, _parameters(type(behavior))
+    if len(args) > len(parameters):
+        raise TypeError(f"{name}.setValues() takes at most {len(parameters)} positional arguments ({len(args)} given)")
+    values = dict(zip(parameters, args))
+    for key, value in kwargs.items():
+        if key not in parameters:
+            raise TypeError(f"{name}.setValues() got an unexpected keyword argument '{key}'")
+        if key in values:
+            raise TypeError(f"{name}.setValues() got multiple values for argument '{key}'")
+        values[key] = value
+    for key, value in values.items():
+        setattr(behavior, key, freezeTable(value) if key == "table" else value)
+
+
+def _parameters(cls: type) -> tuple[str, ...]:
+    """Return the names of the parameters of the constructor of a class, looked up once per class."""
+    if cls not in _PARAMETERS:
+        _PARAMETERS[cls] = tuple(inspect.signature(cls).parameters)
+    return _PARAMETERS[cls]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
 from typing_extensions import Literal
 
@@ -10,6 +10,9 @@ from ..UtilityAndView.abaqusConstants import SymbolicConstant
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .Material import Material
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from .Elastic.HyperElastic.HyperelasticPotential import HyperelasticPotential
+
 """ This command evaluates the behavior of a hyperelastic material under standard test 
 conditions. 
 
@@ -31,16 +34,16 @@ def evaluateMaterial(
     marlowData: SymbolicConstant | None = None,
     marlowDataType: SymbolicConstant | None = None,
     testDataTypes: SymbolicConstant | None = None,
-    uniaxialStrainRange: float | None = None,
-    biaxialStrainRange: float | None = None,
-    planarStrainRange: float | None = None,
-    volumeRatioRange: float | None = None,
-    simpleShearStrainRange: float | None = None,
+    uniaxialStrainRange: tuple[float, float] | None = None,
+    biaxialStrainRange: tuple[float, float] | None = None,
+    planarStrainRange: tuple[float, float] | None = None,
+    volumeRatioRange: tuple[float, float] | None = None,
+    simpleShearStrainRange: tuple[float, float] | None = None,
     viscoDataSource: SymbolicConstant | None = None,
     viscoTestDataTypes: SymbolicConstant | None = None,
     relaxationTime: float | None = None,
     creepTime: float | None = None,
-):
+) -> dict[str, HyperelasticPotential]:
     """This method evaluates the behavior of a hyperelastic material under standard test conditions.
 
     .. note::
@@ -129,6 +132,14 @@ def evaluateMaterial(
         None or a Float specifying the time period for the creep response mode. The default
         value is None.
 
+    Returns
+    -------
+    dict[str, HyperelasticPotential]
+        The potentials evaluated, by name. Their :attr:`~HyperelasticPotential.responses` map each mode to the
+        nominal strains, or volume ratios, and the nominal stresses, or pressures, and their
+        :attr:`~HyperelasticPotential.coefficients` are the coefficients used, fitted to the test data if
+        **dataSource** = TEST_DATA.
+
     Raises
     ------
     MaterialEvaluationError: POLY_N3, POLY_N4, POLY_N5, or POLY_N6 not allowed for **dataSource** = TEST_DATA
@@ -139,4 +150,82 @@ def evaluateMaterial(
     MaterialEvaluationError: Material evaluation is currentlysupported only for hyperelastic materials
         If the material type of the material to be evaluated is not hyperelastic.
     """
-    ...
+    import numpy as np
+
+    from .Elastic.HyperElastic.HyperelasticPotential import MODES, NUM_POINTS, HyperelasticPotential, modeKinematics
+
+    if "hyperelastic" not in vars(material):
+        raise ValueError("Material evaluation is currently supported only for hyperelastic materials")
+    hyperelastic = material.hyperelastic
+    source = str(dataSource if isinstance(dataSource, str) else list(dataSource)[0])
+    names = [str(name) for name in ([strainEnergyPotentials] if isinstance(strainEnergyPotentials, str)
+                                    else strainEnergyPotentials or ())]  # fmt: skip
+
+    # Test data of each mode as (x, y) columns: nominal strain and stress, or volume ratio and pressure
+    included = None if testDataTypes is None else _names(testDataTypes)
+    testData = {}
+    for mode, attribute in zip(MODES, ("uniaxialTestData", "biaxialTestData", "planarTestData",
+                                       "simpleShearTestData", "volumetricTestData")):  # fmt: skip
+        rows = [row[:2] for row in getattr(getattr(hyperelastic, attribute, None), "table", ()) if len(row) >= 2]
+        if rows and (included is None or mode in included):
+            testData[mode] = np.asarray(rows, dtype=np.float64)[:, ::-1]
+    deviatoric = [mode for mode in MODES[:-1] if mode in testData]
+
+    potentials: dict[str, HyperelasticPotential] = {}
+    if source == "COEFFICIENTS":
+        potential = HyperelasticPotential.fromHyperelastic(hyperelastic)
+        potentials[potential.name] = potential
+    else:
+        invalid = [name for name in names if name in ("POLY_N3", "POLY_N4", "POLY_N5", "POLY_N6")]
+        if invalid:
+            raise ValueError("POLY_N3, POLY_N4, POLY_N5, or POLY_N6 not allowed for dataSource = TEST_DATA")
+        if not deviatoric:
+            raise ValueError("Material evaluation failed, the material has no uniaxial, biaxial or planar test data")
+        modes = np.concatenate([np.full(len(testData[mode]), mode) for mode in deviatoric])
+        strains, stresses = np.concatenate([testData[mode] for mode in deviatoric]).T
+        volumetric = testData.get("VOLUMETRIC", np.zeros((0, 2)))
+        beta = getattr(hyperelastic, "beta", None)
+        for name in names:
+            potential = HyperelasticPotential(name, beta if isinstance(beta, (int, float)) else None)
+            potential.fit(modes, strains, stresses, volumetric[:, 0], volumetric[:, 1])
+            potentials[potential.name] = potential
+    if marlowData is not None:
+        marlowModes = [mode for mode in MODES if mode in _names(marlowData) and mode in testData]
+        marlowDeviatoric = [mode for mode in marlowModes if mode != "VOLUMETRIC"]
+        if not marlowDeviatoric:
+            raise ValueError("Material evaluation failed, the Marlow potential has no uniaxial, biaxial or planar data")
+        potential = HyperelasticPotential("MARLOW")
+        volumetric = testData["VOLUMETRIC"] if "VOLUMETRIC" in marlowModes else np.zeros((0, 2))
+        data = testData[marlowDeviatoric[0]]
+        potential.fit(marlowDeviatoric[0], data[:, 0], data[:, 1], volumetric[:, 0], volumetric[:, 1],
+                      dataType=str(marlowDataType or "BOTH"))  # fmt: skip
+        potentials[potential.name] = potential
+
+    # Points of all the modes evaluated, the ranges given or those of the test data
+    limits = (uniaxialStrainRange, biaxialStrainRange, planarStrainRange, simpleShearStrainRange, volumeRatioRange)
+    ranges: dict[str, tuple[float, float] | None] = dict(zip(MODES, limits))
+    for mode, data in testData.items():
+        if ranges[mode] is None:
+            ranges[mode] = (min(data[:, 0].min(), 0.0 if mode != "VOLUMETRIC" else 1.0),
+                            max(data[:, 0].max(), 0.0 if mode != "VOLUMETRIC" else 1.0))  # fmt: skip
+    if all(value is None for value in ranges.values()):
+        ranges.update(UNIAXIAL=(0.0, 1.0), BIAXIAL=(0.0, 1.0), PLANAR=(0.0, 1.0))
+    points = {mode: np.linspace(float(bounds[0]), float(bounds[1]), NUM_POINTS)
+              for mode, bounds in ranges.items() if bounds is not None}  # fmt: skip
+    evaluated = [mode for mode in MODES[:-1] if mode in points]
+    strains = np.concatenate([points[mode] for mode in evaluated] + [np.zeros(0)])
+    kinematics = modeKinematics(np.repeat(np.asarray(evaluated, dtype=str), NUM_POINTS), strains)
+    for potential in potentials.values():
+        stresses = potential.stress(kinematics).reshape(len(evaluated), NUM_POINTS)
+        potential.responses = {
+            mode: np.column_stack([points[mode], stress]) for mode, stress in zip(evaluated, stresses)
+        }
+        if "VOLUMETRIC" in points:
+            pressures = potential.pressure(points["VOLUMETRIC"])
+            potential.responses["VOLUMETRIC"] = np.column_stack([points["VOLUMETRIC"], pressures])
+    return potentials
+
+
+def _names(values) -> list[str]:
+    """Return the names of a SymbolicConstant or a sequence of SymbolicConstants."""
+    return [str(values)] if isinstance(values, str) else [str(value) for value in values]
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from .elementTopology import (
+    clampNatural,
+    elementShape,
+    shapeCentroid,
+    shapeDimension,
+    shapeFunctionDerivatives,
+    shapeFunctions,
+    shapeNodes,
+)
+from .MeshArrays import MeshArrays
+
+
+class ElementLocator:
+    """The ElementLocator object finds the elements containing arbitrary points of a mesh.
+
+    The bounding boxes of the elements are registered in a uniform grid of cells. A point is only tested against the
+    elements registered in its cell, and the natural coordinates of the point in each candidate element are found
+    with a Newton iteration performed for all candidates of the same shape at once. Points on two-dimensional
+    elements in space, such as shells, are projected onto the element.
+    """
+
+    #: A MeshArrays object specifying the mesh.
+    mesh: MeshArrays
+
+    #: An (N, 3) float array specifying the node coordinates used to locate points, for example deformed
+    #: coordinates.
+    coordinates: np.ndarray
+
+    #: An (E,) int array specifying the indices of the elements that can contain points.
+    elements: np.ndarray
+
+    def __init__(self, mesh: MeshArrays, coordinates=None, elements: Sequence[int] | None = None):
+        """This method creates an ElementLocator object.
+
+        Parameters
+        ----------
+        mesh
+            A MeshArrays object specifying the mesh.
+        coordinates
+            An (N, 3) array of Floats specifying the node coordinates. The default is the coordinates of the mesh.
+        elements
+            A sequence of Ints specifying the indices of the elements that can contain points. The default is all
+            the elements with a recognised shape other than point elements.
+        """
+        self.mesh = mesh
+        self.coordinates = mesh.coordinates if coordinates is None else np.asarray(coordinates, dtype=np.float64)
+        self._shapes = np.array([elementShape(elemType) or "" for elemType in mesh.elementTypes] + [""])
+        if elements is None:
+            codes = np.flatnonzero(~np.isin(self._shapes[:-1], ("", "POINT1")))
+            self.elements = np.flatnonzero(np.isin(mesh.elementTypeCodes, codes)).astype(np.int64)
+        else:
+            self.elements = np.asarray(elements, dtype=np.int64)
+
+        # Bounding box of each element
+        connectivity = mesh.connectivity[self.elements]
+        points = self.coordinates[np.maximum(connectivity, 0)]
+        valid = (connectivity >= 0)[:, :, None]
+        self._low = np.where(valid, points, np.inf).min(axis=1)
+        self._high = np.where(valid, points, -np.inf).max(axis=1)
+        self._sizes = np.linalg.norm(self._high - self._low, axis=1)
+
+        # Uniform grid with cells of about the size of an element, at most a few cells per element
+        if len(self.elements):
+            self._origin, extent = self._low.min(axis=0), self._high.max(axis=0) - self._low.min(axis=0)
+            cellSize = max(float(np.median((self._high - self._low).max(axis=1))), 1e-12 * max(extent.max(), 1.0))
+            while np.prod(np.floor(extent / cellSize) + 1) > 8 * len(self.elements) + 64:
+                cellSize *= 1.5
+        else:
+            self._origin, extent, cellSize = np.zeros(3), np.zeros(3), 1.0
+        self._cellSize = cellSize
+        self._shape = (np.floor(extent / cellSize) + 1).astype(np.int64)
+        owners, cells = self._overlaps(self._low, self._high)
+        order = np.argsort(cells, kind="stable")
+        self._cellElements = owners[order]
+        self._cellStart = np.concatenate(([0], np.cumsum(np.bincount(cells, minlength=int(np.prod(self._shape))))))
+
+    def locate(self, points, tolerance: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+        """Find the element containing each point.
+
+        Parameters
+        ----------
+        points
+            A (P, 3) array of Floats specifying the coordinates of the points.
+        tolerance
+            A Float specifying the distance within which a point outside the mesh is projected onto the closest
+            element. The default value is 0.0, a relative tolerance of 1E-6 of the element size always applies.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            A (P,) int array with the index of the element containing each point, -1 for points outside the mesh,
+            and a (P, 3) float array with the natural coordinates of the points in their elements, padded with
+            zeros for elements of lower dimension.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        found = np.full(len(points), -1, dtype=np.int64)
+        natural = np.zeros((len(points), 3))
+        if not len(points) or not len(self.elements):
+            return found, natural
+
+        # Candidate elements registered in the cells overlapped by each point
+        owners, cells = self._overlaps(points - tolerance, points + tolerance)
+        counts = self._cellStart[cells + 1] - self._cellStart[cells]
+        pointIndex = np.repeat(owners, counts)
+        offsets = np.arange(len(pointIndex)) - np.repeat(np.cumsum(counts) - counts, counts)
+        candidates = self._cellElements[np.repeat(self._cellStart[cells], counts) + offsets]
+        if tolerance > 0:
+            unique = np.unique(pointIndex * len(self.elements) + candidates)
+            pointIndex, candidates = unique // len(self.elements), unique % len(self.elements)
+        margin = tolerance + 1e-6 * self._sizes[candidates]
+        inside = np.all((points[pointIndex] >= self._low[candidates] - margin[:, None])
+                        & (points[pointIndex] <= self._high[candidates] + margin[:, None]), axis=1)  # fmt: skip
+        pointIndex, candidates = pointIndex[inside], candidates[inside]
+
+        # Natural coordinates and distance of the points in their candidate elements, one batch per shape
+        distances = np.full(len(candidates), np.inf)
+        coordinates = np.zeros((len(candidates), 3))
+        codes = self.mesh.elementTypeCodes[self.elements[candidates]]
+        for shape in np.unique(self._shapes[codes]):
+            rows = np.flatnonzero(self._shapes[codes] == shape)
+            xi, distances[rows] = self._invert(shape, self.elements[candidates[rows]], points[pointIndex[rows]])
+            coordinates[rows, : xi.shape[1]] = xi
+
+        # Keep the closest candidate of each point within the tolerance
+        accepted = distances <= tolerance + 1e-6 * self._sizes[candidates]
+        pointIndex, candidates, distances = pointIndex[accepted], candidates[accepted], distances[accepted]
+        coordinates = coordinates[accepted]
+        order = np.lexsort((distances, pointIndex))
+        first = order[np.concatenate(([True], np.diff(pointIndex[order]) != 0))] if len(order) else order
+        found[pointIndex[first]] = self.elements[candidates[first]]
+        natural[pointIndex[first]] = coordinates[first]
+        return found, natural
+
+    def interpolate(self, elements: np.ndarray, natural: np.ndarray, values) -> np.ndarray:
+        """Interpolate nodal values at points given by their elements and natural coordinates.
+
+        Parameters
+        ----------
+        elements
+            A (P,) int array specifying the element index of each point, -1 for points outside the mesh.
+        natural
+            A (P, 3) float array specifying the natural coordinates of each point.
+        values
+            An (N,) or (N, c) array of Floats specifying the values at the nodes of the mesh.
+
+        Returns
+        -------
+        np.ndarray
+            A (P,) or (P, c) float array of interpolated values, NaN for points outside the mesh.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        flat = values.reshape(len(values), -1)
+        result = np.full((len(elements), flat.shape[1]), np.nan)
+        codes = np.where(elements >= 0, self.mesh.elementTypeCodes[np.maximum(elements, 0)], len(self._shapes) - 1)
+        for shape in np.unique(self._shapes[codes]):
+            rows = np.flatnonzero((self._shapes[codes] == shape) & (elements >= 0))
+            if shape == "" or not len(rows):
+                continue
+            weights = shapeFunctions(shape, natural[rows, : shapeDimension[shape]])
+            nodes = self.mesh.connectivity[elements[rows], : shapeNodes[shape]]
+            result[rows] = np.einsum("pk,pkc->pc", weights, flat[nodes])
+        return result.reshape((len(elements),) + values.shape[1:])
+
+    def interpolateElementNodal(self, elements: np.ndarray, natural: np.ndarray, values) -> np.ndarray:
+        """Interpolate element nodal values at points given by their elements and natural coordinates.
+
+        Unlike :meth:`interpolate`, every element has its own values at its nodes, so the interpolated values may
+        be discontinuous between elements.
+
+        Parameters
+        ----------
+        elements
+            A (P,) int array specifying the element index of each point, -1 for points outside the mesh.
+        natural
+            A (P, 3) float array specifying the natural coordinates of each point.
+        values
+            An (E, k) or (E, k, c) array of Floats specifying the values at the nodes of each element of the mesh
+            in the order of the connectivity, where E is the number of elements of the mesh.
+
+        Returns
+        -------
+        np.ndarray
+            A (P,) or (P, c) float array of interpolated values, NaN for points outside the mesh.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        flat = values.reshape(len(values), values.shape[1], -1)
+        result = np.full((len(elements), flat.shape[2]), np.nan)
+        codes = np.where(elements >= 0, self.mesh.elementTypeCodes[np.maximum(elements, 0)], len(self._shapes) - 1)
+        for shape in np.unique(self._shapes[codes]):
+            rows = np.flatnonzero((self._shapes[codes] == shape) & (elements >= 0))
+            if shape == "" or not len(rows):
+                continue
+            weights = shapeFunctions(shape, natural[rows, : shapeDimension[shape]])
+            result[rows] = np.einsum("pk,pkc->pc", weights, flat[elements[rows], : shapeNodes[shape]])
+        return result.reshape((len(elements),) + values.shape[2:])
+
+    def _overlaps(self, low: np.ndarray, high: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the (owner, cell) pairs of the grid cells overlapped by each box."""
+        first = np.floor((low - self._origin) / self._cellSize).astype(np.int64)
+        last = np.floor((high - self._origin) / self._cellSize).astype(np.int64)
+        outside = np.any((last < 0) | (first >= self._shape), axis=1)
+        first, last = np.clip(first, 0, self._shape - 1), np.clip(last, 0, self._shape - 1)
+        spans = np.where(outside[:, None], 0, last - first + 1)
+        counts = spans.prod(axis=1)
+        owners = np.repeat(np.arange(len(low)), counts)
+        local = np.arange(len(owners)) - np.repeat(np.cumsum(counts) - counts, counts)
+        spans, first = spans[owners], first[owners]
+        i = first[:, 0] + local % spans[:, 0]
+        j = first[:, 1] + (local // spans[:, 0]) % spans[:, 1]
+        k = first[:, 2] + local // (spans[:, 0] * spans[:, 1])
+        return owners, (k * self._shape[1] + j) * self._shape[0] + i
+
+    def _invert(self, shape: str, elements: np.ndarray, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Find the natural coordinates of the points closest to **points** in elements of the same shape."""
+        nodes = self.coordinates[self.mesh.connectivity[elements, : shapeNodes[shape]]]
+        xi = np.tile(shapeCentroid(shape), (len(points), 1))
+        dimension = shapeDimension[shape]
+        for _ in range(20):
+            residual = points - np.einsum("pk,pkc->pc", shapeFunctions(shape, xi), nodes)
+            jacobian = np.einsum("pkc,pkd->pcd", nodes, shapeFunctionDerivatives(shape, xi))
+            normal = np.einsum("pcd,pce->pde", jacobian, jacobian)
+            normal += 1e-14 * np.trace(normal, axis1=1, axis2=2)[:, None, None] * np.eye(dimension)
+            step = np.linalg.solve(normal, np.einsum("pcd,pc->pd", jacobian, residual)[:, :, None])[:, :, 0]
+            update = clampNatural(shape, xi + step)
+            converged = np.abs(update - xi).max() < 1e-10
+            xi = update
+            if converged:
+                break
+        residual = points - np.einsum("pk,pkc->pc", shapeFunctions(shape, xi), nodes)
+        return xi, np.linalg.norm(residual, axis=1)
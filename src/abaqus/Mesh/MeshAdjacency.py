@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .MeshArrays import uniqueIndices
+
+if TYPE_CHECKING:  # to avoid circular imports
+    from .MeshArrays import MeshArrays
+
+
+class MeshAdjacency:
+    """The MeshAdjacency object stores the elements of each node of a mesh in compressed sparse row format.
+
+    The elements of the node at index i are ``elements[offsets[i]:offsets[i + 1]]``, sorted and without repetition
+    for collapsed elements referencing a node twice. The nodes of each element are the connectivity of the mesh.
+    The structure is built from the connectivity with a single stable sort and cached by
+    :meth:`~abaqus.Mesh.MeshArrays.MeshArrays.adjacency` until the mesh changes. The queries take and return arrays
+    of internal indices, the label queries take and return arrays of labels.
+    """
+
+    #: A MeshArrays object specifying the mesh.
+    mesh: MeshArrays
+
+    #: An (N + 1,) int64 array specifying the start of the elements of each node in :attr:`elements`.
+    offsets: np.ndarray
+
+    #: An int64 array specifying the element indices of the nodes, node after node.
+    elements: np.ndarray
+
+    def __init__(self, mesh: MeshArrays):
+        """This method builds the MeshAdjacency object of a mesh.
+
+        Parameters
+        ----------
+        mesh
+            A MeshArrays object specifying the mesh.
+        """
+        self.mesh = mesh
+        connectivity = mesh.connectivity
+        nodes = connectivity.ravel()
+        owners = np.repeat(np.arange(mesh.numElements, dtype=np.int64), connectivity.shape[1])
+        used = nodes >= 0
+        nodes, owners = nodes[used], owners[used]
+        # The owners are increasing, a stable sort by node keeps the elements of each node sorted
+        order = np.argsort(nodes, kind="stable")
+        nodes, owners = nodes[order], owners[order]
+        unique = np.ones(len(nodes), dtype=bool)
+        unique[1:] = (nodes[1:] != nodes[:-1]) | (owners[1:] != owners[:-1])
+        nodes, self.elements = nodes[unique], owners[unique]
+        self.offsets = np.zeros(mesh.numNodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(nodes, minlength=mesh.numNodes), out=self.offsets[1:])
+
+    def valence(self, nodes: np.ndarray | None = None) -> np.ndarray:
+        """Return the number of elements of each node at **nodes**, or of all nodes if **nodes** is None."""
+        counts = np.diff(self.offsets)
+        return counts if nodes is None else counts[nodes]
+
+    def nodeElements(self, nodes) -> np.ndarray:
+        """Return the sorted indices of the elements referencing any of the nodes at **nodes**."""
+        nodes = np.asarray(nodes, dtype=np.int64).ravel()
+        starts, counts = self.offsets[nodes], self.offsets[nodes + 1] - self.offsets[nodes]
+        total = int(counts.sum())
+        if not total:
+            return np.zeros(0, dtype=np.int64)
+        # Positions of the elements of all the nodes, the ranges concatenated without a Python loop
+        shifts = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        return uniqueIndices(self.elements[np.arange(total) + shifts], self.mesh.numElements)
+
+    def elementNodes(self, elements=None) -> np.ndarray:
+        """Return the sorted indices of the nodes referenced by the elements at **elements**, or by all elements if
+        **elements** is None."""
+        return self.mesh.elementNodes(elements)
+
+    def adjacentElements(self, elements) -> np.ndarray:
+        """Return the sorted indices of the elements sharing a node with the elements at **elements**, excluding
+        these elements."""
+        elements = np.asarray(elements, dtype=np.int64)
+        neighbours = self.nodeElements(self.elementNodes(elements))
+        return neighbours[~np.isin(neighbours, elements)]
+
+    def elementLabels(self, nodeLabels) -> np.ndarray:
+        """Return the labels of the elements referencing any of the nodes with the labels **nodeLabels**, in index
+        order.
+
+        Raises
+        ------
+        ValueError
+            If a node label does not exist.
+        """
+        return self.mesh.elementLabels[self.nodeElements(self.mesh.nodesFromLabels(nodeLabels))]
+
+    def nodeLabels(self, elementLabels) -> np.ndarray:
+        """Return the labels of the nodes referenced by the elements with the labels **elementLabels**, in index
+        order.
+
+        Raises
+        ------
+        ValueError
+            If an element label does not exist.
+        """
+        return self.mesh.nodeLabels[self.elementNodes(self.mesh.elementsFromLabels(elementLabels))]
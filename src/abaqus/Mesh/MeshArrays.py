@@ -0,0 +1,535 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+
+from ..UtilityAndView.abaqusConstants import abaqusConstants as C
+from .elementTopology import elementNodeCount, elementShape, shapeDimension, shapeEdges, shapeFaces
+from .MeshEdge import MeshEdge
+from .MeshEdgeArray import MeshEdgeArray
+from .MeshElement import MeshElement
+from .MeshElementArray import MeshElementArray
+from .MeshFace import MeshFace
+from .MeshFaceArray import MeshFaceArray
+from .MeshNode import MeshNode
+from .MeshNodeArray import MeshNodeArray
+
+if TYPE_CHECKING:  # to avoid circular imports
+    from .MeshAdjacency import MeshAdjacency
+
+
+class MeshArrays:
+    """The MeshArrays object stores an orphan mesh as flat arrays instead of MeshNode and MeshElement objects.
+
+    Nodes are stored as a label array and an (N, 3) coordinate array, elements are stored as a label array, an
+    array of codes into :attr:`elementTypes` and an (M, k) connectivity array of internal node indices padded with
+    -1 for element types with fewer than k nodes. MeshNode and MeshElement objects are only created on demand when
+    a single node or element is accessed.
+    """
+
+    #: An (N,) int64 array specifying the node labels.
+    nodeLabels: np.ndarray
+
+    #: An (N, 3) float64 array specifying the node coordinates.
+    coordinates: np.ndarray
+
+    #: An (M,) int64 array specifying the element labels.
+    elementLabels: np.ndarray
+
+    #: A tuple of Strings specifying the element types referenced by :attr:`elementTypeCodes`.
+    elementTypes: tuple[str, ...]
+
+    #: An (M,) int32 array specifying the index of the element type of each element in :attr:`elementTypes`.
+    elementTypeCodes: np.ndarray
+
+    #: An (M, k) int64 array specifying the internal node indices of each element, padded with -1.
+    connectivity: np.ndarray
+
+    def __init__(
+        self,
+        nodeLabels: np.ndarray,
+        coordinates: np.ndarray,
+        elementLabels: np.ndarray,
+        elementTypes: Sequence[str],
+        elementTypeCodes: np.ndarray,
+        connectivity: np.ndarray,
+    ):
+        self.nodeLabels = nodeLabels
+        self.coordinates = coordinates
+        self.elementLabels = elementLabels
+        self.elementTypes = tuple(str(elemType) for elemType in elementTypes)
+        self.elementTypeCodes = elementTypeCodes
+        self.connectivity = connectivity
+        self._nodeIndex: LabelIndex | None = None
+        self._elementIndex: LabelIndex | None = None
+        self._groups: dict[str, np.ndarray] | None = None
+        self._adjacency: MeshAdjacency | None = None
+
+    @classmethod
+    def fromArrays(
+        cls,
+        coordinates,
+        connectivity,
+        elementTypeCodes,
+        elementTypes: Sequence[str],
+        nodeLabels=None,
+        elementLabels=None,
+    ) -> MeshArrays:
+        """Build the mesh storage from bulk arrays.
+
+        Parameters
+        ----------
+        coordinates
+            An (N, 3) or (N, 2) array of Floats specifying the node coordinates.
+        connectivity
+            An (M, k) array of Ints specifying the node labels of each element. Element types with fewer than k
+            nodes are padded with zeros or negative values.
+        elementTypeCodes
+            An (M,) array of Ints specifying the index of the type of each element in **elementTypes**, or a
+            single Int if all elements have the same type.
+        elementTypes
+            A sequence of Strings specifying the element types, such as ``C3D8R``.
+        nodeLabels
+            An (N,) array of Ints specifying the node labels. The default is 1 to N.
+        elementLabels
+            An (M,) array of Ints specifying the element labels. The default is 1 to M.
+
+        Returns
+        -------
+        MeshArrays
+            A MeshArrays object.
+
+        Raises
+        ------
+        ValueError
+            If the arrays have inconsistent shapes, the labels are not unique and positive, an element type code
+            is out of range, or an element references a node label that does not exist.
+        """
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        if coordinates.ndim != 2 or coordinates.shape[1] not in (2, 3):
+            raise ValueError(f"coordinates must be an (N, 3) array, got shape {coordinates.shape}")
+        if coordinates.shape[1] == 2:
+            coordinates = np.column_stack([coordinates, np.zeros(len(coordinates))])
+        connectivity = np.asarray(connectivity, dtype=np.int64)
+        if connectivity.ndim == 1:
+            connectivity = connectivity[:, None]
+        if connectivity.ndim != 2:
+            raise ValueError(f"connectivity must be an (M, k) array, got shape {connectivity.shape}")
+        numNodes, numElements = len(coordinates), len(connectivity)
+        nodeLabels = _labels(nodeLabels, numNodes, "node")
+        elementLabels = _labels(elementLabels, numElements, "element")
+        elementTypes = tuple(str(elemType) for elemType in elementTypes)
+        codes = np.broadcast_to(np.asarray(elementTypeCodes, dtype=np.int32), (numElements,)).copy()
+        if numElements and (codes.min() < 0 or codes.max() >= len(elementTypes)):
+            raise ValueError(f"Element type codes must be in the range [0, {len(elementTypes)})")
+
+        # Map node labels to internal indices, padding entries become -1
+        valid = connectivity > 0
+        nodeIndex = LabelIndex(nodeLabels)
+        indices = nodeIndex(np.where(valid, connectivity, 0))
+        found = indices >= 0
+        if not np.array_equal(found, valid):
+            row, col = np.argwhere(valid & ~found)[0]
+            raise ValueError(f"Element {elementLabels[row]} references node {connectivity[row, col]} "
+                             "that does not exist")  # fmt: skip
+
+        # Validate the number of nodes of each element type, one vectorised check per type
+        counts = found.sum(axis=1)
+        for code, elemType in enumerate(elementTypes):
+            expected = elementNodeCount(elemType)
+            if not expected:
+                continue
+            rows = np.flatnonzero((codes == code) & (counts != expected))
+            if len(rows):
+                raise ValueError(f"Element {elementLabels[rows[0]]} of type {elemType} has {counts[rows[0]]} "
+                                 f"nodes, expected {expected}")  # fmt: skip
+
+        mesh = cls(nodeLabels, coordinates, elementLabels, elementTypes, codes, indices)
+        mesh._nodeIndex = nodeIndex
+        return mesh
+
+    @classmethod
+    def fromNodesAndElements(cls, nodes: Sequence, elements: Sequence) -> MeshArrays:
+        """Build the mesh storage from the arguments of ``PartFromNodesAndElements``.
+
+        Parameters
+        ----------
+        nodes
+            A sequence of (**nodeLabels**, **nodeCoords**), both members can be arrays.
+        elements
+            A sequence of sequences of (**meshType**, **elementLabels**, **elementConns**), the labels and
+            connectivity of each element type can be arrays.
+
+        Returns
+        -------
+        MeshArrays
+            A MeshArrays object.
+        """
+        nodeLabels, coordinates = nodes
+        elementTypes: list[str] = []
+        codes: list[np.ndarray] = []
+        labels: list[np.ndarray] = []
+        blocks: list[np.ndarray] = []
+        for meshType, elementLabels, elementConns in elements:
+            code = elementTypes.index(str(meshType)) if str(meshType) in elementTypes else len(elementTypes)
+            elementTypes += [str(meshType)] if code == len(elementTypes) else []
+            elementLabels, elementConns = np.asarray(elementLabels, dtype=np.int64), np.asarray(elementConns)
+            blocks.append(elementConns.reshape(len(elementLabels), -1))
+            labels.append(elementLabels)
+            codes.append(np.full(len(elementLabels), code, dtype=np.int32))
+        width = max((block.shape[1] for block in blocks), default=1)
+        connectivity = np.zeros((sum(len(block) for block in blocks), width), dtype=np.int64)
+        start = 0
+        for block in blocks:
+            connectivity[start : start + len(block), : block.shape[1]] = block
+            start += len(block)
+        return cls.fromArrays(
+            coordinates,
+            connectivity,
+            np.concatenate(codes) if codes else np.zeros(0, dtype=np.int32),
+            elementTypes,
+            nodeLabels=nodeLabels,
+            elementLabels=np.concatenate(labels) if labels else np.zeros(0, dtype=np.int64),
+        )
+
+    @classmethod
+    def fromMeshObjects(cls, nodes: Sequence, elements: Sequence) -> MeshArrays:
+        """Build the mesh storage from node and element objects, such as the OdbMeshNode and OdbMeshElement
+        objects of an OdbInstance.
+
+        Parameters
+        ----------
+        nodes
+            A sequence of objects with a **label** and **coordinates**.
+        elements
+            A sequence of objects with a **label**, a **type** and a **connectivity** of node labels.
+
+        Returns
+        -------
+        MeshArrays
+            A MeshArrays object.
+        """
+        coordinates = np.array([node.coordinates for node in nodes], dtype=np.float64).reshape(len(nodes), -1)
+        nodeLabels = np.fromiter((node.label for node in nodes), dtype=np.int64, count=len(nodes))
+        byType: dict[str, list] = {}
+        for element in elements:
+            byType.setdefault(str(element.type), []).append(element)
+        return cls.fromNodesAndElements(
+            (nodeLabels, coordinates if len(nodes) else np.zeros((0, 3))),
+            [(elemType, [element.label for element in group], [element.connectivity for element in group])
+             for elemType, group in byType.items()],
+        )  # fmt: skip
+
+    @property
+    def numNodes(self) -> int:
+        """The number of nodes in the mesh."""
+        return len(self.nodeLabels)
+
+    @property
+    def numElements(self) -> int:
+        """The number of elements in the mesh."""
+        return len(self.elementLabels)
+
+    def copy(self) -> MeshArrays:
+        """Return a deep copy of the mesh storage."""
+        return MeshArrays(
+            self.nodeLabels.copy(),
+            self.coordinates.copy(),
+            self.elementLabels.copy(),
+            self.elementTypes,
+            self.elementTypeCodes.copy(),
+            self.connectivity.copy(),
+        )
+
+    def groups(self) -> dict[str, np.ndarray]:
+        """Return the element indices grouped by element type.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            A Dictionary mapping each element type to a sorted array of element indices.
+        """
+        if self._groups is None:
+            order = np.argsort(self.elementTypeCodes, kind="stable")
+            bounds = np.searchsorted(self.elementTypeCodes[order], np.arange(len(self.elementTypes) + 1))
+            self._groups = {elemType: order[bounds[code] : bounds[code + 1]]
+                            for code, elemType in enumerate(self.elementTypes)
+                            if bounds[code + 1] > bounds[code]}  # fmt: skip
+        return self._groups
+
+    def nodeIndices(self, labels) -> np.ndarray:
+        """Map node labels to internal node indices.
+
+        Parameters
+        ----------
+        labels
+            An array of Ints specifying the node labels.
+
+        Returns
+        -------
+        np.ndarray
+            An array of internal node indices, -1 for labels that do not exist.
+        """
+        if self._nodeIndex is None:
+            self._nodeIndex = LabelIndex(self.nodeLabels)
+        return self._nodeIndex(labels)
+
+    def elementIndices(self, labels) -> np.ndarray:
+        """Map element labels to internal element indices.
+
+        Parameters
+        ----------
+        labels
+            An array of Ints specifying the element labels.
+
+        Returns
+        -------
+        np.ndarray
+            An array of internal element indices, -1 for labels that do not exist.
+        """
+        if self._elementIndex is None:
+            self._elementIndex = LabelIndex(self.elementLabels)
+        return self._elementIndex(labels)
+
+    def nodeRange(self, indices: np.ndarray | None = None) -> np.ndarray:
+        """Return **indices**, or the indices of all nodes if **indices** is None."""
+        return np.arange(self.numNodes) if indices is None else indices
+
+    def elementRange(self, indices: np.ndarray | None = None) -> np.ndarray:
+        """Return **indices**, or the indices of all elements if **indices** is None."""
+        return np.arange(self.numElements) if indices is None else indices
+
+    def nodesFromLabels(self, labels, subset: np.ndarray | None = None) -> np.ndarray:
+        """Map node labels to internal node indices, raising a ValueError for labels missing from **subset**."""
+        return _select(self.nodeIndices(labels), labels, subset, "Node")
+
+    def elementsFromLabels(self, labels, subset: np.ndarray | None = None) -> np.ndarray:
+        """Map element labels to internal element indices, raising a ValueError for labels missing from
+        **subset**."""
+        return _select(self.elementIndices(labels), labels, subset, "Element")
+
+    def elementNodes(self, indices: np.ndarray | None = None) -> np.ndarray:
+        """Return the sorted unique node indices referenced by the elements at **indices**."""
+        connectivity = self.connectivity if indices is None else self.connectivity[indices]
+        nodes = connectivity.ravel()
+        return uniqueIndices(nodes[nodes >= 0], self.numNodes)
+
+    def adjacency(self) -> MeshAdjacency:
+        """Return the node to element adjacency of the mesh, built on the first call and cached until
+        :meth:`invalidate` is called."""
+        if self._adjacency is None:
+            from .MeshAdjacency import MeshAdjacency
+
+            self._adjacency = MeshAdjacency(self)
+        return self._adjacency
+
+    def nodesInBox(self, low, high) -> np.ndarray:
+        """Return a mask of the nodes inside the box between the corners **low** and **high**."""
+        inside = (self.coordinates >= np.asarray(low, dtype=np.float64)) & (
+            self.coordinates <= np.asarray(high, dtype=np.float64)
+        )
+        return np.asarray(inside.all(axis=1))
+
+    def nodesInCylinder(self, center1, center2, radius: float) -> np.ndarray:
+        """Return a mask of the nodes inside the cylinder between the centers of its ends **center1** and
+        **center2**."""
+        start = np.asarray(center1, dtype=np.float64)
+        axis = np.asarray(center2, dtype=np.float64) - start
+        length = float(np.linalg.norm(axis))
+        relative = self.coordinates - start
+        if not length:
+            return np.zeros(self.numNodes, dtype=bool)
+        along = relative @ (axis / length)
+        distance = np.linalg.norm(relative - along[:, None] * (axis / length), axis=1)
+        return (along >= 0.0) & (along <= length) & (distance <= radius)
+
+    def nodesInSphere(self, center, radius: float) -> np.ndarray:
+        """Return a mask of the nodes inside the sphere of center **center**."""
+        return np.linalg.norm(self.coordinates - np.asarray(center, dtype=np.float64), axis=1) <= radius
+
+    def elementsWithin(self, inside: np.ndarray, indices: np.ndarray | None = None) -> np.ndarray:
+        """Return the indices of the elements at **indices** whose nodes are all inside a region, given a mask of
+        the nodes inside the region. Only the elements of the nodes inside are tested."""
+        candidates = self.adjacency().nodeElements(np.flatnonzero(inside))
+        if indices is not None:
+            candidates = candidates[np.isin(candidates, indices)]
+        connectivity = self.connectivity[candidates]
+        return candidates[(inside[connectivity] | (connectivity < 0)).all(axis=1)]
+
+    def invalidate(self):
+        """Discard the cached label indices, element groups and adjacency, after the arrays were modified in
+        place."""
+        self._nodeIndex = self._elementIndex = None
+        self._groups = None
+        self._adjacency = None
+
+    def boundingBox(self, indices: np.ndarray) -> dict[str, tuple[float, float, float]]:
+        """Return the bounding box of the nodes at **indices** in the format of ``getBoundingBox``."""
+        if not len(indices):
+            return {"low": (0.0, 0.0, 0.0), "high": (0.0, 0.0, 0.0)}
+        coordinates = self.coordinates[indices]
+        return {"low": tuple(coordinates.min(axis=0).tolist()), "high": tuple(coordinates.max(axis=0).tolist())}
+
+    def node(self, index: int) -> MeshNode:
+        """Create the MeshNode object of the node at **index**."""
+        label, coordinates = int(self.nodeLabels[index]), tuple(self.coordinates[index].tolist())
+        node = MeshNode(coordinates, label=label)
+        node.label, node.coordinates = label, coordinates
+        node._mesh, node._index = self, int(index)
+        return node
+
+    def element(self, index: int) -> MeshElement:
+        """Create the MeshElement object of the element at **index**."""
+        element = MeshElement()
+        connectivity = self.connectivity[index]
+        element.label, element.type = int(self.elementLabels[index]), self.elementTypes[self.elementTypeCodes[index]]
+        element.connectivity = tuple(connectivity[connectivity >= 0].tolist())
+        element._mesh, element._index = self, int(index)
+        return element
+
+    def nodeArray(self, indices: np.ndarray | None = None) -> MeshNodeArray:
+        """Create a MeshNodeArray backed by this mesh storage without creating MeshNode objects."""
+        nodes = MeshNodeArray([])
+        nodes._mesh, nodes._indices = self, indices
+        return nodes
+
+    def elementArray(self, indices: np.ndarray | None = None) -> MeshElementArray:
+        """Create a MeshElementArray backed by this mesh storage without creating MeshElement objects."""
+        elements = MeshElementArray([])
+        elements._mesh, elements._indices = self, indices
+        return elements
+
+    def face(self, element: int, side: int) -> MeshFace:
+        """Create the MeshFace object of the zero-based face **side** of the element at **element**."""
+        face = MeshFace()
+        face.label, face.face = int(self.elementLabels[element]), getattr(C, f"FACE{int(side) + 1}")
+        face._mesh, face._element, face._side = self, int(element), int(side)
+        return face
+
+    def edge(self, element: int, number: int) -> MeshEdge:
+        """Create the MeshEdge object of the zero-based edge **number** of the element at **element**."""
+        edge = MeshEdge()
+        edge._mesh, edge._element, edge._edge = self, int(element), int(number)
+        return edge
+
+    def faceArray(self, elements: np.ndarray, sides: np.ndarray) -> MeshFaceArray:
+        """Create a MeshFaceArray of element faces backed by this mesh storage without creating MeshFace objects."""
+        faces = MeshFaceArray([])
+        faces._mesh, faces._elements, faces._sides = self, elements, sides
+        return faces
+
+    def edgeArray(self, elements: np.ndarray, numbers: np.ndarray) -> MeshEdgeArray:
+        """Create a MeshEdgeArray of element edges backed by this mesh storage without creating MeshEdge objects."""
+        edges = MeshEdgeArray([])
+        edges._mesh, edges._elements, edges._edges = self, elements, numbers
+        return edges
+
+    def faceNodes(self, element: int, side: int) -> np.ndarray:
+        """Return the node indices of the zero-based face **side** of the element at **element**, the faces of
+        two-dimensional elements are their edges."""
+        shape = self._shape(element)
+        if shapeDimension[shape] != 3:
+            return self.edgeNodes(element, side)
+        return self.connectivity[element, np.array(shapeFaces(shape)[side])]
+
+    def edgeNodes(self, element: int, number: int) -> np.ndarray:
+        """Return the node indices of the zero-based edge **number** of the element at **element**."""
+        shape = self._shape(element)
+        return self.connectivity[element, np.array([node for node in shapeEdges(shape)[number] if node >= 0])]
+
+    def _shape(self, element: int) -> str:
+        """Return the shape of the element at **element**."""
+        elemType = self.elementTypes[self.elementTypeCodes[element]]
+        shape = elementShape(elemType)
+        if shape is None:
+            raise ValueError(f"Unsupported element type {elemType}")
+        return shape
+
+
+class LabelIndex:
+    """A label to index map over an array of unique labels.
+
+    Runs of consecutive labels stored in order, such as the labels 1 to n of most meshes, are looked up by their
+    offset from the first label of their run. Otherwise labels in a compact range are looked up in a dense offset
+    table, and scattered labels by a binary search on the sorting permutation of the labels. The tables hold 32-bit
+    indices, so an index costs at most a few bytes per label.
+    """
+
+    def __init__(self, labels: np.ndarray):
+        self.labels = labels
+        self.table: np.ndarray | None = None
+        self.order: np.ndarray | None = None
+        self.runs: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+        self.low = int(labels.min()) if len(labels) else 0
+        high = int(labels.max()) if len(labels) else -1
+        dtype = np.int32 if len(labels) < 2**31 else np.int64
+        starts = np.flatnonzero(np.diff(labels) != 1) + 1 if len(labels) else np.zeros(0, dtype=np.int64)
+        starts = np.concatenate([[0], starts]) if len(labels) else starts
+        if len(starts) * 16 <= len(labels) + 16:
+            order = np.argsort(labels[starts], kind="stable")
+            lengths = np.diff(np.append(starts, len(labels)))
+            self.runs = (labels[starts][order], starts[order].astype(dtype), lengths[order].astype(dtype))
+        elif high - self.low < 4 * len(labels) + 1024:
+            # Entry 0 and the last entry are sentinels for labels out of range
+            self.table = np.full(high - self.low + 3, -1, dtype=dtype)
+            self.table[labels - self.low + 1] = np.arange(len(labels))
+        else:
+            self.order = np.argsort(labels, kind="stable").astype(dtype)
+
+    def __call__(self, labels) -> np.ndarray:
+        """Return the indices of **labels**, -1 for labels that do not exist."""
+        labels = np.asarray(labels, dtype=np.int64)
+        if self.runs is not None:
+            firsts, starts, lengths = self.runs
+            if not len(firsts):
+                return np.full(labels.shape, -1, dtype=np.int64)
+            run = (np.searchsorted(firsts, labels, side="right") - 1).clip(min=0)
+            offsets = labels - firsts[run]
+            return np.where((offsets >= 0) & (offsets < lengths[run]), starts[run] + offsets, -1)
+        if self.order is not None:
+            position = np.searchsorted(self.labels, labels, sorter=self.order).clip(max=len(self.labels) - 1)
+            indices = self.order[position].astype(np.int64)
+            return np.where(self.labels[indices] == labels, indices, -1)
+        table = np.asarray(self.table)
+        return table[(labels - self.low + 1).clip(0, len(table) - 1)].astype(np.int64)
+
+
+def uniqueIndices(indices: np.ndarray, size: int) -> np.ndarray:
+    """Return the sorted unique values of an array of indices in the range [0, **size**), marking them in a mask
+    instead of sorting unless the array is much smaller than the range."""
+    if len(indices) * 16 < size:
+        return np.unique(indices)
+    mask = np.zeros(size, dtype=bool)
+    mask[indices] = True
+    return np.flatnonzero(mask)
+
+
+def _labels(labels, size: int, kind: str) -> np.ndarray:
+    """Validate a label array, or generate labels 1 to **size**."""
+    if labels is None:
+        return np.arange(1, size + 1, dtype=np.int64)
+    labels = np.asarray(labels, dtype=np.int64).reshape(-1)
+    if len(labels) != size:
+        raise ValueError(f"Expected {size} {kind} labels, got {len(labels)}")
+    if size and labels.min() <= 0:
+        raise ValueError(f"The {kind} labels must be positive integers")
+    if size and labels.max() < 4 * size + 1024:
+        counts = np.bincount(labels)
+        duplicated = np.flatnonzero(counts > 1)
+    else:
+        ordered = np.sort(labels)
+        duplicated = ordered[1:][ordered[1:] == ordered[:-1]]
+    if len(duplicated):
+        raise ValueError(f"Duplicate {kind} label {duplicated[0]}")
+    return labels
+
+
+def _select(indices: np.ndarray, labels, subset: np.ndarray | None, kind: str) -> np.ndarray:
+    """Check that all **indices** are found and belong to **subset**."""
+    valid = indices >= 0
+    if subset is not None:
+        valid &= np.isin(indices, subset)
+    if not valid.all():
+        raise ValueError(f"{kind} label {np.asarray(labels).reshape(-1)[np.argmin(valid)]} not found")
+    return indices
@@ -1,7 +1,14 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .MeshElementArray import MeshElementArray
 
+if TYPE_CHECKING:  # to avoid circular imports
+    from .MeshArrays import MeshArrays
+
 
 @abaqus_class_doc
 class MeshEdge:
@@ -21,6 +28,15 @@ class MeshEdge:
             mdb.models[name].rootAssembly.instances[name].elementEdges[i]
     """
 
+    #: A MeshArrays object storing the element, if the mesh is stored as arrays.
+    _mesh: MeshArrays | None = None
+
+    #: An Int specifying the internal index of the element in :attr:`_mesh`.
+    _element: int = -1
+
+    #: An Int specifying the zero-based edge number on the element.
+    _edge: int = -1
+
     @abaqus_method_doc
     def getElements(self):
         """This method returns a tuple of elements that share the element edge.
@@ -88,4 +104,5 @@ class MeshEdge:
         Sequence[MeshNode]
             A tuple of MeshNode objects.
         """
-        ...
+        if self._mesh is not None:
+            return tuple(self._mesh.node(index) for index in self._mesh.edgeNodes(self._element, self._edge))
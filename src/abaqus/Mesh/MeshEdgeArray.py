@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from typing import List, Sequence, Union
+from typing import TYPE_CHECKING, List, Sequence, Union
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .MeshEdge import MeshEdge
 
+if TYPE_CHECKING:  # to avoid circular imports
+    from numpy import ndarray
+
+    from .MeshArrays import MeshArrays
+
 
 @abaqus_class_doc
 class MeshEdgeArray(List[MeshEdge]):
@@ -21,6 +26,15 @@ class MeshEdgeArray(List[MeshEdge]):
             mdb.models[name].rootAssembly.instances[name].elementEdges
     """
 
+    #: A MeshArrays object backing this sequence, if the mesh is stored as arrays.
+    _mesh: MeshArrays | None = None
+
+    #: An array of internal element indices into :attr:`_mesh`.
+    _elements: ndarray | None = None
+
+    #: An array of the zero-based edge numbers on the elements at :attr:`_elements`.
+    _edges: ndarray | None = None
+
     @abaqus_method_doc
     def __init__(self, elemEdges: list[MeshEdge]):
         """This method creates a MeshEdgeArray object.
@@ -45,6 +59,23 @@ class MeshEdgeArray(List[MeshEdge]):
         """
         super().__init__()
 
+    def __len__(self) -> int:
+        if self._mesh is None or self._elements is None:
+            return super().__len__()
+        return len(self._elements)
+
+    def __iter__(self):
+        if self._mesh is None:
+            return super().__iter__()
+        return (self._mesh.edge(element, number) for element, number in zip(self._elements, self._edges))
+
+    def __getitem__(self, key):
+        if self._mesh is None:
+            return super().__getitem__(key)
+        if isinstance(key, slice):
+            return self._mesh.edgeArray(self._elements[key], self._edges[key])
+        return self._mesh.edge(self._elements[key], self._edges[key])
+
     @abaqus_method_doc
     def getSequenceFromMask(self, mask: Union[str, Sequence[str]]) -> MeshEdgeArray:
         """This method returns the objects in the MeshEdgeArray identified using the specified
@@ -10,6 +10,7 @@ from ..UtilityAndView.abaqusConstants import SymbolicConstant
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 
 if TYPE_CHECKING:  # to avoid circular imports
+    from .MeshArrays import MeshArrays
     from .MeshEdge import MeshEdge
     from .MeshElementArray import MeshElementArray
     from .MeshFace import MeshFace
@@ -66,6 +67,12 @@ class MeshElement:
     #: connectivity is node labels instead of node indices.
     connectivity: tuple[int, ...] = ()
 
+    #: A MeshArrays object storing the element, if the mesh is stored as arrays.
+    _mesh: MeshArrays | None = None
+
+    #: An Int specifying the internal index of the element in :attr:`_mesh`.
+    _index: int = -1
+
     @abaqus_method_doc
     def Element(
         self,
@@ -111,7 +118,7 @@ class MeshElement:
         return MeshElement()
 
     @abaqus_method_doc
-    def getNodes(self) -> tuple[MeshNode]:
+    def getNodes(self) -> tuple[MeshNode, ...]:
         """This method returns a tuple of node objects of the element.
 
         Returns
@@ -119,6 +126,8 @@ class MeshElement:
         tuple[MeshNode]
             A tuple of MeshNode objects.
         """
+        if self._mesh is not None:
+            return tuple(self._mesh.node(index) for index in self.connectivity)
         return (
             MeshNode(
                 (
@@ -160,6 +169,8 @@ class MeshElement:
         MeshElementArray
             A MeshElementArray object which is a sequence of MeshElement objects.
         """
+        if self._mesh is not None:
+            return self._mesh.elementArray(self._mesh.adjacency().adjacentElements([self._index]))
         return MeshElementArray([MeshElement()])
 
     @abaqus_method_doc
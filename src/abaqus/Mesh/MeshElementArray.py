@@ -2,15 +2,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List, Sequence, Union
 
-from abaqus.BasicGeometry.Edge import Edge
-from abaqus.BasicGeometry.Face import Face
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .MeshElement import MeshElement
 
 if TYPE_CHECKING:  # to avoid circular imports
-    from ..BasicGeometry.EdgeArray import EdgeArray
-    from ..BasicGeometry.FaceArray import FaceArray
+    from numpy import ndarray
+
+    from .MeshArrays import MeshArrays
+    from .MeshEdgeArray import MeshEdgeArray
+    from .MeshFaceArray import MeshFaceArray
 
 
 @abaqus_class_doc
@@ -47,6 +48,12 @@ class MeshElementArray(List[MeshElement]):
             mdb.models[name].rootAssembly.surfaces[name].elements
     """
 
+    #: A MeshArrays object backing this sequence, if the mesh is stored as arrays.
+    _mesh: MeshArrays | None = None
+
+    #: An array of internal element indices into :attr:`_mesh`, None for all elements of the mesh.
+    _indices: ndarray | None = None
+
     @abaqus_method_doc
     def __init__(self, elements: list[MeshElement]) -> None:
         """This method creates a MeshElementArray object.
@@ -68,6 +75,24 @@ class MeshElementArray(List[MeshElement]):
         """
         super().__init__()
 
+    def __len__(self) -> int:
+        if self._mesh is None:
+            return super().__len__()
+        return self._mesh.numElements if self._indices is None else len(self._indices)
+
+    def __iter__(self):
+        if self._mesh is None:
+            return super().__iter__()
+        return (self._mesh.element(index) for index in self._mesh.elementRange(self._indices))
+
+    def __getitem__(self, key):
+        if self._mesh is None:
+            return super().__getitem__(key)
+        indices = self._mesh.elementRange(self._indices)
+        if isinstance(key, slice):
+            return self._mesh.elementArray(indices[key])
+        return self._mesh.element(indices[key])
+
     @abaqus_method_doc
     def getFromLabel(self, label: int) -> MeshElement:
         """This method returns the object in the MeshElementArray with the given label.
@@ -82,6 +107,8 @@ class MeshElementArray(List[MeshElement]):
         MeshElement
             A MeshElement object.
         """
+        if self._mesh is not None:
+            return self._mesh.element(self._mesh.elementsFromLabels([label], self._indices)[0])
         return MeshElement()
 
     @abaqus_method_doc
@@ -145,6 +172,9 @@ class MeshElementArray(List[MeshElement]):
         MeshElementArray
             A MeshElementArray object, which is a sequence of MeshElement objects.
         """
+        if self._mesh is not None:
+            inside = self._mesh.nodesInBox((xMin, yMin, zMin), (xMax, yMax, zMax))
+            return self._mesh.elementArray(self._mesh.elementsWithin(inside, self._indices))
         return MeshElementArray([MeshElement()])
 
     @abaqus_method_doc
@@ -166,6 +196,9 @@ class MeshElementArray(List[MeshElement]):
         MeshElementArray
             A MeshElementArray object, which is a sequence of MeshElement objects.
         """
+        if self._mesh is not None:
+            inside = self._mesh.nodesInCylinder(center1, center2, float(radius))
+            return self._mesh.elementArray(self._mesh.elementsWithin(inside, self._indices))
         return MeshElementArray([MeshElement()])
 
     @abaqus_method_doc
@@ -184,6 +217,9 @@ class MeshElementArray(List[MeshElement]):
         MeshElementArray
             A MeshElementArray object, which is a sequence of MeshElement objects.
         """
+        if self._mesh is not None:
+            inside = self._mesh.nodesInSphere(center, radius)
+            return self._mesh.elementArray(self._mesh.elementsWithin(inside, self._indices))
         return MeshElementArray([MeshElement()])
 
     @abaqus_method_doc
@@ -201,6 +237,8 @@ class MeshElementArray(List[MeshElement]):
             - **high**: a tuple of three floats representing the maximum x, y, and z boundary values of
               the bounding box.
         """
+        if self._mesh is not None:
+            return self._mesh.boundingBox(self._mesh.elementNodes(self._indices))
         return {"low": (0.0, 0.0, 0.0), "high": (0.0, 0.0, 0.0)}
 
     @abaqus_method_doc
@@ -222,10 +260,12 @@ class MeshElementArray(List[MeshElement]):
         Error
             The mask results in an empty sequence, An exception occurs if the resulting sequence is empty.
         """
+        if self._mesh is not None:
+            return self._mesh.elementArray(self._mesh.elementsFromLabels(labels, self._indices))
         return MeshElementArray([MeshElement()])
 
     @abaqus_method_doc
-    def getExteriorEdges(self) -> EdgeArray:
+    def getExteriorEdges(self) -> MeshEdgeArray:
         """This method returns the edges on the exterior of the faces in the FaceArray. That is, it returns the
         edges that are referenced by exactly one of the faces in the sequence.
 
@@ -234,13 +274,20 @@ class MeshElementArray(List[MeshElement]):
 
         Returns
         -------
-        EdgeArray
-            An EdgeArray object specifying the exterior edges.
+        MeshEdgeArray
+            A MeshEdgeArray object specifying the exterior edges. The faces of two-dimensional elements are the
+            elements, the faces of solid elements are their exterior faces.
         """
-        return EdgeArray([Edge()])
+        from .MeshEdgeArray import MeshEdgeArray
+
+        if self._mesh is not None:
+            from .meshExterior import exteriorEdges
+
+            return self._mesh.edgeArray(*exteriorEdges(self._mesh, self._indices))
+        return MeshEdgeArray([])
 
     @abaqus_method_doc
-    def getExteriorFaces(self) -> FaceArray:
+    def getExteriorFaces(self) -> MeshFaceArray:
         """This method returns the cell faces on the exterior of the CellArray. That is, it returns the faces
         that are referenced by exactly one of the cells in the sequence.
 
@@ -249,7 +296,14 @@ class MeshElementArray(List[MeshElement]):
 
         Returns
         -------
-        FaceArray
-            A FaceArray object representing the faces on the exterior of the cells.
+        MeshFaceArray
+            A MeshFaceArray object representing the faces on the exterior of the cells. The faces of
+            two-dimensional elements are their edges.
         """
-        return FaceArray([Face()])
+        from .MeshFaceArray import MeshFaceArray
+
+        if self._mesh is not None:
+            from .meshExterior import exteriorFaces
+
+            return self._mesh.faceArray(*exteriorFaces(self._mesh, self._indices))
+        return MeshFaceArray([])
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+if TYPE_CHECKING:  # to avoid circular imports
+    from .MeshArrays import MeshArrays
+
 
 @abaqus_class_doc
 class MeshFace:
@@ -27,6 +32,15 @@ class MeshFace:
     #: An Int specifying a symbolic constant specifying the side of the element.
     face: int | None = None
 
+    #: A MeshArrays object storing the element, if the mesh is stored as arrays.
+    _mesh: MeshArrays | None = None
+
+    #: An Int specifying the internal index of the element in :attr:`_mesh`.
+    _element: int = -1
+
+    #: An Int specifying the zero-based face number on the element.
+    _side: int = -1
+
     @abaqus_method_doc
     def getElemEdges(self):
         """This method returns a tuple of unique element edges on the element face.
@@ -58,7 +72,8 @@ class MeshFace:
         nodes: Sequence[MeshNode]
             A tuple of MeshNode objects
         """
-        ...
+        if self._mesh is not None:
+            return tuple(self._mesh.node(index) for index in self._mesh.faceNodes(self._element, self._side))
 
     @abaqus_method_doc
     def getNodesByFaceAngle(self, angle: str):
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from typing import List, Sequence, Union
+from typing import TYPE_CHECKING, List, Sequence, Union
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .MeshFace import MeshFace
 
+if TYPE_CHECKING:  # to avoid circular imports
+    from numpy import ndarray
+
+    from .MeshArrays import MeshArrays
+
 
 @abaqus_class_doc
 class MeshFaceArray(List[MeshFace]):
@@ -21,6 +26,15 @@ class MeshFaceArray(List[MeshFace]):
             mdb.models[name].rootAssembly.instances[name].elementFaces
     """
 
+    #: A MeshArrays object backing this sequence, if the mesh is stored as arrays.
+    _mesh: MeshArrays | None = None
+
+    #: An array of internal element indices into :attr:`_mesh`.
+    _elements: ndarray | None = None
+
+    #: An array of the zero-based face numbers on the elements at :attr:`_elements`.
+    _sides: ndarray | None = None
+
     @abaqus_method_doc
     def __init__(self, elemFaces: list[MeshFace]):
         """This method creates a MeshFaceArray object.
@@ -45,6 +59,23 @@ class MeshFaceArray(List[MeshFace]):
         """
         super().__init__()
 
+    def __len__(self) -> int:
+        if self._mesh is None or self._elements is None:
+            return super().__len__()
+        return len(self._elements)
+
+    def __iter__(self):
+        if self._mesh is None:
+            return super().__iter__()
+        return (self._mesh.face(element, number) for element, number in zip(self._elements, self._sides))
+
+    def __getitem__(self, key):
+        if self._mesh is None:
+            return super().__getitem__(key)
+        if isinstance(key, slice):
+            return self._mesh.faceArray(self._elements[key], self._sides[key])
+        return self._mesh.face(self._elements[key], self._sides[key])
+
     @abaqus_method_doc
     def getSequenceFromMask(self, mask: Union[str, Sequence[str]]) -> MeshFaceArray:
         """This method returns the objects in the MeshFaceArray identified using the specified
@@ -8,6 +8,7 @@ from ..Datum.DatumCsys import DatumCsys
 from .MeshFace import MeshFace
 
 if TYPE_CHECKING:  # to avoid circular imports
+    from .MeshArrays import MeshArrays
     from .MeshEdge import MeshEdge
     from .MeshElement import MeshElement
     from .MeshNodeArray import MeshNodeArray
@@ -59,6 +60,12 @@ class MeshNode:
     #: A tuple of three Floats specifying the coordinates of the new node.
     coordinates: tuple[float, float, float]
 
+    #: A MeshArrays object storing the node, if the mesh is stored as arrays.
+    _mesh: MeshArrays | None = None
+
+    #: An Int specifying the internal index of the node in :attr:`_mesh`.
+    _index: int = -1
+
     @abaqus_method_doc
     def __init__(
         self,
@@ -121,6 +128,8 @@ class MeshNode:
         elements: Sequence[MeshElement]
             A tuple of MeshElement objects
         """
+        if self._mesh is not None:
+            return tuple(self._mesh.element(index) for index in self._mesh.adjacency().nodeElements([self._index]))
         return (MeshElement(),)
 
     @abaqus_method_doc
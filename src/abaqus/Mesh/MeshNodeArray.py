@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from typing import List, Sequence, Union
+from typing import TYPE_CHECKING, List, Sequence, Union
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from .MeshNode import MeshNode
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
+    from .MeshArrays import MeshArrays
+
 
 @abaqus_class_doc
 class MeshNodeArray(List[MeshNode]):
@@ -42,6 +47,12 @@ class MeshNodeArray(List[MeshNode]):
             mdb.models[name].rootAssembly.surfaces[name].nodes
     """
 
+    #: A MeshArrays object backing this sequence, if the mesh is stored as arrays.
+    _mesh: MeshArrays | None = None
+
+    #: An array of internal node indices into :attr:`_mesh`, None for all nodes of the mesh.
+    _indices: ndarray | None = None
+
     @abaqus_method_doc
     def __init__(self, nodes: list[MeshNode]) -> None:
         """This method creates a MeshNodeArray object.
@@ -63,6 +74,24 @@ class MeshNodeArray(List[MeshNode]):
         """
         super().__init__()
 
+    def __len__(self) -> int:
+        if self._mesh is None:
+            return super().__len__()
+        return self._mesh.numNodes if self._indices is None else len(self._indices)
+
+    def __iter__(self):
+        if self._mesh is None:
+            return super().__iter__()
+        return (self._mesh.node(index) for index in self._mesh.nodeRange(self._indices))
+
+    def __getitem__(self, key):
+        if self._mesh is None:
+            return super().__getitem__(key)
+        indices = self._mesh.nodeRange(self._indices)
+        if isinstance(key, slice):
+            return self._mesh.nodeArray(indices[key])
+        return self._mesh.node(indices[key])
+
     @abaqus_method_doc
     def getFromLabel(self, label: int) -> MeshNode:
         """This method returns the object in the MeshNodeArray with the given label.
@@ -77,6 +106,8 @@ class MeshNodeArray(List[MeshNode]):
         MeshNode
             A MeshNode object.
         """
+        if self._mesh is not None:
+            return self._mesh.node(self._mesh.nodesFromLabels([label], self._indices)[0])
         return MeshNode((0.0, 0.0, 0.0))
 
     @abaqus_method_doc
@@ -204,6 +235,8 @@ class MeshNodeArray(List[MeshNode]):
         Raises
         ------
         """
+        if self._mesh is not None:
+            return self._mesh.boundingBox(self._mesh.nodeRange(self._indices))
         return {"low": (0.0, 0.0, 0.0), "high": (0.0, 0.0, 0.0)}
 
     @abaqus_method_doc
@@ -251,4 +284,6 @@ class MeshNodeArray(List[MeshNode]):
         Error
             The mask results in an empty sequence, An exception occurs if the resulting sequence is empty.
         """
+        if self._mesh is not None:
+            return self._mesh.nodeArray(self._mesh.nodesFromLabels(labels, self._indices))
         return MeshNodeArray([MeshNode((0.0, 0.0, 0.0))])
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence, Union
+from typing import TYPE_CHECKING, Sequence, Union
 
 from typing_extensions import Literal
 
@@ -24,9 +24,13 @@ from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .ElemType import ElemType
 from .MeshEdge import MeshEdge
 from .MeshElement import MeshElement
+from .MeshElementArray import MeshElementArray
 from .MeshFace import MeshFace
 from .MeshNode import MeshNode
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @abaqus_class_doc
 class MeshPart(PartBase):
@@ -671,7 +675,20 @@ class MeshPart(PartBase):
         MeshStats
             A MeshStats object.
         """
-        return MeshStats()
+        stats = MeshStats()
+        if self._mesh is None:
+            return stats
+        from .MeshQuality import MeshQuality
+
+        elements = self._meshElementIndices(regions)
+        counts = MeshQuality(self._mesh, numWorkers=1).statistics(elements)
+        for family, attribute in (("POINT", "numPointElems"), ("LINE", "numLineElems"), ("QUAD", "numQuadElems"),
+                                  ("TRI", "numTriElems"), ("HEX", "numHexElems"), ("WEDGE", "numWedgeElems"),
+                                  ("TET", "numTetElems"), ("PYRAMID", "numPyramidElems")):  # fmt: skip
+            setattr(stats, attribute, counts.get(family, 0))
+        stats.numNodes = counts["NODES"]
+        stats.numMeshedRegions = int(any(count for family, count in counts.items() if family != "NODES"))
+        return stats
 
     @abaqus_method_doc
     def getPartSeeds(
@@ -1129,6 +1146,8 @@ class MeshPart(PartBase):
         threshold: float | None = None,
         elemShape: Literal[C.LINE, C.WEDGE, C.TET, C.HEX, C.QUAD, C.TRI] | None = None,
         regions: tuple = (),
+        waveSpeed: float | None = None,
+        numWorkers: int | None = None,
     ):
         """This method tests the mesh quality of a part and returns poor-quality elements.
 
@@ -1192,6 +1211,13 @@ class MeshPart(PartBase):
         regions
             A sequence of Region or MeshElement objects. If you do not specify the **regions**
             argument, the entire part mesh is considered.
+        waveSpeed
+            A Float, or a sequence of Floats for the elements of **regions**, specifying the dilatational wave
+            speed of the material, used by the STABLE_TIME_INCREMENT and MAX_FREQUENCY criteria of an orphan mesh
+            stored as arrays, whose elements are otherwise not applicable. The default is None.
+        numWorkers
+            An Int specifying the number of threads evaluating the criterion on an orphan mesh stored as arrays.
+            The default is the number of CPUs.
 
         Returns
         -------
@@ -1201,7 +1227,52 @@ class MeshPart(PartBase):
             numElements (Int); average, worst (Float); worstElement
             (MeshElement object) .
         """
-        ...
+        if self._mesh is None:
+            return {}
+        from .MeshQuality import MeshQuality
+
+        quality = MeshQuality(self._mesh, numWorkers=numWorkers)
+        elements = self._meshElementIndices(regions)
+        if elemShape is not None:
+            elements = quality.select(str(elemShape), elements)
+        if str(criterion) == "ANALYSIS_CHECKS":
+            checks = quality.analysisChecks(elements)
+            return {
+                "numElements": checks["numElements"],
+                "failedElements": self._mesh.elementArray(checks["failedElements"]),
+                "warningElements": self._mesh.elementArray(checks["warningElements"]),
+            }
+        result = quality.verify(str(criterion), threshold, elements, waveSpeed)
+        verified = {"numElements": result["numElements"], "naElements": self._mesh.elementArray(result["naElements"])}
+        if result["worstElement"] is not None:
+            verified.update(average=result["average"], worst=result["worst"])
+            verified["worstElement"] = self._mesh.element(result["worstElement"])
+        if threshold is not None:
+            verified["failedElements"] = self._mesh.elementArray(result["failedElements"])
+        return verified
+
+    def _meshElementIndices(self, regions) -> np.ndarray | None:
+        """Return the indices in the array mesh of the elements of a sequence of Region, Set, MeshElementArray or
+        MeshElement objects, or None for the entire mesh if the sequence is empty."""
+        import numpy as np
+
+        if not regions or self._mesh is None:
+            return None
+        if isinstance(regions, (MeshElement, MeshElementArray, Region, Set)):
+            regions = [regions]
+        indices, labels = [], []
+        for region in regions:
+            if isinstance(region, MeshElement):
+                labels.append(region.label)
+                continue
+            elements = region if isinstance(region, MeshElementArray) else getattr(region, "elements", None)
+            if isinstance(elements, MeshElementArray) and elements._mesh is self._mesh:
+                indices.append(self._mesh.elementRange(elements._indices))
+            elif elements is not None:
+                labels.extend(element.label for element in elements)
+        if labels:
+            indices.append(self._mesh.elementsFromLabels(labels))
+        return np.unique(np.concatenate(indices)) if indices else np.zeros(0, dtype=np.int64)
 
     @abaqus_method_doc
     def Node(
@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .elementTopology import (
+    elementShape,
+    shapeCentroid,
+    shapeCorners,
+    shapeDimension,
+    shapeEdges,
+    shapeFaces,
+    shapeFamily,
+    shapeFunctionDerivatives,
+    shapeNaturalCoordinates,
+    shapeNodes,
+)
+from .MeshArrays import MeshArrays
+
+#: The quality criteria, mapped to whether larger values are worse.
+CRITERIA: dict[str, bool] = {
+    "ASPECT_RATIO": True,
+    "SHAPE_FACTOR": False,
+    "SMALL_ANGLE": False,
+    "LARGE_ANGLE": True,
+    "ANGULAR_DEVIATION": True,
+    "SHORTEST_EDGE": False,
+    "LONGEST_EDGE": True,
+    "JACOBIAN_RATIO": False,
+    "GEOM_DEVIATION_FACTOR": True,
+    "STABLE_TIME_INCREMENT": False,
+    "MAX_FREQUENCY": False,
+}
+
+#: The Jacobian ratio below which the analysis checks report an element as a warning.
+WARNING_JACOBIAN_RATIO = 0.1
+
+#: The number of elements evaluated at once by a worker.
+CHUNK_SIZE = 1 << 15
+
+# Measure of the parametric domain of each shape family, the length, area or volume of the natural element
+_domainMeasure = {"LINE": 2.0, "TRI": 0.5, "QUAD": 4.0, "TET": 1.0 / 6.0, "WEDGE": 1.0, "HEX": 8.0}
+# Factor of the measure divided by the largest facet giving the characteristic length, the height of the element
+_heightFactor = {"TRI": 2.0, "QUAD": 1.0, "TET": 3.0, "WEDGE": 2.0, "HEX": 1.0, "PYRAMID": 3.0}
+_idealAngle = {3: 60.0, 4: 90.0}
+
+
+class MeshQuality:
+    """The MeshQuality object evaluates quality metrics of the elements of a mesh stored as arrays.
+
+    The elements are grouped by basic shape and every metric is evaluated for chunks of elements of the same shape
+    at once, from an (m, k, 3) array of the coordinates of their nodes. The chunks are distributed over a thread
+    pool; the array operations release the global interpreter lock, so the workers share the mesh arrays without
+    copying them. Metrics that do not apply to an element, such as the shape factor of a hexahedron, are NaN.
+
+    The metrics follow the definitions of ``verifyMeshQuality``. The Jacobian ratio is the smallest determinant of
+    the Jacobian of the isoparametric map divided by the largest, sampled at the points between the centroid and
+    the corner nodes at the distance of the Gauss points; it is not positive for inverted elements. The geometric
+    deviation factor of an orphan mesh, which has no geometry, is the largest distance of a midside node from the
+    middle of its edge divided by the length of the edge. The stable time increment is the height of the element,
+    its measure divided by its largest face or edge, divided by the wave speed, and the maximum frequency is the
+    wave speed divided by pi times the height.
+    """
+
+    #: A MeshArrays object specifying the mesh.
+    mesh: MeshArrays
+
+    #: An (N, 3) float array specifying the node coordinates.
+    coordinates: np.ndarray
+
+    #: An Int specifying the number of worker threads.
+    numWorkers: int = 1
+
+    def __init__(self, mesh: MeshArrays, coordinates=None, numWorkers: int | None = None):
+        """This method creates a MeshQuality object.
+
+        Parameters
+        ----------
+        mesh
+            A MeshArrays object specifying the mesh.
+        coordinates
+            An (N, 3) array of Floats specifying the node coordinates, for example deformed coordinates. The
+            default is the coordinates of the mesh.
+        numWorkers
+            An Int specifying the number of worker threads. The default is the number of CPUs.
+        """
+        self.mesh = mesh
+        self.coordinates = mesh.coordinates if coordinates is None else np.asarray(coordinates, dtype=np.float64)
+        self.numWorkers = max(1, os.cpu_count() or 1) if numWorkers is None else max(1, numWorkers)
+
+    def metric(self, criterion: str, elements: np.ndarray | None = None, waveSpeed=None) -> np.ndarray:
+        """Evaluate a quality metric.
+
+        Parameters
+        ----------
+        criterion
+            A String specifying the metric, one of :data:`CRITERIA`.
+        elements
+            An array of Ints specifying the indices of the elements. The default is all elements.
+        waveSpeed
+            A Float or an array of Floats specifying the wave speed of the material of each element, required by
+            the STABLE_TIME_INCREMENT and MAX_FREQUENCY criteria.
+
+        Returns
+        -------
+        np.ndarray
+            The metric of each element, NaN where it does not apply.
+
+        Raises
+        ------
+        ValueError
+            If the criterion is not known.
+        """
+        criterion = str(criterion).upper()
+        if criterion not in CRITERIA:
+            raise ValueError(f"Unknown quality criterion {criterion}, expected one of {tuple(CRITERIA)}")
+        indices = np.asarray(self.mesh.elementRange(elements), dtype=np.int64)
+        values = np.full(len(indices), np.nan)
+        if waveSpeed is not None:
+            waveSpeed = np.broadcast_to(np.asarray(waveSpeed, dtype=np.float64), (len(indices),))
+        elif criterion in ("STABLE_TIME_INCREMENT", "MAX_FREQUENCY"):
+            return values
+        tasks = [(shape, indices, positions, criterion, waveSpeed) for shape, positions in self._chunks(indices)]
+        if self.numWorkers == 1 or len(tasks) < 2:
+            results = [self._evaluate(*task) for task in tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.numWorkers, len(tasks))) as executor:
+                results = list(executor.map(lambda task: self._evaluate(*task), tasks))
+        for (_, _, positions, _, _), result in zip(tasks, results):
+            values[positions] = result
+        return values
+
+    def verify(self, criterion: str, threshold: float | None = None, elements=None, waveSpeed=None) -> dict:
+        """Evaluate a quality metric and find the elements failing a threshold.
+
+        Parameters
+        ----------
+        criterion
+            A String specifying the metric, one of :data:`CRITERIA`.
+        threshold
+            A Float specifying the threshold. Elements with a value larger than the threshold fail, or smaller for
+            the criteria where smaller values are worse. If None, no elements fail.
+        elements
+            An array of Ints specifying the indices of the elements. The default is all elements.
+        waveSpeed
+            A Float or an array of Floats specifying the wave speed of the material of each element.
+
+        Returns
+        -------
+        dict
+            A Dictionary with the keys numElements (Int), average and worst (Floats, NaN if the metric applies to
+            no element), worstElement (Int index or None), naElements and failedElements (arrays of element
+            indices).
+        """
+        elements = np.asarray(self.mesh.elementRange(elements), dtype=np.int64)
+        values = self.metric(criterion, elements, waveSpeed)
+        applies = ~np.isnan(values)
+        larger = CRITERIA[str(criterion).upper()]
+        result = {"numElements": len(elements), "average": np.nan, "worst": np.nan, "worstElement": None,
+                  "naElements": elements[~applies], "failedElements": elements[:0]}  # fmt: skip
+        if applies.any():
+            valid = values[applies]
+            worst = int(np.argmax(valid) if larger else np.argmin(valid))
+            result.update(average=float(valid.mean()), worst=float(valid[worst]))
+            result["worstElement"] = int(elements[applies][worst])
+        if threshold is not None:
+            failed = values > threshold if larger else values < threshold
+            result["failedElements"] = elements[failed & applies]
+        return result
+
+    def analysisChecks(self, elements=None) -> dict:
+        """Find the inverted and the distorted elements.
+
+        Returns
+        -------
+        dict
+            A Dictionary with the keys numElements (Int), failedElements, the elements with a Jacobian ratio that is
+            not positive, and warningElements, the elements with a Jacobian ratio below
+            :data:`WARNING_JACOBIAN_RATIO` (arrays of element indices).
+        """
+        elements = np.asarray(self.mesh.elementRange(elements), dtype=np.int64)
+        ratio = self.metric("JACOBIAN_RATIO", elements)
+        return {
+            "numElements": len(elements),
+            "failedElements": elements[ratio <= 0.0],
+            "warningElements": elements[(ratio > 0.0) & (ratio < WARNING_JACOBIAN_RATIO)],
+        }
+
+    def statistics(self, elements=None) -> dict[str, int]:
+        """Count the elements of each shape family, such as HEX, and the nodes referenced by the elements.
+
+        Returns
+        -------
+        dict[str, int]
+            A Dictionary mapping the shape families and ``"NODES"`` to counts, elements of unknown types are counted
+            as ``"UNKNOWN"``.
+        """
+        elements = self.mesh.elementRange(elements)
+        counts = np.bincount(self.mesh.elementTypeCodes[elements], minlength=len(self.mesh.elementTypes))
+        statistics: dict[str, int] = {}
+        for elemType, count in zip(self.mesh.elementTypes, counts.tolist()):
+            shape = elementShape(elemType)
+            family = "UNKNOWN" if shape is None else shapeFamily[shape]
+            statistics[family] = statistics.get(family, 0) + count
+        statistics["NODES"] = len(self.mesh.elementNodes(None if len(elements) == self.mesh.numElements else elements))
+        return statistics
+
+    def select(self, family: str, elements=None) -> np.ndarray:
+        """Return the indices of the elements of a shape family, such as HEX, among **elements**."""
+        elements = np.asarray(self.mesh.elementRange(elements), dtype=np.int64)
+        codes = [code for code, elemType in enumerate(self.mesh.elementTypes)
+                 if shapeFamily.get(elementShape(elemType) or "") == family]  # fmt: skip
+        return elements[np.isin(self.mesh.elementTypeCodes[elements], codes)]
+
+    def _chunks(self, elements: np.ndarray):
+        """Yield the shapes and the positions in **elements** of chunks of elements of the same shape."""
+        codes = self.mesh.elementTypeCodes[elements]
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(self.mesh.elementTypes) + 1))
+        for code, elemType in enumerate(self.mesh.elementTypes):
+            shape = elementShape(elemType)
+            if shape is None or shape == "POINT1":
+                continue
+            positions = order[bounds[code] : bounds[code + 1]]
+            for first in range(0, len(positions), CHUNK_SIZE):
+                yield shape, positions[first : first + CHUNK_SIZE]
+
+    def _evaluate(self, shape: str, elements: np.ndarray, positions: np.ndarray, criterion: str, waveSpeed):
+        """Evaluate a metric for the chunk of elements of the same shape at **positions** in **elements**."""
+        connectivity = self.mesh.connectivity[elements[positions], : shapeNodes[shape]]
+        return _metric(shape, self.coordinates[connectivity], criterion,
+                       None if waveSpeed is None else waveSpeed[positions])  # fmt: skip
+
+
+def _metric(shape: str, nodes: np.ndarray, criterion: str, waveSpeed) -> np.ndarray:
+    """Evaluate a metric for the (m, k, 3) node coordinates of elements of the same shape."""
+    family = shapeFamily[shape]
+    nan = np.full(len(nodes), np.nan)
+    if criterion in ("ASPECT_RATIO", "SHORTEST_EDGE", "LONGEST_EDGE"):
+        lengths = _edgeLengths(shape, nodes)
+        if criterion == "SHORTEST_EDGE":
+            return lengths.min(axis=1)
+        if criterion == "LONGEST_EDGE":
+            return lengths.max(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return lengths.max(axis=1) / lengths.min(axis=1)
+    if criterion == "SHAPE_FACTOR":
+        return _shapeFactor(family, nodes) if family in ("TRI", "TET") else nan
+    if criterion in ("SMALL_ANGLE", "LARGE_ANGLE", "ANGULAR_DEVIATION"):
+        if shapeDimension[shape] < 2:
+            return nan
+        angles = _faceAngles(shape, nodes)
+        if criterion == "SMALL_ANGLE":
+            return np.min([values.min(axis=1) for values, _ in angles], axis=0)
+        if criterion == "LARGE_ANGLE":
+            return np.max([values.max(axis=1) for values, _ in angles], axis=0)
+        return np.max([np.abs(values - ideal).max(axis=1) for values, ideal in angles], axis=0)
+    if criterion == "JACOBIAN_RATIO":
+        determinants = _jacobianDeterminants(shape, nodes)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return determinants.min(axis=1) / np.abs(determinants).max(axis=1)
+    if criterion == "GEOM_DEVIATION_FACTOR":
+        edges = np.array([edge for edge in shapeEdges(shape) if edge[2] >= 0], dtype=np.int64).reshape(-1, 3)
+        if not len(edges):
+            return nan
+        chord = nodes[:, edges[:, 1]] - nodes[:, edges[:, 0]]
+        gap = nodes[:, edges[:, 2]] - 0.5 * (nodes[:, edges[:, 0]] + nodes[:, edges[:, 1]])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (np.linalg.norm(gap, axis=2) / np.linalg.norm(chord, axis=2)).max(axis=1)
+    height = _height(shape, nodes)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if criterion == "STABLE_TIME_INCREMENT":
+            return height / waveSpeed
+        return waveSpeed / (np.pi * height)
+
+
+def _edgeLengths(shape: str, nodes: np.ndarray) -> np.ndarray:
+    """Return the (m, e) lengths of the straight edges between the corner nodes."""
+    edges = np.array([edge[:2] for edge in shapeEdges(shape)], dtype=np.int64)
+    return np.linalg.norm(nodes[:, edges[:, 1]] - nodes[:, edges[:, 0]], axis=2)
+
+
+def _faceCorners(shape: str) -> dict[int, np.ndarray]:
+    """Return the corner nodes of the faces of a shape, grouped by the number of corners."""
+    groups: dict[int, list] = {}
+    for face in shapeFaces(shape):
+        corners = face if len(face) <= 4 else face[: len(face) // 2]
+        groups.setdefault(len(corners), []).append(corners)
+    return {count: np.array(faces, dtype=np.int64) for count, faces in groups.items()}
+
+
+def _faceAngles(shape: str, nodes: np.ndarray) -> list[tuple[np.ndarray, float]]:
+    """Return the (m, n) corner angles in degrees of the faces with the same number of corners, with the ideal
+    angle of the faces."""
+    angles = []
+    for count, faces in _faceCorners(shape).items():
+        corners = nodes[:, faces]
+        following = np.roll(corners, -1, axis=2) - corners
+        preceding = np.roll(corners, 1, axis=2) - corners
+        cosine = np.einsum("mfcx,mfcx->mfc", following, preceding)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cosine /= np.linalg.norm(following, axis=3) * np.linalg.norm(preceding, axis=3)
+        angles.append((np.degrees(np.arccos(np.clip(cosine, -1.0, 1.0))).reshape(len(nodes), -1), _idealAngle[count]))
+    return angles
+
+
+def _faceAreas(shape: str, nodes: np.ndarray) -> np.ndarray:
+    """Return the (m, f) areas of the faces of a solid shape, from the cross product of the edges of triangles and
+    of the diagonals of quadrilaterals."""
+    areas = []
+    for count, faces in _faceCorners(shape).items():
+        corners = nodes[:, faces]
+        if count == 3:
+            vector = _cross(corners[:, :, 1] - corners[:, :, 0], corners[:, :, 2] - corners[:, :, 0])
+        else:
+            vector = _cross(corners[:, :, 2] - corners[:, :, 0], corners[:, :, 3] - corners[:, :, 1])
+        areas.append(0.5 * np.linalg.norm(vector, axis=2))
+    return np.concatenate(areas, axis=1)
+
+
+def _cross(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Return the cross products of the vectors along the last axis, faster than ``np.cross`` for many vectors."""
+    result = np.empty(np.broadcast_shapes(first.shape, second.shape))
+    result[..., 0] = first[..., 1] * second[..., 2] - first[..., 2] * second[..., 1]
+    result[..., 1] = first[..., 2] * second[..., 0] - first[..., 0] * second[..., 2]
+    result[..., 2] = first[..., 0] * second[..., 1] - first[..., 1] * second[..., 0]
+    return result
+
+
+def _shapeFactor(family: str, nodes: np.ndarray) -> np.ndarray:
+    """Return the area or volume of triangles or tetrahedra divided by the area or volume of the equilateral
+    element with the same circumradius."""
+    first, second, third = nodes[:, 1] - nodes[:, 0], nodes[:, 2] - nodes[:, 0], None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if family == "TRI":
+            area = 0.5 * np.linalg.norm(_cross(first, second), axis=1)
+            product = np.linalg.norm(first, axis=1) * np.linalg.norm(second, axis=1)
+            product *= np.linalg.norm(nodes[:, 2] - nodes[:, 1], axis=1)
+            radius = product / (4.0 * area)
+            return area / (3.0 * np.sqrt(3.0) / 4.0 * radius**2)
+        third = nodes[:, 3] - nodes[:, 0]
+        volume = np.abs(np.einsum("mx,mx->m", first, _cross(second, third))) / 6.0
+        squared = [np.einsum("mx,mx->m", vector, vector)[:, None] for vector in (first, second, third)]
+        numerator = (squared[0] * _cross(second, third) + squared[1] * _cross(third, first)
+                     + squared[2] * _cross(first, second))  # fmt: skip
+        radius = np.linalg.norm(numerator, axis=1) / (12.0 * volume)
+        return volume / (8.0 * np.sqrt(3.0) / 27.0 * radius**3)
+
+
+def _samplePoints(shape: str) -> np.ndarray:
+    """Return the natural coordinates of the points between the centroid and the corner nodes of a shape, at the
+    distance of the Gauss points."""
+    natural = np.array(shapeNaturalCoordinates[shape], dtype=np.float64).reshape(shapeNodes[shape], -1)
+    centroid = shapeCentroid(shape)
+    return centroid + (natural[list(shapeCorners[shape])] - centroid) / np.sqrt(3.0)
+
+
+def _jacobianDeterminants(shape: str, nodes: np.ndarray) -> np.ndarray:
+    """Return the (m, p) determinants of the Jacobian of the isoparametric map at the sample points.
+
+    The determinant of two-dimensional elements is signed by the normal of the element at its centroid, and the
+    determinant of line elements is the length of the tangent. The determinant of pyramids is divided by the
+    determinant of the collapsed hexahedron mapping the ideal pyramid, which vanishes at the apex.
+    """
+    dimension = shapeDimension[shape]
+    samples = _samplePoints(shape)
+    jacobian = _jacobians(shape, samples, nodes)
+    if dimension == 1:
+        return np.linalg.norm(jacobian[:, 0], axis=2).T
+    if dimension == 2:
+        normals = _cross(jacobian[:, 0], jacobian[:, 1])
+        center = _jacobians(shape, shapeCentroid(shape), nodes)[0]
+        reference = _cross(center[0], center[1])
+        length = np.linalg.norm(reference, axis=1, keepdims=True)
+        reference = np.divide(reference, length, out=np.zeros_like(reference), where=length > 0)
+        return np.einsum("pmx,mx->mp", normals, reference)
+    first, second, third = jacobian[:, 0], jacobian[:, 1], jacobian[:, 2]
+    determinants = np.einsum("pmx,pmx->mp", first, _cross(second, third))
+    if shape == "PYRAMID5":
+        determinants /= ((1.0 - samples[:, 2]) / 2.0) ** 2
+    return determinants
+
+
+def _jacobians(shape: str, samples: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """Return the (p, d, m, 3) Jacobians of the isoparametric map at the natural coordinates **samples**, computed
+    as a single matrix product."""
+    derivatives = shapeFunctionDerivatives(shape, samples)
+    count, nodeCount, dimension = derivatives.shape
+    product = derivatives.transpose(0, 2, 1).reshape(-1, nodeCount) @ nodes.transpose(1, 0, 2).reshape(nodeCount, -1)
+    return product.reshape(count, dimension, len(nodes), 3)
+
+
+def _height(shape: str, nodes: np.ndarray) -> np.ndarray:
+    """Return the characteristic length of elements: the length of line elements, otherwise the measure of the
+    element divided by its largest face, or edge for two-dimensional elements, times a factor giving the height of
+    regular elements."""
+    family = shapeFamily[shape]
+    if family == "PYRAMID":
+        # The determinants of pyramids are normalized, split the pyramid into two tetrahedra instead
+        base = nodes[:, [0, 1, 2, 3]] - nodes[:, 4:5]
+        measure = np.abs(np.einsum("mx,mx->m", base[:, 0], _cross(base[:, 1], base[:, 2])))
+        measure += np.abs(np.einsum("mx,mx->m", base[:, 0], _cross(base[:, 2], base[:, 3])))
+        measure /= 6.0
+    else:
+        measure = _domainMeasure[family] * np.abs(_jacobianDeterminants(shape, nodes)).mean(axis=1)
+    if family == "LINE":
+        return measure
+    facets = _edgeLengths(shape, nodes) if shapeDimension[shape] == 2 else _faceAreas(shape, nodes)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _heightFactor[family] * measure / facets.max(axis=1)
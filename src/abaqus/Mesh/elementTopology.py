@@ -0,0 +1,388 @@
+"""Element topology tables used by the array based mesh storage.
+
+Abaqus element codes are mapped onto one of the basic element shapes (``LINE2``, ``TRI3``, ``HEX8``, ...), the
+same shapes accepted by :meth:`~abaqus.Mesh.MeshElement.MeshElement.Element`. The tables in this module are keyed
+by shape so that any vectorised mesh operation only has to deal with a handful of topologies. The isoparametric
+shape functions of each shape are evaluated for arrays of natural coordinates at once, and the integration points
+of the Abaqus integration rules of each shape are tabulated in natural coordinates.
+"""
+
+from __future__ import annotations
+
+import re
+
+import numpy as np
+
+#: Number of nodes of each basic element shape.
+shapeNodes: dict[str, int] = {
+    "POINT1": 1,
+    "LINE2": 2,
+    "LINE3": 3,
+    "TRI3": 3,
+    "TRI6": 6,
+    "QUAD4": 4,
+    "QUAD8": 8,
+    "TET4": 4,
+    "TET10": 10,
+    "PYRAMID5": 5,
+    "WEDGE6": 6,
+    "WEDGE15": 15,
+    "HEX8": 8,
+    "HEX20": 20,
+}
+
+#: Topological dimension of each basic element shape.
+shapeDimension: dict[str, int] = {
+    "POINT1": 0,
+    "LINE2": 1,
+    "LINE3": 1,
+    "TRI3": 2,
+    "TRI6": 2,
+    "QUAD4": 2,
+    "QUAD8": 2,
+    "TET4": 3,
+    "TET10": 3,
+    "PYRAMID5": 3,
+    "WEDGE6": 3,
+    "WEDGE15": 3,
+    "HEX8": 3,
+    "HEX20": 3,
+}
+
+#: Corner nodes of each basic element shape. They are the first nodes of every shape except LINE3, whose midside
+#: node is its second node.
+shapeCorners: dict[str, tuple] = {
+    "POINT1": (0,),
+    "LINE2": (0, 1),
+    "LINE3": (0, 2),
+    "TRI3": (0, 1, 2),
+    "TRI6": (0, 1, 2),
+    "QUAD4": (0, 1, 2, 3),
+    "QUAD8": (0, 1, 2, 3),
+    "TET4": (0, 1, 2, 3),
+    "TET10": (0, 1, 2, 3),
+    "PYRAMID5": (0, 1, 2, 3, 4),
+    "WEDGE6": (0, 1, 2, 3, 4, 5),
+    "WEDGE15": (0, 1, 2, 3, 4, 5),
+    "HEX8": (0, 1, 2, 3, 4, 5, 6, 7),
+    "HEX20": (0, 1, 2, 3, 4, 5, 6, 7),
+}
+
+#: Family of each basic element shape, as accepted by the **elemShape** argument of ``verifyMeshQuality``.
+shapeFamily: dict[str, str] = {shape: shape.rstrip("0123456789") for shape in shapeNodes}
+
+_solidShapes = {4: "TET4", 5: "PYRAMID5", 6: "WEDGE6", 8: "HEX8", 10: "TET10", 15: "WEDGE15", 20: "HEX20"}
+_surfaceShapes = {3: "TRI3", 4: "QUAD4", 6: "TRI6", 8: "QUAD8"}
+_lineShapes = {2: "LINE2", 3: "LINE3"}
+
+# Families of element codes, the first group of the pattern is the number of nodes
+_families = (
+    (re.compile(r"^(?:C|DC|AC|EC|Q|COH|GK)3D(\d+)"), _solidShapes),
+    (re.compile(r"^SC(\d+)"), _solidShapes),
+    (
+        re.compile(r"^(?:CPE|CPS|CPEG|CAX|CGAX|DC2D|DCAX|AC2D|ACAX|M3D|R3D|SFM3D|F3D|DS|S|COH2D|COHAX)(\d+)"),
+        _surfaceShapes,
+    ),
+    (re.compile(r"^STRI(\d)"), _surfaceShapes),
+    (re.compile(r"^(?:T2D|T3D|DC1D|R2D|RAX|SFM2D|M2D|F2D)(\d)"), _lineShapes),
+)
+# Families where the digit is the interpolation order instead of the number of nodes: B31, PIPE32, SAX1, MAX2, ...
+_ordered = re.compile(r"^(?:(?:B|PIPE|ELBOW)\d|SAX|DSAX|MAX|MGAX|SFMAX|FAX)(\d)")
+_cache: dict[str, "str | None"] = {}
+
+
+def elementShape(elemType: str) -> str | None:
+    """Return the basic shape of an Abaqus element code.
+
+    Parameters
+    ----------
+    elemType
+        A String specifying the Abaqus element code, such as ``C3D8R`` or ``S4R``. A shape name such as ``HEX8``
+        is returned unchanged.
+
+    Returns
+    -------
+    str | None
+        The name of the basic element shape, or None if the element code is not recognised.
+    """
+    elemType = str(elemType).upper()
+    if elemType in _cache:
+        return _cache[elemType]
+    shape = elemType if elemType in shapeNodes else None
+    match = None if shape else _ordered.match(elemType)
+    if match:
+        # B31 and B33 are two-node beams, B32 is a three-node beam
+        shape = "LINE3" if match.group(1) == "2" else "LINE2"
+    for pattern, shapes in () if shape else _families:
+        match = pattern.match(elemType)
+        if match:
+            shape = shapes.get(int(match.group(1)))
+            break
+    if shape is None and elemType in ("MASS", "ROTARYI", "SPRING1", "DASHPOT1", "HEATCAP"):
+        shape = "POINT1"
+    _cache[elemType] = shape
+    return shape
+
+
+def elementNodeCount(elemType: str) -> int | None:
+    """Return the number of nodes of an Abaqus element code, or None if the element code is not recognised."""
+    shape = elementShape(elemType)
+    return None if shape is None else shapeNodes[shape]
+
+
+#: Natural coordinates of the nodes of each basic element shape. Lines, quadrilaterals and hexahedra span
+#: [-1, 1] in each direction, triangles and tetrahedra use area and volume coordinates, wedges combine a triangle
+#: with [-1, 1] through the thickness and pyramids are collapsed hexahedra.
+shapeNaturalCoordinates: dict[str, tuple] = {
+    "POINT1": ((),),
+    "LINE2": ((-1.0,), (1.0,)),
+    "LINE3": ((-1.0,), (0.0,), (1.0,)),
+    "TRI3": ((0.0, 0.0), (1.0, 0.0), (0.0, 1.0)),
+    "TRI6": ((0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (0.5, 0.0), (0.5, 0.5), (0.0, 0.5)),
+    "QUAD4": ((-1.0, -1.0), (1.0, -1.0), (1.0, 1.0), (-1.0, 1.0)),
+    "QUAD8": ((-1.0, -1.0), (1.0, -1.0), (1.0, 1.0), (-1.0, 1.0),
+              (0.0, -1.0), (1.0, 0.0), (0.0, 1.0), (-1.0, 0.0)),
+    "TET4": ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)),
+    "TET10": ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0), (0.5, 0.0, 0.0),
+              (0.5, 0.5, 0.0), (0.0, 0.5, 0.0), (0.0, 0.0, 0.5), (0.5, 0.0, 0.5), (0.0, 0.5, 0.5)),
+    "PYRAMID5": ((-1.0, -1.0, -1.0), (1.0, -1.0, -1.0), (1.0, 1.0, -1.0), (-1.0, 1.0, -1.0), (0.0, 0.0, 1.0)),
+    "WEDGE6": ((0.0, 0.0, -1.0), (1.0, 0.0, -1.0), (0.0, 1.0, -1.0),
+               (0.0, 0.0, 1.0), (1.0, 0.0, 1.0), (0.0, 1.0, 1.0)),
+    "WEDGE15": ((0.0, 0.0, -1.0), (1.0, 0.0, -1.0), (0.0, 1.0, -1.0),
+                (0.0, 0.0, 1.0), (1.0, 0.0, 1.0), (0.0, 1.0, 1.0),
+                (0.5, 0.0, -1.0), (0.5, 0.5, -1.0), (0.0, 0.5, -1.0),
+                (0.5, 0.0, 1.0), (0.5, 0.5, 1.0), (0.0, 0.5, 1.0),
+                (0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)),
+    "HEX8": ((-1.0, -1.0, -1.0), (1.0, -1.0, -1.0), (1.0, 1.0, -1.0), (-1.0, 1.0, -1.0),
+             (-1.0, -1.0, 1.0), (1.0, -1.0, 1.0), (1.0, 1.0, 1.0), (-1.0, 1.0, 1.0)),
+    "HEX20": ((-1.0, -1.0, -1.0), (1.0, -1.0, -1.0), (1.0, 1.0, -1.0), (-1.0, 1.0, -1.0),
+              (-1.0, -1.0, 1.0), (1.0, -1.0, 1.0), (1.0, 1.0, 1.0), (-1.0, 1.0, 1.0),
+              (0.0, -1.0, -1.0), (1.0, 0.0, -1.0), (0.0, 1.0, -1.0), (-1.0, 0.0, -1.0),
+              (0.0, -1.0, 1.0), (1.0, 0.0, 1.0), (0.0, 1.0, 1.0), (-1.0, 0.0, 1.0),
+              (-1.0, -1.0, 0.0), (1.0, -1.0, 0.0), (1.0, 1.0, 0.0), (-1.0, 1.0, 0.0)),
+}  # fmt: skip
+
+# Exponents of the monomials spanning the interpolation space of each shape, the shape functions are the
+# combinations of these monomials that interpolate the nodes
+_hexSerendipity = ((0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1), (1, 1, 0), (0, 1, 1), (1, 0, 1), (1, 1, 1),
+                   (2, 0, 0), (0, 2, 0), (0, 0, 2), (2, 1, 0), (2, 0, 1), (1, 2, 0), (0, 2, 1), (1, 0, 2),
+                   (0, 1, 2), (2, 1, 1), (1, 2, 1), (1, 1, 2))  # fmt: skip
+_wedgeQuadratic = ((0, 0, 0), (1, 0, 0), (0, 1, 0), (2, 0, 0), (1, 1, 0), (0, 2, 0),
+                   (0, 0, 1), (1, 0, 1), (0, 1, 1), (2, 0, 1), (1, 1, 1), (0, 2, 1),
+                   (0, 0, 2), (1, 0, 2), (0, 1, 2))  # fmt: skip
+_monomials: dict[str, tuple] = {
+    "POINT1": ((),),
+    "LINE2": ((0,), (1,)),
+    "LINE3": ((0,), (1,), (2,)),
+    "TRI3": ((0, 0), (1, 0), (0, 1)),
+    "TRI6": ((0, 0), (1, 0), (0, 1), (2, 0), (1, 1), (0, 2)),
+    "QUAD4": ((0, 0), (1, 0), (0, 1), (1, 1)),
+    "QUAD8": ((0, 0), (1, 0), (0, 1), (1, 1), (2, 0), (0, 2), (2, 1), (1, 2)),
+    "TET4": ((0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)),
+    "TET10": ((0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1), (2, 0, 0), (0, 2, 0), (0, 0, 2), (1, 1, 0),
+              (0, 1, 1), (1, 0, 1)),
+    "WEDGE6": ((0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1), (1, 0, 1), (0, 1, 1)),
+    "WEDGE15": _wedgeQuadratic,
+    "HEX8": _hexSerendipity[:8],
+    "HEX20": _hexSerendipity,
+}  # fmt: skip
+_simplexShapes = {"TRI3", "TRI6", "TET4", "TET10"}
+_coefficients: dict[str, tuple] = {}
+
+
+def _interpolation(shape: str) -> tuple:
+    """Return the monomial exponents and the coefficients of the shape functions of a shape."""
+    if shape not in _coefficients:
+        exponents = np.array(_monomials[shape], dtype=np.int64).reshape(len(_monomials[shape]), -1)
+        nodes = np.array(shapeNaturalCoordinates[shape], dtype=np.float64).reshape(len(exponents), -1)
+        vandermonde = np.prod(nodes[:, None, :] ** exponents[None, :, :], axis=2)
+        _coefficients[shape] = (exponents, np.linalg.inv(vandermonde))
+    return _coefficients[shape]
+
+
+def shapeFunctions(shape: str, xi) -> np.ndarray:
+    """Evaluate the shape functions of a basic element shape.
+
+    Parameters
+    ----------
+    shape
+        A String specifying the basic element shape, such as ``HEX8``.
+    xi
+        A (P, d) array of Floats specifying natural coordinates, where d is the dimension of the shape.
+
+    Returns
+    -------
+    np.ndarray
+        A (P, k) array with the value of the shape function of each of the k nodes at each point.
+    """
+    xi = np.asarray(xi, dtype=np.float64).reshape(-1, shapeDimension[shape])
+    if shape == "PYRAMID5":
+        # Collapsed hexahedron, the four top nodes merge into the apex
+        values = shapeFunctions("HEX8", xi)
+        return np.column_stack([values[:, :4], values[:, 4:].sum(axis=1)])
+    exponents, coefficients = _interpolation(shape)
+    return _powers(xi, exponents) @ coefficients
+
+
+def shapeFunctionDerivatives(shape: str, xi) -> np.ndarray:
+    """Evaluate the derivatives of the shape functions of a basic element shape.
+
+    Parameters
+    ----------
+    shape
+        A String specifying the basic element shape, such as ``HEX8``.
+    xi
+        A (P, d) array of Floats specifying natural coordinates, where d is the dimension of the shape.
+
+    Returns
+    -------
+    np.ndarray
+        A (P, k, d) array with the derivative of the shape function of each node with respect to each natural
+        coordinate.
+    """
+    dimension = shapeDimension[shape]
+    xi = np.asarray(xi, dtype=np.float64).reshape(-1, dimension)
+    if shape == "PYRAMID5":
+        derivatives = shapeFunctionDerivatives("HEX8", xi)
+        return np.concatenate([derivatives[:, :4], derivatives[:, 4:].sum(axis=1, keepdims=True)], axis=1)
+    exponents, coefficients = _interpolation(shape)
+    result = np.empty((len(xi), len(exponents), dimension))
+    for axis in range(dimension):
+        lowered = exponents.copy()
+        lowered[:, axis] = np.maximum(lowered[:, axis] - 1, 0)
+        result[:, :, axis] = (exponents[:, axis] * _powers(xi, lowered)) @ coefficients
+    return result
+
+
+def shapeCentroid(shape: str) -> np.ndarray:
+    """Return the natural coordinates of the centroid of a basic element shape."""
+    if shape == "PYRAMID5":
+        return np.zeros(3)
+    nodes = np.array(shapeNaturalCoordinates[shape], dtype=np.float64).reshape(shapeNodes[shape], -1)
+    return nodes[: {"TRI6": 3, "TET10": 4, "WEDGE15": 6}.get(shape, len(nodes))].mean(axis=0)
+
+
+def clampNatural(shape: str, xi: np.ndarray) -> np.ndarray:
+    """Return the natural coordinates moved onto the closest point of the parametric domain of a shape."""
+    xi = np.clip(xi, -1.0, 1.0)
+    if shape in _simplexShapes or shape.startswith("WEDGE"):
+        planar = np.maximum(xi[:, :2] if shape.startswith("WEDGE") else xi, 0.0)
+        total = planar.sum(axis=1, keepdims=True)
+        planar = np.where(total > 1.0, planar / np.maximum(total, 1e-300), planar)
+        xi = np.column_stack([planar, xi[:, 2:]]) if shape.startswith("WEDGE") else planar
+    return xi
+
+
+def _powers(xi: np.ndarray, exponents: np.ndarray) -> np.ndarray:
+    """Evaluate the monomials given by **exponents** at the points **xi**."""
+    table = np.ones((len(xi), exponents.shape[1], int(exponents.max(initial=0)) + 1))
+    for degree in range(1, table.shape[2]):
+        table[:, :, degree] = table[:, :, degree - 1] * xi
+    result = np.ones((len(xi), len(exponents)))
+    for axis in range(exponents.shape[1]):
+        result *= table[:, axis, exponents[:, axis]]
+    return result
+
+
+# Corner nodes of the faces of the solid shapes, in the order of the Abaqus face identifiers S1, S2, ..., ordered
+# so that the right-hand rule gives the outward normal
+_cornerFaces: dict[str, tuple] = {
+    "TET4": ((0, 2, 1), (0, 1, 3), (1, 2, 3), (2, 0, 3)),
+    "PYRAMID5": ((0, 3, 2, 1), (0, 1, 4), (1, 2, 4), (2, 3, 4), (3, 0, 4)),
+    "WEDGE6": ((0, 2, 1), (3, 4, 5), (0, 1, 4, 3), (1, 2, 5, 4), (2, 0, 3, 5)),
+    "HEX8": ((0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)),
+}
+# Midside node of each edge of the quadratic shapes, keyed by the sorted corner nodes of the edge
+_midsideNodes: dict[str, dict] = {
+    "LINE3": {(0, 2): 1},
+    "TRI6": {(0, 1): 3, (1, 2): 4, (0, 2): 5},
+    "QUAD8": {(0, 1): 4, (1, 2): 5, (2, 3): 6, (0, 3): 7},
+    "TET10": {(0, 1): 4, (1, 2): 5, (0, 2): 6, (0, 3): 7, (1, 3): 8, (2, 3): 9},
+    "WEDGE15": {(0, 1): 6, (1, 2): 7, (0, 2): 8, (3, 4): 9, (4, 5): 10, (3, 5): 11, (0, 3): 12, (1, 4): 13,
+                (2, 5): 14},
+    "HEX20": {(0, 1): 8, (1, 2): 9, (2, 3): 10, (0, 3): 11, (4, 5): 12, (5, 6): 13, (6, 7): 14, (4, 7): 15,
+              (0, 4): 16, (1, 5): 17, (2, 6): 18, (3, 7): 19},
+}  # fmt: skip
+_linearShapes = {"LINE3": "LINE2", "TRI6": "TRI3", "QUAD8": "QUAD4", "TET10": "TET4", "WEDGE15": "WEDGE6",
+                 "HEX20": "HEX8"}  # fmt: skip
+
+
+def shapeFaces(shape: str) -> tuple:
+    """Return the faces of a solid shape, or the shape itself for a two-dimensional shape.
+
+    Each face is a tuple of node indices of the element, the corner nodes ordered so that the right-hand rule gives
+    the outward normal followed by the midside nodes of the edges between consecutive corner nodes. The faces of a
+    solid shape are ordered by their Abaqus face identifiers S1, S2, ....
+    """
+    dimension = shapeDimension[shape]
+    if dimension < 2:
+        return ()
+    corners = _cornerFaces.get(_linearShapes.get(shape, shape), ()) if dimension == 3 else (shapeCorners[shape],)
+    midside = _midsideNodes.get(shape)
+    if midside is None:
+        return corners
+    return tuple(
+        face + tuple(midside[tuple(sorted((face[index], face[(index + 1) % len(face)])))] for index in range(len(face)))
+        for face in corners
+    )
+
+
+def shapeEdges(shape: str) -> tuple:
+    """Return the edges of a shape as (first corner, second corner, midside node) tuples of node indices of the
+    element, the midside node is -1 for linear shapes."""
+    dimension = shapeDimension[shape]
+    if dimension == 0:
+        return ()
+    if dimension == 1:
+        pairs = [shapeCorners[shape]]
+    else:
+        pairs = []
+        for face in shapeFaces(_linearShapes.get(shape, shape)):
+            for index in range(len(face)):
+                pair = tuple(sorted((face[index], face[(index + 1) % len(face)])))
+                if pair not in pairs:
+                    pairs.append(pair)
+    midside = _midsideNodes.get(shape, {})
+    return tuple((first, second, midside.get((first, second), -1)) for first, second in pairs)
+
+
+_gauss = {1: (0.0,), 2: (-1.0 / np.sqrt(3.0), 1.0 / np.sqrt(3.0)), 3: (-np.sqrt(0.6), 0.0, np.sqrt(0.6))}
+_tetPoints = (0.1381966011250105, 0.5854101966249685)
+# Integration points of the simplex rules, in the Abaqus order
+_simplexPoints: dict[tuple, tuple] = {
+    ("TRI", 1): ((1.0 / 3.0, 1.0 / 3.0),),
+    ("TRI", 3): ((1.0 / 6.0, 1.0 / 6.0), (2.0 / 3.0, 1.0 / 6.0), (1.0 / 6.0, 2.0 / 3.0)),
+    ("TET", 1): ((0.25, 0.25, 0.25),),
+    ("TET", 4): ((_tetPoints[0],) * 3, (_tetPoints[1],) + (_tetPoints[0],) * 2,
+                 (_tetPoints[0], _tetPoints[1], _tetPoints[0]), (_tetPoints[0],) * 2 + (_tetPoints[1],)),
+}  # fmt: skip
+
+
+def shapeIntegrationPoints(shape: str, count: int) -> np.ndarray | None:
+    """Return the natural coordinates of the integration points of the Abaqus rule with **count** points of a
+    basic element shape, in the order of the integration point numbers.
+
+    Lines, quadrilaterals and hexahedra use Gauss rules with the first coordinate varying fastest, wedges combine
+    a triangle rule with a Gauss rule through the thickness. A single point is the centroid of any shape.
+
+    Returns
+    -------
+    np.ndarray | None
+        A (count, d) array of Floats, or None if the shape has no rule with **count** points.
+    """
+    family, dimension = shapeFamily[shape], shapeDimension[shape]
+    if count == 1:
+        return shapeCentroid(shape).reshape(1, dimension)
+    if (family, count) in _simplexPoints:
+        return np.array(_simplexPoints[family, count])
+    order = round(count ** (1.0 / dimension)) if dimension else 0
+    if family in ("LINE", "QUAD", "HEX") and order in (2, 3) and order**dimension == count:
+        grid = np.meshgrid(*[_gauss[order]] * dimension, indexing="ij")
+        return np.column_stack([axis.ravel() for axis in reversed(grid)])
+    if family == "WEDGE":
+        for planar in (1, 3):
+            if count % planar == 0 and count // planar in (2, 3):
+                triangle = np.array(_simplexPoints["TRI", planar])
+                thickness = np.repeat(_gauss[count // planar], planar)
+                return np.column_stack([np.tile(triangle, (count // planar, 1)), thickness])
+    return None
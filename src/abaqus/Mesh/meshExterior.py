@@ -0,0 +1,199 @@
+"""Exterior faces and edges of the array based mesh storage.
+
+Every face of every element is generated from the topology tables of :mod:`.elementTopology` as its sorted corner
+node indices, which identify the face independently of the element and of the side it is seen from. The faces with
+the same number of corners are packed into one integer each, or hashed when the node indices do not fit, and
+sorted once; the faces occurring exactly once are on the exterior. The faces of two-dimensional elements are their
+edges, numbered like the face identifiers of planar elements.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .elementTopology import elementShape, shapeDimension, shapeEdges, shapeFaces
+from .MeshArrays import MeshArrays
+
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+_HASH_MIXER = np.uint64(0xBF58476D1CE4E5B9)
+_cache: dict[str, tuple] = {}
+
+
+def faceTable(shape: str) -> tuple:
+    """Return the faces of a shape as (corner nodes, edge numbers) tuples, in the order of the face identifiers.
+
+    The corner nodes are node indices of the element and the edge numbers index :func:`.shapeEdges`. The faces of a
+    two-dimensional shape are its edges, a line has no faces.
+    """
+    table = _cache.get(shape)
+    if table is None:
+        edges = [tuple(sorted(edge[:2])) for edge in shapeEdges(shape)]
+        if shapeDimension[shape] == 2:
+            table = tuple(((first, second), (number,)) for number, (first, second) in enumerate(edges))
+        elif shapeDimension[shape] == 3:
+            faces = [face[: len(face) // 2] if len(face) > 4 else face for face in shapeFaces(shape)]
+            table = tuple(
+                (corners, tuple(edges.index(tuple(sorted(pair))) for pair in zip(corners, corners[1:] + corners[:1])))
+                for corners in faces
+            )
+        else:
+            table = ()
+        _cache[shape] = table
+    return table
+
+
+def exteriorFaces(mesh: MeshArrays, elements: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Find the faces referenced by exactly one of the elements.
+
+    Parameters
+    ----------
+    mesh
+        A MeshArrays object specifying the mesh.
+    elements
+        An array of Ints specifying the indices of the elements. The default is all elements.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The element indices and the zero-based face numbers of the exterior faces, sorted by element and face.
+    """
+    elements = np.asarray(mesh.elementRange(elements), dtype=np.int64)
+    owners, sides = _faces(mesh, elements)
+    return _sorted(owners, sides)
+
+
+def exteriorEdges(mesh: MeshArrays, elements: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Find the edges referenced by exactly one of the faces of the elements.
+
+    The faces of two-dimensional elements are the elements themselves, the edges returned are the free edges of
+    the elements. The faces of solid elements are their exterior faces, the edges returned are the edges on the
+    boundary of the exterior faces, which is empty for a closed body.
+
+    Parameters
+    ----------
+    mesh
+        A MeshArrays object specifying the mesh.
+    elements
+        An array of Ints specifying the indices of the elements. The default is all elements.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The element indices and the zero-based edge numbers of the exterior edges, numbered like
+        :func:`.shapeEdges`, sorted by element and edge.
+    """
+    elements = np.asarray(mesh.elementRange(elements), dtype=np.int64)
+    owners: list[np.ndarray] = []
+    numbers: list[np.ndarray] = []
+    keys: list[np.ndarray] = []
+    exteriorOwners, exteriorSides = _faces(mesh, elements, solids=True)
+    exteriorCodes = mesh.elementTypeCodes[exteriorOwners]
+    for shape, group in _shapeGroups(mesh, elements):
+        if shapeDimension[shape] == 2:
+            candidates, edges = group, np.arange(len(faceTable(shape)))
+            candidates, edges = np.repeat(candidates, len(edges)), np.tile(edges, len(candidates))
+        elif shapeDimension[shape] == 3:
+            codes = [code for code, elemType in enumerate(mesh.elementTypes) if elementShape(elemType) == shape]
+            selected = np.isin(exteriorCodes, codes)
+            candidates, sides = exteriorOwners[selected], exteriorSides[selected]
+            faceEdges = [edgeNumbers for _, edgeNumbers in faceTable(shape)]
+            width = max(len(edgeNumbers) for edgeNumbers in faceEdges)
+            table = np.array([edgeNumbers + (-1,) * (width - len(edgeNumbers)) for edgeNumbers in faceEdges])
+            edges = table[sides]
+            candidates, edges = np.repeat(candidates, width), edges.ravel()
+            candidates, edges = candidates[edges >= 0], edges[edges >= 0]
+        else:
+            continue
+        pairs = np.array([edge[:2] for edge in shapeEdges(shape)], dtype=np.int64)[edges]
+        owners.append(candidates)
+        numbers.append(edges)
+        keys.append(np.sort(mesh.connectivity[candidates[:, None], pairs], axis=1))
+    if not owners:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    single = singles(np.concatenate(keys))
+    return _sorted(np.concatenate(owners)[single], np.concatenate(numbers)[single])
+
+
+def singles(keys: np.ndarray) -> np.ndarray:
+    """Return a mask of the rows of an (n, w) array of non-negative Ints that occur exactly once.
+
+    The rows are packed into one Int each when they fit, otherwise they are hashed and the rows with equal hashes
+    are compared; the rows are sorted by a full lexicographic sort only if two different rows have the same hash.
+    """
+    count, width = keys.shape
+    if count < 2:
+        return np.ones(count, dtype=bool)
+    bits = max(int(keys.max()).bit_length(), 1)
+    exact = bits * width <= 63
+    if exact:
+        hashes = keys[:, 0].astype(np.int64)
+        for column in range(1, width):
+            hashes = (hashes << bits) | keys[:, column]
+    else:
+        hashes = keys[:, 0].astype(np.uint64)
+        for column in range(1, width):
+            hashes = (hashes * _HASH_MULTIPLIER) ^ keys[:, column].astype(np.uint64)
+        hashes ^= hashes >> np.uint64(31)
+        hashes *= _HASH_MIXER
+    order = np.argsort(hashes)
+    ordered = hashes[order]
+    same = ordered[1:] == ordered[:-1]
+    if not exact:
+        rows = keys[order]
+        equal = (rows[1:] == rows[:-1]).all(axis=1)
+        if (same & ~equal).any():
+            order = np.lexsort(keys.T[::-1])
+            rows = keys[order]
+            equal = (rows[1:] == rows[:-1]).all(axis=1)
+        same = equal
+    single = np.ones(count, dtype=bool)
+    single[1:] &= ~same
+    single[:-1] &= ~same
+    mask = np.empty(count, dtype=bool)
+    mask[order] = single
+    return mask
+
+
+def _faces(mesh: MeshArrays, elements: np.ndarray, solids: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """Return the element indices and the face numbers of the exterior faces, of solid elements only if **solids**
+    is True."""
+    owners: dict[int, list[np.ndarray]] = {}
+    sides: dict[int, list[np.ndarray]] = {}
+    keys: dict[int, list[np.ndarray]] = {}
+    dtype = np.int32 if mesh.numNodes < 2**31 else np.int64
+    for shape, group in _shapeGroups(mesh, elements):
+        if solids and shapeDimension[shape] != 3:
+            continue
+        for side, (corners, _) in enumerate(faceTable(shape)):
+            width = len(corners)
+            owners.setdefault(width, []).append(group)
+            sides.setdefault(width, []).append(np.full(len(group), side, dtype=np.int8))
+            keys.setdefault(width, []).append(np.sort(mesh.connectivity[group[:, None], corners].astype(dtype), axis=1))
+    if not keys:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    exteriorOwners, exteriorSides = [], []
+    for width in list(keys):
+        single = singles(np.concatenate(keys.pop(width)))
+        exteriorOwners.append(np.concatenate(owners[width])[single])
+        exteriorSides.append(np.concatenate(sides[width])[single])
+    return np.concatenate(exteriorOwners), np.concatenate(exteriorSides).astype(np.int64)
+
+
+def _shapeGroups(mesh: MeshArrays, elements: np.ndarray):
+    """Yield the basic shapes and the indices of the elements of each shape."""
+    codes = mesh.elementTypeCodes[elements]
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(mesh.elementTypes) + 1))
+    groups: dict[str, list] = {}
+    for code, elemType in enumerate(mesh.elementTypes):
+        shape = elementShape(elemType)
+        if shape is not None and bounds[code + 1] > bounds[code]:
+            groups.setdefault(shape, []).append(elements[order[bounds[code] : bounds[code + 1]]])
+    for shape, group in groups.items():
+        yield shape, np.concatenate(group)
+
+
+def _sorted(owners: np.ndarray, numbers: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sort element indices and face or edge numbers by element, then by number."""
+    order = np.lexsort((numbers, owners))
+    return owners[order], numbers[order]
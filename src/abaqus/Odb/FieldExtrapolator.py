@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from ..Mesh.elementTopology import (
+    elementShape,
+    shapeCentroid,
+    shapeDimension,
+    shapeFamily,
+    shapeFunctions,
+    shapeIntegrationPoints,
+    shapeNaturalCoordinates,
+    shapeNodes,
+)
+from ..Mesh.MeshArrays import MeshArrays, uniqueIndices
+from ..UtilityAndView.abaqusConstants import CENTROID, ELEMENT_NODAL, INTEGRATION_POINT, NODAL, SymbolicConstant
+from .FieldBulkData import FieldBulkData
+
+# The shapes of each family in increasing number of nodes, the candidates to interpolate integration point values
+_carriers: dict[str, list] = {}
+for _shape in sorted(shapeNodes, key=shapeNodes.__getitem__):
+    _carriers.setdefault(shapeFamily[_shape], []).append(_shape)
+_matrices: dict[tuple, np.ndarray] = {}
+
+
+def extrapolationMatrix(shape: str, count: int, centroid: bool = False) -> np.ndarray:
+    """Return the matrix mapping the values at the **count** integration points of a basic element shape to the
+    values at its nodes, or at its centroid if **centroid** is True.
+
+    The integration point values are interpolated by the shape functions of the largest shape of the same family
+    with at most **count** nodes, fitted in the least squares sense when that shape has fewer nodes than integration
+    points, and the interpolation is evaluated at the nodes. The 2 x 2 x 2 points of a quadratic hexahedron are
+    thus extrapolated trilinearly to the corners and the midside values are the means of the corner values, like in
+    Abaqus. The points of a wedge rule with a single triangle point lie on a line through the thickness and are
+    interpolated along the thickness by a line shape, linearly for the 2 points of a C3D6 element. A single
+    integration point, or a number of points without an integration rule or an interpolating shape, gives the mean
+    of the integration point values at every node.
+
+    Returns
+    -------
+    np.ndarray
+        A (k, count) array of Floats, or a (1, count) array for the centroid.
+    """
+    key = (shape, count, centroid)
+    if key not in _matrices:
+        points = shapeIntegrationPoints(shape, count)
+        family, axes = shapeFamily[shape], slice(None)
+        if points is not None and family == "WEDGE" and not np.ptp(points[:, :2], axis=0).any():
+            # The points lie on the line through the thickness at the centroid of the triangle
+            family, axes = "LINE", slice(2, 3)
+        carriers = [other for other in _carriers[family] if shapeNodes[other] <= count]
+        if points is None or not carriers or count == 1:
+            matrix = np.full((1 if centroid else shapeNodes[shape], count), 1.0 / count)
+        else:
+            targets = shapeCentroid(shape) if centroid else shapeNaturalCoordinates[shape]
+            targets = np.reshape(targets, (-1, shapeDimension[shape]))[:, axes]
+            carrier = carriers[-1]
+            matrix = shapeFunctions(carrier, targets) @ np.linalg.pinv(shapeFunctions(carrier, points[:, axes]))
+        _matrices[key] = matrix
+    return _matrices[key]
+
+
+class FieldExtrapolator:
+    """The FieldExtrapolator object converts field values at the integration points of the elements of a mesh to
+    element nodal, centroidal and averaged nodal values.
+
+    The integration point values of the elements of one shape are an (m, g, c) array of g integration points and c
+    components, extrapolated to the k nodes by the (k, g) matrix of :func:`extrapolationMatrix` in a single matrix
+    product for all elements of the shape. The element nodal values are averaged at the nodes by a scatter-add of
+    the values of all elements referencing each node, optionally only within regions and only where the values of
+    the elements differ by less than an averaging threshold, like the contour plots of Abaqus/CAE. Rows with a NaN
+    component, such as the nodes of elements whose type is not recognised, are not averaged.
+    """
+
+    #: A MeshArrays object specifying the mesh.
+    mesh: MeshArrays
+
+    def __init__(self, mesh: MeshArrays):
+        """This method creates a FieldExtrapolator object.
+
+        Parameters
+        ----------
+        mesh
+            A MeshArrays object specifying the mesh.
+        """
+        self.mesh = mesh
+
+    def integrationPointValues(
+        self, elementLabels: Sequence[int], integrationPoints: Sequence[int], data
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Arrange rows of integration point data by element.
+
+        Parameters
+        ----------
+        elementLabels
+            A sequence of Ints specifying the element label of each row, or of each element if the rows of each
+            element are consecutive.
+        integrationPoints
+            A sequence of Ints specifying the one-based integration point number of each row. If empty, the rows
+            of each element are consecutive and in the order of the integration points.
+        data
+            An (n, c) array of Floats specifying the components of each row, scalar data can be given as a flat
+            sequence.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The element indices and the (m, g, c) values at the integration points of each element, NaN for
+            missing integration points. The elements are in the order of the rows if the rows of each element are
+            consecutive and in the order of the integration points, otherwise they are sorted.
+
+        Raises
+        ------
+        ValueError
+            If the number of labels and rows differ or if an element label does not exist.
+        """
+        data = np.asarray(data, dtype=np.float64)
+        data = data.reshape(len(data), -1)
+        labels = np.asarray(elementLabels, dtype=np.int64).reshape(-1)
+        points = np.asarray(integrationPoints, dtype=np.int64).reshape(-1) - 1
+        if not len(points) and len(labels):
+            points = np.tile(np.arange(len(data) // len(labels)), len(labels))
+        count = int(points.max()) + 1 if len(points) else 1
+        if len(labels) * count == len(data) and len(labels) != len(data):
+            labels = np.repeat(labels, count)
+        if len(labels) != len(data) or len(points) != len(data):
+            raise ValueError(f"Expected {len(data)} element labels and integration points, got {len(labels)}")
+        rows = points.reshape(-1, count) if len(data) % count == 0 else None
+        if (
+            rows is not None
+            and (rows == np.arange(count)).all()
+            and (labels[::count, None] == labels.reshape(-1, count)).all()
+        ):
+            return self.mesh.elementsFromLabels(labels[::count]), data.reshape(-1, count, data.shape[1])
+        indices = self.mesh.elementsFromLabels(labels)
+        elements = uniqueIndices(indices, self.mesh.numElements)
+        values = np.full((len(elements), count, data.shape[1]), np.nan)
+        values[np.searchsorted(elements, indices), points] = data
+        return elements, values
+
+    def elementNodal(self, elements: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Extrapolate integration point values to the nodes of the elements.
+
+        Parameters
+        ----------
+        elements
+            An (m,) array of Ints specifying the element indices.
+        values
+            An (m, g, c) array of Floats specifying the values at the integration points of each element.
+
+        Returns
+        -------
+        np.ndarray
+            The (m, k, c) values at the nodes of each element in the order of the connectivity, where k is the
+            largest number of nodes of the elements, NaN for the padding of elements with fewer nodes.
+        """
+        elements, values = np.asarray(elements, dtype=np.int64), np.asarray(values, dtype=np.float64)
+        groups = list(self._groups(elements))
+        width = max([shapeNodes[shape] for shape, _ in groups], default=0)
+        result = np.full((len(elements), width, values.shape[2]), np.nan)
+        for shape, positions in groups:
+            result[positions, : shapeNodes[shape]] = _apply(
+                extrapolationMatrix(shape, values.shape[1]), values[positions]
+            )
+        return result
+
+    def centroid(self, elements: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Extrapolate integration point values to the centroids of the elements.
+
+        Parameters
+        ----------
+        elements
+            An (m,) array of Ints specifying the element indices.
+        values
+            An (m, g, c) array of Floats specifying the values at the integration points of each element.
+
+        Returns
+        -------
+        np.ndarray
+            The (m, c) values at the centroid of each element, NaN for elements whose type is not recognised.
+        """
+        elements, values = np.asarray(elements, dtype=np.int64), np.asarray(values, dtype=np.float64)
+        result = np.full((len(elements), values.shape[2]), np.nan)
+        for shape, positions in self._groups(elements):
+            result[positions] = _apply(extrapolationMatrix(shape, values.shape[1], centroid=True), values[positions])[
+                :, 0
+            ]
+        return result
+
+    def rows(self, elements: np.ndarray, elementNodal: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Flatten element nodal values to one row per node of each element, dropping the padding.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The element index, the node index and the (r, c) values of each row.
+        """
+        elements = np.asarray(elements, dtype=np.int64)
+        count, width, components = np.shape(elementNodal)
+        nodes = self.mesh.connectivity[elements, :width].ravel()
+        values = np.reshape(elementNodal, (-1, components))
+        valid = (nodes >= 0) & ~np.isnan(values).any(axis=1)
+        return np.repeat(elements, width)[valid], nodes[valid], values[valid]
+
+    def nodal(self, nodes: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Average values given per element node at the nodes.
+
+        Parameters
+        ----------
+        nodes
+            An (r,) array of Ints specifying the node index of each row.
+        values
+            An (r, c) array of Floats specifying the values of each row.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The sorted indices of the nodes and the (n, c) mean of the rows of each node.
+        """
+        nodes, values = np.asarray(nodes, dtype=np.int64), np.asarray(values, dtype=np.float64)
+        counts = np.bincount(nodes, minlength=self.mesh.numNodes)
+        used = np.flatnonzero(counts)
+        sums = np.empty((len(used), values.shape[1]))
+        for column in range(values.shape[1]):
+            sums[:, column] = np.bincount(nodes, weights=values[:, column], minlength=self.mesh.numNodes)[used]
+        return used, sums / counts[used, None]
+
+    def averaged(
+        self,
+        elements: np.ndarray,
+        elementNodal: np.ndarray,
+        threshold: float | None = None,
+        regions: Sequence | None = None,
+    ) -> np.ndarray:
+        """Average element nodal values at the nodes shared by the elements.
+
+        Parameters
+        ----------
+        elements
+            An (m,) array of Ints specifying the element indices.
+        elementNodal
+            An (m, k, c) array of Floats specifying the values at the nodes of each element.
+        threshold
+            A Float specifying the averaging threshold in percent. The values of a node are averaged only if their
+            range is at most this percentage of the range of the values of all elements, separately for each
+            component, otherwise the element nodal values are kept. The default is to average all values.
+        regions
+            A sequence specifying the region of each element, such as a section or material name. Values are
+            averaged only between elements of the same region. The default is to average across all elements.
+
+        Returns
+        -------
+        np.ndarray
+            The (m, k, c) averaged values at the nodes of each element.
+        """
+        elements, elementNodal = np.asarray(elements, dtype=np.int64), np.asarray(elementNodal, dtype=np.float64)
+        count, width, components = elementNodal.shape
+        keys = self.mesh.connectivity[elements, :width].ravel()
+        values = elementNodal.reshape(-1, components)
+        valid = (keys >= 0) & ~np.isnan(values).any(axis=1)
+        if regions is not None:
+            codes = np.unique(np.asarray(regions).reshape(-1), return_inverse=True)[1].reshape(-1)
+            keys = keys * (int(codes.max(initial=0)) + 1) + np.repeat(codes, width)
+        keys, values = keys[valid], values[valid]
+        if threshold is None and regions is None:
+            nodes, means = self.nodal(keys, values)
+            averaged = np.empty((self.mesh.numNodes, components))
+            averaged[nodes] = means
+            averaged = averaged[keys]
+        else:
+            # Sort the rows by key once, every node or node and region is then a contiguous run of rows
+            order = np.argsort(keys, kind="stable")
+            ordered = values[order]
+            first = np.ones(len(keys), dtype=bool)
+            first[1:] = keys[order][1:] != keys[order][:-1]
+            starts = np.flatnonzero(first)
+            groups = np.empty(len(keys), dtype=np.int64)
+            groups[order] = np.cumsum(first) - 1
+            counts = np.diff(np.append(starts, len(keys)))
+            averaged = (np.add.reduceat(ordered, starts, axis=0) / counts[:, None])[groups] if len(keys) else values
+            if threshold is not None and len(keys):
+                spread = np.maximum.reduceat(ordered, starts, axis=0) - np.minimum.reduceat(ordered, starts, axis=0)
+                span = values.max(axis=0) - values.min(axis=0)
+                within = spread * 100.0 <= threshold * np.where(span > 0, span, 1.0)
+                averaged = np.where(within[groups], averaged, values)
+        result = np.full((count * width, components), np.nan)
+        result[valid] = averaged
+        return result.reshape(count, width, components)
+
+    def _groups(self, elements: np.ndarray):
+        """Yield the basic shapes and the positions in **elements** of the elements of each shape."""
+        codes = self.mesh.elementTypeCodes[elements]
+        groups: dict[str, list] = {}
+        for code in np.unique(codes):
+            shape = elementShape(self.mesh.elementTypes[code])
+            if shape is not None:
+                groups.setdefault(shape, []).append(np.flatnonzero(codes == code))
+        for shape, positions in groups.items():
+            yield shape, np.concatenate(positions)
+
+
+def extrapolateBulkData(blocks: Sequence[FieldBulkData], position: SymbolicConstant) -> list[FieldBulkData]:
+    """Convert FieldBulkData objects to the output **position**.
+
+    If any of the blocks is at **position**, only these blocks are returned. Otherwise the blocks at
+    INTEGRATION_POINT are extrapolated to ELEMENT_NODAL, CENTROID or NODAL, and the blocks at ELEMENT_NODAL are
+    averaged to NODAL. The nodal values are averaged over all the blocks of a part instance and section point.
+    Blocks that cannot be converted are omitted.
+
+    Parameters
+    ----------
+    blocks
+        A sequence of FieldBulkData objects.
+    position
+        A SymbolicConstant specifying the output position. Possible values are NODAL, INTEGRATION_POINT,
+        ELEMENT_NODAL and CENTROID.
+
+    Returns
+    -------
+    list[FieldBulkData]
+        The converted FieldBulkData objects.
+    """
+    found = [block for block in blocks if block.position == position]
+    if found or position not in (ELEMENT_NODAL, CENTROID, NODAL):
+        return found
+    result: list[FieldBulkData] = []
+    nodal: dict[tuple, tuple[FieldExtrapolator, FieldBulkData, list]] = {}
+    extrapolators: dict[int, FieldExtrapolator] = {}
+    for block in blocks:
+        if block.position not in ((INTEGRATION_POINT, ELEMENT_NODAL) if position == NODAL else (INTEGRATION_POINT,)):
+            continue
+        extrapolator = extrapolators.get(id(block.instance))
+        if extrapolator is None:
+            extrapolator = extrapolators[id(block.instance)] = FieldExtrapolator(block.instance._meshArrays())
+        mesh = extrapolator.mesh
+        if block.position == ELEMENT_NODAL:
+            nodes = mesh.nodesFromLabels(block.nodeLabels)
+            values = np.asarray(block.data, dtype=np.float64).reshape(len(nodes), -1)
+        else:
+            elements, values = extrapolator.integrationPointValues(
+                block.elementLabels, block.integrationPoints, block.data
+            )
+            if position == CENTROID:
+                centroids = extrapolator.centroid(elements, values)
+                result.append(_bulkData(block, CENTROID, mesh.elementLabels[elements], (), centroids))
+                continue
+            elements, nodes, values = extrapolator.rows(elements, extrapolator.elementNodal(elements, values))
+            if position == ELEMENT_NODAL:
+                result.append(
+                    _bulkData(block, ELEMENT_NODAL, mesh.elementLabels[elements], mesh.nodeLabels[nodes], values)
+                )
+                continue
+        key = (id(block.instance), getattr(block.sectionPoint, "number", None))
+        nodal.setdefault(key, (extrapolator, block, []))[2].append((nodes, values))
+    for extrapolator, block, parts in nodal.values():
+        nodes, values = np.concatenate([nodes for nodes, _ in parts]), np.concatenate([values for _, values in parts])
+        nodes, values = extrapolator.nodal(nodes, values)
+        result.append(_bulkData(block, NODAL, (), extrapolator.mesh.nodeLabels[nodes], values))
+    return result
+
+
+def regionMask(region, nodeLabels, elementLabels, instanceName: str | None = None) -> np.ndarray:
+    """Return whether each row of output, given by its node and element labels, lies on a region.
+
+    Element rows lie on the region if their element is in it; node rows if their node is in it or, for a region of
+    elements, is a node of these elements. The members of OdbSet regions are found by their label indices.
+
+    Parameters
+    ----------
+    region
+        An OdbSet, an OdbMeshNode or an OdbMeshElement object specifying the region.
+    nodeLabels
+        A sequence of Ints specifying the node label of each row, or an empty sequence.
+    elementLabels
+        A sequence of Ints specifying the element label of each row, or an empty sequence.
+    instanceName
+        A String specifying the name of the instance of the rows.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean array of whether each row lies on the region.
+    """
+    nodeLabels = np.asarray(nodeLabels, dtype=np.int64).reshape(-1)
+    elementLabels = np.asarray(elementLabels, dtype=np.int64).reshape(-1)
+    elements = [region] if hasattr(region, "connectivity") else list(getattr(region, "elements", None) or ())
+    if elements and not hasattr(elements[0], "label"):
+        elements = [element for group in elements for element in group]
+    if elements and len(elementLabels):
+        kind, labels = "element", elementLabels
+    elif elements:
+        # Nodes of the elements of the region
+        members = [label for element in elements if _onInstance(element, instanceName)
+                   for label in np.asarray(element.connectivity, dtype=np.int64).reshape(-1)]  # fmt: skip
+        return np.isin(nodeLabels, np.asarray(members, dtype=np.int64))
+    else:
+        kind, labels = "node", nodeLabels
+    if hasattr(region, "contains"):
+        return region.contains(labels, kind, instanceName)
+    return (labels == region.label) & _onInstance(region, instanceName)
+
+
+def subsetBulkData(blocks: Sequence[FieldBulkData], region) -> list[FieldBulkData]:
+    """Return the rows of FieldBulkData objects on a region, omitting the blocks without rows on it.
+
+    Parameters
+    ----------
+    blocks
+        A sequence of FieldBulkData objects.
+    region
+        An OdbSet, an OdbMeshNode or an OdbMeshElement object specifying the region.
+
+    Returns
+    -------
+    list[FieldBulkData]
+        The FieldBulkData objects of the rows on the region.
+    """
+    result = []
+    for block in blocks:
+        instanceName = getattr(block.instance, "name", None)
+        mask = regionMask(region, block.nodeLabels, block.elementLabels, instanceName)
+        if not mask.any():
+            continue
+        rows = np.flatnonzero(mask)
+        subset = _bulkData(block, block.position, (), (), ())
+        for name in ("elementLabels", "nodeLabels", "integrationPoints", "data", "conjugateData", "mises"):
+            values = getattr(block, name, ())
+            if values is not None and len(values) == len(mask):
+                setattr(subset, name, np.asarray(values)[rows])
+        result.append(subset)
+    return result
+
+
+def _onInstance(member, instanceName: str | None) -> bool:
+    """Return whether a node or element is on the instance, those of an unknown instance being on any."""
+    name = getattr(member, "instanceName", None)
+    return not name or not instanceName or name == instanceName
+
+
+def _apply(matrix: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Apply a (k, g) matrix to (m, g, c) values as a single matrix product, giving (m, k, c) values."""
+    return np.tensordot(values, matrix, axes=([1], [1])).transpose(0, 2, 1)
+
+
+def _bulkData(block: FieldBulkData, position: SymbolicConstant, elementLabels, nodeLabels, data) -> FieldBulkData:
+    """Create a FieldBulkData object with the instance, section point and components of **block**."""
+    bulkData = FieldBulkData()
+    bulkData.position, bulkData.instance, bulkData.sectionPoint = position, block.instance, block.sectionPoint
+    if hasattr(block, "type"):
+        bulkData.type = block.type
+    bulkData.componentLabels = block.componentLabels
+    bulkData.elementLabels, bulkData.nodeLabels, bulkData.data = elementLabels, nodeLabels, data
+    return bulkData
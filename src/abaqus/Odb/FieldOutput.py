@@ -8,6 +8,7 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import OFF, Boolean, SymbolicConstant
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
+from .FieldBulkData import FieldBulkData
 from .FieldLocation import FieldLocation
 from .FieldLocationArray import FieldLocationArray
 from .FieldValueArray import FieldValueArray
@@ -79,6 +80,9 @@ class FieldOutput:
     #: parameter applies only to tensor field outputs. The default value is OFF.
     isEngineeringTensor: Boolean = OFF
 
+    #: A sequence of FieldBulkData objects specifying the field data of each class of elements or nodes.
+    bulkDataBlocks: list[FieldBulkData] = []
+
     @overload
     @abaqus_method_doc
     def __init__(
@@ -534,7 +538,26 @@ class FieldOutput:
 
     @abaqus_method_doc
     def getSubset(self, *args, **kwargs) -> "FieldOutput":
-        return FieldOutput("", "", C.SCALAR)
+        position = kwargs.get("position", args[0] if args and isinstance(args[0], SymbolicConstant) else None)
+        subset = FieldOutput(
+            getattr(self, "name", ""), getattr(self, "description", ""), getattr(self, "type", C.SCALAR)
+        )
+        if position is not None and self.bulkDataBlocks:
+            from .FieldExtrapolator import extrapolateBulkData
+
+            subset.componentLabels = self.componentLabels
+            subset.bulkDataBlocks = extrapolateBulkData(self.bulkDataBlocks, position)
+        region = kwargs.get(
+            "region", args[0] if args and isinstance(args[0], (OdbSet, OdbMeshNode, OdbMeshElement)) else None
+        )
+        if region is not None and (self.bulkDataBlocks or self.values):
+            from .FieldExtrapolator import subsetBulkData
+
+            subset.componentLabels = self.componentLabels
+            subset.bulkDataBlocks = subsetBulkData(self.bulkDataBlocks, region)
+            if self.values:
+                subset.values = [self.values[row] for row in _regionRows(self.values, region)]
+        return subset
 
     @overload
     def getTransformedField(self, datumCsys: str, projected22Axis: int | None = None, projectionTol: str = ""):
@@ -777,3 +800,19 @@ class FieldOutput:
             The default value is an empty sequence.
         """
         ...
+
+
+def _regionRows(values: Sequence, region) -> list[int]:
+    """Return the positions of the FieldValue objects on a region, looked up once per instance."""
+    from .FieldExtrapolator import regionMask
+
+    groups: dict = {}
+    for row, value in enumerate(values):
+        groups.setdefault(getattr(value.instance, "name", None), []).append(row)
+    rows = []
+    for name, group in groups.items():
+        nodes = [values[row].nodeLabel for row in group]
+        elements = [values[row].elementLabel for row in group]
+        mask = regionMask(region, nodes if None not in nodes else (), elements if None not in elements else (), name)
+        rows += [row for row, selected in zip(group, mask.tolist() if len(mask) else []) if selected]
+    return sorted(rows)
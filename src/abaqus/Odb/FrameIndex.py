@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from ..UtilityAndView.abaqusConstants import CLOSEST
+
+#: The tolerance, relative to the largest magnitude of the frame values, within which a frame value matches a
+#: requested value exactly.
+TOLERANCE = 1e-9
+
+
+class FrameIndex:
+    """The FrameIndex object resolves requested frame values to frames by binary search in the sorted frame
+    values.
+
+    The frame values are sorted once, keeping the order of the frames for equal values. A requested value matches a
+    frame exactly within :data:`TOLERANCE`; otherwise BEFORE returns the last frame before the value, AFTER the
+    first frame after it and CLOSEST the closest frame, the frame after the value if it is exactly halfway between
+    two frames. EXACT finds no frame.
+    """
+
+    #: An (m,) float array specifying the frame values in the order of the frames.
+    values: np.ndarray
+
+    def __init__(self, values: Sequence[float] | np.ndarray):
+        """This method builds a FrameIndex object.
+
+        Parameters
+        ----------
+        values
+            A sequence of Floats specifying the frame values in the order of the frames.
+        """
+        self.values = np.asarray(values, dtype=np.float64).reshape(-1)
+        self._order = np.argsort(self.values, kind="stable")
+        self._sorted = self.values[self._order]
+        self._tolerance = TOLERANCE * max(float(np.abs(self._sorted).max(initial=0.0)), np.finfo(np.float64).tiny)
+
+    def lookup(self, values, match=CLOSEST) -> np.ndarray:
+        """Return the positions of the frames matching requested values.
+
+        Parameters
+        ----------
+        values
+            A Float or an array of Floats specifying the requested frame values.
+        match
+            A SymbolicConstant specifying which frame to return if there is no frame at the exact frame value.
+            Possible values are CLOSEST, BEFORE, AFTER, and EXACT. The default value is CLOSEST.
+
+        Returns
+        -------
+        np.ndarray
+            An int array of the shape of **values** with the positions of the frames, -1 where no frame matches.
+
+        Raises
+        ------
+        ValueError
+            If **match** is not valid.
+        """
+        match = str(match)
+        if match not in ("CLOSEST", "BEFORE", "AFTER", "EXACT"):
+            raise ValueError(f"Invalid match {match}, expected CLOSEST, BEFORE, AFTER or EXACT")
+        values = np.asarray(values, dtype=np.float64)
+        shape, values, count = values.shape, values.reshape(-1), len(self._sorted)
+        if not count:
+            return np.full(shape, -1, dtype=np.int64)
+        # First frame not before the value, which is the exact frame if any
+        after = np.searchsorted(self._sorted, values - self._tolerance, side="left")
+        exact = after < count
+        exact[exact] = self._sorted[after[exact]] <= values[exact] + self._tolerance
+        if match == "EXACT":
+            positions = np.where(exact, after, -1)
+        elif match == "AFTER":
+            positions = np.where(after < count, after, -1)
+        elif match == "BEFORE":
+            positions = np.where(exact, after, after - 1)
+        else:
+            lower, upper = np.maximum(after - 1, 0), np.minimum(after, count - 1)
+            closer = (values - self._sorted[lower]) < (self._sorted[upper] - values)
+            positions = np.where(exact | ~closer | (after == 0), upper, lower)
+            positions = np.where(after == count, count - 1, positions)
+        return np.where(positions >= 0, self._order[np.maximum(positions, 0)], -1).reshape(shape)
@@ -6,8 +6,17 @@ from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import (
     DEFORMABLE_BODY,
+    ELEMENT_FACE,
+    ELEMENT_FACE_INTEGRATION_POINT,
+    ELEMENT_NODAL,
     FACE_UNKNOWN,
+    INTEGRATION_POINT,
+    NODAL,
     THREE_D,
+    WHOLE_ELEMENT,
+    WHOLE_MODEL,
+    WHOLE_PART_INSTANCE,
+    WHOLE_REGION,
     SymbolicConstant,
 )
 from .OdbAssembly import OdbAssembly
@@ -236,4 +245,46 @@ class HistoryPoint:
         """
         ...
 
-    def __init__(self, *args, **kwargs): ...
+    def __init__(self, *args, **kwargs):
+        first = args[0] if args else None
+        if isinstance(first, OdbMeshElement) or "element" in kwargs:
+            names = ("element", "ipNumber", "sectionPoint", "face", "node")
+        elif isinstance(first, OdbSet) or "region" in kwargs:
+            names = ("region",)
+        elif isinstance(first, OdbAssembly) or "assembly" in kwargs:
+            names = ("assembly",)
+        elif isinstance(first, OdbInstance) or "instance" in kwargs:
+            names = ("instance",)
+        else:
+            names = ("node",)
+        values = {**dict(zip(names, args)), **kwargs}
+        for key, value in values.items():
+            setattr(self, key, value)
+        if "element" in values:
+            integrated = bool(self.ipNumber)
+            if str(self.face) not in ("FACE_UNKNOWN", "None"):
+                self.position = ELEMENT_FACE_INTEGRATION_POINT if integrated else ELEMENT_FACE
+            elif getattr(self, "node", None) is not None:
+                self.position = ELEMENT_NODAL
+            else:
+                self.position = INTEGRATION_POINT if integrated else WHOLE_ELEMENT
+        else:
+            self.position = {"region": WHOLE_REGION, "assembly": WHOLE_MODEL, "instance": WHOLE_PART_INSTANCE}.get(
+                names[0], NODAL
+            )
+
+    def _key(self) -> tuple:
+        """Return the key of the point in the hash index of the history regions of a step: its position and the
+        labels and names of its members."""
+        element, node = getattr(self, "element", None), getattr(self, "node", None)
+        return (
+            str(self.position),
+            getattr(element if element is not None else node, "instanceName", None) or None,
+            getattr(element, "label", None),
+            getattr(node, "label", None),
+            int(self.ipNumber or 0),
+            getattr(getattr(self, "sectionPoint", None), "number", None),
+            str(self.face),
+            getattr(getattr(self, "region", None), "name", None) if "region" in self.__dict__ else None,
+            getattr(getattr(self, "instance", None), "name", None) if "instance" in self.__dict__ else None,
+        )
@@ -76,7 +76,10 @@ class HistoryRegion:
         HistoryRegion
             A HistoryRegion object.
         """
-        ...
+        self.name = name
+        self.description = description
+        self.point = point
+        self.loadCase = loadCase
 
     @overload
     @abaqus_method_doc
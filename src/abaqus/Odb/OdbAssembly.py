@@ -324,4 +324,11 @@ class OdbAssembly(OdbAssemblyBase):
             An OdbSet object.
         """
         self.nodeSets[name] = odbSet = OdbSet(name, nodes)
+        if None in odbSet.instanceNames:
+            # Groups of nodes not named by their nodes belong to the instance holding them
+            owners = {id(node): instance.name for instance in self.instances.values() for node in instance.nodes}
+            odbSet.instanceNames = tuple(
+                instanceName or (owners.get(id(group[0])) if len(group) else None)
+                for instanceName, group in zip(odbSet.instanceNames, odbSet.nodes)
+            )
         return odbSet
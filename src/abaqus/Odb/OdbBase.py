@@ -14,6 +14,7 @@ from ..UtilityAndView.abaqusConstants import CLOSEST, OFF, Boolean
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 from .JobData import JobData
 from .OdbAssembly import OdbAssembly
+from .OdbFrame import OdbFrame
 from .OdbPart import OdbPart
 from .OdbStep import OdbStep
 from .SectionCategory import SectionCategory
@@ -74,6 +75,15 @@ class OdbBase:
     #: A repository of Profile objects.
     profiles: dict[str, Profile] = {}
 
+    #: The key of the output database in the OdbCache that opened it, None if no cache opened it.
+    _cacheKey: str | None = None
+
+    #: Whether the OdbCache that opened the output database closed it to keep within its budget.
+    _evicted: bool = False
+
+    #: Whether the output database was closed.
+    _closed: bool = False
+
     @abaqus_method_doc
     def __init__(self, name: str, analysisTitle: str = "", description: str = "", path: str = ""):
         """This method creates a new Odb object.
@@ -102,12 +112,23 @@ class OdbBase:
         Odb
             An Odb object.
         """
-        ...
+        self.name = name
+        self.analysisTitle = analysisTitle
+        self.description = description
+        self.path = path
+        self.amplitudes = {}
+        self.filters = {}
+        self.parts = {}
+        self.materials = {}
+        self.steps = {}
+        self.sections = {}
+        self.sectionCategories = {}
+        self.profiles = {}
 
     @abaqus_method_doc
     def close(self):
         """This method closes an output database."""
-        ...
+        self._closed = True
 
     @abaqus_method_doc
     def getFrame(self, frameValue: str, match: Literal[C.BEFORE, C.EXACT, C.AFTER, C.CLOSEST] = CLOSEST):
@@ -138,7 +159,66 @@ class OdbBase:
         OdbError
             Frame not found, If the exact frame is not found.
         """
-        ...
+        return self.getFrames(frameValue, match)[0]
+
+    def getFrames(self, frameValue, match: Literal[C.BEFORE, C.EXACT, C.AFTER, C.CLOSEST] = CLOSEST) -> list[OdbFrame]:
+        """This method returns the frames at many total times, frequencies or modes at once, by binary search in
+        the frame values of all the steps sorted once. The frame values of the steps in the time domain are
+        offset by the total time of the step, or by the time periods of the previous steps if it is not known.
+
+        Parameters
+        ----------
+        frameValue
+            A Double or a sequence of Doubles specifying the values at which the frames are required.
+        match
+            A SymbolicConstant specifying which frame to return if there is no frame at the exact
+            frame value. Possible values are CLOSEST, BEFORE, AFTER, and EXACT. The default value is
+            CLOSEST.
+
+        Returns
+        -------
+        list[OdbFrame]
+            The OdbFrame objects, one for each frame value.
+
+        Raises
+        ------
+        ValueError
+            Frame not found, If an OdbFrame object is not found, or if the steps have different domains or load
+            case specific data.
+        """
+        import numpy as np
+
+        from .FrameIndex import FrameIndex
+
+        steps = list(self.steps.values())
+        key = tuple((id(step), len(step.frames), id(step.frames[-1]) if step.frames else None, str(step.domain),
+                     step.totalTime, step.timePeriod, len(step.loadCases)) for step in steps)  # fmt: skip
+        cached = getattr(self, "_frameIndex", None)
+        if cached is None or cached[0] != key:
+            domains = {str(step.domain) for step in steps}
+            if len(domains) > 1:
+                raise ValueError(f"The steps of the output database have different domains {sorted(domains)}")
+            if any(step.loadCases for step in steps):
+                raise ValueError("The output database contains a step with load case specific data")
+            frames: list[OdbFrame] = []
+            stepValues: list[np.ndarray] = []
+            time = 0.0
+            for step in steps:
+                stepFrames, index = step._frames()
+                offset = 0.0
+                if domains == {"TIME"}:
+                    totalTime = step.totalTime
+                    offset = time if totalTime is None or totalTime < 0 else totalTime
+                    time = offset + (step.timePeriod or 0.0)
+                frames += stepFrames
+                stepValues.append(index.values + offset)
+            cached = self._frameIndex = (key, frames, FrameIndex(np.concatenate(stepValues) if stepValues else []))
+        _, frames, index = cached
+        values = np.asarray(frameValue, dtype=float).reshape(-1)
+        positions = index.lookup(values, match)
+        if (positions < 0).any():
+            raise ValueError(f"Frame not found at the frame value {values[np.argmax(positions < 0)]} for {match}")
+        return [frames[position] for position in positions.tolist()]
 
     @abaqus_method_doc
     def save(self):
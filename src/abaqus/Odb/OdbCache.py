@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from typing import Callable
+
+from ..UtilityAndView.abaqusConstants import OFF, Boolean
+from .Odb import Odb
+
+
+def odbSize(path: str) -> float:
+    """Return the estimated memory footprint of an open output database in megabytes, the size of its file."""
+    try:
+        return os.path.getsize(path) / 2**20
+    except OSError:
+        return 0.0
+
+
+class OdbCache:
+    """The OdbCache object keeps the open output databases of a session, least recently used first.
+
+    Opening a path that is already open returns the same Odb object; an output database closed with its close
+    method is opened again. When the number of open output databases exceeds **maxOdbs**, or their estimated
+    memory footprint exceeds **memoryLimit**, the least recently used ones are closed. An OdbRepository, such as
+    ``session.odbs``, reopens an output database the cache closed transparently when it is accessed again.
+    """
+
+    #: An Int specifying the maximum number of open output databases, or None for no limit.
+    maxOdbs: int | None = None
+
+    #: A Float specifying the maximum estimated memory footprint of the open output databases in megabytes, or
+    #: None for no limit.
+    memoryLimit: float | None = None
+
+    #: An Int specifying the number of requests for output databases that were already open.
+    hits: int = 0
+
+    #: An Int specifying the number of requests for output databases that had to be opened.
+    misses: int = 0
+
+    #: An Int specifying the number of output databases closed to keep within the budget.
+    evictions: int = 0
+
+    def __init__(
+        self,
+        opener: Callable[[str, str, Boolean], Odb],
+        maxOdbs: int | None = None,
+        memoryLimit: float | None = None,
+        sizeOf: Callable[[str], float] = odbSize,
+    ):
+        """This method creates an OdbCache object.
+
+        Parameters
+        ----------
+        opener
+            A callable opening the output database of a name, a path and a read-only flag.
+        maxOdbs
+            An Int specifying the maximum number of open output databases. The default is no limit.
+        memoryLimit
+            A Float specifying the maximum estimated memory footprint of the open output databases in megabytes.
+            The default is no limit.
+        sizeOf
+            A callable returning the estimated memory footprint of the output database of a path in megabytes.
+            The default is the size of its file.
+        """
+        self.opener = opener
+        self.maxOdbs = maxOdbs
+        self.memoryLimit = memoryLimit
+        self.sizeOf = sizeOf
+        self.hits = self.misses = self.evictions = 0
+        # Normalized path -> (Odb, estimated size), least recently used first
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+
+    @staticmethod
+    def key(path: str) -> str:
+        """Return the normalized absolute path identifying an output database."""
+        return os.path.normcase(os.path.abspath(path))
+
+    def open(self, name: str, path: str, readOnly: Boolean = OFF) -> Odb:
+        """This method returns the open output database of a path, opening it if needed.
+
+        Parameters
+        ----------
+        name
+            A String specifying the repository key of the output database.
+        path
+            A String specifying the path to the output database (`.odb`) file.
+        readOnly
+            A Boolean specifying whether the file will permit only read access.
+
+        Returns
+        -------
+        Odb
+            An Odb object.
+        """
+        key = self.key(path)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]._closed:
+            # Closed by its owner, the output database is opened again
+            del self._entries[key]
+        elif entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+        self.misses += 1
+        odb = self.opener(name, path, readOnly)
+        odb._cacheKey = key
+        self._entries[key] = (odb, float(self.sizeOf(path)))
+        self.evict(keep=key)
+        return odb
+
+    def reopen(self, odb: Odb) -> Odb:
+        """This method returns the open output database of the path of an Odb object, reopening it if the cache
+        closed it, and marks it as the most recently used.
+
+        Parameters
+        ----------
+        odb
+            An Odb object.
+
+        Returns
+        -------
+        Odb
+            The open Odb object of the path, **odb** itself if the cache did not open it.
+        """
+        key = odb._cacheKey
+        if key is not None and key in self._entries and not self._entries[key][0]._closed:
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+        if not odb._evicted:
+            return odb
+        return self.open(odb.name, odb.path, odb.isReadOnly)
+
+    def close(self, path: str) -> bool:
+        """This method closes the output database of a path, returning whether it was open."""
+        entry = self._entries.pop(self.key(path), None)
+        if entry is not None:
+            entry[0].close()
+        return entry is not None
+
+    def evict(self, keep: str | None = None) -> list[str]:
+        """This method closes the least recently used output databases until the cache is within its budget.
+
+        Parameters
+        ----------
+        keep
+            A String specifying the key of an output database never to close, such as the one just opened.
+
+        Returns
+        -------
+        list[str]
+            The paths of the closed output databases.
+        """
+        closed = []
+        for key in [key for key, (odb, _) in self._entries.items() if odb._closed and key != keep]:
+            del self._entries[key]
+        memory = sum(size for _, size in self._entries.values())
+        for key in list(self._entries):
+            count = len(self._entries)
+            if (self.maxOdbs is None or count <= self.maxOdbs) and (
+                self.memoryLimit is None or memory <= self.memoryLimit
+            ):
+                break
+            if key == keep:
+                continue
+            odb, size = self._entries.pop(key)
+            odb.close()
+            odb._evicted = True
+            memory -= size
+            self.evictions += 1
+            closed.append(key)
+        return closed
+
+    def setValues(self, **kwargs):
+        """This method modifies the budget of the OdbCache object, closing output databases beyond it.
+
+        Parameters
+        ----------
+        maxOdbs
+            An Int specifying the maximum number of open output databases, or None for no limit.
+        memoryLimit
+            A Float specifying the maximum estimated memory footprint of the open output databases in megabytes,
+            or None for no limit.
+        """
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        self.evict()
+
+    def info(self) -> dict:
+        """Return the counters of the cache, the number of open output databases and their memory footprint."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "open": len(self._entries),
+            "memory": sum(size for _, size in self._entries.values()),
+            "maxOdbs": self.maxOdbs,
+            "memoryLimit": self.memoryLimit,
+        }
+
+    def clear(self):
+        """This method closes all the output databases of the cache, to be reopened when they are accessed again."""
+        for odb, _ in self._entries.values():
+            odb.close()
+            odb._evicted = True
+        self._entries.clear()
+
+
+class OdbRepository(dict):
+    """A repository of Odb objects that reopens, through an OdbCache, the output databases the cache closed when
+    they are accessed by key. Iterating over its values does not reopen them."""
+
+    def __init__(self, cache: OdbCache, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+
+    def __getitem__(self, key: str) -> Odb:
+        odb = super().__getitem__(key)
+        current = self.cache.reopen(odb)
+        if current is not odb:
+            super().__setitem__(key, current)
+        return current
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self else default
@@ -146,7 +146,19 @@ class OdbFrame:
         """
         ...
 
-    def __init__(self, *args, **kwargs): ...
+    def __init__(self, *args, **kwargs):
+        if isinstance(args[0] if args else kwargs.get("loadCase"), OdbLoadCase):
+            names = ("loadCase", "description", "frequency")
+        elif "mode" in kwargs or "frequency" in kwargs:
+            names = ("mode", "frequency", "description")
+        else:
+            names = ("incrementNumber", "frameValue", "description")
+        values = {**dict(zip(names, args)), **kwargs}
+        for key, value in values.items():
+            setattr(self, key, value)
+        if "frameValue" not in values:
+            self.frameValue = self.frequency
+        self.fieldOutputs = {}
 
     @abaqus_method_doc
     def Frame(self, *args, **kwargs): ...
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Sequence
+import copy
+from typing import TYPE_CHECKING, Sequence
 
 from typing_extensions import Literal
 
@@ -30,6 +31,12 @@ from .OdbRigidBodyArray import OdbRigidBodyArray
 from .OdbSet import OdbSet
 from .RebarOrientationArray import RebarOrientationArray
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
+    from ..Mesh.MeshAdjacency import MeshAdjacency
+    from ..Mesh.MeshArrays import LabelIndex, MeshArrays
+
 
 @abaqus_class_doc
 class OdbInstanceBase:
@@ -94,6 +101,9 @@ class OdbInstanceBase:
     #: An AnalyticSurface object specifying analytic Surface defined on the instance.
     analyticSurface: AnalyticSurface = AnalyticSurface()
 
+    #: The array storage of the mesh of the instance, built from **nodes** and **elements** on first use.
+    _mesh: MeshArrays | None = None
+
     @abaqus_method_doc
     def __init__(self, name: str, object: OdbPart, localCoordSystem: tuple = ()):
         """This method creates an OdbInstance object from an OdbPart object.
@@ -127,7 +137,79 @@ class OdbInstanceBase:
         OdbInstance
             An OdbInstance object.
         """
-        ...
+        self.name = name
+        self.nodes = [_member(node, name) for node in getattr(object, "nodes", [])]
+        self.elements = [_member(element, name) for element in getattr(object, "elements", [])]
+        self.nodeSets = {}
+        self.elementSets = {}
+        self.surfaces = {}
+
+    def _meshArrays(self) -> MeshArrays:
+        """Return the mesh of the instance as a MeshArrays object, rebuilt when nodes or elements were added."""
+        size = (len(self.nodes), len(self.elements))
+        if self._mesh is None or (self._mesh.numNodes, self._mesh.numElements) != size:
+            from ..Mesh.MeshArrays import MeshArrays
+
+            self._mesh = MeshArrays.fromMeshObjects(self.nodes, self.elements)
+        return self._mesh
+
+    def adjacency(self) -> MeshAdjacency:
+        """This method returns the node to element adjacency of the mesh of the instance, built on the first call
+        and rebuilt when nodes or elements were added.
+
+        Returns
+        -------
+        MeshAdjacency
+            A MeshAdjacency object, whose indices are the positions of the nodes and elements in **nodes** and
+            **elements**.
+        """
+        return self._meshArrays().adjacency()
+
+    def _labelIndex(self, kind: str) -> LabelIndex:
+        """Return the label index of the nodes or elements of the instance, built on first use and rebuilt when
+        nodes or elements were added."""
+        import numpy as np
+
+        from ..Mesh.MeshArrays import LabelIndex
+
+        objects = self.nodes if kind == "node" else self.elements
+        indices = self.__dict__.setdefault("_labelIndices", {})
+        if kind not in indices or indices[kind][0] != len(objects):
+            labels = np.fromiter((item.label for item in objects), dtype=np.int64, count=len(objects))
+            indices[kind] = (len(objects), LabelIndex(labels))
+        return indices[kind][1]
+
+    def nodeIndices(self, labels) -> ndarray:
+        """This method maps node labels to the positions of the nodes in **nodes**, by a label index built on the
+        first call and rebuilt when nodes were added.
+
+        Parameters
+        ----------
+        labels
+            An Int or a sequence of Ints specifying the node labels.
+
+        Returns
+        -------
+        ndarray
+            An int array of the positions of the nodes, -1 for labels that do not exist.
+        """
+        return self._labelIndex("node")(labels)
+
+    def elementIndices(self, labels) -> ndarray:
+        """This method maps element labels to the positions of the elements in **elements**, by a label index
+        built on the first call and rebuilt when elements were added.
+
+        Parameters
+        ----------
+        labels
+            An Int or a sequence of Ints specifying the element labels.
+
+        Returns
+        -------
+        ndarray
+            An int array of the positions of the elements, -1 for labels that do not exist.
+        """
+        return self._labelIndex("element")(labels)
 
     @abaqus_method_doc
     def assignBeamOrientation(self, region: str, method: Literal[C.N1_COSINES], vector: tuple):
@@ -224,7 +306,10 @@ class OdbInstanceBase:
         OdbError
             Invalid element label, If no element with the specified label exists.
         """
-        ...
+        index = int(self.elementIndices(label))
+        if index < 0:
+            raise ValueError(f"Invalid element label {label}")
+        return self.elements[index]
 
     @abaqus_method_doc
     def getNodeFromLabel(self, label: int):
@@ -245,7 +330,10 @@ class OdbInstanceBase:
         OdbError
             Invalid node label, If no node with the specified label exists.
         """
-        ...
+        index = int(self.nodeIndices(label))
+        if index < 0:
+            raise ValueError(f"Invalid node label {label}")
+        return self.nodes[index]
 
     @abaqus_method_doc
     def assignSection(self, region: str, section: Section):
@@ -393,3 +481,10 @@ class OdbInstanceBase:
             Rigid body definition requires a node set, If **referenceNode** is not a node set.
         """
         ...
+
+
+def _member(member, instanceName: str):
+    """Return a copy of a node or element of a part as a member of an instance, named after the instance."""
+    member = copy.copy(member)
+    member.instanceName = instanceName
+    return member
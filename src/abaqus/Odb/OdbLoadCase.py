@@ -36,4 +36,4 @@ class OdbLoadCase:
         OdbLoadCase
             An OdbLoadCase object.
         """
-        ...
+        self.name = name
@@ -31,3 +31,6 @@ class OdbMeshNode:
     #: A tuple of Floats specifying the nodal coordinates in the global Cartesian coordinate
     #: system.
     coordinates: float | None = None
+
+    #: A String specifying the instance name.
+    instanceName: str = ""
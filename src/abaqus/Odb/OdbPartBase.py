@@ -97,7 +97,14 @@ class OdbPartBase:
         OdbPart
             An OdbPart object.
         """
-        ...
+        self.name = name
+        self.embeddedSpace = embeddedSpace
+        self.type = type
+        self.nodes = []
+        self.elements = []
+        self.nodeSets = {}
+        self.elementSets = {}
+        self.surfaces = {}
 
     @overload
     @abaqus_method_doc
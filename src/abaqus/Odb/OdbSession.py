@@ -1,13 +1,30 @@
+from __future__ import annotations
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..Session.SessionBase import SessionBase
 from ..UtilityAndView.abaqusConstants import OFF, Boolean
 from .Odb import Odb
+from .OdbCache import OdbCache, OdbRepository
 from .ScratchOdb import ScratchOdb
 
 
 @abaqus_class_doc
 class OdbSession(SessionBase):
+    #: The OdbCache object of the open output databases, created on first use.
+    _odbCache: OdbCache | None = None
+
+    @property
+    def odbCache(self) -> OdbCache:
+        """The OdbCache object keeping the output databases opened by :meth:`openOdb`, least recently used first.
+        Its memory budget is **kernelMemoryLimit**, reduced to the **percentThreshold** of the
+        **memoryReductionOptions** in reduced memory mode; its handle budget **maxOdbs** is not limited unless set
+        with its setValues method. Output databases it closes are reopened when accessed in ``session.odbs``."""
+        if self._odbCache is None:
+            self._odbCache = OdbCache(_openOdbFile, memoryLimit=self._odbMemoryLimit())
+            self.odbs = OdbRepository(self._odbCache, self.odbs)
+        return self._odbCache
+
     @abaqus_method_doc
     def ScratchOdb(self, odb: Odb) -> ScratchOdb:
         """This method creates a new ScratchOdb object.
@@ -72,7 +89,8 @@ class OdbSession(SessionBase):
         AbaqusError: Cannot open file <filename>
             If the file is not a valid database.
         """
-        self.odbs[name] = odb = Odb(name)
+        # An output database already open at the same path is reused
+        self.odbs[name] = odb = self.odbCache.open(name, path or name, readOnly)
         return odb
 
     @abaqus_method_doc
@@ -105,3 +123,10 @@ class OdbSession(SessionBase):
             If the output database upgrade fails.
         """
         ...
+
+
+def _openOdbFile(name: str, path: str, readOnly: Boolean = OFF) -> Odb:
+    """Open the output database (`.odb`) file of a path."""
+    odb = Odb(name, path=path)
+    odb.isReadOnly = readOnly
+    return odb
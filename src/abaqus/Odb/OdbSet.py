@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
@@ -10,6 +10,11 @@ from .OdbMeshElementArray import OdbMeshElementArray
 from .OdbMeshNode import OdbMeshNode
 from .OdbMeshNodeArray import OdbMeshNodeArray
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
+    from .OdbInstance import OdbInstance
+
 
 @abaqus_class_doc
 class OdbSet:
@@ -89,7 +94,99 @@ class OdbSet:
         OdbSet
             An OdbSet object.
         """
-        ...
+        self.name = name
+        self.nodes = list(nodes)
+        self.elements = []
+        # The instance of each group of nodes of an assembly-level set, named by its nodes
+        nested = bool(self.nodes) and not hasattr(self.nodes[0], "label")
+        self.instanceNames = tuple(_instanceName(group) for group in nodes) if nested else ()
+        self._labelIndices: dict[str, tuple] = {}
+
+    def _groups(self, kind: str) -> dict:
+        """Return the label indices of the nodes or elements of the set by instance name, None for the members
+        whose instance is not known, built on first use and rebuilt when the members change."""
+        import numpy as np
+
+        from ..Mesh.MeshArrays import LabelIndex
+
+        members: Sequence = self.nodes if kind == "node" else self.elements
+        cached = self._labelIndices.get(kind)
+        if cached is not None and cached[0] is members and cached[1] == len(members):
+            return cached[2]
+        labels: dict = {}
+        nested = bool(len(members)) and not hasattr(members[0], "label")
+        names = self.instanceNames if nested and len(self.instanceNames) == len(members) else ()
+        for number, group in enumerate(members if nested else [members]):
+            for item in group:
+                name = getattr(item, "instanceName", None) or (names[number] if names else None)
+                labels.setdefault(name, []).append(item.label)
+        groups = {name: LabelIndex(np.unique(np.asarray(values, dtype=np.int64))) for name, values in labels.items()}
+        self._labelIndices[kind] = (members, len(members), groups)
+        return groups
+
+    def contains(self, labels, kind: str = "node", instanceName: str | None = None) -> ndarray:
+        """This method tests whether labels are the labels of nodes or elements of the set, by label indices of
+        its members built on the first call.
+
+        Parameters
+        ----------
+        labels
+            A sequence of Ints specifying the labels.
+        kind
+            A String specifying whether the labels are node labels, "node", or element labels, "element". The
+            default value is "node".
+        instanceName
+            A String specifying the name of the instance of the labels. Members of the set whose instance is not
+            known match any instance.
+
+        Returns
+        -------
+        ndarray
+            A boolean array of whether each label is in the set.
+        """
+        import numpy as np
+
+        labels = np.asarray(labels, dtype=np.int64)
+        groups = self._groups(kind)
+        result = np.zeros(labels.shape, dtype=bool)
+        for name in {instanceName, None}:
+            if name in groups:
+                result |= groups[name](labels) >= 0
+        return result
+
+    def nodeIndices(self, instance: OdbInstance) -> ndarray:
+        """This method maps the nodes of the set on an instance to the positions of the nodes in the **nodes** of
+        the instance, by the label index of the instance.
+
+        Parameters
+        ----------
+        instance
+            An OdbInstance object.
+
+        Returns
+        -------
+        ndarray
+            An int array of the positions of the nodes, -1 for nodes that do not exist in the instance.
+        """
+        groups = self._groups("node")
+        return instance.nodeIndices(_labels(groups, instance.name))
+
+    def elementIndices(self, instance: OdbInstance) -> ndarray:
+        """This method maps the elements of the set on an instance to the positions of the elements in the
+        **elements** of the instance, by the label index of the instance.
+
+        Parameters
+        ----------
+        instance
+            An OdbInstance object.
+
+        Returns
+        -------
+        ndarray
+            An int array of the positions of the elements, -1 for elements that do not exist in the instance.
+        """
+        groups = self._groups("element")
+        return instance.elementIndices(_labels(groups, instance.name))
 
     @abaqus_method_doc
     def NodeSetFromNodeLabels(self, name: str, nodeLabels: tuple):
@@ -274,3 +371,16 @@ class OdbSet:
             An OdbSet object.
         """
         ...
+
+
+def _labels(groups: dict, instanceName: str):
+    """Return the sorted labels of the members of an instance and of the members whose instance is not known."""
+    import numpy as np
+
+    labels = [groups[name].labels for name in (instanceName, None) if name in groups]
+    return np.unique(np.concatenate(labels)) if labels else np.zeros(0, dtype=np.int64)
+
+
+def _instanceName(members) -> str | None:
+    """Return the instance name of a group of nodes or elements, None if none of them is named."""
+    return next((member.instanceName for member in members if getattr(member, "instanceName", "")), None)
@@ -169,7 +169,16 @@ class OdbStepBase:
         ValueError
             previousStepName is invalid, If **previousStepName** is invalid.
         """
-        ...
+        self.name = name
+        self.description = description
+        self.domain = domain
+        self.timePeriod = timePeriod
+        self.previousStepName = previousStepName
+        self.procedure = procedure
+        self.totalTime = totalTime
+        self.frames = []
+        self.historyRegions = {}
+        self.loadCases = {}
 
     @overload
     @abaqus_method_doc
@@ -262,7 +271,72 @@ class OdbStepBase:
 
     @abaqus_method_doc
     def getFrame(self, *args, **kwargs) -> OdbFrame:
-        return OdbFrame(0, 0.0)
+        loadCase = kwargs.pop("loadCase", args[0] if args and isinstance(args[0], OdbLoadCase) else None)
+        args = args[1:] if args and args[0] is loadCase else args
+        if not args and "frameValue" not in kwargs:
+            frames = self._frames(loadCase)[0]
+            if not frames:
+                raise ValueError(f"Frame not found for the load case {getattr(loadCase, 'name', '')}")
+            return frames[0]
+        frameValue = kwargs.get("frameValue", args[0] if args else None)
+        match = kwargs.get("match", args[1] if len(args) > 1 else CLOSEST)
+        return self.getFrames(frameValue, match, loadCase)[0]
+
+    def getFrames(
+        self,
+        frameValue,
+        match: Literal[C.CLOSEST, C.BEFORE, C.AFTER, C.EXACT] = CLOSEST,
+        loadCase: OdbLoadCase | None = None,
+    ) -> list[OdbFrame]:
+        """This method retrieves the OdbFrame objects associated with many frame values at once, by binary search
+        in the frame values of the step sorted once.
+
+        Parameters
+        ----------
+        frameValue
+            A Double or a sequence of Doubles specifying the values at which the frames are required.
+        match
+            A SymbolicConstant specifying which frame to return if there is no frame at the exact
+            frame value. Possible values are CLOSEST, BEFORE, AFTER, and EXACT. The default value is
+            CLOSEST.
+        loadCase
+            None or an OdbLoadCase object specifying a load case in the step. The default is the frames of all
+            load cases.
+
+        Returns
+        -------
+        list[OdbFrame]
+            The OdbFrame objects, one for each frame value.
+
+        Raises
+        ------
+        ValueError
+            Frame not found, If an OdbFrame object is not found.
+        """
+        import numpy as np
+
+        frames, index = self._frames(loadCase)
+        values = np.asarray(frameValue, dtype=float).reshape(-1)
+        positions = index.lookup(values, match)
+        if (positions < 0).any():
+            raise ValueError(f"Frame not found at the frame value {values[np.argmax(positions < 0)]} for {match}")
+        return [frames[position] for position in positions.tolist()]
+
+    def _frames(self, loadCase: OdbLoadCase | None = None) -> tuple:
+        """Return the frames of a load case, or all the frames, and the index of their frame values, built once
+        and rebuilt when frames are added."""
+        from .FrameIndex import FrameIndex
+
+        frames = self.frames
+        key = (len(frames), id(frames[-1]) if frames else None)
+        indices = self.__dict__.setdefault("_frameIndices", {})
+        name = None if loadCase is None else getattr(loadCase, "name", id(loadCase))
+        if name not in indices or indices[name][0] != key:
+            if loadCase is not None:
+                frames = [frame for frame in frames if frame.loadCase is loadCase
+                          or getattr(frame.loadCase, "name", None) == name]  # fmt: skip
+            indices[name] = (key, frames, FrameIndex([frame.frameValue for frame in frames]))
+        return indices[name][1:]
 
     def getHistoryRegion(self, point: HistoryPoint, loadCase: OdbLoadCase = OdbLoadCase("loadCase")) -> HistoryRegion:
         """This method retrieves a HistoryRegion object associated with a HistoryPoint in the model.
@@ -284,7 +358,19 @@ class OdbStepBase:
         OdbError
             HistoryRegion not found, If a HistoryRegion object is not found.
         """
-        return HistoryRegion("", "", point)
+        cached = getattr(self, "_historyIndex", None)
+        if cached is None or cached[0] != len(self.historyRegions):
+            # Hash index of the regions by the labels and names of their points and their load case
+            index: dict = {}
+            for region in self.historyRegions.values():
+                if hasattr(region.point, "_key"):
+                    index.setdefault((region.point._key(), getattr(region.loadCase, "name", region.loadCase)), region)
+            cached = self._historyIndex = (len(self.historyRegions), index)
+        key = point._key()
+        found = cached[1].get((key, getattr(loadCase, "name", loadCase))) or cached[1].get((key, None))
+        if found is None:
+            raise ValueError("HistoryRegion not found")
+        return found
 
     @abaqus_method_doc
     def setDefaultDeformedField(self, field: FieldOutput) -> None:
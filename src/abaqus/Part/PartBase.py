@@ -54,7 +54,11 @@ from .AcisFile import AcisFile
 from .PartFeature import PartFeature
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from ..Assembly.PartInstance import PartInstance
+    from ..Mesh.MeshAdjacency import MeshAdjacency
+    from ..Mesh.MeshArrays import MeshArrays
 
 
 class PartBase(PartFeature):
@@ -180,6 +184,12 @@ class PartBase(PartFeature):
     #: A MeshEdgeArray object specifying all the unique element edges in the part.
     elementEdges: MeshEdgeArray = MeshEdgeArray([])
 
+    #: A MeshArrays object storing the orphan mesh of the part as arrays, None if the part has no array mesh.
+    _mesh: MeshArrays | None = None
+
+    #: A tuple of the dimensionality, type and twist of the part.
+    _partType: tuple = (C.THREE_D, C.DEFORMABLE_BODY, OFF)
+
     @overload
     @abaqus_method_doc
     def __init__(
@@ -270,6 +280,29 @@ class PartBase(PartFeature):
     @abaqus_method_doc
     def __init__(self, *args, **kwargs): ...
 
+    def _setMesh(self, mesh: MeshArrays, partType: tuple):
+        """Store the orphan mesh of the part as arrays and expose it through the nodes and elements members."""
+        self._mesh, self._partType = mesh, partType
+        self.nodes, self.elements = mesh.nodeArray(), mesh.elementArray()
+
+    def adjacency(self) -> MeshAdjacency:
+        """This method returns the node to element adjacency of the orphan mesh of the part, built on the first
+        call and cached until the mesh changes.
+
+        Returns
+        -------
+        MeshAdjacency
+            A MeshAdjacency object.
+
+        Raises
+        ------
+        ValueError
+            If the part does not contain an orphan mesh stored as arrays.
+        """
+        if self._mesh is None:
+            raise ValueError("The part does not contain an orphan mesh stored as arrays")
+        return self._mesh.adjacency()
+
     def PartFromBooleanCut(self, name: str, instanceToBeCut: str, cuttingInstances: Sequence[PartInstance]):
         """This method creates a Part in the parts repository after subtracting or cutting the geometries of a
         group of part instances from that of a base part instance.
@@ -550,7 +583,15 @@ class PartBase(PartFeature):
             - If the part does not contain a mesh:
               The current part does not contain a mesh for a mesh part.
         """
-        ...
+        from .Part import Part
+
+        if self._mesh is None:
+            raise ValueError("The current part does not contain a mesh for a mesh part.")
+        part = Part(name, *self._partType)
+        part._setMesh(self._mesh.copy(), self._partType)
+        if copySets:
+            part.sets, part.surfaces = dict(self.sets), dict(self.surfaces)
+        return part
 
     @abaqus_method_doc
     def PartFromMeshMirror(self, name: str, part: "PartBase", point1: tuple, point2: tuple):
@@ -625,12 +666,14 @@ class PartBase(PartFeature):
         nodes
             A sequence of (*nodeLabels*, **nodeCoords**) specifying the nodes of the mesh.
             **nodeLabels** is a sequence of Ints specifying the node labels, and **nodeCoords** is a
-            sequence of sequences of three Floats specifying the nodal coordinates.
+            sequence of sequences of three Floats specifying the nodal coordinates. Both members can
+            also be arrays.
         elements
             A sequence of sequences of(*meshType*, **elementLabels**, **elementConns**) specifying the
             elements of the mesh. **meshType** is a String specifying the element type.
             **elementlabels** is a sequence of Ints specifying the element labels. **elementConns** is a
-            sequence of sequences of node labels specifying the element connectivity.
+            sequence of sequences of node labels specifying the element connectivity. The labels and
+            connectivity can also be arrays, see :meth:`PartFromArrays` for mixed element types.
         twist
             A boolean specifying whether the part is defined with twist. This option has meaning
             only when **dimensionality** = AXISYMMETRIC. Possible values are ON and OFF. The default
@@ -641,7 +684,78 @@ class PartBase(PartFeature):
         part: Part
             A Part object
         """
-        ...
+        from ..Mesh.MeshArrays import MeshArrays
+        from .Part import Part
+
+        part = Part(name, dimensionality, type, twist)
+        part._setMesh(MeshArrays.fromNodesAndElements(nodes, elements), (dimensionality, type, twist))
+        return part
+
+    def PartFromArrays(
+        self,
+        name: str,
+        dimensionality: Literal[C.THREE_D, C.AXISYMMETRIC, C.TWO_D_PLANAR],
+        type: Literal[C.EULERIAN, C.DISCRETE_RIGID_SURFACE, C.DEFORMABLE_BODY, C.ANALYTIC_RIGID_SURFACE],
+        coordinates: NDArray,
+        connectivity: NDArray,
+        elementTypeCodes: NDArray | int,
+        elementTypes: Sequence[str],
+        nodeLabels: NDArray | None = None,
+        elementLabels: NDArray | None = None,
+        twist: Boolean = OFF,
+    ):
+        """This method creates an orphan mesh Part object from bulk node and element arrays. It is the array
+        counterpart of :meth:`PartFromNodesAndElements`, the nodes and elements are stored as arrays and no
+        MeshNode or MeshElement object is created.
+
+        Parameters
+        ----------
+        name
+            A String specifying the repository key.
+        dimensionality
+            A SymbolicConstant specifying the dimensionality of the part. Possible values are
+            THREE_D, TWO_D_PLANAR, and AXISYMMETRIC.
+        type
+            A SymbolicConstant specifying the type of the part. Possible values are DEFORMABLE_BODY,
+            EULERIAN, DISCRETE_RIGID_SURFACE, and ANALYTIC_RIGID_SURFACE.
+        coordinates
+            An (N, 3) array of Floats specifying the nodal coordinates.
+        connectivity
+            An (M, k) array of Ints specifying the node labels of each element. Rows of element types with
+            fewer than k nodes are padded with zeros.
+        elementTypeCodes
+            An (M,) array of Ints specifying the index of the element type of each element in
+            **elementTypes**, or a single Int if all elements have the same type.
+        elementTypes
+            A sequence of Strings specifying the element types, such as ``C3D8R``.
+        nodeLabels
+            An (N,) array of Ints specifying the node labels. The default is 1 to N.
+        elementLabels
+            An (M,) array of Ints specifying the element labels. The default is 1 to M.
+        twist
+            A boolean specifying whether the part is defined with twist. This option has meaning
+            only when **dimensionality** = AXISYMMETRIC. Possible values are ON and OFF. The default
+            value is OFF.
+
+        Returns
+        -------
+        part: Part
+            A Part object
+
+        Raises
+        ------
+        ValueError
+            If the labels are not unique, an element references a node that does not exist, or the number of
+            nodes of an element does not match its element type.
+        """
+        from ..Mesh.MeshArrays import MeshArrays
+        from .Part import Part
+
+        mesh = MeshArrays.fromArrays(coordinates, connectivity, elementTypeCodes, elementTypes, nodeLabels,
+                                     elementLabels)  # fmt: skip
+        part = Part(name, dimensionality, type, twist)
+        part._setMesh(mesh, (dimensionality, type, twist))
+        return part
 
     @abaqus_method_doc
     def PartFromOdb(
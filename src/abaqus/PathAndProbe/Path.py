@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-from typing import Sequence, Union
+from typing import TYPE_CHECKING, Sequence, Union
 
 from typing_extensions import Literal
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
-from ..UtilityAndView.abaqusConstants import SymbolicConstant
+from ..UtilityAndView.abaqusConstants import (
+    CIRCLE_RADIUS,
+    CIRCUMFERENTIAL,
+    NODE_LIST,
+    POINT_ARC,
+    POINT_LIST,
+    RADIAL,
+    SymbolicConstant,
+)
 from ..UtilityAndView.abaqusConstants import abaqusConstants as C
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
+    from ..Odb.Odb import Odb
+
 
 @abaqus_class_doc
 class Path:
@@ -187,4 +200,102 @@ class Path:
             When **type** = CIRCUMFERENTIAL or RADIAL, the three points specified in
             **expression** are collinear.
         """
-        ...
+        self.name = name
+        self.type = type
+        self.expression = expression
+        self.circleDefinition = circleDefinition
+        self.numSegments = numSegments
+        self.startAngle = startAngle
+        self.endAngle = endAngle
+        self.radius = radius
+        self.radialAngle = radialAngle
+        self.startRadius = startRadius
+        self.endRadius = endRadius
+
+    def points(self, odb: Odb | None = None) -> ndarray:
+        """This method returns the coordinates of the points defining the path.
+
+        Parameters
+        ----------
+        odb
+            An Odb object providing the node coordinates of a path of **type** = NODE_LIST.
+
+        Returns
+        -------
+        ndarray
+            An (n, 3) float array with the coordinates of the path points in order. For circumferential and
+            radial paths the points are the ends of the **numSegments** segments.
+
+        Raises
+        ------
+        ValueError
+            If the path is of **type** = EDGE_LIST, or of **type** = NODE_LIST and no Odb is given or a node
+            does not exist.
+        """
+        import numpy as np
+
+        if self.type == POINT_LIST:
+            return np.asarray(self.expression, dtype=np.float64).reshape(-1, 3)
+        if self.type == NODE_LIST:
+            if odb is None:
+                raise ValueError(f"An output database is required to find the nodes of path {self.name}")
+            points = [mesh.coordinates[nodes] for mesh, nodes in self._nodes(odb)]
+            return np.concatenate(points) if points else np.zeros((0, 3))
+        if self.type not in (CIRCUMFERENTIAL, RADIAL):
+            raise ValueError(f"Points of a path of type {self.type} are not supported")
+        origin, axes, radius = self._circle()
+        if self.type == CIRCUMFERENTIAL:
+            radius = radius if self.radius == CIRCLE_RADIUS else float(self.radius)
+            angles = np.radians(np.linspace(self.startAngle, self.endAngle, self.numSegments + 1))
+            return origin + radius * (np.outer(np.cos(angles), axes[0]) + np.outer(np.sin(angles), axes[1]))
+        start = radius if self.startRadius == CIRCLE_RADIUS else float(self.startRadius)
+        end = radius if self.endRadius == CIRCLE_RADIUS else float(self.endRadius)
+        angle = np.radians(self.radialAngle)
+        direction = np.cos(angle) * axes[0] + np.sin(angle) * axes[1]
+        return origin + np.outer(np.linspace(start, end, self.numSegments + 1), direction)
+
+    def _nodes(self, odb: Odb) -> list[tuple]:
+        """Return the instance mesh and the node indices of each part of a path of **type** = NODE_LIST."""
+        nodes = []
+        for instanceName, labels in self.expression:
+            mesh = odb.rootAssembly.instances[instanceName]._meshArrays()
+            nodes.append((mesh, mesh.nodesFromLabels(_labels(labels))))
+        return nodes
+
+    def _circle(self) -> tuple:
+        """Return the center, the in-plane axes and the radius of the circle of a circumferential or radial path."""
+        import numpy as np
+
+        p1, p2, p3 = np.asarray(self.expression, dtype=np.float64).reshape(3, 3)
+        if self.circleDefinition == POINT_ARC:
+            a, b = p1 - p3, p2 - p3
+            normal = np.cross(a, b)
+            if np.linalg.norm(normal) <= 1e-12 * max(np.dot(a, a), np.dot(b, b)):
+                raise ValueError(f"The points defining path {self.name} are collinear")
+            center = p3 + np.cross(np.dot(a, a) * b - np.dot(b, b) * a, normal) / (2 * np.dot(normal, normal))
+            axis, x = normal / np.linalg.norm(normal), p1 - center
+        else:
+            axis = p2 - p1
+            if np.linalg.norm(axis) == 0:
+                raise ValueError(f"The axis of path {self.name} is undefined")
+            axis = axis / np.linalg.norm(axis)
+            center = p1 + axis * np.dot(p3 - p1, axis)
+            x = p3 - center
+            if np.linalg.norm(x) <= 1e-12 * np.linalg.norm(p3 - p1):
+                raise ValueError(f"The points defining path {self.name} are collinear")
+        radius = float(np.linalg.norm(x))
+        x = x / radius
+        return center, np.stack([x, np.cross(axis, x), axis]), radius
+
+
+def _labels(labels: Sequence) -> list[int]:
+    """Expand a sequence of Ints and range Strings such as '1:9:2' into node labels."""
+    result: list[int] = []
+    for label in labels:
+        if isinstance(label, str):
+            bounds = [int(value) for value in label.split(":")]
+            start, stop, step = bounds[0], bounds[min(1, len(bounds) - 1)], bounds[2] if len(bounds) > 2 else 1
+            result.extend(range(start, stop + (1 if step > 0 else -1), step))
+        else:
+            result.append(int(label))
+    return result
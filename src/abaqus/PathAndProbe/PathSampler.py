@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+
+from ..FieldReport.FieldReportBlock import FieldReportBlock
+from ..FieldReport.FieldReportWriter import fieldReportBlocks, refineBlock
+from ..Mesh.ElementLocator import ElementLocator
+from ..Odb.FieldExtrapolator import extrapolateBulkData
+from ..UtilityAndView.abaqusConstants import (
+    DEFORMED,
+    ELEMENT_NODAL,
+    INTEGRATION_POINT,
+    NODAL,
+    NODE_LIST,
+    NORM_DISTANCE,
+    PATH_POINTS,
+    SEQ_ID,
+    TRUE_DISTANCE,
+    TRUE_DISTANCE_X,
+    TRUE_DISTANCE_Y,
+    TRUE_DISTANCE_Z,
+    UNDEFORMED,
+    UNIFORM_SPACING,
+    X_COORDINATE,
+    Y_COORDINATE,
+    Z_COORDINATE,
+    SymbolicConstant,
+)
+from .Path import Path
+
+if TYPE_CHECKING:
+    from ..Odb.Odb import Odb
+
+
+class PathSampler:
+    """The PathSampler object extracts field output values along a path through the mesh of an output database.
+
+    The sample points are located once per configuration: each point is found in the mesh of the part instances
+    with an :class:`~abaqus.Mesh.ElementLocator.ElementLocator` and the values are interpolated with the shape
+    functions of the containing element, for all points at once. Integration point values are extrapolated to the
+    nodes of each element with :func:`~abaqus.Odb.FieldExtrapolator.extrapolateBulkData` and interpolated from
+    these element nodal values, centroidal and whole element values are constant over each element. With the
+    UNDEFORMED shape the location is reused for all frames, so sampling many frames only costs one interpolation per
+    frame and variable.
+    """
+
+    #: An Odb object specifying the output database.
+    odb: Odb
+
+    #: A Path object specifying the path.
+    path: Path
+
+    #: A SymbolicConstant specifying the model shape to use. Possible values are UNDEFORMED and DEFORMED.
+    shape: SymbolicConstant = UNDEFORMED
+
+    #: A SymbolicConstant specifying the path style. Possible values are PATH_POINTS and UNIFORM_SPACING.
+    pathStyle: SymbolicConstant = PATH_POINTS
+
+    #: An Int specifying the number of uniform-spacing intervals.
+    numIntervals: int = 10
+
+    #: A tuple of three Floats specifying the deformation magnitude in the X-, Y-, and Z- directions.
+    deformedMag: tuple = (1.0, 1.0, 1.0)
+
+    #: A Float specifying the distance within which points outside the mesh are projected onto the mesh.
+    projectionTolerance: float = 0.0
+
+    def __init__(
+        self,
+        odb: Odb,
+        path: Path,
+        shape: SymbolicConstant = UNDEFORMED,
+        pathStyle: SymbolicConstant = PATH_POINTS,
+        numIntervals: int = 10,
+        deformedMag: Sequence[float] | None = None,
+        projectionTolerance: float = 0.0,
+    ):
+        """This method creates a PathSampler object.
+
+        Parameters
+        ----------
+        odb
+            An Odb object specifying the output database.
+        path
+            A Path object specifying the path.
+        shape
+            A SymbolicConstant specifying the model shape to use. Possible values are UNDEFORMED and DEFORMED.
+            The default value is UNDEFORMED.
+        pathStyle
+            A SymbolicConstant specifying the path style. Possible values are PATH_POINTS and UNIFORM_SPACING.
+            The default value is PATH_POINTS.
+        numIntervals
+            An Int specifying the number of uniform-spacing intervals. The default value is 10.
+        deformedMag
+            A tuple of three Floats specifying the deformation magnitude in the X-, Y-, and Z- directions. The
+            default value is (1, 1, 1).
+        projectionTolerance
+            A Float specifying the distance within which points outside the mesh are projected onto the mesh.
+            The default value is 0.0.
+        """
+        self.odb, self.path, self.shape, self.pathStyle = odb, path, shape, pathStyle
+        self.numIntervals, self.projectionTolerance = int(numIntervals), float(projectionTolerance)
+        self.deformedMag = (1.0, 1.0, 1.0) if deformedMag is None else tuple(float(mag) for mag in deformedMag)
+        if len(self.deformedMag) != 3:
+            raise ValueError("Deformed magnification tuple must contain X, Y and Z values")
+        self._locations: dict | None = None
+
+    def sample(
+        self,
+        variable: Sequence,
+        frames: Sequence[tuple[int, int]],
+        labelType: SymbolicConstant = TRUE_DISTANCE,
+        removeDuplicateXYPairs: bool = True,
+    ) -> list[list[tuple[str, tuple]]]:
+        """This method samples field output variables along the path in several frames.
+
+        Parameters
+        ----------
+        variable
+            A sequence of variable description sequences as accepted by ``XYDataFromPath``.
+        frames
+            A sequence of (step, frame) pairs of Ints specifying the indices of the steps and frames.
+        labelType
+            A SymbolicConstant specifying the X label type to use. Possible values are NORM_DISTANCE, SEQ_ID,
+            TRUE_DISTANCE, TRUE_DISTANCE_X, TRUE_DISTANCE_Y, TRUE_DISTANCE_Z, X_COORDINATE, Y_COORDINATE and
+            Z_COORDINATE. The default value is TRUE_DISTANCE.
+        removeDuplicateXYPairs
+            A Boolean specifying whether to remove consecutive duplicate X - Y pairs. The default value is True.
+
+        Returns
+        -------
+        list[list[tuple[str, tuple]]]
+            For each frame a list of (name, data) pairs, one for each component or invariant of the variables,
+            where data is a tuple of X - Y pairs. Points outside the mesh are omitted.
+        """
+        result = []
+        for step, frame in frames:
+            points, instances = self._locate(step, frame)
+            xValues = pathLabels(points, labelType)
+            # Gather the values of each column per instance, per node, per element node or per element
+            fields: dict[tuple, tuple] = {}
+            for block, nodeLabels in self._blocks(step, frame, variable):
+                if block.instanceName not in instances:
+                    continue
+                mesh = instances[block.instanceName][0]
+                if block.position == NODAL:
+                    size, rows = mesh.numNodes, mesh.nodesFromLabels(block.labels)
+                elif block.position == ELEMENT_NODAL:
+                    elements, nodes = mesh.elementsFromLabels(block.labels), mesh.nodesFromLabels(nodeLabels)
+                    slots = np.argmax(mesh.connectivity[elements] == nodes[:, None], axis=1)
+                    size, rows = mesh.connectivity.size, elements * mesh.connectivity.shape[1] + slots
+                else:
+                    size, rows = mesh.numElements, mesh.elementsFromLabels(block.labels)
+                for column, name in enumerate(block.columns):
+                    sums, counts = fields.setdefault(
+                        (name, block.instanceName, block.position), (np.zeros(size), np.zeros(size))
+                    )
+                    np.add.at(sums, rows, block.data[:, column])
+                    np.add.at(counts, rows, 1.0)
+            columns: dict[str, np.ndarray] = {}
+            for (name, instanceName, position), (sums, counts) in fields.items():
+                mesh, locator, elements, natural = instances[instanceName]
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    means = sums / counts
+                if position == NODAL:
+                    sampled = locator.interpolate(elements, natural, means)
+                elif position == ELEMENT_NODAL:
+                    sampled = locator.interpolateElementNodal(elements, natural, means.reshape(mesh.connectivity.shape))
+                else:
+                    sampled = np.where(elements >= 0, means[np.maximum(elements, 0)], np.nan)
+                values = columns.setdefault(name, np.full(len(points), np.nan))
+                update = np.isnan(values) & ~np.isnan(sampled)
+                values[update] = sampled[update]
+            frameData = []
+            for name, values in columns.items():
+                valid = ~np.isnan(values)
+                pairs = np.column_stack([xValues[valid], values[valid]])
+                if removeDuplicateXYPairs and len(pairs) > 1:
+                    pairs = pairs[np.concatenate(([True], np.any(pairs[1:] != pairs[:-1], axis=1)))]
+                frameData.append((name, tuple(map(tuple, pairs.tolist()))))
+            result.append(frameData)
+        return result
+
+    def samplePoints(self, step: int = -1, frame: int = -1) -> np.ndarray:
+        """This method returns the coordinates of the sample points of the path in the configuration of a frame.
+
+        Parameters
+        ----------
+        step
+            An Int specifying the index of the step, used for the DEFORMED shape. The default is the last step.
+        frame
+            An Int specifying the index of the frame, used for the DEFORMED shape. The default is the last frame.
+
+        Returns
+        -------
+        np.ndarray
+            A (P, 3) float array with the coordinates of the sample points.
+        """
+        points = self.path.points(self.odb)
+        if self.shape == DEFORMED and self.path.type == NODE_LIST:
+            # Node paths follow the deformation of their nodes
+            displacements = self._displacements(step, frame)
+            offsets = [displacements[name][nodes] if name in displacements else np.zeros((len(nodes), 3))
+                       for (name, _), (_, nodes) in zip(self.path.expression, self.path._nodes(self.odb))]  # fmt: skip
+            points = points + np.concatenate(offsets) if offsets else points
+        if self.pathStyle == UNIFORM_SPACING and len(points) > 1:
+            lengths = np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))))
+            positions = np.linspace(0.0, lengths[-1], self.numIntervals + 1)
+            points = np.column_stack([np.interp(positions, lengths, points[:, axis]) for axis in range(3)])
+        return points
+
+    def _locate(self, step: int, frame: int) -> tuple[np.ndarray, dict]:
+        """Locate the sample points in the mesh of each part instance, first instance first."""
+        if self.shape != DEFORMED and self._locations is not None:
+            return self._locations["points"], self._locations["instances"]
+        points = self.samplePoints(step, frame)
+        displacements = self._displacements(step, frame) if self.shape == DEFORMED else {}
+        missing = np.ones(len(points), dtype=bool)
+        instances = {}
+        for name, instance in self.odb.rootAssembly.instances.items():
+            mesh = instance._meshArrays()
+            coordinates = mesh.coordinates + displacements[name] if name in displacements else None
+            locator = ElementLocator(mesh, coordinates)
+            elements = np.full(len(points), -1, dtype=np.int64)
+            natural = np.zeros((len(points), 3))
+            elements[missing], natural[missing] = locator.locate(points[missing], self.projectionTolerance)
+            missing &= elements < 0
+            instances[name] = (mesh, locator, elements, natural)
+        if self.shape != DEFORMED:
+            self._locations = {"points": points, "instances": instances}
+        return points, instances
+
+    def _blocks(self, step: int, frame: int, variable: Sequence):
+        """Yield the refined FieldReportBlock objects of the variables in a frame with the node labels of their rows,
+        integration point values being extrapolated to element nodal values."""
+        stepName, odbStep = list(self.odb.steps.items())[step]
+        odbFrame = odbStep.frames[frame]
+        for description in variable:
+            name, refinements = description[0], description[2] if len(description) > 2 else ()
+            bulkDataBlocks = list(getattr(odbFrame.fieldOutputs[name], "bulkDataBlocks", ()))
+            integrationPoints = [bulkData for bulkData in bulkDataBlocks if bulkData.position == INTEGRATION_POINT]
+            if integrationPoints:
+                bulkDataBlocks = [bulkData for bulkData in bulkDataBlocks if bulkData.position != INTEGRATION_POINT]
+                bulkDataBlocks += extrapolateBulkData(integrationPoints, ELEMENT_NODAL)
+            for bulkData in bulkDataBlocks:
+                block = FieldReportBlock.fromBulkData(bulkData, name, stepName, odbFrame.description)
+                yield refineBlock(block, refinements) if refinements else block, bulkData.nodeLabels
+
+    def _displacements(self, step: int, frame: int) -> dict[str, np.ndarray]:
+        """Return the scaled nodal displacements of each part instance in a frame."""
+        displacements: dict[str, np.ndarray] = {}
+        for block in fieldReportBlocks(self.odb, step, frame, (("U", NODAL),)):
+            mesh = self.odb.rootAssembly.instances[block.instanceName]._meshArrays()
+            values = displacements.setdefault(block.instanceName, np.zeros((mesh.numNodes, 3)))
+            values[mesh.nodesFromLabels(block.labels), : min(3, block.data.shape[1])] = block.data[:, :3]
+        for values in displacements.values():
+            values *= self.deformedMag
+        return displacements
+
+
+def pathLabels(points: np.ndarray, labelType: SymbolicConstant = TRUE_DISTANCE) -> np.ndarray:
+    """Return the X-values of the points of a path for a label type of ``XYDataFromPath``.
+
+    Raises
+    ------
+    ValueError
+        If the label type is not supported.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    steps = np.diff(points, axis=0)
+    axes = {TRUE_DISTANCE_X: 0, TRUE_DISTANCE_Y: 1, TRUE_DISTANCE_Z: 2, X_COORDINATE: 0, Y_COORDINATE: 1,
+            Z_COORDINATE: 2}  # fmt: skip
+    if labelType == SEQ_ID:
+        return np.arange(1.0, len(points) + 1.0)
+    if labelType in (X_COORDINATE, Y_COORDINATE, Z_COORDINATE):
+        return points[:, axes[labelType]].copy()
+    if labelType in (TRUE_DISTANCE_X, TRUE_DISTANCE_Y, TRUE_DISTANCE_Z):
+        return np.concatenate(([0.0], np.cumsum(np.abs(steps[:, axes[labelType]]))))
+    if labelType not in (TRUE_DISTANCE, NORM_DISTANCE):
+        raise ValueError(f"Unsupported label type {labelType}")
+    distances = np.concatenate(([0.0], np.cumsum(np.linalg.norm(steps, axis=1))))
+    if labelType == NORM_DISTANCE and distances[-1] > 0:
+        distances /= distances[-1]
+    return distances
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import ON, Boolean
@@ -15,9 +17,18 @@ class MemoryReductionOptions:
             session.memoryReductionOptions
     """
 
+    #: A Boolean specifying whether Abaqus/CAE should run in reduced memory mode. The default
+    #: value is ON.
+    reducedMemoryMode: Boolean = ON
+
+    #: A Float specifying the percent of **kernelMemoryLimit** at which the reduced memory mode
+    #: starts. The default value is 75.0.
+    percentThreshold: float = 75
+
     @abaqus_method_doc
-    def setValues(self, reducedMemoryMode: Boolean = ON, percentThreshold: float = 75):
-        """This method modifies the MemoryReductionOptions object.
+    def setValues(self, reducedMemoryMode: Boolean | None = None, percentThreshold: float | None = None):
+        """This method modifies the MemoryReductionOptions object. The memory budget of the output databases
+        opened by the session follows the new options.
 
         Parameters
         ----------
@@ -28,4 +39,12 @@ class MemoryReductionOptions:
             A Float specifying the percent of **kernelMemoryLimit** at which the reduced memory mode
             starts. The default value is 75.0.
         """
-        ...
+        from abaqus import session
+
+        if reducedMemoryMode is not None:
+            self.reducedMemoryMode = reducedMemoryMode
+        if percentThreshold is not None:
+            self.percentThreshold = percentThreshold
+        cache = session.__dict__.get("_odbCache")
+        if cache is not None and session.memoryReductionOptions is self:
+            cache.setValues(memoryLimit=session._odbMemoryLimit())
@@ -81,4 +81,4 @@ class NumberFormat:
         NumberFormat
             A NumberFormat object.
         """
-        ...
+        self.blankPad, self.format, self.numDigits, self.precision = blankPad, format, numDigits, precision
@@ -317,7 +317,20 @@ class SessionBase:
             less than the physical amount of memory on the machine.The minimum setting allowed is
             256 MB.
         """
-        ...
+        self.kernelMemoryLimit = kernelMemoryLimit
+        cache = self.__dict__.get("_odbCache")
+        if cache is not None:
+            cache.setValues(memoryLimit=self._odbMemoryLimit())
+
+    def _odbMemoryLimit(self) -> float | None:
+        """Return the memory budget of the open output databases in megabytes: **kernelMemoryLimit**, reduced to
+        its **percentThreshold** in reduced memory mode, or None if there is no limit."""
+        if self.kernelMemoryLimit is None:
+            return None
+        options = self.memoryReductionOptions
+        if options.reducedMemoryMode:
+            return self.kernelMemoryLimit * options.percentThreshold / 100
+        return float(self.kernelMemoryLimit)
 
     @abaqus_method_doc
     def enableCADConnection(self, CADName: str, portNum: int | None = None):
@@ -1,10 +1,24 @@
 from __future__ import annotations
 
+import weakref
+from typing import TYPE_CHECKING, Sequence
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ..Material.behaviorValues import freezeTable
 from ..UtilityAndView.abaqusConstants import OFF, Boolean, SymbolicConstant
 from .PropertyTableData import PropertyTableData
 
+if TYPE_CHECKING:  # to avoid importing numpy at runtime
+    from numpy import ndarray
+
+    from ..Material.MaterialTable import MaterialTable
+
+#: The default tolerance to regularize the property table data.
+REGULARIZE_TOLERANCE = 0.03
+
+_indices: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
 @abaqus_class_doc
 class PropertyTable:
@@ -67,7 +81,10 @@ class PropertyTable:
         ------
         RangeError
         """
-        ...
+        self.name = name
+        self.properties = properties
+        self.variables = variables
+        self.propertyTableDatas = {}
 
     @abaqus_method_doc
     def setValues(self, variables: str = ""):
@@ -86,7 +103,7 @@ class PropertyTable:
         ------
         RangeError
         """
-        ...
+        self.variables = variables
 
     @abaqus_method_doc
     def PropertyTableData(
@@ -97,7 +114,7 @@ class PropertyTable:
         isTemp: Boolean = OFF,
         fieldNums: int | None = None,
         regularizeTolerance: str = "",
-        data: str = "",
+        data: Sequence = (),
     ) -> PropertyTableData:
         """This method creates a PropertyTableData object.
 
@@ -138,3 +155,90 @@ class PropertyTable:
             label, regularize, extrapolate, isTemp, fieldNums, regularizeTolerance, data
         )
         return propertyTableData
+
+    def index(self, label: str) -> MaterialTable:
+        """Return the interpolation index of a PropertyTableData object, built once and cached until its data or
+        settings change.
+
+        The columns of the data are the properties, the independent variables, the temperature if **isTemp** is ON
+        and the field variables, the first independent variable varying fastest. Data holding every combination of
+        the values of the independent variables are indexed as a regular grid, other data as nested groups of rows.
+        Values of a variable closer than **regularizeTolerance** times its range are merged if the data are
+        regularized.
+
+        Parameters
+        ----------
+        label
+            A String specifying the label of the PropertyTableData object.
+
+        Returns
+        -------
+        MaterialTable
+            The interpolation index of the data.
+
+        Raises
+        ------
+        ValueError
+            If there is no PropertyTableData object with the label or its extrapolation is not supported.
+        """
+        from ..Material.MaterialTable import MaterialTable
+
+        if label not in self.propertyTableDatas:
+            raise ValueError(f"There is no property table data {label} in the property table {self.name}")
+        tableData = self.propertyTableDatas[label]
+        properties, variables = _names(self.properties), _names(self.variables)
+        extrapolate = str(tableData.extrapolate or "CONSTANT")
+        if extrapolate not in ("CONSTANT", "LINEAR"):
+            raise ValueError(f"Unsupported extrapolation {extrapolate}, expected CONSTANT or LINEAR")
+        regularize = tableData.regularize is not None and str(tableData.regularize) not in ("OFF", "NONE")
+        tolerance = float(tableData.regularizeTolerance or REGULARIZE_TOLERANCE) if regularize else 0.0
+        # The data are stored as nested tuples and recognized by identity, data assigned otherwise by contents
+        values = tableData.data if isinstance(tableData.data, tuple) else freezeTable(tableData.data)
+        key = (properties, variables, extrapolate, tolerance, str(tableData.isTemp), tableData.fieldNums)
+        cached = _indices.get(tableData)
+        if cached is None or cached[1] != key or (cached[0] is not values and cached[0] != values):
+            isTemp, fieldNums = bool(tableData.isTemp), int(tableData.fieldNums or 0)
+            width = len(properties) + len(variables) + isTemp + fieldNums
+            rows: list = list(values)
+            if rows and not isinstance(rows[0], tuple):
+                rows = [values[start : start + width] for start in range(0, len(values), width)]
+            names = (
+                variables + ("temperature",) * isTemp + tuple(f"field{number}" for number in range(1, fieldNums + 1))
+            )
+            linear = names if extrapolate == "LINEAR" else ()
+            table = MaterialTable(rows, len(properties), variables, isTemp, fieldNums, linear, tolerance)
+            cached = _indices[tableData] = (values, key, table)
+        return cached[2]
+
+    def evaluate(self, label: str, points=None, **variables) -> ndarray:
+        """Interpolate the properties of a PropertyTableData object at batches of values of the independent
+        variables, constant or linear outside their range according to its **extrapolate** setting.
+
+        Parameters
+        ----------
+        label
+            A String specifying the label of the PropertyTableData object.
+        points
+            An (n, k) array of Floats specifying the independent variables of the queries, in the order of the
+            columns of the data. Alternatively the variables are given by name as (n,) arrays, the temperature as
+            ``temperature`` and the field variables as ``field1``, ``field2`` and so on or together as an (n, d)
+            array ``fieldVariables``.
+
+        Returns
+        -------
+        ndarray
+            An (n, p) float array of the properties.
+
+        Raises
+        ------
+        ValueError
+            If there is no PropertyTableData object with the label or a variable is not given.
+        """
+        return self.index(label).evaluate(points, **variables)
+
+
+def _names(names) -> tuple:
+    """Return the names of a string array, a single String being one name."""
+    if not names:
+        return ()
+    return (names,) if isinstance(names, str) else tuple(names)
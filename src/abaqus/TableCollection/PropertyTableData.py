@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
+from ..Material.behaviorValues import freezeTable
 from ..UtilityAndView.abaqusConstants import OFF, Boolean, SymbolicConstant
 
 
@@ -29,11 +32,11 @@ class PropertyTableData:
     label: str = ""
 
     #: A SymbolicConstant specifying the type of regularize to the user-defined property data.
-    regularize: SymbolicConstant
+    regularize: SymbolicConstant | None = None
 
     #: A SymbolicConstant specifying the type of extrapolation of dependent variables outside
     #: the specified range of the independent variables.
-    extrapolate: SymbolicConstant
+    extrapolate: SymbolicConstant | None = None
 
     #: A Boolean specifying the dependency of properties on temperature.
     isTemp: Boolean = OFF
@@ -45,8 +48,8 @@ class PropertyTableData:
     regularizeTolerance: str = ""
 
     #: An Array of doubles specifying the values of the properties, the variables mentioned in
-    #: PropertyTable, and the field variables mentioned in PropertyTableData.
-    data: str = ""
+    #: PropertyTable, and the field variables mentioned in PropertyTableData, stored as nested tuples.
+    data: tuple = ()
 
     @abaqus_method_doc
     def __init__(
@@ -57,7 +60,7 @@ class PropertyTableData:
         isTemp: Boolean = OFF,
         fieldNums: int | None = None,
         regularizeTolerance: str = "",
-        data: str = "",
+        data: Sequence = (),
     ):
         """This method creates a PropertyTableData object.
 
@@ -94,7 +97,13 @@ class PropertyTableData:
         ------
         RangeError
         """
-        ...
+        self.label = label
+        self.regularize = regularize
+        self.extrapolate = extrapolate
+        self.isTemp = isTemp
+        self.fieldNums = fieldNums
+        self.regularizeTolerance = regularizeTolerance
+        self.data = freezeTable(data)
 
     @abaqus_method_doc
     def setValues(self, *args, **kwargs):
@@ -107,4 +116,5 @@ class PropertyTableData:
         ------
         RangeError
         """
-        ...
+        for key, value in kwargs.items():
+            setattr(self, key, freezeTable(value) if key == "data" else value)
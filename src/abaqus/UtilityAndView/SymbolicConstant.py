@@ -1981,6 +1981,12 @@ class abaqusConstants(SymbolicConstant, Enum):
     REDUCED_POLYNOMIAL_N4 = "REDUCED_POLYNOMIAL_N4"
     REDUCED_POLYNOMIAL_N5 = "REDUCED_POLYNOMIAL_N5"
     REDUCED_POLYNOMIAL_N6 = "REDUCED_POLYNOMIAL_N6"
+    REDUCED_POLY_N1 = "REDUCED_POLY_N1"
+    REDUCED_POLY_N2 = "REDUCED_POLY_N2"
+    REDUCED_POLY_N3 = "REDUCED_POLY_N3"
+    REDUCED_POLY_N4 = "REDUCED_POLY_N4"
+    REDUCED_POLY_N5 = "REDUCED_POLY_N5"
+    REDUCED_POLY_N6 = "REDUCED_POLY_N6"
     RED_TO_BLUE = "RED_TO_BLUE"
     REEDER = "REEDER"
     REFERENCE = "REFERENCE"
@@ -1935,6 +1935,12 @@ REDUCED_POLYNOMIAL_N3 = abaqusConstants.REDUCED_POLYNOMIAL_N3
 REDUCED_POLYNOMIAL_N4 = abaqusConstants.REDUCED_POLYNOMIAL_N4
 REDUCED_POLYNOMIAL_N5 = abaqusConstants.REDUCED_POLYNOMIAL_N5
 REDUCED_POLYNOMIAL_N6 = abaqusConstants.REDUCED_POLYNOMIAL_N6
+REDUCED_POLY_N1 = abaqusConstants.REDUCED_POLY_N1
+REDUCED_POLY_N2 = abaqusConstants.REDUCED_POLY_N2
+REDUCED_POLY_N3 = abaqusConstants.REDUCED_POLY_N3
+REDUCED_POLY_N4 = abaqusConstants.REDUCED_POLY_N4
+REDUCED_POLY_N5 = abaqusConstants.REDUCED_POLY_N5
+REDUCED_POLY_N6 = abaqusConstants.REDUCED_POLY_N6
 RED_TO_BLUE = abaqusConstants.RED_TO_BLUE
 REEDER = abaqusConstants.REEDER
 REFERENCE = abaqusConstants.REFERENCE
@@ -733,7 +733,7 @@ class XYData(tuple):
         complexAngle: float = 0,
         projectOntoMesh: Boolean = False,
         projectionTolerance: float = 0,
-    ) -> XYData:
+    ) -> XYData | list[XYData]:
         """This method creates an XYData object from path information.
 
         .. note::
@@ -851,7 +851,28 @@ class XYData(tuple):
         ErrorDeformedMagTupleInPathExtract: Deformed magnification tuple must contain X, Y and Z values
             If **deformedMag** does not contain three Floats.
         """
-        return XYData()
+        from abaqus import session
+
+        return session.XYDataFromPath(
+            path,
+            name,
+            includeIntersections,
+            shape,
+            pathStyle,
+            numIntervals,
+            labelType,
+            viewport,
+            removeDuplicateXYPairs,
+            includeAllElements,
+            step,
+            frame,
+            variable,
+            deformedMag,
+            numericForm,
+            complexAngle,
+            projectOntoMesh,
+            projectionTolerance,
+        )
 
     @abaqus_method_doc
     def save(self):
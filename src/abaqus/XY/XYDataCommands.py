@@ -565,7 +565,7 @@ def XYDataFromPath(
     complexAngle: float = 0,
     projectOntoMesh: Boolean = False,
     projectionTolerance: float = 0,
-) -> XYData:
+) -> XYData | list[XYData]:
     """This method creates an XYData object from path information.
 
     .. note::
@@ -683,4 +683,25 @@ def XYDataFromPath(
     ErrorDeformedMagTupleInPathExtract: Deformed magnification tuple must contain X, Y and Z values
         If **deformedMag** does not contain three Floats.
     """
-    return XYData()
+    from abaqus import session
+
+    return session.XYDataFromPath(
+        path,
+        name,
+        includeIntersections,
+        shape,
+        pathStyle,
+        numIntervals,
+        labelType,
+        viewport,
+        removeDuplicateXYPairs,
+        includeAllElements,
+        step,
+        frame,
+        variable,
+        deformedMag,
+        numericForm,
+        complexAngle,
+        projectOntoMesh,
+        projectionTolerance,
+    )
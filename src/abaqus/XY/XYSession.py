@@ -10,6 +10,7 @@ from ..Odb.Odb import Odb
 from ..PathAndProbe.Path import Path
 from ..UtilityAndView.abaqusConstants import (
     FILLED_CIRCLE,
+    FROM_ODB,
     NONE,
     OFF,
     ON,
@@ -1047,7 +1048,7 @@ class XYSession(XYSessionBase):
         complexAngle: float = 0,
         projectOntoMesh: Boolean = False,
         projectionTolerance: float = 0,
-    ) -> XYDataType:
+    ) -> XYDataType | list[XYDataType]:
         """This method creates an XYData object from path information.
 
         .. note::
@@ -1172,6 +1173,49 @@ class XYSession(XYSessionBase):
             If the label specifying the refinement invariant or component is invalid.
         ErrorDeformedMagTupleInPathExtract: Deformed magnification tuple must contain X, Y and Z values
             If **deformedMag** does not contain three Floats.
+
+        Notes
+        -----
+        The sample points are located in the mesh of the part instances with vectorised element location and the
+        values are interpolated with the shape functions of the elements. Integration point values are first
+        extrapolated to the nodes of each element, centroidal and whole element values are constant over each
+        element. A list of XYData objects is returned whenever the variables give more than one curve, such as
+        several components or invariants. Intersections with element faces (**includeIntersections**) and paths
+        of type EDGE_LIST are not supported. Use :class:`~abaqus.PathAndProbe.PathSampler.PathSampler` to
+        sample the same path in many frames.
         """
-        self.xyDataObjects[name] = xyData = XYDataType(())
-        return xyData
+        from ..PathAndProbe.PathSampler import PathSampler
+
+        odb = self._pathOdb(viewport)
+        step, frame = -1 if step is None else step, -1 if frame is None else frame
+        if not variable:
+            raise ValueError("No variable selection for XY data extraction from path")
+        if isinstance(variable[0], str):
+            variable = (variable,)
+        sampler = PathSampler(odb, path, shape, pathStyle, numIntervals, deformedMag,
+                              projectionTolerance if projectOntoMesh else 0.0)  # fmt: skip
+        curves = sampler.sample(variable, [(step, frame)], labelType, bool(removeDuplicateXYPairs))[0]
+        xyDataList = []
+        for column, data in curves:
+            key = name if len(curves) == 1 else f"{name}_{column}"
+            xyData = XYDataType(data)
+            xyData.name, xyData.legendLabel, xyData.data = key, key, data
+            xyData.sourceType, xyData.yValuesLabel = FROM_ODB, column
+            xyData.positionDescription = f"Path {path.name}, step {step}, frame {frame}"
+            self.xyDataObjects[key] = xyData
+            xyDataList.append(xyData)
+        return xyDataList[0] if len(xyDataList) == 1 else xyDataList
+
+    def _pathOdb(self, viewport: str | int = "") -> Odb:
+        """Return the output database displayed in a viewport, or the only open output database."""
+        viewports = getattr(self, "viewports", {})
+        name = viewport or getattr(self, "currentViewportName", "")
+        if isinstance(name, int):
+            name = list(viewports)[name - 1] if 0 < name <= len(viewports) else ""
+        displayed = getattr(viewports.get(name), "displayedObject", None)
+        if displayed is not None and hasattr(displayed, "steps"):
+            return displayed
+        odbs = list(getattr(self, "odbs", {}).values())
+        if len(odbs) == 1:
+            return odbs[0]
+        raise ValueError("Current viewport not found")
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import stat
+import tempfile
+import time
+from typing import Sequence
+
+from typeguard import typechecked
+
+from .config import config
+
+#: The extensions of the job files stored in the cache after a successful analysis
+RESULT_EXTENSIONS = (".odb", ".dat", ".msg", ".sta")
+
+_INPUT = re.compile(rb",\s*input\s*=\s*(\"[^\"]*\"|[^,\s]+)", re.IGNORECASE)
+_SUFFIXES = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+
+
+def normalize_inp(text: bytes) -> bytes:
+    """Normalize an Abaqus input file so that insignificant differences do not change its hash.
+
+    Comment lines (``**``), which hold the generation date and the Abaqus/CAE version, blank lines, trailing whitespace
+    and line endings are removed. Keyword lines are also upper-cased and spaces around their ``,`` and ``=`` separators
+    are removed, since keywords and parameters are case and space insensitive.
+
+    Parameters
+    ----------
+    text : bytes
+        The content of the input file.
+
+    Returns
+    -------
+    bytes
+        The normalized content.
+    """
+    lines = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith(b"**"):
+            continue
+        if line.startswith(b"*"):
+            line = re.sub(rb"\s*([,=])\s*", rb"\1", line).upper()
+        lines.append(line)
+    return b"\n".join(lines) + b"\n"
+
+
+def _keyword_lines(text: bytes):
+    """Yield the keyword lines of an input file, each joined with its continuation lines."""
+    keyword = b""
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith(b"**"):
+            continue
+        if keyword or line.startswith(b"*"):
+            keyword += line
+            if not keyword.endswith(b","):
+                yield keyword
+                keyword = b""
+    if keyword:
+        yield keyword
+
+
+def parse_size(size: int | str) -> int:
+    """Parse a size in bytes, given as an integer or a string with an optional K, M, G or T suffix, e.g. ``'10G'``."""
+    if isinstance(size, int):
+        return size
+    match = re.fullmatch(r"\s*(\d+(?:\.\d*)?)\s*([kmgt]?)i?b?\s*", size.lower())
+    if match is None:
+        raise ValueError(f"Invalid size: {size!r}")
+    return int(float(match.group(1)) * _SUFFIXES[match.group(2)])
+
+
+def _copy(source: str, target: str):
+    """Copy a file, sharing its data blocks on file systems with copy-on-write support such as Btrfs and XFS."""
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        shutil.copyfile(source, target)
+        return
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = copy_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:  # not supported between these file systems
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+            shutil.copyfileobj(src, dst)
+
+
+@typechecked
+class ResultCache:
+    """Content-addressed cache of Abaqus analysis results.
+
+    Each entry is keyed on the SHA-256 hash of the normalized input file (see :func:`normalize_inp`), including the
+    files it reads with the ``INPUT`` parameter of any keyword, such as ``*INCLUDE`` or ``*NODE``, the user subroutine
+    file and the solver options. Files are stored by copying, which shares the data blocks on file systems with
+    copy-on-write support, and restored into the job directory with hard links, so restoring a large output database
+    costs no copy, or by copying when the cache and the job directory are on different file systems. Cached files are
+    read-only, so that writing to a restored file fails instead of corrupting the cache. Entries are evicted in least
+    recently used order when the total size of the cache exceeds its maximum size.
+
+    Parameters
+    ----------
+    directory : str, optional
+        The directory of the cache, by default the ``ABQPY_CACHE_DIR`` environment variable or ``~/.cache/abqpy``.
+    max_size : int or str, optional
+        The maximum size of the cache in bytes or with a K, M, G or T suffix, 0 for no limit, by default the
+        ``ABQPY_CACHE_SIZE`` environment variable or 0.
+    """
+
+    def __init__(self, directory: str | None = None, max_size: int | str | None = None):
+        self.directory = os.path.abspath(os.path.expanduser(directory or config.cache_dir))
+        self.max_size = parse_size(config.cache_size if max_size is None else max_size)
+
+    def key(self, input: str, user: str | None = None, **options: str | int | bool | None) -> str:
+        """Compute the cache key of an analysis.
+
+        Parameters
+        ----------
+        input : str
+            The input file of the analysis.
+        user : str, optional
+            The user subroutine file of the analysis, by default None
+        options
+            The solver options of the analysis, options that are None or False are ignored.
+
+        Returns
+        -------
+        str
+            The hexadecimal SHA-256 hash of the analysis.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the input file or a file it reads with the ``INPUT`` parameter does not exist, the analysis then cannot
+            be cached.
+        """
+        digest = hashlib.sha256()
+        self._hash_inp(digest, os.path.abspath(input), set())
+        if user:
+            with open(user, "rb") as file:
+                digest.update(b"user\0" + hashlib.sha256(file.read()).digest())
+        options = {name: value for name, value in options.items() if value is not None and value is not False}
+        options["abaqus"] = os.environ.get("ABAQUS_BAT_PATH", "abaqus")
+        digest.update(b"options\0" + json.dumps(options, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def lookup(self, key: str) -> dict | None:
+        """Return the metadata of a cache entry and mark it as recently used, or None if the entry does not exist."""
+        entry = self._entry(key)
+        try:
+            with open(os.path.join(entry, "meta.json"), encoding="utf-8") as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not all(os.path.isfile(os.path.join(entry, name)) for name in meta["files"]):
+            return None
+        os.utime(os.path.join(entry, "meta.json"))
+        return meta
+
+    def store(self, key: str, job: str, files: Sequence[str], directory: str = ".") -> dict:
+        """Store the result files of an analysis in the cache.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the analysis, see :meth:`key`.
+        job : str
+            The job name of the analysis, the files starting with it are restored under the job name of later runs.
+        files : Sequence[str]
+            The names of the files to store, relative to **directory**.
+        directory : str, optional
+            The job directory, by default the current working directory.
+
+        Returns
+        -------
+        dict
+            The metadata of the cache entry.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".store-", dir=self.directory)
+        try:
+            names, size = [], 0
+            for name in files:
+                stored = "{job}" + name[len(job) :] if name.startswith(job) else name
+                target = os.path.join(staging, stored)
+                _copy(os.path.join(directory, name), target)
+                os.chmod(target, stat.S_IREAD | stat.S_IRGRP | stat.S_IROTH)
+                names.append(stored)
+                size += os.path.getsize(target)
+            meta = {"key": key, "job": job, "files": names, "size": size, "created": time.time()}
+            with open(os.path.join(staging, "meta.json"), "w", encoding="utf-8") as file:
+                json.dump(meta, file, indent=2)
+            entry = self._entry(key)
+            self._remove(entry)
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            os.replace(staging, entry)
+        except BaseException:
+            self._remove(staging)
+            raise
+        if self.max_size:
+            self.prune(self.max_size)
+        return meta
+
+    def restore(self, key: str, job: str, directory: str = ".") -> list[str] | None:
+        """Restore the result files of a cached analysis into a job directory.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the analysis, see :meth:`key`.
+        job : str
+            The job name under which to restore the files.
+        directory : str, optional
+            The job directory, by default the current working directory.
+
+        Returns
+        -------
+        list[str] or None
+            The names of the restored files, or None if the analysis is not in the cache.
+        """
+        meta = self.lookup(key)
+        if meta is None:
+            return None
+        restored = []
+        for stored in meta["files"]:
+            name = stored.replace("{job}", job, 1)
+            source, target = os.path.join(self._entry(key), stored), os.path.join(directory, name)
+            if os.path.lexists(target):
+                try:
+                    os.remove(target)
+                except PermissionError:  # read-only files cannot be removed on Windows
+                    os.chmod(target, stat.S_IWRITE | stat.S_IREAD)
+                    os.remove(target)
+            try:
+                os.link(source, target)
+            except OSError:
+                _copy(source, target)
+            restored.append(name)
+        return restored
+
+    def entries(self) -> list[dict]:
+        """Return the metadata of all cache entries, most recently used first."""
+        entries: list[dict] = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for prefix in os.scandir(self.directory):
+            if not prefix.is_dir() or prefix.name.startswith("."):
+                continue
+            for entry in os.scandir(prefix.path):
+                try:
+                    with open(os.path.join(entry.path, "meta.json"), encoding="utf-8") as file:
+                        meta = json.load(file)
+                    meta["accessed"] = os.path.getmtime(os.path.join(entry.path, "meta.json"))
+                except (OSError, ValueError):
+                    continue
+                entries.append(meta)
+        return sorted(entries, key=lambda meta: meta["accessed"], reverse=True)
+
+    def info(self) -> dict:
+        """Return the directory, the number of entries, the total size and the maximum size of the cache."""
+        entries = self.entries()
+        return {"directory": self.directory, "entries": len(entries),
+                "size": sum(meta["size"] for meta in entries), "max_size": self.max_size}  # fmt: skip
+
+    def prune(self, max_size: int | str | None = None) -> list[str]:
+        """Evict the least recently used entries until the total size of the cache is at most **max_size**.
+
+        Parameters
+        ----------
+        max_size : int or str, optional
+            The maximum size in bytes or with a K, M, G or T suffix, by default the maximum size of the cache.
+
+        Returns
+        -------
+        list[str]
+            The keys of the evicted entries.
+        """
+        max_size = self.max_size if max_size is None else parse_size(max_size)
+        entries = self.entries()
+        size, evicted = sum(meta["size"] for meta in entries), []
+        while entries and size > max_size:
+            meta = entries.pop()
+            self._remove(self._entry(meta["key"]))
+            size -= meta["size"]
+            evicted.append(meta["key"])
+        return evicted
+
+    def clear(self) -> list[str]:
+        """Remove all entries of the cache and return their keys."""
+        return self.prune(0)
+
+    def _entry(self, key: str) -> str:
+        """Return the directory of a cache entry."""
+        return os.path.join(self.directory, key[:2], key)
+
+    def _hash_inp(self, digest, path: str, visited: set):
+        """Hash a normalized input file followed by the files it reads with the ``INPUT`` parameter of its keywords,
+        in order of appearance."""
+        if path in visited:
+            return
+        visited.add(path)
+        with open(path, "rb") as file:
+            text = file.read()
+        digest.update(b"inp\0" + hashlib.sha256(normalize_inp(text)).digest())
+        for line in _keyword_lines(text):
+            for match in _INPUT.finditer(line):
+                name = match.group(1).strip(b'"').decode()
+                included = os.path.join(os.path.dirname(path), name)
+                if not os.path.isfile(included):
+                    raise FileNotFoundError(f"File {name} read by {path} does not exist")
+                self._hash_inp(digest, included, visited)
+
+    @staticmethod
+    def _remove(path: str):
+        """Remove a directory of the cache, including its read-only files."""
+        if not os.path.exists(path):
+            return
+        for root, _, names in os.walk(path):
+            for name in names:
+                os.chmod(os.path.join(root, name), stat.S_IWRITE | stat.S_IREAD)
+        shutil.rmtree(path)
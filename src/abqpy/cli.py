@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import os
+from typing import Sequence
 
 from typeguard import typechecked
 from typing_extensions import Self
 
+from .cache import RESULT_EXTENSIONS, ResultCache
+
 
 @typechecked
 class AbqpyCLIBase:
@@ -196,6 +200,93 @@ class AbqpyCLI(AbqpyCLIBase):
         self.abaqus("optimization", task=task, job=job, cpus=cpus, gpus=gpus, memory=memory,
                     interactive=interactive, globalmodel=globalmodel, scratch=scratch)  # fmt: skip
 
+    @property
+    def cache(self) -> ResultCache:
+        """Commands to inspect and prune the result cache, see :class:`~abqpy.cache.ResultCache`."""
+        return ResultCache()
+
+    def job(
+        self,
+        job: str,
+        input: str | None = None,
+        user: str | None = None,
+        *,
+        cpus: int | None = None,
+        gpus: int | None = None,
+        memory: str | None = None,
+        double: str | None = None,
+        scratch: str | None = None,
+        post: str | None = None,
+        results: str | Sequence[str] = (),
+        cache: bool = True,
+        **options: str | int | bool | None,
+    ):
+        """Run an Abaqus analysis, or restore its results from the result cache if an identical analysis was run.
+
+        The analysis is identified by its normalized input file, its user subroutine, its post-processing script
+        and its solver options, see :class:`~abqpy.cache.ResultCache`. After a successful analysis the output
+        database, the ``.dat``, ``.msg`` and ``.sta`` files and the **results** files are stored in the cache.
+
+        Parameters
+        ----------
+        job : str
+            The name of the job.
+        input : str, optional
+            The input file of the analysis, by default ``{job}.inp``.
+        user : str, optional
+            The user subroutine file of the analysis, by default None
+        cpus : int, optional
+            The number of processors to use during the analysis.
+        gpus : int, optional
+            The number of GPGPUs to use during the analysis.
+        memory : str, optional
+            Maximum amount of memory or maximum percentage of the physical memory that can be allocated.
+        double : str, optional
+            The precision of Abaqus/Explicit, one of ``explicit``, ``both``, ``off`` or ``constraint``.
+        scratch : str, optional
+            The name of the directory used for scratch files, it is not part of the cache key.
+        post : str, optional
+            A python script run with ``abaqus python`` after the analysis to extract the **results** files.
+        results : str or Sequence[str], optional
+            Additional files produced by the analysis or by the **post** script to store in the cache, for example
+            extracted CSV files.
+        cache : bool, optional
+            Use the result cache, by default True.
+        options
+            Other options to be passed to the Abaqus command.
+        """
+        input = input or f"{job}.inp"
+        results = (results,) if isinstance(results, str) else tuple(results)
+        solver = dict(cpus=cpus, gpus=gpus, memory=memory, double=double, **options)
+        key = None
+        if cache:
+            store, script = ResultCache(), None
+            if post:
+                with open(post, "rb") as file:
+                    script = hashlib.sha256(file.read()).hexdigest()
+            try:
+                key = store.key(input, user, post=script, results=",".join(results), **solver)
+            except FileNotFoundError as error:
+                print(f"Not using the result cache: {error}")
+            restored = None if key is None else store.restore(key, job)
+            if restored is not None:
+                print(f"Restored the results of job {job} from the cache: {', '.join(restored)}")
+                return
+
+        self.abaqus(job=job, input=input, user=user, scratch=scratch, interactive=True, **solver)
+        if post:
+            self.python(post)
+
+        if key is not None:
+            try:
+                with open(f"{job}.sta", "rb") as file:
+                    completed = b"COMPLETED SUCCESSFULLY" in file.read()
+            except OSError:
+                completed = False
+            files = [job + ext for ext in RESULT_EXTENSIONS if os.path.isfile(job + ext)] + list(results)
+            if completed and all(os.path.isfile(file) for file in files):
+                store.store(key, job, files)
+
     def help(self, *args, **options):
         self.abaqus("help", *args, **options)
 
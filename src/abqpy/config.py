@@ -43,6 +43,9 @@ class AbaqusConfig(CompatibleBaseModel):
     skip_abaqus: bool = False
     make_docs: bool = False
     cli_traceback_limit: int = 0
+    cache_dir: str = os.path.join("~", ".cache", "abqpy")
+    cache_size: str = "0"
+    profile: str = ""
 
 
 class AbaqusCommandOptions(AbaqusCAEConfig, AbaqusPythonConfig): ...
@@ -97,4 +100,7 @@ config = AbaqusConfig(
     skip_abaqus=os.environ.get("ABQPY_SKIP_ABAQUS", "false").lower() in trues,
     make_docs=os.environ.get("ABQPY_MAKE_DOCS", "false").lower() in trues,
     cli_traceback_limit=int(os.environ.get("ABQPY_CLI_TRACEBACK_LIMIT", 0)),
+    cache_dir=os.environ.get("ABQPY_CACHE_DIR", os.path.join("~", ".cache", "abqpy")),
+    cache_size=os.environ.get("ABQPY_CACHE_SIZE", "0"),
+    profile=os.environ.get("ABQPY_PROFILE", ""),
 )
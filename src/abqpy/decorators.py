@@ -3,6 +3,7 @@ from functools import partial
 from typing import Tuple
 
 from . import __version__ as version
+from .config import config
 
 
 def class_or_module_link(
@@ -193,6 +194,16 @@ add_link_in_method_docstring = partial(add_link_in_method_or_function_docstring,
 add_link_in_function_docstring = partial(add_link_in_method_or_function_docstring, "function")
 
 
+def profiled(func, name: str, method: bool = False):
+    """Wrap a method or a function with the API call profiler if ``ABQPY_PROFILE`` is set, otherwise return it
+    unchanged, see :mod:`abqpy.profiler`."""
+    if not config.profile:
+        return func
+    from .profiler import profiler
+
+    return func if profiler is None else profiler.wrap(func, name, method)
+
+
 def abaqus_function_doc(func):
     """Add a link to the Abaqus documentation to the docstring of the function."""
     module_name = func.__module__.split(".")[-1]
@@ -203,7 +214,7 @@ def abaqus_function_doc(func):
         prefix="gpr" if module_name.lower().startswith("cae") else "",
         label=f"{module_name}.{func.__name__}",
     )
-    return func
+    return profiled(func, f"{module_name}.{func.__name__}")
 
 
 def _process_class_name(class_name: str) -> str:
@@ -245,7 +256,7 @@ class_suffix = {
 def abaqus_method_doc(method):
     """Add a link to the Abaqus documentation to the docstring of the method."""
     if method.__name__ == "__init__":
-        return method
+        return profiled(method, method.__qualname__, method=True)
     class_name = method.__qualname__.split(".")[0]
     method.__doc__ = add_link_in_method_docstring(
         class_or_module_name=_process_class_name(class_name),
@@ -255,7 +266,7 @@ def abaqus_method_doc(method):
         suffix=class_suffix.get(class_name, ""),
         label=f"{class_name}.{method.__name__}",
     )
-    return method
+    return profiled(method, method.__qualname__, method=True)
 
 
 def abaqus_class_doc(cls):
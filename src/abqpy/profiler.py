@@ -0,0 +1,213 @@
+"""Opt-in profiler of the API calls.
+
+If the ``ABQPY_PROFILE`` environment variable is set, the methods and functions decorated with
+:func:`~abqpy.decorators.abaqus_method_doc` and :func:`~abqpy.decorators.abaqus_function_doc` are wrapped when they
+are defined, and the calls are counted and timed. Otherwise the decorators return the methods and functions
+unchanged, so that they cost nothing.
+
+For every API method the profiler records the number of calls, the cumulative time, the self time, which excludes
+the time spent in nested API calls, and the number of items of the sequence arguments, a hint of the size of the
+calls, such as the number of points passed to ``findAt``. The results are written at exit, depending on the value of
+``ABQPY_PROFILE``:
+
+- ``true``, ``1``, ``on`` or ``yes``: a report sorted by self time is printed to the standard error.
+- A path ending with ``.speedscope.json``: a profile in the speedscope format, see https://www.speedscope.app.
+- A path ending with ``.json``: a trace in the Chrome trace event format, which can be opened with
+  ``chrome://tracing``, Perfetto or speedscope.
+- Any other path: the report is written to the file.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Callable
+
+from .config import config
+
+#: The maximum number of calls recorded for a trace, later calls are only counted.
+MAX_EVENTS = 1_000_000
+
+trues = ["true", "1", "on", "yes"]
+
+
+class CallStats:
+    """The statistics of the calls of an API method or function."""
+
+    __slots__ = ("name", "calls", "total_time", "self_time", "items", "max_items", "active")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.total_time = 0
+        self.self_time = 0
+        self.items = 0
+        self.max_items = 0
+        self.active = 0
+
+
+class Profiler:
+    """Profiler of the API calls, the times are recorded in nanoseconds."""
+
+    def __init__(self, output: str):
+        self.output = output
+        self.stats: dict[str, CallStats] = {}
+        self.events: list[tuple] = []
+        self.dropped = 0
+        self.start = time.perf_counter_ns()
+        self.trace = output.lower().endswith(".json")
+        self._local = threading.local()
+
+    def wrap(self, func: Callable, name: str, method: bool = False) -> Callable:
+        """Wrap a function so that its calls are recorded.
+
+        Parameters
+        ----------
+        func : Callable
+            The function.
+        name : str
+            The name of the function in the report.
+        method : bool
+            Whether the function is a method, whose first argument is not counted in the argument sizes.
+
+        Returns
+        -------
+        Callable
+            The wrapped function.
+        """
+        stats = self.stats.setdefault(name, CallStats(name))
+        local, events, skip = self._local, self.events, 1 if method else 0
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stack = getattr(local, "stack", None)
+            if stack is None:
+                stack = local.stack = []
+            stack.append(0)
+            stats.active += 1
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                stats.active -= 1
+                children = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                items = argument_items(args[skip:], kwargs)
+                stats.calls += 1
+                # Recursive calls are only counted once in the cumulative time
+                stats.total_time += 0 if stats.active else elapsed
+                stats.self_time += elapsed - children
+                stats.items += items
+                stats.max_items = max(stats.max_items, items)
+                if self.trace:
+                    if len(events) < MAX_EVENTS:
+                        events.append((name, start, elapsed, threading.get_ident(), items))
+                    else:
+                        self.dropped += 1
+
+        return wrapper
+
+    def report(self) -> str:
+        """Return the report of the calls, sorted by self time."""
+        stats = sorted((item for item in self.stats.values() if item.calls), key=lambda item: -item.self_time)
+        elapsed = (time.perf_counter_ns() - self.start) / 1e9
+        lines = [
+            f"abqpy profile: {sum(item.calls for item in stats)} calls of {len(stats)} API methods "
+            f"in {elapsed:.3f} s",
+            f"{'calls':>10} {'total s':>11} {'self s':>11} {'per call ms':>12} {'mean items':>11} "
+            f"{'max items':>10}  name",
+        ]
+        for item in stats:
+            lines.append(
+                f"{item.calls:>10} {item.total_time / 1e9:>11.4f} {item.self_time / 1e9:>11.4f} "
+                f"{item.total_time / item.calls / 1e6:>12.4f} {item.items / item.calls:>11.1f} "
+                f"{item.max_items:>10}  {item.name}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def chrome_trace(self) -> dict:
+        """Return the recorded calls in the Chrome trace event format."""
+        pid = os.getpid()
+        events = [
+            {"name": name, "cat": "abqpy", "ph": "X", "ts": (start - self.start) / 1e3, "dur": elapsed / 1e3,
+             "pid": pid, "tid": thread, "args": {"items": items}}
+            for name, start, elapsed, thread, items in self.events
+        ]  # fmt: skip
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"droppedEvents": self.dropped}}
+
+    def speedscope(self) -> dict:
+        """Return the recorded calls in the speedscope format, with an evented profile per thread."""
+        frames: dict[str, int] = {}
+        threads: dict[int, list] = {}
+        for name, start, elapsed, thread, _ in self.events:
+            threads.setdefault(thread, []).append((start - self.start, -elapsed, frames.setdefault(name, len(frames))))
+        profiles = []
+        for thread, calls in threads.items():
+            # Outer calls end after their nested calls, sorting by start and decreasing duration nests them
+            calls.sort()
+            events: list[dict] = []
+            stack: list[tuple[int, int]] = []
+            for start, elapsed, frame in calls:
+                while stack and stack[-1][0] <= start:
+                    end, closed = stack.pop()
+                    events.append({"type": "C", "frame": closed, "at": end})
+                events.append({"type": "O", "frame": frame, "at": start})
+                stack.append((start - elapsed, frame))
+            while stack:
+                end, closed = stack.pop()
+                events.append({"type": "C", "frame": closed, "at": end})
+            profiles.append(
+                {"type": "evented", "name": f"Thread {thread}", "unit": "nanoseconds",
+                 "startValue": events[0]["at"], "endValue": events[-1]["at"], "events": events}
+            )  # fmt: skip
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": [{"name": name} for name in frames]},
+            "profiles": profiles,
+            "exporter": "abqpy",
+        }
+
+    def dump(self):
+        """Write the results to the output given by ``ABQPY_PROFILE``."""
+        if self.output.lower() in trues:
+            sys.stderr.write(self.report())
+            return
+        if self.output.lower().endswith(".speedscope.json"):
+            content = json.dumps(self.speedscope())
+        elif self.trace:
+            content = json.dumps(self.chrome_trace())
+        else:
+            content = self.report()
+        with open(os.path.expanduser(self.output), "w") as file:
+            file.write(content)
+
+
+def argument_items(args: tuple, kwargs: dict) -> int:
+    """Return the total length of the sequence arguments of a call, strings are not counted."""
+    items = 0
+    for value in args + tuple(kwargs.values()):
+        if isinstance(value, (str, bytes)):
+            continue
+        try:
+            items += len(value)
+        except Exception:
+            pass
+    return items
+
+
+def enabled() -> bool:
+    """Whether the API calls are profiled, see ``ABQPY_PROFILE``."""
+    return bool(config.profile) and config.profile.lower() not in ["false", "0", "off", "no"]
+
+
+profiler = Profiler(config.profile) if enabled() else None
+if profiler is not None:
+    atexit.register(profiler.dump)
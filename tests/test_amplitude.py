@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.Amplitude.DecayAmplitude import DecayAmplitude  # noqa: E402
+from abaqus.Amplitude.EquallySpacedAmplitude import EquallySpacedAmplitude  # noqa: E402
+from abaqus.Amplitude.ModulatedAmplitude import ModulatedAmplitude  # noqa: E402
+from abaqus.Amplitude.PeriodicAmplitude import PeriodicAmplitude  # noqa: E402
+from abaqus.Amplitude.SmoothStepAmplitude import SmoothStepAmplitude  # noqa: E402
+from abaqus.Amplitude.TabularAmplitude import TabularAmplitude  # noqa: E402
+from abaqusConstants import SOLVER_DEFAULT, STEP, TOTAL  # noqa: E402
+
+DATA = ((0.0, 0.0), (1.0, 2.0), (3.0, 2.0), (4.0, -1.0))
+
+
+def test_tabular_linear():
+    amplitude = TabularAmplitude("A", DATA, smooth=0.0)
+    times = np.array([-1.0, 0.0, 0.5, 2.0, 3.5, 4.0, 9.0])
+    np.testing.assert_allclose(amplitude.evaluate(times), [0.0, 0.0, 1.0, 2.0, 0.5, -1.0, -1.0])
+    np.testing.assert_allclose(amplitude.evaluate(times), np.interp(times, *zip(*DATA)))
+
+
+def test_tabular_smoothing_is_continuous():
+    amplitude = TabularAmplitude("A", DATA, smooth=0.25)
+    times = np.linspace(0.0, 4.0, 40001)
+    values = amplitude.evaluate(times)
+    slopes = np.diff(values) / np.diff(times)
+    # Values and slopes are continuous, the knots are only rounded within a quarter of the shorter interval
+    assert np.abs(np.diff(values)).max() < 1e-3 and np.abs(np.diff(slopes)).max() < 1e-2
+    np.testing.assert_allclose(amplitude.evaluate([0.5, 2.0, 3.5]), [1.0, 2.0, 0.5])
+
+
+def test_equally_spaced_and_time_span():
+    amplitude = EquallySpacedAmplitude("A", fixedInterval=0.5, data=(0.0, 1.0, 4.0), begin=1.0, smooth=0.0)
+    np.testing.assert_allclose(amplitude.evaluate([1.0, 1.25, 2.0]), [0.0, 0.5, 4.0])
+    # Step time is total time minus the start of the step
+    np.testing.assert_allclose(amplitude.evaluate([11.25], stepStart=10.0), [0.5])
+    amplitude.setValues(timeSpan=TOTAL)
+    np.testing.assert_allclose(amplitude.evaluate([1.25], stepStart=10.0), [0.5])
+
+
+def test_smooth_step():
+    amplitude = SmoothStepAmplitude("A", ((0.0, 0.0), (2.0, 1.0)))
+    np.testing.assert_allclose(amplitude.evaluate([0.0, 1.0, 2.0, 3.0]), [0.0, 0.5, 1.0, 1.0])
+    assert amplitude.evaluate([0.2])[0] == pytest.approx(0.1**3 * (10 - 15 * 0.1 + 6 * 0.1**2))
+
+
+def test_analytical_amplitudes():
+    times = np.linspace(0.0, 3.0, 7)
+    periodic = PeriodicAmplitude("P", frequency=2.0, start=0.5, a_0=1.0, data=((0.5, 0.25), (0.1, -0.2)))
+    expected = [1.0 if t < 0.5 else 1.0 + sum(a * math.cos(n * 2.0 * (t - 0.5)) + b * math.sin(n * 2.0 * (t - 0.5))
+                for n, (a, b) in enumerate(((0.5, 0.25), (0.1, -0.2)), start=1)) for t in times]  # fmt: skip
+    np.testing.assert_allclose(periodic.evaluate(times), expected)
+    decay = DecayAmplitude("D", initial=1.0, maximum=2.0, start=1.0, decayTime=0.5)
+    np.testing.assert_allclose(decay.evaluate([0.0, 1.0, 1.5]), [1.0, 3.0, 1.0 + 2.0 * math.exp(-1.0)])
+    modulated = ModulatedAmplitude("M", initial=0.0, magnitude=2.0, start=0.0, frequency1=1.0, frequency2=3.0)
+    np.testing.assert_allclose(modulated.evaluate(times), 2.0 * np.sin(times) * np.sin(3.0 * times))
+
+
+def test_set_values_keeps_unspecified_arguments():
+    amplitude = TabularAmplitude("A", DATA, smooth=0.1)
+    amplitude.setValues(timeSpan=TOTAL)
+    assert amplitude.smooth == 0.1 and amplitude.timeSpan == TOTAL
+    spaced = EquallySpacedAmplitude("E", fixedInterval=1.0, data=(0.0, 1.0), begin=2.0, smooth=0.1, timeSpan=TOTAL)
+    spaced.setValues(smooth=SOLVER_DEFAULT)
+    assert spaced.begin == 2.0 and spaced.smooth == SOLVER_DEFAULT and spaced.timeSpan == TOTAL
+    periodic = PeriodicAmplitude("P", 1.0, 0.0, 0.0, ((1.0, 0.0),), timeSpan=TOTAL)
+    periodic.setValues()
+    assert periodic.timeSpan == TOTAL
+    periodic.setValues(timeSpan=STEP)
+    assert periodic.timeSpan == STEP
+
+
+def test_set_values_resets_table():
+    amplitude = TabularAmplitude("A", DATA, smooth=0.0)
+    assert amplitude.evaluate([1.0])[0] == pytest.approx(2.0)
+    amplitude.setValues(smooth=0.5)
+    assert amplitude.evaluate([1.0])[0] < 2.0
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.InputFileParser import BlockDispatcher  # noqa: E402
+from abaqus.InputFileParser.InputFile import InputFile  # noqa: E402
+
+
+@pytest.fixture
+def deck(tmp_path, monkeypatch):
+    """An input file whose bulk blocks are split into several chunks by small block and chunk sizes."""
+    monkeypatch.setattr(BlockDispatcher, "MIN_BLOCK_SIZE", 256)
+    monkeypatch.setattr(BlockDispatcher, "CHUNK_SIZE", 200)
+    # Integer coordinates first and floats at the end, the integer chunks are parsed again as floats
+    nodes = "".join(f"{i}, {i}, 0, 0\n" for i in range(1, 40)) + "".join(f"{i}, {i}.5, 1., 0.\n" for i in range(40, 80))
+    # Continued element lines, which must not be split between chunks
+    elements = "".join(
+        f"{i}, {i}, {i + 1}, {i + 2}, {i + 3},\n {i + 4}, {i + 5}, {i + 6}, {i + 7}\n" for i in range(1, 30)
+    )
+    # A set with a short last line is not rectangular, the chunks are parsed again as tuples
+    elset = "".join(f"{i}, {i + 1}, {i + 2}\n" for i in range(1, 120, 3)) + "** comment\n200\n"
+    (tmp_path / "main.inp").write_text(
+        f"*Heading\n*Node\n{nodes}*Element, type=C3D8\n{elements}*Elset, elset=all\n{elset}*End Step\n"
+    )
+    return str(tmp_path)
+
+
+def summary(keywords) -> list:
+    return [(keyword.name, keyword.parameter, [list(row) for row in keyword.data], keyword.comments)
+            for keyword in keywords]  # fmt: skip
+
+
+@pytest.mark.parametrize("usePyArray", [False, True])
+@pytest.mark.parametrize("bulk", [False, True])
+def test_parallel_parse_matches_serial(deck, usePyArray, bulk):
+    serial = InputFile("main.inp", deck).parse(bulk=bulk, usePyArray=usePyArray)
+    parallel = InputFile("main.inp", deck).parse(bulk=bulk, usePyArray=usePyArray, numWorkers=2)
+    assert summary(parallel) == summary(serial)
+    assert [type(keyword.data) for keyword in parallel] == [type(keyword.data) for keyword in serial]
+    if bulk:
+        assert len(parallel[2].data) == 29 and parallel[2].data[0] == (1, 1, 2, 3, 4, 5, 6, 7, 8)
+    if bulk and usePyArray:
+        assert parallel[1].data.dtype.kind == "f" and parallel[1].data.colZeroIsInt
+        assert parallel[1].data.shape == (79, 4) and not parallel[1].data.flags.writeable
+
+
+def test_chunk_bounds_keep_continued_lines(deck):
+    text = b"1, 2,\n 3\n" * 40
+    bounds = BlockDispatcher._chunkBounds(text, 0, len(text), True)
+    assert len(bounds) > 2 and all(text[bound - 3 : bound] == b" 3\n" for bound in bounds[1:])
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+import stat
+
+import pytest
+
+from abqpy.cache import ResultCache, normalize_inp, parse_size
+
+MAIN = b"""** Generated by: Abaqus/CAE 2024
+*Heading
+*Node, nset=all,
+    input=nodes.inp
+*Element, type=C3D8, INPUT="elements.inp"
+*Include, input=step.inp
+"""
+
+
+@pytest.fixture
+def job(tmp_path):
+    """A job directory with an input file reading three other files."""
+    (tmp_path / "job.inp").write_bytes(MAIN)
+    (tmp_path / "nodes.inp").write_bytes(b"1, 0., 0., 0.\n")
+    (tmp_path / "elements.inp").write_bytes(b"1, 1, 2, 3, 4, 5, 6, 7, 8\n")
+    (tmp_path / "step.inp").write_bytes(b"*Step\n*Static\n*Include, input=loads.inp\n*End Step\n")
+    (tmp_path / "loads.inp").write_bytes(b"*Cload\nall, 1, 1.0\n")
+    return tmp_path
+
+
+def test_normalize_inp():
+    assert normalize_inp(b"** comment\r\n*NODE , NSET = All  \r\n\r\n1, 0.0\r\n") == b"*NODE,NSET=ALL\n1, 0.0\n"
+
+
+def test_parse_size():
+    assert parse_size(10) == 10 and parse_size("1.5k") == 1536 and parse_size("2GiB") == 2 * 1024**3
+    with pytest.raises(ValueError):
+        parse_size("ten")
+
+
+def test_key_ignores_comments_and_options(job, tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    key = cache.key(str(job / "job.inp"), cpus=4)
+    (job / "job.inp").write_bytes(b"** Edited\n" + MAIN.replace(b"*Heading", b"*HEADING  "))
+    assert cache.key(str(job / "job.inp"), cpus=4, gpus=None, double=False) == key
+    assert cache.key(str(job / "job.inp"), cpus=2) != key
+
+
+@pytest.mark.parametrize("name", ["nodes.inp", "elements.inp", "step.inp", "loads.inp"])
+def test_key_hashes_every_input_file(job, tmp_path, name):
+    cache = ResultCache(str(tmp_path / "cache"))
+    key = cache.key(str(job / "job.inp"))
+    with open(job / name, "ab") as file:
+        file.write(b"2, 1., 0., 0.\n")
+    assert cache.key(str(job / "job.inp")) != key
+
+
+def test_key_fails_for_a_missing_input_file(job, tmp_path):
+    os.remove(job / "loads.inp")
+    with pytest.raises(FileNotFoundError, match="loads.inp"):
+        ResultCache(str(tmp_path / "cache")).key(str(job / "job.inp"))
+
+
+def test_store_and_restore(job, tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    key = cache.key(str(job / "job.inp"))
+    assert cache.restore(key, "job", str(job)) is None
+    (job / "job.odb").write_bytes(b"odb")
+    (job / "job.sta").write_bytes(b"COMPLETED SUCCESSFULLY")
+    (job / "stress.csv").write_bytes(b"1,2")
+    cache.store(key, "job", ["job.odb", "job.sta", "stress.csv"], str(job))
+    target = tmp_path / "rerun"
+    target.mkdir()
+    (target / "other.odb").write_bytes(b"stale")
+    assert cache.restore(key, "other", str(target)) == ["other.odb", "other.sta", "stress.csv"]
+    assert (target / "other.odb").read_bytes() == b"odb" and (target / "stress.csv").read_bytes() == b"1,2"
+    assert not os.stat(target / "other.odb").st_mode & stat.S_IWUSR
+    assert cache.info()["entries"] == 1 and cache.info()["size"] == 28
+
+
+def test_prune_least_recently_used(job, tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    (job / "job.odb").write_bytes(b"0123456789")
+    for key in ("aa11", "bb22", "cc33"):
+        cache.store(key, "job", ["job.odb"], str(job))
+        os.utime(os.path.join(cache._entry(key), "meta.json"), (1.0, {"aa11": 3.0, "bb22": 1.0, "cc33": 2.0}[key]))
+    assert cache.prune(20) == ["bb22"]
+    assert cache.lookup("bb22") is None and cache.lookup("aa11") is not None
+    assert sorted(cache.clear()) == ["aa11", "cc33"]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus import mdb  # noqa: E402
+from abaqus.Calibration.curveCalibration import (  # noqa: E402
+    calibrateCurves,
+    curveArrays,
+    dissectCycles,
+    linearRegression,
+)
+
+
+def bilinear(modulus: float = 1000.0, yieldStress: float = 4.0, count: int = 101) -> np.ndarray:
+    """Return the points of a bilinear stress-strain curve hardening with a slope of 20 up to a strain of 0.05."""
+    strains = np.linspace(0.0, 0.05, count)
+    stresses = np.minimum(strains * modulus, yieldStress + 20.0 * (strains - yieldStress / modulus))
+    return np.column_stack([strains, stresses])
+
+
+def test_curve_arrays_and_regression():
+    x, y, counts = curveArrays([[[0, 1], [1, 3], [2, 5]], [[0, 0]], []])
+    assert x.shape == (3, 3) and counts.tolist() == [3, 1, 0] and np.isnan(y[1, 1:]).all()
+    slopes, intercepts, rSquared = linearRegression(x, y)
+    assert (slopes[0], intercepts[0], rSquared[0]) == pytest.approx((2.0, 1.0, 1.0))
+    assert np.isnan(slopes[1:]).all()
+
+
+@pytest.mark.parametrize("numWorkers", [1, 2])
+def test_calibrate_curves(numWorkers):
+    curves = [bilinear(), bilinear(2000.0, count=51), [[0.0, 0.0]]]
+    result = calibrateCurves(curves, nominal=False, numWorkers=numWorkers)
+    np.testing.assert_allclose(result["elasticModulus"][:2], [1000.0, 2000.0])
+    # The offset line 1000 (e - 0.002) crosses the hardening line 4 + 20 (e - 0.004) at e = 5.92 / 980
+    np.testing.assert_allclose(result["yieldPoint"][0], [5.92 / 980, 1000.0 * (5.92 / 980 - 0.002)])
+    np.testing.assert_allclose(result["ultimatePoint"][:2], [[0.05, 4.92], [0.05, 4.96]])
+    plastic = result["plasticPoints"]
+    assert plastic.shape == (3, 20, 2) and plastic[0, 0, 1] == 0.0 and plastic[0, -1, 0] == pytest.approx(4.92)
+    assert (np.diff(plastic[0, :, 1]) >= 0.0).all()
+    assert np.isnan(result["elasticModulus"][2]) and np.isnan(plastic[2]).all()
+
+
+def test_nominal_curves_are_converted():
+    nominal, true = calibrateCurves([bilinear(), bilinear()], nominal=[True, False])["plasticPoints"]
+    np.testing.assert_allclose(nominal[-1, 0], true[-1, 0] * 1.05)
+
+
+def test_behavior():
+    calibration = mdb.models["Model-1"].Calibration("calibration")
+    dataSet = calibration.DataSet("steel", tuple(map(tuple, bilinear().tolist())), "STRESS/STRAIN", "TRUE")
+    behavior = calibration.Behavior("behavior", "ElasPlasIsoBehavior")
+    assert behavior.compute_ultimatePoint(dataSet) == (0.05, pytest.approx(4.92))
+    assert behavior.compute_yieldPoint(dataSet) == pytest.approx((5.92 / 980, 1000.0 * (5.92 / 980 - 0.002)))
+    assert behavior.compute_elasticModulus("(0.002, 2.0)") == 1000.0
+    points = behavior.compute_plasticPoints(dataSet, "3", "", "", "(0.004, 4.0)")
+    np.testing.assert_allclose(points, [[4.0, 0.0], [4.46, 0.02254], [4.92, 0.04508]])
+    slope, intercept, rSquared, first, last = behavior.compute_E(dataSet)
+    assert first[0] == 0.0 and last[0] == 0.05 and 0.0 < rSquared < 1.0
+    with pytest.raises(ValueError, match="must not be zero"):
+        behavior.compute_elasticModulus((0.0, 1.0))
+
+
+def test_dissect_cycles():
+    points = [[0, 0], [1, 1], [2, 2], [1, 0.5], [0.5, 0], [1.5, 1], [2, 1.6], [3, 3], [2, 1], [1, 0]]
+    primary, unloads, reloads, permanent = dissectCycles(points)
+    assert primary[:3].tolist() == [[0, 0], [1, 1], [2, 2]] and primary[-1].tolist() == [3, 3]
+    assert [len(branch) for branch in unloads] == [3, 3] and unloads[1][-1].tolist() == [1, 0]
+    assert reloads[0].tolist() == [[0.5, 0], [1.5, 1]]
+    assert permanent.tolist() == [[2, 0.5], [3, 1]]
+    assert dissectCycles([[0, 0]])[1:3] == ([], [])
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.InputFileParser.DeckSets import DeckSets  # noqa: E402
+from abaqus.InputFileParser.InputFile import InputFile  # noqa: E402
+from abaqus.InputFileParser.LabelSet import LabelSet, expandRanges  # noqa: E402
+
+DECK = """*Heading
+*Part, name=Plate
+*Node, nset=corners
+1, 0., 0.
+2, 1., 0.
+5, 0., 1.
+*Node
+3, 2., 0.
+4, 2., 1.
+6, 1., 1.
+*Element, type=CPS4, elset=left
+1, 1, 2, 6, 5
+*Element, type=CPS3
+2, 2, 3, 6
+3, 3, 4, 6
+*Elset, elset=right, generate
+2, 3
+*Elset, elset=all
+left, right
+*Nset, nset=rightNodes, elset=right
+*Nset, nset=mixed
+corners
+4, 2
+*Nset, nset=mixed
+6
+*End Part
+*Assembly, name=Assembly
+*Instance, name=Plate-1, part=Plate
+*End Instance
+*Nset, nset=top, instance=Plate-1, generate
+4, 6, 1
+*End Assembly
+"""
+
+
+@pytest.fixture(params=[False, True], ids=["tuples", "arrays"])
+def deck(tmp_path, request) -> DeckSets:
+    (tmp_path / "main.inp").write_text(DECK)
+    keywords = InputFile("main.inp", str(tmp_path)).parse(organize=request.param, usePyArray=request.param)
+    return DeckSets.fromKeywords(keywords)
+
+
+def test_sets_are_resolved(deck):
+    assert deck.nodeSets("plate") == ("CORNERS", "RIGHTNODES", "MIXED")
+    assert deck.elementSet("all", "Plate").labels.tolist() == [1, 2, 3]
+    assert deck.elementSet("RIGHT", "PLATE").labels.tolist() == [2, 3]
+    assert deck.nodeSet("rightNodes", "Plate").labels.tolist() == [2, 3, 4, 6]
+    assert deck.nodeSet("mixed", "Plate").labels.tolist() == [1, 2, 4, 5, 6]
+    assert deck.nodeSet("top", "Plate-1").labels.tolist() == [4, 5, 6] and deck.nodeSets() == ()
+
+
+def test_instance_scopes_use_the_part_mesh(deck):
+    assert deck.nodeLabels("Plate-1").tolist() == [1, 2, 5, 3, 4, 6]
+    assert deck.elementLabels("plate").tolist() == [1, 2, 3]
+    assert deck.nodeIndices("rightNodes", "Plate").tolist() == [1, 3, 4, 5]
+    assert deck.elementIndices("right", "Plate").tolist() == [1, 2]
+    assert deck.nodeIndices("top", "Plate-1").tolist() == [4, 2, 5]
+
+
+def test_undefined_and_circular_references(tmp_path):
+    cases = (("*Elset, elset=a\nb\n", "not defined"), ("*Elset, elset=a\nb\n*Elset, elset=b\na\n", "each other"))
+    for data, message in cases:
+        (tmp_path / "main.inp").write_text(data)
+        with pytest.raises(ValueError, match=message):
+            DeckSets.fromKeywords(InputFile("main.inp", str(tmp_path)).parse())
+
+
+def test_label_set_algebra():
+    a, b = LabelSet([5, 1, 3, 3]), LabelSet.fromRanges(3, 9, 3)
+    assert a.labels.tolist() == [1, 3, 5] and b.labels.tolist() == [3, 6, 9]
+    assert (a | b).labels.tolist() == [1, 3, 5, 6, 9] and (a & b).labels.tolist() == [3]
+    assert (a - b).labels.tolist() == [1, 5] and 5 in a and 6 not in a
+    assert a.isin([1, 2, 3]).tolist() == [True, False, True]
+    assert LabelSet([1, 2, 3, 5, 7, 8]).ranges().tolist() == [[1, 3], [5, 5], [7, 8]]
+    assert expandRanges(np.array([1, 10]), np.array([5, 12]), np.array([2, 1])).tolist() == [1, 3, 5, 10, 11, 12]
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.Field.AnalyticalField import AnalyticalField  # noqa: E402
+from abaqus.Field.CompiledExpression import CompiledExpression, compileExpression, localVariables  # noqa: E402
+from abaqus.Field.ExpressionField import ExpressionField  # noqa: E402
+from abaqusConstants import CYLINDRICAL, SPHERICAL  # noqa: E402
+
+POINTS = np.array([[0.5, -1.0, 2.0], [3.0, 0.25, -0.5], [-2.0, 1.5, 0.0], [1.0, 1.0, 1.0]])
+
+
+@pytest.mark.parametrize(
+    argnames="expression, function",
+    argvalues=[
+        ("1 + 2*X - Y/4 + Z**2", lambda X, Y, Z: 1 + 2 * X - Y / 4 + Z**2),
+        ("sqrt(X*X + Y*Y) * exp(-abs(Z)) + atan2(Y, X)", lambda X, Y, Z: math.hypot(X, Y) * math.exp(-abs(Z))
+         + math.atan2(Y, X)),
+        ("max(X, Y, Z) - min(X, 0) + pow(2, Y) + pi", lambda X, Y, Z: max(X, Y, Z) - min(X, 0) + 2**Y + math.pi),
+        ("X if X > 0 and not Y > 1 else -e", lambda X, Y, Z: X if X > 0 and not Y > 1 else -math.e),
+        ("0 < X <= 1 or Z == 0", lambda X, Y, Z: 0 < X <= 1 or Z == 0),
+    ],
+)  # fmt: skip
+def test_expressions_match_scalar_evaluation(expression, function):
+    compiled = CompiledExpression(expression)
+    variables = dict(zip("XYZ", POINTS.T))
+    expected = [float(function(*point)) for point in POINTS.tolist()]
+    np.testing.assert_allclose(compiled.evaluate(variables), expected)
+
+
+@pytest.mark.parametrize(
+    argnames="expression, message",
+    argvalues=[("__import__('os')", "Unknown function"), ("X.real", "Unsupported syntax"), ("[X][0]", "Unsupported"),
+               ("sqrt(x=X)", "positional"), ("T + 1", "Unknown name T"), ("'a'", "Unsupported constant"),
+               ("X +", "Invalid expression"), ("10**400 + X", "Invalid operation"), ("1e999999 * 2", "too large"),
+               ("X - 10" + "0" * 400, "too large")],
+)  # fmt: skip
+def test_invalid_expressions_are_rejected(expression, message):
+    with pytest.raises(ValueError, match=message):
+        CompiledExpression(expression)
+
+
+def test_compiled_expressions_are_cached():
+    compiled = compileExpression("Z + X + Z")
+    assert compileExpression("Z + X + Z") is compiled and compiled.variables == ("Z", "X")
+    assert compileExpression("2.5").evaluate({}, (3,)).tolist() == [2.5] * 3
+    with pytest.raises(ValueError, match="Variable X"):
+        compiled.evaluate({"Z": POINTS[:, 2]})
+    # Only the most recently used expressions are kept
+    assert compileExpression.cache_info().maxsize is not None
+
+
+def test_conditional_branches_do_not_warn():
+    variables = {"X": np.array([-4.0, 0.0, 9.0])}
+    with np.errstate(all="raise"):
+        values = CompiledExpression("X if X > 0 else sqrt(-X)").evaluate(variables)
+        assert values.tolist() == [2.0, 0.0, 9.0]
+        assert CompiledExpression("1 / X if X != 0 else 0").evaluate(variables).tolist() == [-0.25, 0.0, 1 / 9]
+
+
+def test_local_variables():
+    csys = SimpleNamespace(coordSysType=CYLINDRICAL, origin=SimpleNamespace(pointOn=(1.0, 0.0, 0.0)),
+                           axis1=SimpleNamespace(direction=(0.0, 2.0, 0.0)),
+                           axis2=SimpleNamespace(direction=(-1.0, 0.0, 0.0)),
+                           axis3=SimpleNamespace(direction=(0.0, 0.0, 1.0)))  # fmt: skip
+    variables = localVariables([[1.0, 3.0, 5.0]], csys)
+    assert variables["R"].tolist() == [3.0] and variables["Z"].tolist() == [5.0]
+    assert variables["Th"] == pytest.approx(0.0)
+    spherical = localVariables([[0.0, 0.0, 2.0], [1.0, 1.0, 0.0]], SimpleNamespace(coordSysType=SPHERICAL), ["P"])
+    assert list(spherical) == ["P"] and spherical["P"] == pytest.approx([0.0, np.pi / 2])
+    with pytest.raises(ValueError, match="Variable X"):
+        localVariables(POINTS, csys, ["X"])
+
+
+def test_expression_field_evaluate():
+    field = ExpressionField(name="field", expression="X * Y + Z")
+    np.testing.assert_allclose(field.evaluate(POINTS), POINTS[:, 0] * POINTS[:, 1] + POINTS[:, 2])
+    assert field.evaluate([[2.0, 3.0]]).tolist() == [6.0]
+    with pytest.raises(TypeError, match="cannot be evaluated"):
+        AnalyticalField().evaluate(POINTS)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.Mesh.elementTopology import (  # noqa: E402
+    shapeCentroid,
+    shapeFunctions,
+    shapeIntegrationPoints,
+    shapeNaturalCoordinates,
+)
+from abaqus.Mesh.MeshArrays import MeshArrays  # noqa: E402
+from abaqus.Odb.FieldExtrapolator import FieldExtrapolator, extrapolationMatrix  # noqa: E402
+
+
+def linear(points: np.ndarray) -> np.ndarray:
+    """A field linear in the natural coordinates."""
+    return 2.0 + points @ np.array([1.0, -3.0, 0.5])[: points.shape[1]]
+
+
+@pytest.mark.parametrize(
+    argnames="shape, count",
+    argvalues=[("LINE2", 2), ("LINE3", 3), ("TRI6", 3), ("QUAD4", 4), ("QUAD8", 4), ("QUAD8", 9), ("TET10", 4),
+               ("WEDGE6", 6), ("WEDGE15", 9), ("HEX8", 8), ("HEX20", 8), ("HEX20", 27)],
+)  # fmt: skip
+def test_linear_fields_are_extrapolated_exactly(shape, count):
+    points = shapeIntegrationPoints(shape, count)
+    nodes = np.array(shapeNaturalCoordinates[shape])
+    np.testing.assert_allclose(extrapolationMatrix(shape, count) @ linear(points), linear(nodes), atol=1e-12)
+    centroid = extrapolationMatrix(shape, count, centroid=True) @ linear(points)
+    np.testing.assert_allclose(centroid, linear(shapeCentroid(shape).reshape(1, -1)), atol=1e-12)
+
+
+@pytest.mark.parametrize("shape", ["WEDGE6", "WEDGE15"])
+def test_wedge_points_through_the_thickness(shape):
+    # A single triangle point, the values vary along the thickness only
+    points = shapeIntegrationPoints(shape, 2)
+    nodes = np.array(shapeNaturalCoordinates[shape])
+    matrix = extrapolationMatrix(shape, 2)
+    np.testing.assert_allclose(matrix @ (1.0 + points[:, 2]), 1.0 + nodes[:, 2], atol=1e-12)
+    quadratic = extrapolationMatrix(shape, 3) @ shapeIntegrationPoints(shape, 3)[:, 2] ** 2
+    np.testing.assert_allclose(quadratic, nodes[:, 2] ** 2, atol=1e-12)
+
+
+def test_single_points_give_the_mean():
+    assert extrapolationMatrix("TET4", 1).tolist() == [[1.0]] * 4
+    assert np.allclose(extrapolationMatrix("HEX8", 5), 0.2)
+
+
+@pytest.fixture
+def mesh() -> MeshArrays:
+    """A row of two unit C3D8 elements along x and a C3D6 element on top of the second one."""
+    coordinates = np.array([[x, y, z] for x in range(3) for y in (0, 1) for z in (0, 1)] + [[2, 0, 2], [1, 0, 2]])
+    connectivity = np.array([[0, 4, 6, 2, 1, 5, 7, 3], [4, 8, 10, 6, 5, 9, 11, 7], [5, 9, 11, 13, 12, 7, -1, -1]])
+    return MeshArrays(np.arange(1, 15), coordinates.astype(float), np.arange(1, 4), ["C3D8", "C3D6"],
+                      np.array([0, 0, 1]), connectivity)  # fmt: skip
+
+
+def test_element_nodal_and_averaged_values(mesh):
+    extrapolator = FieldExtrapolator(mesh)
+    # A field linear in x on the hexahedra, at the 8 points of each element in the order of the connectivity
+    points = shapeIntegrationPoints("HEX8", 8)
+    xyz = np.einsum("pk,mkx->mpx", shapeFunctions("HEX8", points), mesh.coordinates[mesh.connectivity[:2]])
+    elements, values = extrapolator.integrationPointValues([1, 2], [], xyz[:, :, :1].reshape(-1, 1))
+    elementNodal = extrapolator.elementNodal(elements, values)
+    np.testing.assert_allclose(elementNodal[:, :, 0], mesh.coordinates[mesh.connectivity[:2], 0], atol=1e-12)
+    nodes, averaged = extrapolator.nodal(*extrapolator.rows(elements, elementNodal)[1:])
+    np.testing.assert_allclose(averaged[:, 0], mesh.coordinates[nodes, 0], atol=1e-12)
+    # Constant values per element are averaged at the shared nodes unless the threshold or regions separate them
+    constant = np.repeat(np.array([[[0.0]], [[10.0]]]), 8, axis=1)
+    elementNodal = extrapolator.elementNodal(elements, constant)
+    assert extrapolator.averaged(elements, elementNodal)[0, 1, 0] == 5.0
+    np.testing.assert_array_equal(extrapolator.averaged(elements, elementNodal, threshold=50.0), elementNodal)
+    np.testing.assert_array_equal(extrapolator.averaged(elements, elementNodal, regions=["a", "b"]), elementNodal)
+
+
+def test_rows_by_integration_point(mesh):
+    extrapolator = FieldExtrapolator(mesh)
+    elements, values = extrapolator.integrationPointValues([3, 3, 2], [2, 1, 1], [[4.0], [2.0], [7.0]])
+    assert elements.tolist() == [1, 2] and values[1, :, 0].tolist() == [2.0, 4.0]
+    assert np.isnan(values[0, 1, 0])
+    # The wedge values at the bottom and top points are extrapolated linearly through the thickness
+    elementNodal = extrapolator.elementNodal(elements[1:], values[1:])
+    assert elementNodal.shape == (1, 6, 1)
+    bottom, top = 3.0 - np.sqrt(3.0), 3.0 + np.sqrt(3.0)
+    np.testing.assert_allclose(elementNodal[0, :, 0], [bottom] * 3 + [top] * 3)
+    with pytest.raises(ValueError, match="Expected 3"):
+        extrapolator.integrationPointValues([3, 3], [2, 1, 1], [[4.0], [2.0], [7.0]])
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import warnings
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.FieldReport.FieldReportBlock import FieldReportBlock  # noqa: E402
+from abaqus.FieldReport.FieldReportOptions import FieldReportOptions  # noqa: E402
+from abaqus.FieldReport.FieldReportWriter import FieldReportWriter, formatFloats, formatIntegers  # noqa: E402
+from abaqus.Session.NumberFormat import NumberFormat  # noqa: E402
+from abaqusConstants import COMMA_SEPARATED_VALUES, DESCENDING, OFF, SCIENTIFIC  # noqa: E402
+
+#: Values whose rounding or exponent is hard to get right
+EDGE_VALUES = [0.0, 1.0, -1.0, 0.125, 2.675, 9.9999995, 99999.95, 1e-5, 1e100, -1e-100, 5e-324, -2.5e-320, 1.5e308]
+
+
+def decode(field) -> list[str]:
+    return [bytes(row).decode().strip() for row in field]
+
+
+@pytest.mark.parametrize("numDigits", [1, 3, 6, 9, 12])
+def test_format_floats_matches_printf(numDigits):
+    rng = np.random.default_rng(numDigits)
+    values = np.concatenate([rng.standard_normal(5000) * 10.0 ** rng.integers(-300, 300, 5000), EDGE_VALUES])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        formatted = decode(formatFloats(values, numDigits, "SCIENTIFIC"))
+    assert formatted == ["%.*E" % (numDigits - 1, value) for value in values]
+
+
+def test_format_floats_engineering_and_automatic():
+    values = np.array([12345.678, 0.00012346, -1.5e-7, 0.0])
+    assert decode(formatFloats(values, 4, "ENGINEERING")) == ["12.35E+03", "123.5E-06", "-150.0E-09", "0.000E+00"]
+    assert decode(formatFloats(values, 4, "AUTOMATIC")) == ["1.235E+04", "0.0001235", "-1.500E-07", "0.000"]
+
+
+def test_format_integers():
+    assert decode(formatIntegers(np.array([0, 7, -12, 3456]))) == ["0", "7", "-12", "3456"]
+
+
+def test_set_values_keeps_unspecified_options():
+    options = FieldReportOptions()
+    options.setValues(printTotal=OFF, sort=DESCENDING)
+    options.setValues(reportFormat=COMMA_SEPARATED_VALUES)
+    assert options.printTotal == OFF and options.sort == DESCENDING
+    assert options.reportFormat == COMMA_SEPARATED_VALUES
+
+
+def test_precision_rounds(tmp_path):
+    options = FieldReportOptions()
+    options.setValues(numberFormat=NumberFormat(format=SCIENTIFIC, numDigits=6, precision=2),
+                      reportFormat=COMMA_SEPARATED_VALUES)  # fmt: skip
+    block = FieldReportBlock("U", [2, 1], [[1.239, -0.016], [0.5, 2.0]], ["U1", "U2"], "PART-1-1")
+    filename = str(tmp_path / "report.csv")
+    FieldReportWriter(options, numWorkers=2).write(filename, [block, block], append=False)
+    with open(filename) as file:
+        lines = file.read().splitlines()
+    assert lines[:3] == ["Node Label,U.U1,U.U2", "1,5.00000E-01,2.00000E+00", "2,1.24000E+00,-2.00000E-02"]
+    assert lines[3:] == lines[:3]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.Filter.ButterworthFilter import ButterworthFilter  # noqa: E402
+from abaqus.Filter.Chebyshev1Filter import Chebyshev1Filter  # noqa: E402
+from abaqus.Filter.Chebyshev2Filter import Chebyshev2Filter  # noqa: E402
+from abaqus.Filter.digitalFilters import applyOperation, filterSections, samplingFrequency  # noqa: E402
+from abaqus.Filter.OperatorFilter import OperatorFilter  # noqa: E402
+from abaqusConstants import ABS, MAX, ON  # noqa: E402
+
+FILTERS = [
+    ButterworthFilter("B", cutoffFrequency=5.0, order=4),
+    Chebyshev1Filter("C1", cutoffFrequency=5.0, order=3, rippleFactor=0.5),
+    Chebyshev2Filter("C2", cutoffFrequency=5.0, order=5, rippleFactor=0.1),
+]
+
+
+def recurrence(sections, signal, steadyState=True):
+    """Filter a signal sample by sample with the direct form II transposed recurrence of each section."""
+    output = np.array(signal, dtype=float)
+    for b0, b1, b2, _, a1, a2 in sections:
+        if steadyState:
+            # State of a constant input equal to the first sample
+            gain = (b0 + b1 + b2) / (1 + a1 + a2)
+            z1 = output[0] * (gain - b0)
+            z2 = output[0] * (b2 - a2 * gain)
+        else:
+            z1 = z2 = 0.0
+        for i, x in enumerate(output):
+            y = b0 * x + z1
+            z1, z2 = b1 * x - a1 * y + z2, b2 * x - a2 * y
+            output[i] = y
+    return output
+
+
+@pytest.mark.parametrize("digitalFilter", FILTERS, ids=lambda f: f.name)
+@pytest.mark.parametrize("steadyState", [True, False])
+def test_filter_matches_recurrence(digitalFilter, steadyState):
+    rng = np.random.default_rng(0)
+    signals = rng.standard_normal((3, 1000)).cumsum(axis=1)
+    sections = digitalFilter.sections(100.0)
+    filtered = filterSections(sections, signals, steadyState, blockSize=64)
+    expected = np.array([recurrence(sections, signal, steadyState) for signal in signals])
+    np.testing.assert_allclose(filtered, expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("digitalFilter", FILTERS, ids=lambda f: f.name)
+def test_filter_gain(digitalFilter):
+    sections = digitalFilter.sections(100.0)
+    # Unit gain at zero frequency, which holds for Chebyshev type I filters of odd order
+    assert np.allclose(filterSections(sections, np.ones(500))[-1], 1.0)
+    times = np.arange(2000) / 100.0
+    stopBand = filterSections(sections, np.sin(2 * np.pi * 40.0 * times), steadyState=False)
+    assert np.abs(stopBand[1000:]).max() < 0.1
+
+
+def test_sections_match_scipy():
+    signal = pytest.importorskip("scipy.signal")
+    sections = ButterworthFilter("B", cutoffFrequency=5.0, order=4).sections(100.0)
+    expected = signal.butter(4, 5.0, fs=100.0, output="sos")
+    frequencies = np.linspace(0, 50, 200)
+    _, response = signal.sosfreqz(sections, frequencies, fs=100.0)
+    _, reference = signal.sosfreqz(expected, frequencies, fs=100.0)
+    np.testing.assert_allclose(np.abs(response), np.abs(reference), atol=1e-8)
+
+
+def test_operation_and_halt():
+    values = np.array([[1.0, 3.0, -5.0, 2.0, 7.0]])
+    np.testing.assert_array_equal(applyOperation(values, MAX)[0], [[1, 3, 3, 3, 7]])
+    np.testing.assert_array_equal(applyOperation(values, ABS, limit=4.0)[0], [[1, 3, 4, 4, 4]])
+    halted, counts = applyOperation(values, MAX, limit=3.0, halt=True)
+    assert counts.tolist() == [2] and np.isnan(halted[0, 2:]).all()
+
+
+def test_filter_xy_data():
+    data = [(i / 100.0, float(i % 7)) for i in range(300)]
+    result = OperatorFilter("O", cutoffFrequency=10.0, operation=MAX, limit=5.0, halt=ON).filterXYData(data)
+    assert len(result) < len(data) and result[-1][1] >= 5.0
+    assert samplingFrequency([0.0, 0.01, 0.02]) == pytest.approx(100.0)
+    with pytest.raises(ValueError):
+        samplingFrequency([0.0, 0.01, 0.05])
+
+
+@pytest.mark.parametrize("filterType", [ButterworthFilter, Chebyshev1Filter, Chebyshev2Filter, OperatorFilter])
+def test_set_values_keeps_other_settings(filterType):
+    digitalFilter = filterType("F", cutoffFrequency=5.0, order=4, operation=MAX, halt=ON)
+    if hasattr(digitalFilter, "rippleFactor"):
+        digitalFilter.setValues(rippleFactor=0.2)
+    digitalFilter.setValues(limit=2.0)
+    assert (digitalFilter.order, digitalFilter.operation, digitalFilter.halt) == (4, MAX, ON)
+    assert digitalFilter.limit == 2.0 and digitalFilter.cutoffFrequency == 5.0
+    assert getattr(digitalFilter, "rippleFactor", 0.2) == 0.2
+    digitalFilter.setValues(order=6)
+    assert (digitalFilter.order, digitalFilter.limit) == (6, 2.0)
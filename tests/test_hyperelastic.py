@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus import mdb  # noqa: E402
+from abaqus.Material.Elastic.HyperElastic.HyperelasticPotential import (  # noqa: E402
+    HyperelasticPotential,
+    modeKinematics,
+)
+from abaqus.Material.evaluateMaterial import evaluateMaterial  # noqa: E402
+from abaqus.Material.TestData.BiaxialTestData import BiaxialTestData  # noqa: E402
+from abaqus.Material.TestData.UniaxialTestData import UniaxialTestData  # noqa: E402
+from abaqus.Material.TestData.VolumetricTestData import VolumetricTestData  # noqa: E402
+from abaqusConstants import (  # noqa: E402
+    ARRUDA_BOYCE,
+    COEFFICIENTS,
+    MOONEY_RIVLIN,
+    NEO_HOOKE,
+    OFF,
+    OGDEN_N2,
+    POLY_N1,
+    POLY_N3,
+    REDUCED_POLY_N3,
+    TENSION,
+    TEST_DATA,
+    UNIAXIAL,
+    UNKNOWN,
+    VAN_DER_WAALS,
+)
+
+C10, C01 = 0.5, 0.1
+
+
+def mooneyRivlin(stretches: np.ndarray, biaxial: bool = False) -> np.ndarray:
+    """Return the nominal stresses of a Mooney-Rivlin material in uniaxial or equibiaxial tension."""
+    if biaxial:
+        return 2 * (stretches - stretches**-5) * (C10 + C01 * stretches**2)
+    return 2 * (stretches - stretches**-2) * (C10 + C01 / stretches)
+
+
+@pytest.fixture
+def material():
+    """A hyperelastic material with uniaxial and equibiaxial test data of a Mooney-Rivlin material."""
+    material = mdb.models["Model-1"].Material("rubber")
+    material.Hyperelastic(table=(), type=UNKNOWN)
+    uniaxial, biaxial = np.linspace(1.05, 2.5, 12), np.linspace(1.05, 1.8, 8)
+    hyperelastic = material.hyperelastic
+    hyperelastic.uniaxialTestData = UniaxialTestData(tuple(zip(mooneyRivlin(uniaxial), uniaxial - 1)))
+    hyperelastic.biaxialTestData = BiaxialTestData(tuple(zip(mooneyRivlin(biaxial, True), biaxial - 1)))
+    return material
+
+
+def test_coefficients():
+    material = mdb.models["Model-1"].Material("coefficients")
+    material.Hyperelastic(table=((C10, C01, 0.0),), type=MOONEY_RIVLIN, testData=OFF)
+    potentials = evaluateMaterial(material, "evaluation", COEFFICIENTS, (POLY_N1,), uniaxialStrainRange=(0.0, 1.0))
+    potential = potentials["POLY_N1"]
+    assert potential.coefficients == (C10, C01, 0.0) and list(potential.responses) == ["UNIAXIAL"]
+    strains, stresses = potential.responses["UNIAXIAL"].T
+    np.testing.assert_allclose(stresses, mooneyRivlin(1 + strains), atol=1e-12)
+
+
+def test_fit_test_data(material):
+    names = (POLY_N1, OGDEN_N2, NEO_HOOKE, REDUCED_POLY_N3, ARRUDA_BOYCE, VAN_DER_WAALS)
+    potentials = evaluateMaterial(material, "evaluation", TEST_DATA, names)
+    assert list(potentials) == ["POLY_N1", "OGDEN_N2", "REDUCED_POLY_N1", "REDUCED_POLY_N3", "ARRUDA_BOYCE",
+                                "VAN_DER_WAALS"]  # fmt: skip
+    # The Mooney-Rivlin material is a first order polynomial and a second order Ogden potential
+    np.testing.assert_allclose(potentials["POLY_N1"].coefficients, [C10, C01, 0.0], atol=1e-12)
+    ogden = sorted(zip(*[iter(potentials["OGDEN_N2"].coefficients[:4])] * 2))
+    np.testing.assert_allclose(ogden, [(0.2, -2.0), (1.0, 2.0)], atol=1e-9)
+    assert potentials["POLY_N1"].error < 1e-12 and potentials["VAN_DER_WAALS"].error < 1e-3
+    # Potentials depending on the first invariant only cannot match both modes
+    assert 0.05 < potentials["REDUCED_POLY_N1"].error < 0.2
+    for potential in potentials.values():
+        assert list(potential.responses) == ["UNIAXIAL", "BIAXIAL"]
+        assert potential.responses["UNIAXIAL"].shape == (51, 2)
+
+
+def test_marlow(material):
+    potentials = evaluateMaterial(material, "evaluation", TEST_DATA, (), marlowData=(UNIAXIAL,), marlowDataType=TENSION)
+    marlow = potentials["MARLOW"]
+    assert marlow.coefficients == () and marlow.error < 1e-12
+    strains, stresses = marlow.responses["UNIAXIAL"].T
+    inside = (strains >= 0.05) & (strains <= 1.5)
+    np.testing.assert_allclose(stresses[inside], mooneyRivlin(1 + strains[inside]), rtol=2e-2)
+
+
+def test_volumetric(material):
+    ratios = np.array([0.9, 0.95, 0.98])
+    # The pressure of U = (J - 1)^2 / D1 with D1 = 0.01
+    pressures = 200.0 * (1.0 - ratios)
+    material.hyperelastic.volumetricTestData = VolumetricTestData(tuple(zip(pressures, ratios)))
+    potential = evaluateMaterial(material, "evaluation", TEST_DATA, (POLY_N1,))["POLY_N1"]
+    np.testing.assert_allclose(potential.coefficients, [C10, C01, 0.01], atol=1e-9)
+    np.testing.assert_allclose(potential.pressure(ratios), pressures)
+    assert potential.responses["VOLUMETRIC"][0, 0] == pytest.approx(0.9)
+
+
+def test_errors(material):
+    with pytest.raises(ValueError, match="POLY_N3, POLY_N4"):
+        evaluateMaterial(material, "evaluation", TEST_DATA, (POLY_N3,))
+    with pytest.raises(ValueError, match="only for hyperelastic materials"):
+        evaluateMaterial(mdb.models["Model-1"].Material("steel"), "evaluation", TEST_DATA, (POLY_N1,))
+    with pytest.raises(ValueError, match="Unsupported strain energy potential"):
+        HyperelasticPotential("POLY_N7")
+
+
+def test_kinematics():
+    kinematics = modeKinematics(["UNIAXIAL", "BIAXIAL", "PLANAR", "SIMPLE_SHEAR"], [1.0, 1.0, 1.0, 0.0])
+    assert kinematics["I1"] == pytest.approx([5.0, 8.0625, 5.25, 3.0])
+    assert HyperelasticPotential("REDUCED_POLYNOMIAL_N2").name == "REDUCED_POLY_N2"
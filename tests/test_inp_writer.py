@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.InputFileParser.AbaqusNDarray import AbaqusNDarray  # noqa: E402
+from abaqus.InputFileParser.InputFile import InputFile  # noqa: E402
+from abaqus.InputFileParser.inpWriter import formatKeyword, formatKeywordLine, writeKeywords  # noqa: E402
+from abaqus.InputFileParser.Keyword import Keyword  # noqa: E402
+
+MAIN = """*Heading
+** A comment kept verbatim
+Round trip
+*Include, input=mesh.inp
+*Material, name=Steel
+*Elastic
+210000., 0.3
+*Density
+7.85e-09,
+"""
+MESH = """*Node
+1, 0., 0., 0.
+2, 1., 0., 0.
+3, 1., 1., 0.
+*Element, type=C3D20R, elset=solid
+1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
+16, 17, 18, 19, 20
+"""
+
+
+@pytest.fixture
+def deck(tmp_path):
+    (tmp_path / "main.inp").write_text(MAIN)
+    (tmp_path / "mesh.inp").write_text(MESH)
+    return tmp_path
+
+
+def summary(keywords) -> list:
+    return [(keyword.name, keyword.parameter, [list(row) for row in keyword.data]) for keyword in keywords]
+
+
+@pytest.mark.parametrize("usePyArray", [False, True])
+def test_unmodified_keywords_are_copied_verbatim(deck, usePyArray):
+    inp = InputFile("main.inp", str(deck))
+    inp.write(inp.parse(usePyArray=usePyArray), "copy/main.inp")
+    assert (deck / "copy" / "main.inp").read_text() == MAIN
+    assert (deck / "copy" / "mesh.inp").read_text() == MESH
+
+
+def test_modified_keywords_are_formatted(deck):
+    inp = InputFile("main.inp", str(deck))
+    keywords = inp.parse(usePyArray=True)
+    keywords[1].data = AbaqusNDarray(np.array([[1, 0.0, 0.0, 0.0], [2, 0.1, 2.5e-10, 1.0 / 3.0]]), colZeroIsInt=True)
+    keywords[4].parameter["name"] = "Steel-2"
+    inp.write(keywords)
+    assert "** A comment kept verbatim" in (deck / "main.inp").read_text()
+    reread = InputFile("main.inp", str(deck)).parse()
+    assert summary(reread) == summary(keywords)
+    assert reread[1].data[1] == (2, 0.1, 2.5e-10, 1.0 / 3.0)
+
+
+def test_write_keywords(tmp_path):
+    element = Keyword("Element", {"type": "C3D20R"}, ((1,) + tuple(range(1, 21)),))
+    keywords = [Keyword("Node", {}, ((1, 0.5, -1e-3, 100.0),)), element, Keyword("Nset", {"nset": "a b"}, ((1, 2),))]
+    writeKeywords(keywords, str(tmp_path / "new.inp"))
+    parsed = InputFile("new.inp", str(tmp_path)).parse()
+    assert summary(parsed) == summary(keywords)
+    assert formatKeyword(element).count("\n") == 3
+
+
+def test_long_keyword_lines_are_continued():
+    line = formatKeywordLine("Material", {f"parameter{i}": "x" * 20 for i in range(12)})
+    assert all(len(part) <= 256 for part in line.splitlines()) and line.count("\n") > 1
+    assert formatKeywordLine("Heading", None) == "*Heading\n"
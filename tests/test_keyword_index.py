@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from abaqus.InputFileParser.InputFile import InputFile
+from abaqus.InputFileParser.KeywordIndex import KeywordIndex
+
+
+@pytest.fixture
+def deck(tmp_path):
+    """An input file with two materials and an included mesh file."""
+    (tmp_path / "main.inp").write_text(
+        "*Heading\nIndexed\n*Include, input=mesh.inp\n"
+        "*Material, name=Steel\n*Elastic\n210000., 0.3\n"
+        "*Material, NAME=alu\n*Elastic\n70000., 0.33\n"
+        "*Nset, nset=top,\n generate\n1, 4, 1\n"
+    )
+    (tmp_path / "mesh.inp").write_text(
+        "*Node\n1, 0., 0.\n2, 1., 0.\n*Element, type=CPS4,\n elset=plate\n1, 1, 2, 3, 4\n"
+    )
+    return tmp_path
+
+
+def test_index_records_keywords_in_parse_order(deck):
+    inp = InputFile("main.inp", str(deck))
+    index = inp.index()
+    assert [entry.name for entry in index] == [keyword.name for keyword in InputFile("main.inp", str(deck)).parse()]
+    element = index.select("element")[0]
+    assert element.path == str(deck / "mesh.inp") and element.line == 4 and element.parameter == {"elset": "plate"}
+    assert index.select("NSET", nset="TOP")[0].line == 10
+    assert inp.index() is index and "MATERIAL" in index.names
+
+
+def test_find_keywords(deck):
+    inp = InputFile("main.inp", str(deck))
+    assert [keyword.parameter["NAME"] for keyword in inp.findKeywords("Material", name="ALU")] == ["alu"]
+    assert inp.getKeyword("element").data == ((1, 1, 2, 3, 4),)
+    assert inp.getKeyword("Material", name="Copper") is None
+    with pytest.raises(ValueError, match="parameters"):
+        inp.getKeyword("Material", type="C3D8")
+
+
+def test_index_file(deck):
+    built = InputFile("main.inp", str(deck)).index(cache=True)
+    assert (deck / "main.inpi").is_file()
+    cached = InputFile("main.inp", str(deck)).index(cache=True)
+    assert isinstance(cached, KeywordIndex) and cached is not built
+    assert [(entry.name, entry.offset, entry.end) for entry in cached] == [(e.name, e.offset, e.end) for e in built]
+
+
+def test_changed_file_is_detected(deck):
+    inp = InputFile("main.inp", str(deck))
+    entries = inp.index().select("element")
+    (deck / "mesh.inp").write_text("*Node\n1, 0., 0.\n")
+    with pytest.raises(ValueError, match="has changed"):
+        list(inp.index().read(entries))
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus import mdb  # noqa: E402
+from abaqus.Material import MaterialTable as module  # noqa: E402
+from abaqus.Material.MaterialTable import MaterialTable  # noqa: E402
+from abaqusConstants import LINEAR, ON  # noqa: E402
+
+
+@pytest.fixture
+def material():
+    return mdb.models["Model-1"].Material("steel")
+
+
+def test_grid(monkeypatch):
+    # Two values depending on the temperature and one field variable, the temperature varying fastest
+    table = [
+        (10.0 * temperature + field, -field, temperature, field) for field in (0.0, 1.0) for temperature in (0, 1, 3)
+    ]
+    compiled = MaterialTable(table, 2, temperatureDependency=True, dependencies=1)
+    assert compiled.isGrid and compiled.variables == ("temperature", "field1")
+    monkeypatch.setattr(module, "CHUNK_SIZE", 2)
+    values = compiled.evaluate(temperature=[0.5, 2.0, 9.0, -1.0], fieldVariables=[[0.25], [1.0], [0.0], [2.0]])
+    np.testing.assert_allclose(values, [[5.25, -0.25], [21.0, -1.0], [30.0, 0.0], [1.0, -1.0]])
+    np.testing.assert_allclose(compiled.evaluate([[1.0, 0.5]]), [[10.5, -0.5]])
+
+
+def test_nested_groups():
+    # The temperatures differ between the field variables, the table is not a grid
+    table = [(1.0, 0.0, 0.0), (3.0, 2.0, 0.0), (10.0, 0.0, 1.0), (20.0, 1.0, 1.0), (30.0, 4.0, 1.0)]
+    compiled = MaterialTable(table, 1, temperatureDependency=True, dependencies=1)
+    assert not compiled.isGrid
+    values = compiled.evaluate(temperature=[1.0, 2.5, 1.0], field1=[0.0, 1.0, 0.5])
+    np.testing.assert_allclose(values[:, 0], [2.0, 25.0, 0.5 * 2.0 + 0.5 * 20.0])
+    with pytest.raises(ValueError, match="The variable field1"):
+        compiled.evaluate(temperature=[1.0])
+    with pytest.raises(ValueError, match="empty"):
+        MaterialTable([()], 1)
+
+
+def test_regularize():
+    table = [(1.0, 0.0, 0.0), (2.0, 1.0, 0.001), (3.0, 0.0, 1.0), (4.0, 1.0, 0.999)]
+    assert not MaterialTable(table, 1, temperatureDependency=True, dependencies=1).isGrid
+    assert MaterialTable(table, 1, temperatureDependency=True, dependencies=1, tolerance=0.01).isGrid
+
+
+def test_from_behavior(material):
+    material.Elastic(table=((200e3, 0.3, 20.0), (100e3, 0.3, 520.0)), temperatureDependency=ON)
+    elastic = MaterialTable.fromBehavior(material.elastic)
+    assert elastic.variables == ("temperature",) and MaterialTable.fromBehavior(material.elastic) is elastic
+    np.testing.assert_allclose(elastic.evaluate(temperature=[0.0, 270.0]), [[200e3, 0.3], [150e3, 0.3]])
+    material.Plastic(table=[[250.0, 0.0], [350.0, 0.1]], extrapolation=LINEAR)
+    plastic = MaterialTable.fromBehavior(material.plastic)
+    assert plastic.variables == ("plasticStrain",)
+    assert plastic.evaluate(plasticStrain=[0.05, 0.2])[:, 0].tolist() == pytest.approx([300.0, 450.0])
+    unknown = type("Unknown", (), {"table": ((1.0,),)})()
+    with pytest.raises(ValueError, match="Unknown behavior is not known"):
+        MaterialTable.fromBehavior(unknown)
+    assert MaterialTable.fromBehavior(unknown, numValues=1).evaluate().tolist() == [[1.0]]
+
+
+def test_cache_follows_the_table(material):
+    material.Plastic(table=[[250.0, 0.0], [350.0, 0.1]])
+    plastic = MaterialTable.fromBehavior(material.plastic)
+    # The table is stored as nested tuples and cannot be edited in place
+    assert material.plastic.table == ((250.0, 0.0), (350.0, 0.1))
+    with pytest.raises(TypeError):
+        material.plastic.table[1][0] = 450.0
+    material.plastic.setValues(table=[[250.0, 0.0], [450.0, 0.1]])
+    edited = MaterialTable.fromBehavior(material.plastic)
+    assert edited is not plastic and edited.evaluate(plasticStrain=[0.05])[0, 0] == pytest.approx(350.0)
+    # An equal table keeps the compiled table, changed options do not
+    material.plastic.setValues(table=((250.0, 0.0), (450.0, 0.1)))
+    assert MaterialTable.fromBehavior(material.plastic) is edited
+    material.plastic.setValues(extrapolation=LINEAR)
+    assert MaterialTable.fromBehavior(material.plastic) is not edited
+
+
+def test_set_values(material):
+    material.Density(table=((7.8e-9,),))
+    material.density.setValues(((7.9e-9,),), ON)
+    assert material.density.table == ((7.9e-9,),) and material.density.temperatureDependency == ON
+    with pytest.raises(TypeError, match="unexpected keyword argument 'tabel'"):
+        material.density.setValues(tabel=((1.0,),))
+    with pytest.raises(TypeError, match="multiple values for argument 'table'"):
+        material.density.setValues(((1.0,),), table=((1.0,),))
+    with pytest.raises(TypeError, match="takes at most 5 positional arguments"):
+        material.density.setValues(*range(6))
+    assert material.density.table == ((7.9e-9,),)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.Part.Part import Part  # noqa: E402
+from abaqusConstants import DEFORMABLE_BODY, THREE_D  # noqa: E402
+
+#: The nodes of a unit hexahedron
+HEX_COORDINATES = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]]
+
+
+def hexPart(columns: int = 1) -> Part:
+    """Create an orphan mesh part of a row of unit C3D8R elements along x."""
+    coordinates = np.array([[x, y, z] for x in range(columns + 1) for y in (0, 1) for z in (0, 1)], dtype=float)
+    labels = np.arange(1, len(coordinates) + 1)
+    corners = np.array([0, 4, 6, 2, 1, 5, 7, 3])
+    connectivity = np.array([labels[corners + 4 * column] for column in range(columns)])
+    base = Part("base", THREE_D, DEFORMABLE_BODY)
+    elements = (("C3D8R", np.arange(1, columns + 1), connectivity),)
+    return base.PartFromNodesAndElements("part", THREE_D, DEFORMABLE_BODY, (labels, coordinates), elements)
+
+
+def test_part_from_nodes_and_elements():
+    base = Part("base", THREE_D, DEFORMABLE_BODY)
+    nodes = (np.arange(11, 19), np.array(HEX_COORDINATES, dtype=float))
+    part = base.PartFromNodesAndElements("part", THREE_D, DEFORMABLE_BODY, nodes, (("C3D8R", [5], [range(11, 19)]),))
+    assert len(part.nodes) == 8 and len(part.elements) == 1
+    assert part.nodes.getFromLabel(13).coordinates == (1.0, 1.0, 0.0)
+    element = part.elements.getFromLabel(5)
+    assert element.type == "C3D8R" and element.connectivity == tuple(range(8))
+    assert [node.label for node in part.nodes.sequenceFromLabels([18, 11])] == [18, 11]
+
+
+def test_part_from_arrays_mixed_types():
+    base = Part("base", THREE_D, DEFORMABLE_BODY)
+    coordinates = np.array(HEX_COORDINATES + [[2, 0, 0]], dtype=float)
+    connectivity = np.array([[1, 2, 3, 4, 5, 6, 7, 8], [2, 9, 3, 6, 0, 0, 0, 0]])
+    part = base.PartFromArrays("part", THREE_D, DEFORMABLE_BODY, coordinates, connectivity, [0, 1], ["C3D8", "C3D4"])
+    assert [element.type for element in part.elements] == ["C3D8", "C3D4"]
+    assert part.elements[1].connectivity == (1, 8, 2, 5)
+
+
+@pytest.mark.parametrize(
+    argnames="connectivity, message",
+    argvalues=[([[1, 2, 3, 4, 5, 6, 7, 99]], "references node 99"), ([[1, 2, 3, 4, 5, 6, 7, 0]], "has 7 nodes")],
+    ids=["missing node", "node count"],
+)
+def test_part_from_arrays_invalid(connectivity, message):
+    base = Part("base", THREE_D, DEFORMABLE_BODY)
+    with pytest.raises(ValueError, match=message):
+        base.PartFromArrays("part", THREE_D, DEFORMABLE_BODY, np.array(HEX_COORDINATES, dtype=float),
+                            np.array(connectivity), 0, ["C3D8"])  # fmt: skip
+
+
+def test_part_from_mesh():
+    part = hexPart(3)
+    copy = part.PartFromMesh("copy")
+    assert copy._mesh is not part._mesh
+    assert len(copy.nodes) == 16 and len(copy.elements) == 3
+    np.testing.assert_array_equal(copy._mesh.connectivity, part._mesh.connectivity)
+
+
+@pytest.mark.parametrize("labels", [np.arange(1, 1001), np.arange(1, 2001, 2), np.array([7, 10**9, 3, 2**40])])
+def test_label_index(labels):
+    from abaqus.Mesh.MeshArrays import LabelIndex
+
+    index = LabelIndex(labels)
+    np.testing.assert_array_equal(index(labels), np.arange(len(labels)))
+    assert (index(np.array([0, -5, labels.max() + 1])) == -1).all()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus import mdb  # noqa: E402
+from abaqus.Mesh.MeshAdjacency import MeshAdjacency  # noqa: E402
+from abaqusConstants import DEFORMABLE_BODY, ON, THREE_D  # noqa: E402
+
+
+@pytest.fixture
+def part():
+    """An orphan mesh part of two unit C3D8 elements along x and a C3D8 element collapsed to a wedge."""
+    coordinates = [[x, y, z] for x in range(3) for y in (0, 1) for z in (0, 1)] + [[3, 0, 0], [3, 0, 1]]
+    # Node label 4x + 2y + z + 1 at (x, y, z), nodes 13 and 14 at x = 3
+    connectivity = [[1, 5, 7, 3, 2, 6, 8, 4], [5, 9, 11, 7, 6, 10, 12, 8], [9, 13, 11, 11, 10, 14, 12, 12]]
+    nodes = (np.arange(1, 15), np.array(coordinates, dtype=float))
+    base = mdb.models["Model-1"].Part("base", THREE_D, DEFORMABLE_BODY)
+    return base.PartFromNodesAndElements(
+        "adjacent", THREE_D, DEFORMABLE_BODY, nodes, (("C3D8", [1, 2, 3], connectivity),)
+    )
+
+
+def test_node_elements(part):
+    adjacency = part.adjacency()
+    assert adjacency is part.adjacency()
+    # Collapsed elements are listed once for their repeated nodes
+    assert adjacency.valence().tolist() == [1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1]
+    assert adjacency.nodeElements([0, 8]).tolist() == [0, 1, 2] and adjacency.nodeElements([]).tolist() == []
+    assert adjacency.adjacentElements([0]).tolist() == [1] and adjacency.adjacentElements([1]).tolist() == [0, 2]
+    assert adjacency.elementNodes([2]).tolist() == [8, 9, 10, 11, 12, 13]
+    assert adjacency.elementLabels([11]).tolist() == [2, 3] and adjacency.nodeLabels([1]).tolist() == list(range(1, 9))
+    with pytest.raises(ValueError, match="99"):
+        adjacency.elementLabels([99])
+
+
+def test_mesh_objects_use_the_adjacency(part):
+    assert [element.label for element in part.nodes.getFromLabel(5).getElements()] == [1, 2]
+    element = part.elements.getFromLabel(2)
+    assert [neighbour.label for neighbour in element.getAdjacentElements()] == [1, 3]
+    assert [node.label for node in element.getNodes()] == [5, 9, 11, 7, 6, 10, 12, 8]
+    assert [element.label for element in part.elements.getByBoundingBox(1.5, -1, -1, 4, 2, 2)] == [3]
+
+
+def test_invalidate(part):
+    mesh = part._mesh
+    adjacency = part.adjacency()
+    mesh.connectivity[2] = mesh.connectivity[1]
+    mesh.invalidate()
+    assert part.adjacency() is not adjacency and isinstance(part.adjacency(), MeshAdjacency)
+    assert part.adjacency().valence([12, 13]).tolist() == [0, 0]
+
+
+def test_instances_share_the_part_adjacency(part):
+    instance = mdb.models["Model-1"].rootAssembly.Instance("adjacent-1", part, dependent=ON)
+    assert instance.adjacency() is part.adjacency()
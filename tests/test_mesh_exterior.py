@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.Mesh.meshExterior import exteriorEdges, exteriorFaces, singles  # noqa: E402
+from abaqus.Part.Part import Part  # noqa: E402
+from abaqusConstants import DEFORMABLE_BODY, FACE4, FACE6, THREE_D  # noqa: E402
+
+
+def hexPart(columns: int) -> Part:
+    """Create an orphan mesh part of a row of unit C3D8R elements along x."""
+    coordinates = np.array([[x, y, z] for x in range(columns + 1) for y in (0, 1) for z in (0, 1)], dtype=float)
+    corners = np.array([0, 4, 6, 2, 1, 5, 7, 3]) + 1
+    connectivity = np.array([corners + 4 * column for column in range(columns)])
+    base = Part("base", THREE_D, DEFORMABLE_BODY)
+    nodes = (np.arange(1, len(coordinates) + 1), coordinates)
+    return base.PartFromNodesAndElements(
+        "part", THREE_D, DEFORMABLE_BODY, nodes, (("C3D8R", range(1, columns + 1), connectivity),)
+    )
+
+
+def shellPart(columns: int) -> Part:
+    """Create an orphan mesh part of a row of unit S4R elements along x."""
+    coordinates = np.array([[x, y, 0] for x in range(columns + 1) for y in (0, 1)], dtype=float)
+    connectivity = np.array(
+        [[2 * column + 1, 2 * column + 3, 2 * column + 4, 2 * column + 2] for column in range(columns)]
+    )
+    base = Part("base", THREE_D, DEFORMABLE_BODY)
+    nodes = (np.arange(1, len(coordinates) + 1), coordinates)
+    return base.PartFromNodesAndElements(
+        "part", THREE_D, DEFORMABLE_BODY, nodes, (("S4R", range(1, columns + 1), connectivity),)
+    )
+
+
+def test_exterior_faces():
+    part = hexPart(3)
+    faces = part.elements.getExteriorFaces()
+    assert len(faces) == 14
+    labels = Counter(face.label for face in faces)
+    assert labels == {1: 5, 2: 4, 3: 5}
+    assert (1, FACE4) not in {(face.label, face.face) for face in faces}
+    assert (3, FACE6) not in {(face.label, face.face) for face in faces}
+    assert len(part.elements[1:2].getExteriorFaces()) == 6
+
+
+def test_exterior_edges():
+    # The exterior faces of a solid form a closed surface without boundary edges
+    assert len(hexPart(2).elements.getExteriorEdges()) == 0
+    part = shellPart(3)
+    owners, numbers = exteriorEdges(part._mesh)
+    assert len(owners) == 8 and owners.tolist() == sorted(owners.tolist())
+    assert Counter(owners.tolist()) == {0: 3, 1: 2, 2: 3}
+    # The edges of a shell element are its faces
+    assert len(exteriorFaces(part._mesh)[0]) == 8
+    assert len(part.elements[0:1].getExteriorEdges()) == 4
+
+
+@pytest.mark.parametrize("maximum", [10, 2**40], ids=["packed", "hashed"])
+def test_singles(maximum):
+    rng = np.random.default_rng(0)
+    keys = np.sort(rng.integers(0, maximum, size=(200, 4)), axis=1)
+    keys = np.concatenate([keys, keys[:50]])
+    counts = Counter(map(tuple, keys.tolist()))
+    assert singles(keys).tolist() == [counts[tuple(row)] == 1 for row in keys.tolist()]
+    assert singles(keys[:1]).tolist() == [True]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.Mesh import MeshQuality  # noqa: E402
+from abaqus.Part.Part import Part  # noqa: E402
+from abaqusConstants import (  # noqa: E402
+    ANALYSIS_CHECKS,
+    ASPECT_RATIO,
+    DEFORMABLE_BODY,
+    SHAPE_FACTOR,
+    STABLE_TIME_INCREMENT,
+    TET,
+    THREE_D,
+)
+
+
+@pytest.fixture
+def part() -> Part:
+    """An orphan mesh part of a unit C3D8 element and a C3D4 element stretched along -z."""
+    coordinates = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1], [0, 0, -5]]
+    nodes = (np.arange(1, 10), np.array(coordinates, dtype=float))
+    elements = (("C3D8", [1], [range(1, 9)]), ("C3D4", [2], [[1, 4, 2, 9]]))
+    base = Part("base", THREE_D, DEFORMABLE_BODY)
+    return base.PartFromNodesAndElements("part", THREE_D, DEFORMABLE_BODY, nodes, elements)
+
+
+def test_mesh_stats(part):
+    stats = part.getMeshStats(())
+    assert (stats.numHexElems, stats.numTetElems, stats.numNodes) == (1, 1, 9)
+    assert part.getMeshStats((part.elements[1],)).numHexElems == 0
+
+
+def test_verify_mesh_quality(part):
+    result = part.verifyMeshQuality(ASPECT_RATIO, threshold=2.0)
+    assert result["numElements"] == 2 and result["worst"] == pytest.approx(np.sqrt(26))
+    assert result["average"] == pytest.approx((1 + np.sqrt(26)) / 2)
+    assert [element.label for element in result["failedElements"]] == [2] and result["worstElement"].label == 2
+    assert "failedElements" not in part.verifyMeshQuality(ASPECT_RATIO)
+
+
+def test_verify_mesh_quality_regions(part):
+    result = part.verifyMeshQuality(SHAPE_FACTOR, elemShape=TET, regions=part.elements)
+    assert result["numElements"] == 1 and result["worstElement"].label == 2
+    result = part.verifyMeshQuality(STABLE_TIME_INCREMENT, regions=(part.elements[0],), waveSpeed=5000.0)
+    assert result["numElements"] == 1 and result["worst"] == pytest.approx(1 / 5000)
+
+
+def test_analysis_checks(part):
+    assert len(part.verifyMeshQuality(ANALYSIS_CHECKS)["failedElements"]) == 0
+    # Swapping the top and bottom faces of the hexahedron turns it inside out
+    coordinates = part._mesh.coordinates.copy()
+    coordinates[:8] = coordinates[[4, 5, 6, 7, 0, 1, 2, 3]]
+    checks = MeshQuality.MeshQuality(part._mesh, coordinates).analysisChecks()
+    assert checks["numElements"] == 2 and checks["failedElements"].tolist() == [0]
+
+
+def test_parallel_chunks_match_serial(part, monkeypatch):
+    monkeypatch.setattr(MeshQuality, "CHUNK_SIZE", 1)
+    for criterion in MeshQuality.CRITERIA:
+        serial = MeshQuality.MeshQuality(part._mesh, numWorkers=1).metric(criterion, waveSpeed=1.0)
+        parallel = MeshQuality.MeshQuality(part._mesh, numWorkers=2).metric(criterion, waveSpeed=1.0)
+        np.testing.assert_array_equal(parallel, serial)
+    with pytest.raises(ValueError, match="Unknown quality criterion"):
+        MeshQuality.MeshQuality(part._mesh).metric("SKEWNESS")
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+
+from abaqus import session
+from abaqus.Odb.Odb import Odb
+from abaqus.Odb.OdbCache import OdbCache, OdbRepository
+from abaqusConstants import OFF, ON
+
+
+def opener(name: str, path: str, readOnly=OFF) -> Odb:
+    odb = Odb(name, path=path)
+    odb.isReadOnly = readOnly
+    return odb
+
+
+@pytest.fixture
+def paths(tmp_path) -> list[str]:
+    """Four output database files of 1 MB each."""
+    paths = []
+    for name in "abcd":
+        path = tmp_path / f"{name}.odb"
+        with open(path, "wb") as file:
+            file.truncate(2**20)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def odbSession(monkeypatch):
+    """The session with no open output databases and a kernel memory limit of 4 MB."""
+    monkeypatch.setattr(session, "_odbCache", None)
+    monkeypatch.setattr(session, "odbs", {})
+    monkeypatch.setattr(session, "kernelMemoryLimit", 4.0)
+    options = session.memoryReductionOptions
+    monkeypatch.setattr(options, "reducedMemoryMode", ON)
+    monkeypatch.setattr(options, "percentThreshold", 75.0)
+    return session
+
+
+def test_least_recently_used(paths):
+    cache = OdbCache(opener, maxOdbs=2)
+    a, b = cache.open("a", paths[0]), cache.open("b", paths[1])
+    assert cache.open("a", paths[0]) is a
+    c = cache.open("c", paths[2])
+    # b is the least recently used
+    assert cache.info()["open"] == 2 and b._evicted and not a._evicted
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 3, 1)
+    assert cache.reopen(a) is a and cache.reopen(opener("x", paths[3])).name == "x"
+    reopened = cache.reopen(b)
+    # a was used after c
+    assert reopened is not b and reopened.path == paths[1] and c._evicted and not a._evicted
+    cache.setValues(maxOdbs=None, memoryLimit=1.5)
+    assert cache.info()["open"] == 1 and cache.info()["memory"] == pytest.approx(1.0)
+    assert cache.close(paths[1]) and not cache.close(paths[1])
+
+
+def test_repository_reopens(paths):
+    cache = OdbCache(opener, maxOdbs=1)
+    odbs = OdbRepository(cache)
+    odbs["a"] = cache.open("a", paths[0])
+    odbs["b"] = cache.open("b", paths[1])
+    assert odbs["a"].path == paths[0] and odbs.get("b") is not None and odbs.get("c") is None
+    cache.clear()
+    assert cache.info()["open"] == 0 and odbs["b"].path == paths[1]
+
+
+def test_session_budget(odbSession, paths):
+    odbs = [odbSession.openOdb(name, path) for name, path in zip("abcd", paths)]
+    assert odbSession.odbCache.memoryLimit == pytest.approx(3.0) and odbs[0]._evicted
+    assert odbSession.openOdb("other", paths[3]) is odbs[3]
+    # The budget follows the memory reduction options, each setting changed on its own
+    odbSession.memoryReductionOptions.setValues(percentThreshold=50.0)
+    assert odbSession.memoryReductionOptions.reducedMemoryMode == ON
+    assert odbSession.odbCache.memoryLimit == pytest.approx(2.0) and odbSession.odbCache.info()["open"] == 2
+    odbSession.memoryReductionOptions.setValues(reducedMemoryMode=OFF)
+    assert odbSession.memoryReductionOptions.percentThreshold == 50.0
+    assert odbSession.odbCache.memoryLimit == pytest.approx(4.0)
+    odbSession.setValues(kernelMemoryLimit=None)
+    assert odbSession.odbCache.memoryLimit is None
+
+
+def test_close_and_reopen(odbSession, paths):
+    a = odbSession.openOdb("a", paths[0])
+    a.close()
+    reopened = odbSession.openOdb("a", paths[0])
+    assert reopened is not a and not reopened._closed
+    assert (odbSession.odbCache.hits, odbSession.odbCache.misses) == (0, 2)
+    assert odbSession.odbs["a"] is reopened and odbSession.odbCache.info()["open"] == 1
+    # A closed output database no longer counts against the budget
+    b = odbSession.openOdb("b", paths[1])
+    b.close()
+    odbSession.openOdb("c", paths[2])
+    assert odbSession.odbCache.info()["open"] == 2 and odbSession.odbs["b"] is b
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.Odb.FrameIndex import FrameIndex  # noqa: E402
+from abaqus.Odb.HistoryPoint import HistoryPoint  # noqa: E402
+from abaqus.Odb.Odb import Odb  # noqa: E402
+from abaqus.Odb.OdbMeshNode import OdbMeshNode  # noqa: E402
+from abaqusConstants import AFTER, BEFORE, EXACT, FREQUENCY, TIME  # noqa: E402
+
+
+@pytest.fixture
+def odb():
+    """An output database with two time steps, the first of total time 0 and the second of unknown total time."""
+    odb = Odb("odb")
+    for name in ("Step-1", "Step-2"):
+        step = odb.Step(name, "", TIME, timePeriod=1.0, totalTime=0.0 if name == "Step-1" else -1.0)
+        for number, value in enumerate((0.0, 0.25, 0.5, 1.0)):
+            step.Frame(incrementNumber=number, frameValue=value)
+    return odb
+
+
+def test_frame_index():
+    index = FrameIndex([0.0, 1.0, 1.0, 3.0])
+    assert index.lookup([-1.0, 0.5, 1.0, 2.0, 2.5, 9.0]).tolist() == [0, 1, 1, 3, 3, 3]
+    assert index.lookup([0.5, 1.0 + 1e-12, 4.0], BEFORE).tolist() == [0, 1, 3]
+    assert index.lookup([0.5, -1.0, 4.0], AFTER).tolist() == [1, 0, -1]
+    assert index.lookup([[1.0, 2.0]], EXACT).tolist() == [[1, -1]]
+    assert FrameIndex([]).lookup([1.0]).tolist() == [-1]
+    with pytest.raises(ValueError, match="Invalid match"):
+        index.lookup(1.0, "NEAREST")
+
+
+def test_step_frames(odb):
+    step = odb.steps["Step-1"]
+    frames = step.frames
+    assert step.getFrames([0.3, 0.75, 2.0]) == [frames[1], frames[3], frames[3]]
+    assert step.getFrame(0.3) is frames[1] and step.getFrame(0.3, BEFORE) is frames[1]
+    assert step.getFrame(frameValue=0.3, match=AFTER) is frames[2] and step.getFrame(0.3, match=AFTER) is frames[2]
+    with pytest.raises(ValueError, match="Frame not found at the frame value 0.3"):
+        step.getFrame(0.3, EXACT)
+    # Appended frames are found
+    frame = step.Frame(incrementNumber=4, frameValue=2.0)
+    assert step.getFrame(1.9) is frame
+
+
+def test_load_case_frames():
+    odb = Odb("odb")
+    step = odb.Step("Step-1", "", FREQUENCY)
+    first, second = step.LoadCase("first"), step.LoadCase("second")
+    frames = [step.Frame(loadCase=loadCase, frequency=frequency) for loadCase in (first, second)
+              for frequency in (1.0, 2.0)]  # fmt: skip
+    assert step.getFrame(first) is frames[0] and step.getFrame(loadCase=second) is frames[2]
+    assert step.getFrame(second, 1.8) is frames[3] and step.getFrame(first, 1.2, AFTER) is frames[1]
+    assert step.getFrame(loadCase=second, frameValue=1.2, match=BEFORE) is frames[2]
+    assert step.getFrames([1.0, 2.0], loadCase=first) == frames[:2]
+    with pytest.raises(ValueError, match="load case specific data"):
+        odb.getFrame(1.0)
+
+
+def test_odb_frames(odb):
+    first, second = odb.steps["Step-1"].frames, odb.steps["Step-2"].frames
+    # The second step follows the time period of the first step
+    assert odb.getFrames([0.3, 1.0, 1.2, 5.0]) == [first[1], first[3], second[1], second[3]]
+    assert odb.getFrame(1.6, AFTER) is second[3] and odb.getFrame(1.0, EXACT) is first[3]
+    odb.steps["Step-2"].totalTime = 10.0
+    assert odb.getFrame(10.5, EXACT) is second[2]
+    odb.Step("Step-3", "", FREQUENCY)
+    with pytest.raises(ValueError, match="different domains"):
+        odb.getFrame(1.0)
+
+
+def test_history_region(odb):
+    step = odb.steps["Step-1"]
+    node = OdbMeshNode()
+    node.label = 7
+    region = step.HistoryRegion("Node 7", "", HistoryPoint(node))
+    other = OdbMeshNode()
+    other.label = 7
+    assert step.getHistoryRegion(HistoryPoint(other)) is region
+    other.label = 8
+    with pytest.raises(ValueError, match="HistoryRegion not found"):
+        step.getHistoryRegion(HistoryPoint(other))
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.Odb.FieldBulkData import FieldBulkData  # noqa: E402
+from abaqus.Odb.FieldOutput import FieldOutput  # noqa: E402
+from abaqus.Odb.Odb import Odb  # noqa: E402
+from abaqus.Odb.OdbMeshElement import OdbMeshElement  # noqa: E402
+from abaqus.Odb.OdbMeshNode import OdbMeshNode  # noqa: E402
+from abaqus.Odb.OdbSet import OdbSet  # noqa: E402
+from abaqusConstants import DEFORMABLE_BODY, NODAL, SCALAR, THREE_D, WHOLE_ELEMENT  # noqa: E402
+
+
+def bulkData(instance, position, data, nodeLabels=(), elementLabels=()) -> FieldBulkData:
+    block = FieldBulkData()
+    block.position, block.instance, block.sectionPoint, block.componentLabels = position, instance, None, ()
+    block.nodeLabels, block.elementLabels, block.integrationPoints = nodeLabels, elementLabels, ()
+    block.data = data
+    return block
+
+
+@pytest.fixture
+def odb() -> Odb:
+    """An output database of two instances A and B of a part of six nodes and five two-node elements."""
+    odb = Odb("odb")
+    part = odb.Part("PART", THREE_D, DEFORMABLE_BODY)
+    for label in range(1, 7):
+        node = OdbMeshNode()
+        node.label, node.coordinates = label, (float(label), 0.0, 0.0)
+        part.nodes.append(node)
+    for label in range(1, 6):
+        element = OdbMeshElement()
+        element.label, element.type, element.connectivity = label, "T3D2", (label, label + 1)
+        part.elements.append(element)
+    for name in ("A", "B"):
+        odb.rootAssembly.Instance(name, part)
+    return odb
+
+
+def test_instance_members(odb):
+    A, B = odb.rootAssembly.instances["A"], odb.rootAssembly.instances["B"]
+    assert A.nodes[0] is not B.nodes[0] and (A.nodes[0].instanceName, B.nodes[0].instanceName) == ("A", "B")
+    assert B.elements[4].instanceName == "B" and A.getNodeFromLabel(6) is A.nodes[5]
+    assert A.nodeIndices([6, 1, 9]).tolist() == [5, 0, -1]
+
+
+def test_assembly_set_with_overlapping_labels(odb):
+    A, B = odb.rootAssembly.instances["A"], odb.rootAssembly.instances["B"]
+    S = OdbSet("S", nodes=(A.nodes[0:2], B.nodes[3:5]))
+    assert S.instanceNames == ("A", "B")
+    assert S.contains([1, 2, 4, 5], instanceName="A").tolist() == [True, True, False, False]
+    assert S.contains([1, 2, 4, 5], instanceName="B").tolist() == [False, False, True, True]
+    assert S.nodeIndices(A).tolist() == [0, 1] and S.nodeIndices(B).tolist() == [3, 4]
+    # The rows of each instance are kept on the nodes of the set on that instance
+    labels = np.arange(1, 7)
+    field = FieldOutput("U", "", SCALAR)
+    field.bulkDataBlocks = [bulkData(instance, NODAL, np.column_stack([labels + offset]), nodeLabels=labels)
+                            for instance, offset in ((A, 0.0), (B, 10.0))]  # fmt: skip
+    blocks = field.getSubset(region=S).bulkDataBlocks
+    assert [block.instance.name for block in blocks] == ["A", "B"]
+    assert [block.nodeLabels.tolist() for block in blocks] == [[1, 2], [4, 5]]
+    assert [block.data.ravel().tolist() for block in blocks] == [[1.0, 2.0], [14.0, 15.0]]
+
+
+def test_assembly_node_set_of_unnamed_nodes(odb):
+    A, B = odb.rootAssembly.instances["A"], odb.rootAssembly.instances["B"]
+    for instance in (A, B):
+        node = OdbMeshNode()
+        node.label = 7
+        instance.nodes.append(node)
+    # Nodes added to the instances without a name belong to the instance holding them
+    S = odb.rootAssembly.NodeSet("S", (A.nodes[6:], B.nodes[:1], []))
+    assert S.instanceNames == ("A", "B", None) and odb.rootAssembly.nodeSets["S"] is S
+    assert S.contains([1, 7], instanceName="A").tolist() == [False, True]
+    assert S.contains([1, 7], instanceName="B").tolist() == [True, False]
+
+
+def test_element_set(odb):
+    A, B = odb.rootAssembly.instances["A"], odb.rootAssembly.instances["B"]
+    E = OdbSet("E", [])
+    E.elements = [A.elements[1:3], B.elements[4:]]
+    assert E.elementIndices(A).tolist() == [1, 2] and E.elementIndices(B).tolist() == [4]
+    field = FieldOutput("E", "", SCALAR)
+    field.bulkDataBlocks = [bulkData(B, WHOLE_ELEMENT, np.ones((5, 1)), elementLabels=np.arange(1, 6)),
+                            bulkData(B, NODAL, np.ones((6, 1)), nodeLabels=np.arange(1, 7))]  # fmt: skip
+    # On B only element 5 and its nodes 5 and 6 are in the set
+    assert [block.elementLabels.tolist() for block in field.getSubset(region=E).bulkDataBlocks[:1]] == [[5]]
+    assert field.getSubset(region=E).bulkDataBlocks[1].nodeLabels.tolist() == [5, 6]
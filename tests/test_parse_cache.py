@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.InputFileParser.InputFile import InputFile  # noqa: E402
+from abaqus.InputFileParser.parseCache import cachedIncludes, cachePath, readCache  # noqa: E402
+
+MESH = "*Node, nset=all\n" + "".join(f"{i}, {i}.0, 0.5, 0.\n" for i in range(1, 301))
+MESH += "*Element, type=C3D8, elset=e\n1, 1, 2, 3, 4, 5, 6, 7, 8\n"
+
+
+@pytest.fixture
+def deck(tmp_path):
+    """An input file including a mesh file and a missing file."""
+    (tmp_path / "main.inp").write_text(
+        "*Heading\n** comment\n*Include, input=mesh.inp\n*Material, name=Steel\n*Elastic\n210000., 0.3\n"
+        "*Include, input=gone.inp\n"
+    )
+    (tmp_path / "mesh.inp").write_text(MESH)
+    return tmp_path
+
+
+def summary(keywords) -> list:
+    return [(keyword.name, keyword.parameter, [list(row) for row in keyword.data]) for keyword in keywords]
+
+
+@pytest.mark.parametrize("usePyArray", [False, True])
+def test_cache_round_trip(deck, usePyArray):
+    parsed = InputFile("main.inp", str(deck)).parse(cache=True, usePyArray=usePyArray)
+    assert os.path.isfile(deck / "main.inpc")
+    cached = InputFile("main.inp", str(deck)).parse(cache=True, usePyArray=usePyArray)
+    assert summary(cached) == summary(parsed) == summary(InputFile("main.inp", str(deck)).parse(usePyArray=usePyArray))
+    if usePyArray:
+        assert not cached[1].data.flags.writeable and cached[1].data.shape == (300, 4)
+
+
+def test_cache_records_includes(deck):
+    InputFile("main.inp", str(deck)).parse(cache=True)
+    includes, missing = cachedIncludes(cachePath(str(deck / "main.inp")))
+    assert includes == (str(deck / "mesh.inp"),) and missing == (str(deck / "gone.inp"),)
+    # A missing included file that appears invalidates the cache
+    (deck / "gone.inp").write_text("*Boundary\nall, 1, 3\n")
+    assert cachedIncludes(cachePath(str(deck / "main.inp"))) is None
+    assert InputFile("main.inp", str(deck)).parse(cache=True)[-1].name == "Boundary"
+
+
+def test_changed_include_invalidates_cache(deck):
+    InputFile("main.inp", str(deck)).parse(cache=True)
+    (deck / "mesh.inp").write_text(MESH.replace("1, 1.0, 0.5", "1, 9.0, 0.5"))
+    assert InputFile("main.inp", str(deck)).parse(cache=True)[1].data[0][1] == 9.0
+
+
+def test_touched_file_is_checked_by_hash(deck):
+    path = str(deck / "main.inp")
+    InputFile("main.inp", str(deck)).parse(cache=True, bulk=False)
+    files, missing = (path, str(deck / "mesh.inp")), (str(deck / "gone.inp"),)
+    os.utime(deck / "mesh.inp", ns=(0, 10**9))
+    assert readCache(cachePath(path), files, missing, {"bulk": False, "usePyArray": False}) is not None
+    assert readCache(cachePath(path), files, missing, {"bulk": True, "usePyArray": False}) is None
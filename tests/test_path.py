@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.Mesh.elementTopology import shapeFunctions, shapeIntegrationPoints  # noqa: E402
+from abaqus.Odb.FieldBulkData import FieldBulkData  # noqa: E402
+from abaqus.Odb.FieldOutput import FieldOutput  # noqa: E402
+from abaqus.Odb.Odb import Odb  # noqa: E402
+from abaqus.Odb.OdbMeshElement import OdbMeshElement  # noqa: E402
+from abaqus.Odb.OdbMeshNode import OdbMeshNode  # noqa: E402
+from abaqus.PathAndProbe.Path import Path  # noqa: E402
+from abaqus.PathAndProbe.PathSampler import PathSampler, pathLabels  # noqa: E402
+from abaqusConstants import (  # noqa: E402
+    CENTROID,
+    COMPONENT,
+    DEFORMABLE_BODY,
+    INTEGRATION_POINT,
+    INVARIANT,
+    NODAL,
+    NORM_DISTANCE,
+    POINT_LIST,
+    SCALAR,
+    SEQ_ID,
+    THREE_D,
+    TIME,
+    TRUE_DISTANCE,
+    TRUE_DISTANCE_X,
+    UNIFORM_SPACING,
+    X_COORDINATE,
+)
+
+#: The sample points, inside a row of two unit hexahedra along x
+POINTS = ((0.1, 0.2, 0.3), (0.9, 0.5, 0.5), (1.6, 0.7, 0.1))
+
+
+def linear(points: np.ndarray) -> np.ndarray:
+    """A linear field with two components."""
+    return np.column_stack([1.0 + points @ [2.0, -3.0, 4.0], 0.5 * points[:, 0]])
+
+
+def bulkData(instance, position, data, nodeLabels=(), elementLabels=(), integrationPoints=()) -> FieldBulkData:
+    block = FieldBulkData()
+    block.position, block.instance, block.sectionPoint, block.componentLabels = position, instance, None, ("A", "B")
+    block.nodeLabels, block.elementLabels, block.integrationPoints = nodeLabels, elementLabels, integrationPoints
+    block.data = data
+    return block
+
+
+@pytest.fixture
+def odb() -> Odb:
+    """An output database of two C3D8 elements with a field at the nodes, at the integration points and at the
+    centroids of the elements."""
+    odb = Odb("odb")
+    instance = odb.rootAssembly.Instance("PART-1-1", odb.Part("PART-1", THREE_D, DEFORMABLE_BODY))
+    coordinates = np.array([[x, y, z] for x in range(3) for y in (0, 1) for z in (0, 1)], dtype=float)
+    for label, point in enumerate(coordinates, start=1):
+        node = OdbMeshNode()
+        node.label, node.coordinates = label, tuple(point)
+        instance.nodes.append(node)
+    corners = np.array([1, 5, 7, 3, 2, 6, 8, 4])
+    for column in range(2):
+        element = OdbMeshElement()
+        element.label, element.type, element.connectivity = column + 1, "C3D8", tuple(corners + 4 * column)
+        instance.elements.append(element)
+    weights = shapeFunctions("HEX8", shapeIntegrationPoints("HEX8", 8))
+    points = np.concatenate([weights @ coordinates[corners + 4 * column - 1] for column in range(2)])
+    frame = odb.Step("Step-1", "", TIME, 1.0).Frame(0, 1.0)
+    for name, block in (
+        ("NT", bulkData(instance, NODAL, linear(coordinates), nodeLabels=np.arange(1, 13))),
+        ("S", bulkData(instance, INTEGRATION_POINT, linear(points), elementLabels=np.repeat([1, 2], 8),
+                       integrationPoints=np.tile(np.arange(1, 9), 2))),
+        ("E", bulkData(instance, CENTROID, [[1.0, 0.0], [2.0, 0.0]], elementLabels=[1, 2])),
+    ):  # fmt: skip
+        fieldOutput = FieldOutput(name, "", SCALAR)
+        fieldOutput.bulkDataBlocks = [block]
+        frame.fieldOutputs[name] = fieldOutput
+    return odb
+
+
+def pointPath(points) -> Path:
+    return Path("Path-1", POINT_LIST, points, None, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def sample(odb, name, **kwargs) -> dict[str, np.ndarray]:
+    path = pointPath(POINTS)
+    variable = ((name, NODAL, ((COMPONENT, "A"), (COMPONENT, "B"))),)
+    curves = PathSampler(odb, path, **kwargs).sample(variable, [(0, 0)], X_COORDINATE, False)[0]
+    return {column.split(".")[1]: np.array(data) for column, data in curves}
+
+
+@pytest.mark.parametrize("name", ["NT", "S"])
+def test_linear_field_is_interpolated_exactly(odb, name):
+    curves = sample(odb, name)
+    expected = linear(np.array(POINTS))
+    np.testing.assert_allclose(curves["A"], np.column_stack([np.array(POINTS)[:, 0], expected[:, 0]]), atol=1e-12)
+    np.testing.assert_allclose(curves["B"][:, 1], expected[:, 1], atol=1e-12)
+
+
+def test_centroid_values_are_constant_per_element(odb):
+    np.testing.assert_allclose(sample(odb, "E")["A"][:, 1], [1.0, 1.0, 2.0])
+
+
+def test_uniform_spacing(odb):
+    sampler = PathSampler(odb, pointPath(POINTS), pathStyle=UNIFORM_SPACING, numIntervals=4)
+    points = sampler.samplePoints()
+    assert len(points) == 5
+    curves = sampler.sample((("S", NODAL, ((COMPONENT, "A"),)),), [(0, 0)], SEQ_ID)[0]
+    ((name, data),) = curves
+    assert name == "S.A" and [x for x, _ in data] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    np.testing.assert_allclose([y for _, y in data], linear(points)[:, 0], atol=1e-12)
+
+
+def test_invariant_is_interpolated_from_the_nodes(odb):
+    sampler = PathSampler(odb, pointPath(((2.0, 1.0, 1.0),)))
+    curves = sampler.sample((("NT", NODAL, ((INVARIANT, "Magnitude"),)),), [(0, 0)])[0]
+    assert curves[0][1][0][1] == pytest.approx(np.linalg.norm(linear(np.array([[2.0, 1.0, 1.0]]))))
+
+
+def test_points_outside_the_mesh_are_omitted(odb):
+    curves = PathSampler(odb, pointPath(((0.5, 0.5, 0.5), (5.0, 0.5, 0.5)))).sample((("NT", NODAL),), [(0, 0)])[0]
+    assert [len(data) for _, data in curves] == [1, 1]
+
+
+def test_path_labels():
+    points = np.array([[0.0, 0.0, 0.0], [3.0, 4.0, 0.0], [0.0, 4.0, 0.0]])
+    np.testing.assert_allclose(pathLabels(points, TRUE_DISTANCE), [0.0, 5.0, 8.0])
+    np.testing.assert_allclose(pathLabels(points, NORM_DISTANCE), [0.0, 5.0 / 8.0, 1.0])
+    np.testing.assert_allclose(pathLabels(points, TRUE_DISTANCE_X), [0.0, 3.0, 6.0])
+    np.testing.assert_allclose(pathLabels(points, SEQ_ID), [1.0, 2.0, 3.0])
+    with pytest.raises(ValueError):
+        pathLabels(points, NODAL)
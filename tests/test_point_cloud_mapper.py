@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.Field import PointCloudMapper as module  # noqa: E402
+from abaqus.Field.MappedField import MappedField  # noqa: E402
+from abaqus.Field.PointCloudMapper import PointCloudMapper, interpolateGrid  # noqa: E402
+from abaqusConstants import ABSOLUTE, XYZ  # noqa: E402
+
+
+def bruteForce(points: np.ndarray, targets: np.ndarray, count: int, radius: float = np.inf) -> np.ndarray:
+    """Return the sorted distances of the count nearest points of each target within radius."""
+    distances = np.sqrt(((targets[:, None] - points[None]) ** 2).sum(axis=2))
+    distances[distances > radius] = np.inf
+    return np.sort(distances, axis=1)[:, :count]
+
+
+def clouds() -> dict:
+    rng = np.random.default_rng(0)
+    return {
+        "uniform": rng.random((1500, 3)),
+        # A dense cluster in a sparse cloud, the mean spacing is far larger than the spacing in the cluster
+        "clustered": np.concatenate([rng.random((1400, 3)) * 1e-4, rng.random((100, 3)) * 100.0]),
+        "planar": np.column_stack([rng.random((1500, 2)), np.zeros(1500)]),
+        "coincident": np.repeat(rng.random((50, 3)), 30, axis=0),
+    }
+
+
+@pytest.mark.parametrize("name", ["uniform", "clustered", "planar", "coincident"])
+@pytest.mark.parametrize("count, radius", [(8, np.inf), (1, np.inf), (8, 0.05)])
+def test_query_matches_brute_force(name, count, radius):
+    points = clouds()[name]
+    rng = np.random.default_rng(1)
+    targets = np.concatenate([points[:100] + 1e-6, rng.random((100, 3)) * points.max(axis=0), [[500.0] * 3]])
+    mapper = PointCloudMapper(points, np.arange(len(points)), numWorkers=2)
+    distances, indices = mapper.query(targets, count, radius)
+    np.testing.assert_allclose(distances, bruteForce(points, targets, count, radius))
+    assert np.array_equal(indices >= 0, np.isfinite(distances))
+    found = np.linalg.norm(mapper.points[np.maximum(indices, 0)] - targets[:, None], axis=2)
+    np.testing.assert_allclose(np.where(indices >= 0, found, np.inf), distances)
+
+
+def test_batches_and_chunks(monkeypatch):
+    monkeypatch.setattr(module, "MAX_CANDIDATES", 20)
+    monkeypatch.setattr(module, "CHUNK_SIZE", 7)
+    points = clouds()["clustered"]
+    targets = np.random.default_rng(2).random((50, 3)) * 1e-4
+    distances, _ = PointCloudMapper(points, points[:, 0], numWorkers=3).query(targets, 5)
+    np.testing.assert_allclose(distances, bruteForce(points, targets, 5))
+
+
+def test_non_uniform_cloud():
+    # The leaves adapt to the density, those in the cluster are as small as the cluster
+    points = clouds()["clustered"]
+    mapper = PointCloudMapper(points, points[:, 0])
+    leaves = mapper._highs[0] - mapper._lows[0]
+    assert mapper.spacing > 1.0 and np.median(leaves.max(axis=1)) < 1e-4
+    assert max(mapper._counts[0]) <= module.LEAF_SIZE and sum(mapper._counts[0]) == len(points)
+
+
+def test_interpolate():
+    points = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    mapper = PointCloudMapper(points, [[1.0, 10.0], [2.0, 20.0], [3.0, 30.0], [4.0, 40.0]])
+    values = mapper.interpolate([[1.0, 0.0], [0.5, 0.5], [9.0, 9.0]], numNeighbors=4, radius=2.0, default=-1.0)
+    np.testing.assert_allclose(values, [[2.0, 20.0], [2.5, 25.0], [-1.0, -1.0]])
+    assert PointCloudMapper(points, [1.0, 2.0, 3.0, 4.0]).interpolate([[0.1, 0.0]], 1).tolist() == [1.0]
+    with pytest.raises(ValueError, match="Expected 4 source values"):
+        PointCloudMapper(points, [1.0])
+
+
+def test_interpolate_grid():
+    table = [[0.0, 1.0], [2.0, 3.0]]
+    values = interpolateGrid([0.0, 1.0], [0.0, 1.0], table, [[0.5, 0.5], [1.5, 0.0], [5.0, 0.0]], tolerance=1.0)
+    assert values.tolist() == [1.5, 1.0, 0.0]
+
+
+def test_mapped_field():
+    data = ((0.0, 0.0, 0.0, 1.0), (1.0, 0.0, 0.0, 3.0))
+    field = MappedField("field", pointDataFormat=XYZ, xyzPointData=data, searchTolType=ABSOLUTE,
+                        neighborhoodSearchTol=2.0, defaultUnMappedValue=-1.0)  # fmt: skip
+    np.testing.assert_allclose(field.evaluate([[0.5, 0.0, 0.0], [0.0, 0.0, 0.0], [9.0, 0.0, 0.0]]), [2.0, 1.0, -1.0])
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from abqpy.profiler import Profiler, argument_items
+
+
+@pytest.fixture
+def calls():
+    """A profiler of an outer function calling an inner function twice."""
+    profiler = Profiler("trace.speedscope.json")
+
+    def inner(points):
+        time.sleep(0.01)
+
+    def outer(self, points, names=("a", "b")):
+        inner(points)
+        inner(points)
+
+    inner = profiler.wrap(inner, "inner")
+    outer = profiler.wrap(outer, "outer", method=True)
+    outer(object(), [1, 2, 3])
+    return profiler
+
+
+def test_call_statistics(calls):
+    inner, outer = calls.stats["inner"], calls.stats["outer"]
+    assert inner.calls == 2 and outer.calls == 1
+    assert inner.items == 6 and inner.max_items == 3 and outer.items == 3
+    # The self time of the outer function excludes the time of the nested calls
+    assert outer.total_time >= inner.total_time >= 0.02e9
+    assert outer.self_time == pytest.approx(outer.total_time - inner.total_time, abs=1e6)
+    report = calls.report().splitlines()
+    assert "3 calls of 2 API methods" in report[0] and report[2].endswith("inner")
+
+
+def test_recursive_calls_are_counted_once():
+    profiler = Profiler("true")
+
+    def count(depth):
+        return depth if depth == 0 else count(depth - 1)
+
+    count = profiler.wrap(count, "count")
+    count(3)
+    stats = profiler.stats["count"]
+    assert stats.calls == 4 and stats.self_time == pytest.approx(stats.total_time, abs=1e6)
+
+
+def test_traces(calls):
+    events = calls.chrome_trace()["traceEvents"]
+    assert [event["name"] for event in events] == ["inner", "inner", "outer"]
+    assert events[2]["ts"] <= events[0]["ts"] and events[2]["dur"] >= events[0]["dur"] + events[1]["dur"]
+    (profile,) = calls.speedscope()["profiles"]
+    frames = [frame["name"] for frame in calls.speedscope()["shared"]["frames"]]
+    opened = [(event["type"], frames[event["frame"]]) for event in profile["events"]]
+    assert opened == [("O", "outer"), ("O", "inner"), ("C", "inner"), ("O", "inner"), ("C", "inner"), ("C", "outer")]
+
+
+@pytest.mark.parametrize(
+    argnames="name, key",
+    argvalues=[("profile.txt", None), ("trace.json", "traceEvents"), ("a.speedscope.json", "profiles")],
+)
+def test_dump(calls, tmp_path, name, key):
+    calls.output = str(tmp_path / name)
+    calls.trace = key is not None
+    calls.dump()
+    content = (tmp_path / name).read_text()
+    if key is None:
+        assert content.splitlines()[1:] == calls.report().splitlines()[1:]
+    else:
+        assert len(json.loads(content)[key]) == (3 if key == "traceEvents" else 1)
+
+
+def test_argument_items():
+    assert argument_items(([1, 2], "text", 3, {"a": 1}), {"points": ((0, 0), (1, 1), (2, 2))}) == 6
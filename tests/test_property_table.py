@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from abaqus.TableCollection.PropertyTable import PropertyTable  # noqa: E402
+from abaqusConstants import LINEAR, ON  # noqa: E402
+
+
+@pytest.fixture
+def table():
+    """A property table of a stiffness and a strength depending on the strain rate and the temperature."""
+    table = PropertyTable("table", ("stiffness", "strength"), ("rate",))
+    data = [(100.0 + 10.0 * rate - temperature, 1.0 + rate, rate, temperature) for temperature in (0.0, 20.0)
+            for rate in (0.0, 1.0, 2.0)]  # fmt: skip
+    table.PropertyTableData("data", isTemp=ON, data=data)
+    return table
+
+
+def test_evaluate(table):
+    assert table.index("data").isGrid and table.index("data").variables == ("rate", "temperature")
+    values = table.evaluate("data", rate=[0.5, 3.0], temperature=[10.0, -5.0])
+    np.testing.assert_allclose(values, [[95.0, 1.5], [120.0, 3.0]])
+    np.testing.assert_allclose(table.evaluate("data", [[1.0, 20.0]]), [[90.0, 2.0]])
+    table.propertyTableDatas["data"].setValues(extrapolate=LINEAR)
+    np.testing.assert_allclose(table.evaluate("data", rate=[3.0], temperature=[-5.0]), [[135.0, 4.0]])
+
+
+def test_flat_data():
+    table = PropertyTable("table", "stiffness", "rate")
+    table.PropertyTableData("data", data=[1.0, 0.0, 3.0, 1.0])
+    assert table.evaluate("data", rate=[0.25, 0.5]).tolist() == [[1.5], [2.0]]
+
+
+def test_errors(table):
+    with pytest.raises(ValueError, match="There is no property table data missing"):
+        table.index("missing")
+    table.propertyTableDatas["data"].setValues(extrapolate="EXPONENTIAL")
+    with pytest.raises(ValueError, match="Unsupported extrapolation EXPONENTIAL"):
+        table.index("data")
+
+
+def test_index_follows_the_data(table):
+    index = table.index("data")
+    assert table.index("data") is index
+    # The data are stored as nested tuples and are changed with setValues
+    tableData = table.propertyTableDatas["data"]
+    with pytest.raises(TypeError):
+        tableData.data[0] = (50.0, 1.0, 0.0, 0.0)
+    tableData.setValues(data=[(50.0, 1.0, 0.0, 0.0)] + list(tableData.data[1:]))
+    edited = table.index("data")
+    assert edited is not index and table.evaluate("data", rate=[0.0], temperature=[0.0])[0, 0] == 50.0
+    # Equal data keep the index, changed settings do not
+    tableData.setValues(data=[list(row) for row in tableData.data])
+    assert table.index("data") is edited
+    tableData.setValues(regularize=ON, regularizeTolerance=0.1)
+    assert table.index("data") is not edited
+    # Data assigned directly are compared by their contents
+    tableData.data = [list(row) for row in tableData.data]
+    assert table.index("data") is table.index("data")